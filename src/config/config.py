@@ -24,6 +24,11 @@ class ConfigJuego:
     SEGUNDOS_VIDA_OBSEQUIO = 10  # Segundos antes de que un obsequio desaparezca
     FRAMES_COOLDOWN_MOVIMIENTO = 8  # Frames de espera entre movimientos por celda
 
+    # === GRABACIÓN DE PARTIDAS ===
+    GRABAR_PARTIDAS = False  # True para guardar cada partida como repetición
+    CARPETA_GRABACIONES = "src/data/grabaciones"
+    SEGUNDOS_ENTRE_KEYFRAMES = 5  # Huellas de estado y puntos de búsqueda
+
     # === DIFICULTAD PROGRESIVA ===
     VELOCIDAD_INICIAL_ENEMIGO = 1.5
     INCREMENTO_VELOCIDAD = 0.2
@@ -39,10 +44,44 @@ class ConfigJuego:
     FRAMES_RECALCULO_BFS = 6  # Cada cuántos frames recalcular pathfinding
     MARGEN_CAPTURA = 5  # Píxeles de holgura para capturar
 
+    # === NAVEGACIÓN (pathfinding del enemigo) ===
+    # La tabla de rutas precomputada (todos los pares de celdas) solo se usa
+    # si el laberinto no supera estos límites; si no, se busca bajo demanda
+    MAX_CELDAS_TABLA_RUTAS = 1000
+    MAX_BYTES_TABLA_RUTAS = 4 * 1024 * 1024  # 4 MB
+    # Si no entra la tabla, se busca sobre el grafo de uniones cuando este
+    # tiene al menos N veces menos nodos que celdas transitables
+    FACTOR_COMPRESION_GRAFO_UNIONES = 4
+    # Mapas con al menos esta cantidad de celdas usan el planificador
+    # jerárquico HPA* (clusters de TAM_CLUSTER_HPA x TAM_CLUSTER_HPA celdas)
+    MIN_CELDAS_HPA = 400 * 400
+    TAM_CLUSTER_HPA = 16
+    # Estrategia fija por dificultad del laberinto, p. ej. {"difícil": "jps"}
+    # (la clave "navegacion" del JSON tiene prioridad; sin entrada se elige
+    # automáticamente). Nombres válidos en ESTRATEGIAS_NAVEGACION
+    NAVEGACION_POR_DIFICULTAD: dict[str, str] = {}
+
     # === OBSEQUIOS ===
     VALOR_OBSEQUIO_DEFAULT = 10
     RADIO_OBSEQUIO_BASE = 8
 
+    # === RECURSOS (caché de imágenes, ver GestorRecursos) ===
+    # Memoria de píxeles máxima; al pasarla se descartan las menos usadas
+    PRESUPUESTO_MEMORIA_RECURSOS = 32 * 1024 * 1024  # 32 MB
+    # Textos renderizados que guarda GestorFuentes (los menos usados se descartan)
+    MAX_TEXTOS_RENDERIZADOS = 512
+
+    # === MENÚS (ver interfaz.espera_eventos) ===
+    # Espera máxima sin eventos antes de volver a revisar el estado de un menú
+    ESPERA_MAXIMA_MENUS_MS = 1000
+
+    # === PRESENTACIÓN DE LA PARTIDA (ver PantallaJuego._renderizar_sucios) ===
+    # True: solo se restauran y presentan los rectángulos que cambiaron
+    # (display.update) en lugar de voltear la ventana entera en cada frame
+    RECTANGULOS_SUCIOS = False
+    # Fracción del área de la ventana a partir de la cual se presenta todo (flip)
+    UMBRAL_AREA_SUCIA = 0.3
+
     # === FÍSICA Y COLISIONES ===
     # Factor de ajuste del rect de colisión respecto al radio visual
     # Un valor de 1.8 hace que el rect sea 90% del diámetro visual (más preciso)
@@ -4,7 +4,8 @@ Punto de entrada de la app: crea la ventana, muestra menús y navega entre panta
 Responsabilidades:
 - Preparar el entorno de importación (sys.path) para ejecutar desde distintos contextos.
 - Inicializar Pygame y crear la ventana principal.
-- Mostrar el menú principal y, según la opción, abrir las pantallas correspondientes.
+- Mostrar el menú principal y, según la opción, abrir las pantallas correspondientes
+  (todas son escenas de un único GestorEscenas: un solo loop y una sola ventana).
 - Salir de forma limpia al terminar.
 """
 
@@ -23,6 +24,7 @@ sys.path.append(
     os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 )  # Ajuste de ruta robusto y portátil
 
+from interfaz.escenas import GestorEscenas  # Pila de escenas y loop principal
 from interfaz.pantallas import (
     MensajeModal,  # Modal reutilizable para mostrar mensajes (éxito/error)
 )
@@ -47,7 +49,7 @@ from interfaz.pantallas import (
 from interfaz.pantallas import (
     PantallaSalonFama,  # Pantalla que muestra los mejores puntajes
 )
-from interfaz.pantallas.pantalla_juego import (  # Pantalla que corre el juego principal (loop propio)
+from interfaz.pantallas.pantalla_juego import (  # Escena que corre el juego principal (cada frame)
     PantallaJuego,
 )
 from mundo.salon_fama import SalonFama  # Modelo para gestionar puntuaciones y récords
@@ -77,12 +79,12 @@ class Juego:
 
         # Objetos de Pygame que se inicializan en iniciar()
         self.screen = None  # Se crea la Surface de la ventana al iniciar
-        self.clock = (
-            pygame.time.Clock()
-        )  # Reloj para controlar FPS si se usa un loop aquí
+        self.escenas = None  # Pila de escenas con el único loop de la app
+        self.admin = None  # Administrador (clave y acciones administrativas)
+        self._pantallas = {}  # Pantallas ya construidas, reutilizadas al volver
 
     def iniciar(self):
-        """Inicializa Pygame, muestra el menú principal y navega hasta salir."""
+        """Inicializa Pygame, crea la única ventana y corre el loop de escenas."""
         # Inicializar Pygame una sola vez antes de usar display, eventos o fuentes
         pygame.init()  # Prepara módulos internos de Pygame para su uso correcto
 
@@ -99,8 +101,9 @@ class Juego:
         ancho_ventana = max(800, ancho_ventana)
         alto_ventana = max(600, alto_ventana)
 
-        # Crear ventana principal con tamaño adaptable
-        screen = pygame.display.set_mode(
+        # Crear ventana principal con tamaño adaptable (la única de la app:
+        # todas las escenas dibujan sobre esta Surface)
+        self.screen = pygame.display.set_mode(
             (ancho_ventana, alto_ventana)
         )  # Crea la Surface principal donde se dibuja
         pygame.display.set_caption(
@@ -108,132 +111,139 @@ class Juego:
         )  # Título visible en la barra de la ventana
 
         # Instancias de servicios que se comparten entre pantallas
-        salon_fama = (
-            SalonFama()
-        )  # Mantiene los récords accesibles desde el menú y su pantalla
-        admin = Administrador(
+        self.admin = Administrador(
             PASSWORD
         )  # Admin con clave por defecto “casa” para pruebas|
 
-        # Loop principal de navegación de menús
-        ejecutando = (
-            True  # Mientras esté en True, se seguirá mostrando el menú principal
+        # El menú principal queda siempre en el fondo de la pila; las demás
+        # pantallas se abren encima y al cerrarse se vuelve a él
+        self.escenas = GestorEscenas()
+        self.escenas.apilar(
+            self._pantalla(MenuPrincipal), self._al_elegir_opcion, persistente=True
         )
-
-        while ejecutando:
-            # Asegura las dimensiones y el título del menú cada vez
-            # Mantener el tamaño actual de la ventana
-            pygame.display.set_caption(
-                "Theseus Runner"
-            )  # Restituye el título principal si cambió
-
-            # Mostrar menú principal y esperar a que el usuario elija
-            menu = MenuPrincipal(
-                screen
-            )  # Crea el menú con la Surface de la ventana actual
-            opcion = (
-                menu.ejecutar()
-            )  # Devuelve un número de opción elegido por el usuario
-
-            if opcion == 1:  # Iniciar Juego
-                self._manejar_iniciar_juego(screen, salon_fama)
-            elif opcion == 2:  # Salón de la Fama
-                self._manejar_salon_fama(screen, salon_fama)
-            elif opcion == 3:  # Administración
-                self._manejar_administracion(screen, admin, salon_fama)
-            elif opcion == 4:  # Salir
-                ejecutando = self._manejar_salir(screen)
+        self.escenas.ejecutar()  # Hasta confirmar la salida
 
         # Al salir del loop, cerrar Pygame y terminar el proceso de forma limpia
         pygame.quit()  # Libera recursos de Pygame (ventana, audio, etc.)
         sys.exit()  # Termina el proceso del programa explícitamente
 
-    def _manejar_iniciar_juego(self, screen, salon_fama):
-        """Maneja la opción de iniciar juego y guarda el puntaje si termina."""
-        pantalla_inicio = PantallaIniciarJuego(screen)
-        nombre = pantalla_inicio.ejecutar()
+    def _pantalla(self, clase, *args):
+        """Pantalla de la clase pedida: se construye una vez y se reutiliza."""
+        if clase not in self._pantallas:
+            self._pantallas[clase] = clase(self.screen, *args)
+        return self._pantallas[clase]
+
+    def _mostrar_mensaje(self, titulo, mensaje, tipo):
+        """Abre un modal de mensaje sobre la escena actual."""
+        self.escenas.apilar(MensajeModal(self.screen, titulo, mensaje, tipo))
+
+    def _al_elegir_opcion(self, opcion):
+        """Abre la pantalla correspondiente a la opción del menú principal."""
+        if opcion == 1:  # Iniciar Juego
+            self._manejar_iniciar_juego()
+        elif opcion == 2:  # Salón de la Fama
+            self._manejar_salon_fama()
+        elif opcion == 3:  # Administración
+            self._manejar_administracion()
+        elif opcion == 4:  # Salir
+            self._manejar_salir()
+
+    def _manejar_iniciar_juego(self):
+        """Pide el nombre del jugador y, si lo ingresa, inicia la partida."""
+        self.escenas.apilar(
+            self._pantalla(PantallaIniciarJuego), self._al_ingresar_nombre
+        )
 
+    def _al_ingresar_nombre(self, nombre):
+        """Inicia la partida con el nombre ingresado (None = volvió al menú)."""
         if nombre:
-            pantalla = PantallaJuego(nombre)
-            datos_puntaje = pantalla.ejecutar()
-
-            # Si hay datos de puntaje, guardar en el salón de la fama
-            if datos_puntaje:
-                from mundo.registro import Registro
-
-                registro = Registro(
-                    nombre_jugador=datos_puntaje["nombre"],
-                    puntaje=datos_puntaje["puntaje"],
-                    laberinto=datos_puntaje["laberinto"],
-                    tiempo_juego=datos_puntaje.get("tiempo_juego", 0),
-                )
-                salon_fama.guardar_puntaje(registro)
-
-    def _manejar_salon_fama(self, screen, salon_fama):
+            self.escenas.apilar(PantallaJuego(nombre), self._al_terminar_partida)
+
+    def _al_terminar_partida(self, datos_puntaje):
+        """Guarda el puntaje en el salón de la fama si hubo game over."""
+        if datos_puntaje:
+            from mundo.registro import Registro
+
+            registro = Registro(
+                nombre_jugador=datos_puntaje["nombre"],
+                puntaje=datos_puntaje["puntaje"],
+                laberinto=datos_puntaje["laberinto"],
+                tiempo_juego=datos_puntaje.get("tiempo_juego", 0),
+            )
+            self.salon_fama.guardar_puntaje(registro)
+
+    def _manejar_salon_fama(self):
         """Maneja la opción de Salón de la Fama."""
         # Recargar datos para mostrar los puntajes más recientes
-        salon_fama.cargar_datos()
-        pantalla_salon = PantallaSalonFama(screen, salon_fama)
-        pantalla_salon.ejecutar()
+        self.salon_fama.cargar_datos()
+        self.escenas.apilar(self._pantalla(PantallaSalonFama, self.salon_fama))
 
-    def _manejar_administracion(self, screen, admin, salon_fama):
+    def _manejar_administracion(self):
         """Maneja la opción de Administración."""
-        pantalla_admin = PantallaAdministracion(screen)
-        clave = pantalla_admin.ejecutar()
+        self.escenas.apilar(
+            self._pantalla(PantallaAdministracion), self._al_ingresar_clave
+        )
 
-        if clave and admin.autenticar(clave):
-            self._mostrar_menu_administrador(screen, admin, salon_fama)
+    def _al_ingresar_clave(self, clave):
+        """Abre el menú de administrador si la clave es correcta."""
+        if clave and self.admin.autenticar(clave):
+            self.escenas.apilar(
+                self._pantalla(PantallaMenuAdministrador),
+                self._al_elegir_opcion_admin,
+                persistente=True,
+            )
         elif clave:
-            modal = MensajeModal(screen, "Error", "Clave incorrecta", "error")
-            modal.ejecutar()
-
-    def _mostrar_menu_administrador(self, screen, admin, salon_fama):
-        """Muestra el menú de administrador y maneja sus opciones."""
-        en_menu_admin = True
-        while en_menu_admin:
-            menu_admin = PantallaMenuAdministrador(screen)
-            opcion_admin = menu_admin.ejecutar()
-
-            if opcion_admin == 1:  # Cargar Laberinto
-                self._manejar_cargar_laberinto(screen, admin)
-            elif opcion_admin == 2:  # Reiniciar Salón de Fama
-                self._manejar_reiniciar_salon(screen, admin, salon_fama)
-            elif opcion_admin == 3:  # Volver
-                en_menu_admin = False
-
-    def _manejar_cargar_laberinto(self, screen, admin):
+            self._mostrar_mensaje("Error", "Clave incorrecta", "error")
+
+    def _al_elegir_opcion_admin(self, opcion_admin):
+        """Maneja las opciones del menú de administrador."""
+        if opcion_admin == 1:  # Cargar Laberinto
+            self._manejar_cargar_laberinto()
+        elif opcion_admin == 2:  # Reiniciar Salón de Fama
+            self._manejar_reiniciar_salon()
+        elif opcion_admin == 3:  # Volver
+            self.escenas.quitar(self._pantalla(PantallaMenuAdministrador))
+
+    def _manejar_cargar_laberinto(self):
         """Maneja la carga de un laberinto."""
-        pantalla_carga = PantallaCargaLaberinto(screen, admin)
-        laberinto, mensaje = pantalla_carga.ejecutar()
+        self.escenas.apilar(
+            self._pantalla(PantallaCargaLaberinto, self.admin),
+            self._al_cargar_laberinto,
+        )
 
+    def _al_cargar_laberinto(self, resultado):
+        """Informa el resultado de la carga del laberinto."""
+        laberinto, mensaje = resultado
         if laberinto:
-            modal = MensajeModal(screen, "Laberinto Cargado", mensaje, "success")
-            modal.ejecutar()
+            self._mostrar_mensaje("Laberinto Cargado", mensaje, "success")
         elif mensaje:
-            modal = MensajeModal(screen, "Error", mensaje, "error")
-            modal.ejecutar()
+            self._mostrar_mensaje("Error", mensaje, "error")
 
-    def _manejar_reiniciar_salon(self, screen, admin, salon_fama):
+    def _manejar_reiniciar_salon(self):
         """Maneja el reinicio del salón de la fama."""
         confirmar = ModalConfirmacion(
-            screen,
+            self.screen,
             "Confirmar Acción",
             "¿Está seguro de que desea\neliminar todos los registros?",
         )
-        if confirmar.ejecutar():
-            mensaje = admin.reiniciar_salon_fama(salon_fama)
-            modal = MensajeModal(screen, "Salón Reiniciado", mensaje, "success")
-            modal.ejecutar()
+        self.escenas.apilar(confirmar, self._al_confirmar_reinicio)
 
-    def _manejar_salir(self, screen):
-        """Maneja la confirmación de salida del juego.
+    def _al_confirmar_reinicio(self, confirmado):
+        """Reinicia el salón de la fama si se confirmó."""
+        if confirmado:
+            mensaje = self.admin.reiniciar_salon_fama(self.salon_fama)
+            self._mostrar_mensaje("Salón Reiniciado", mensaje, "success")
 
-        Returns:
-            False para salir del loop, True para continuar
-        """
+    def _manejar_salir(self):
+        """Maneja la confirmación de salida del juego."""
         confirmar = ModalConfirmacion(
-            screen,
+            self.screen,
             "Confirmar Salida",
             "¿Está seguro de que desea\nsalir del juego?",
         )
-        return not confirmar.ejecutar()
+        self.escenas.apilar(confirmar, self._al_confirmar_salida)
+
+    def _al_confirmar_salida(self, confirmado):
+        """Termina el loop de escenas si se confirmó la salida."""
+        if confirmado:
+            self.escenas.detener()
@@ -0,0 +1,8 @@
+"""
+Módulo de herramientas de desarrollo.
+
+Scripts de línea de comandos para medir rendimiento y ajustar el juego
+sin necesidad de jugar a mano.
+"""
+
+__all__: list[str] = []
@@ -0,0 +1,1202 @@
+"""
+Benchmarks de rendimiento del juego.
+
+Mide el costo por frame de las partes más calientes del loop para poder
+comparar antes/después de una optimización sobre los laberintos incluidos.
+
+Uso (desde la raíz del proyecto):
+    python src/herramientas/benchmark.py fondo --frames 300
+    python src/herramientas/benchmark.py obsequios
+    python src/herramientas/benchmark.py rutas
+    python src/herramientas/benchmark.py enemigos
+    python src/herramientas/benchmark.py incremental --frames 600
+    python src/herramientas/benchmark.py uniones --frames 50
+    python src/herramientas/benchmark.py hpa --frames 20
+    python src/herramientas/benchmark.py estrategias --frames 100
+    python src/herramientas/benchmark.py colisiones --frames 2000
+    python src/herramientas/benchmark.py simulacion --frames 5000
+    python src/herramientas/benchmark.py timers --frames 2000
+    python src/herramientas/benchmark.py reposicion --frames 2000
+    python src/herramientas/benchmark.py recursos --frames 200
+    python src/herramientas/benchmark.py sprites --frames 2000
+    python src/herramientas/benchmark.py contadores --frames 2000
+    python src/herramientas/benchmark.py hud --frames 1000
+    python src/herramientas/benchmark.py overlays --frames 300
+    python src/herramientas/benchmark.py presentacion --frames 600
+    python src/herramientas/benchmark.py cola --frames 300
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Permitir ejecutar el script directamente (igual que game/juego.py)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+LABERINTOS_INCLUIDOS = [
+    "src/data/laberintos/laberinto1.json",
+    "src/data/laberintos/laberinto2.json",
+    "src/data/laberintos/laberinto3.json",
+]
+
+
+def _inicializar_pygame(ancho: int = 1200, alto: int = 800) -> pygame.Surface:
+    """Inicializa pygame con una ventana (usa el driver dummy si no hay display)."""
+    if "DISPLAY" not in os.environ and "WAYLAND_DISPLAY" not in os.environ:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    return pygame.display.set_mode((ancho, alto))
+
+
+def _cronometrar(funcion, frames: int) -> float:
+    """Ejecuta la función 'frames' veces y retorna los milisegundos promedio por llamada."""
+    inicio = time.perf_counter()
+    for _ in range(frames):
+        funcion()
+    return (time.perf_counter() - inicio) * 1000 / frames
+
+
+def benchmark_fondo(frames: int = 300) -> list[dict]:
+    """
+    Compara dibujar el laberinto celda por celda contra el fondo cacheado.
+
+    Args:
+        frames: Frames a simular por laberinto
+
+    Returns:
+        Lista de resultados {'laberinto', 'sin_cache_ms', 'con_cache_ms', 'aceleracion'}
+    """
+    from interfaz.pantallas.pantalla_juego import PantallaJuego
+
+    screen = _inicializar_pygame()
+    resultados = []
+    for ruta in LABERINTOS_INCLUIDOS:
+        pantalla = PantallaJuego("Benchmark", ruta_laberinto=ruta)
+        pantalla.screen = screen
+
+        def sin_cache(pantalla=pantalla):
+            screen.blit(pantalla._construir_fondo_laberinto(), (0, 0))
+
+        sin_cache_ms = _cronometrar(sin_cache, frames)
+        con_cache_ms = _cronometrar(pantalla._dibujar_laberinto, frames)
+        resultados.append(
+            {
+                "laberinto": os.path.basename(ruta),
+                "sin_cache_ms": sin_cache_ms,
+                "con_cache_ms": con_cache_ms,
+                "aceleracion": sin_cache_ms / con_cache_ms if con_cache_ms else 0.0,
+            }
+        )
+    return resultados
+
+
+def benchmark_obsequios(frames: int = 300) -> list[dict]:
+    """
+    Compara dibujar cada obsequio desde cero contra blitear frames pre-renderizados.
+
+    Usa un laberinto abierto de 40x30 con cantidades crecientes de obsequios.
+
+    Args:
+        frames: Frames a simular por cantidad de obsequios
+
+    Returns:
+        Lista de resultados {'obsequios', 'sin_cache_ms', 'con_cache_ms', 'aceleracion'}
+    """
+    from mundo.laberinto import Laberinto
+    from mundo.obsequio import Obsequio
+
+    screen = _inicializar_pygame()
+    mapa = [[0] * 40 for _ in range(30)]
+    resultados = []
+    for cantidad in (3, 30, 300):
+        laberinto = Laberinto({"mapa": mapa})
+        for i in range(cantidad):
+            posicion = (i % 40, i // 40)
+            laberinto._obsequios[posicion] = Obsequio(posicion)
+
+        contador = [0]
+
+        def sin_cache(contador=contador, laberinto=laberinto):
+            # Costo equivalente al dibujo anterior: todas las primitivas por obsequio
+            contador[0] += 1
+            paso = contador[0] % len(Laberinto.obtener_frames_obsequio())
+            for col, fila in laberinto._obsequios:
+                screen.blit(
+                    Laberinto._renderizar_frame_obsequio(paso), (col * 32, fila * 32)
+                )
+
+        def con_cache(contador=contador, laberinto=laberinto):
+            contador[0] += 1
+            laberinto.dibujar_obsequios(screen, contador[0], 32)
+
+        sin_cache_ms = _cronometrar(sin_cache, frames)
+        con_cache_ms = _cronometrar(con_cache, frames)
+        resultados.append(
+            {
+                "obsequios": cantidad,
+                "sin_cache_ms": sin_cache_ms,
+                "con_cache_ms": con_cache_ms,
+                "aceleracion": sin_cache_ms / con_cache_ms if con_cache_ms else 0.0,
+            }
+        )
+    return resultados
+
+
+def benchmark_rutas(frames: int = 300) -> list[dict]:
+    """
+    Compara el BFS por consulta contra la tabla de rutas precomputada.
+
+    Cada "frame" es una consulta de siguiente paso entre dos celdas
+    transitables elegidas en forma determinista.
+
+    Args:
+        frames: Consultas a realizar por laberinto
+
+    Returns:
+        Lista de resultados {'laberinto', 'construccion_ms', 'bfs_us', 'tabla_us', 'aceleracion'}
+    """
+    from jugabilidad.navegacion import NavegacionBFS, NavegacionTablaRutas
+    from mundo.laberinto import Laberinto
+
+    _inicializar_pygame()
+    resultados = []
+    for ruta in LABERINTOS_INCLUIDOS:
+        laberinto = Laberinto(ruta)
+        celdas = [(fila, col) for col, fila in laberinto._pasillos]
+        pares = [
+            (celdas[i % len(celdas)], celdas[(i * 7 + len(celdas) // 2) % len(celdas)])
+            for i in range(frames)
+        ]
+
+        inicio = time.perf_counter()
+        tabla = NavegacionTablaRutas(laberinto)
+        construccion_ms = (time.perf_counter() - inicio) * 1000
+        bfs = NavegacionBFS(laberinto)
+
+        def consultar(estrategia, pares=pares):
+            iterador = iter(pares)
+            return lambda: estrategia.siguiente_paso(*next(iterador))
+
+        bfs_us = _cronometrar(consultar(bfs), frames) * 1000
+        tabla_us = _cronometrar(consultar(tabla), frames) * 1000
+        resultados.append(
+            {
+                "laberinto": os.path.basename(ruta),
+                "construccion_ms": construccion_ms,
+                "bfs_us": bfs_us,
+                "tabla_us": tabla_us,
+                "aceleracion": bfs_us / tabla_us if tabla_us else 0.0,
+            }
+        )
+    return resultados
+
+
+def benchmark_enemigos(frames: int = 300) -> list[dict]:
+    """
+    Mide el costo por frame de N minotauros persiguiendo y dibujándose.
+
+    Usa laberinto1.json con spawns adicionales ("inicio_enemigos") y mueve al
+    jugador de celda cada 8 frames para forzar recálculos. Compara el BFS
+    propio de cada Computadora contra el campo de flujo compartido.
+
+    Args:
+        frames: Frames a simular por cantidad de enemigos
+
+    Returns:
+        Lista de resultados {'enemigos', 'bfs_ms', 'campo_flujo_ms', 'presupuesto_%'}
+    """
+    import json
+
+    from interfaz.pantallas.pantalla_juego import PantallaJuego
+    from jugabilidad.navegacion import NavegacionCampoFlujo
+
+    screen = _inicializar_pygame()
+    with open(LABERINTOS_INCLUIDOS[0], "r", encoding="utf-8") as f:
+        datos = json.load(f)
+    resultados = []
+    for cantidad in (1, 8, 24):
+        def preparar(usar_campo: bool, cantidad=cantidad) -> PantallaJuego:
+            pasillos = [
+                (c, f)
+                for f, fila in enumerate(datos["mapa"])
+                for c, v in enumerate(fila)
+                if v == 0
+            ]
+            spawns = pasillos[::-3][: cantidad - 1]
+            pantalla = PantallaJuego(
+                "Benchmark", ruta_laberinto={**datos, "inicio_enemigos": spawns}
+            )
+            pantalla.screen = screen
+            navegacion = NavegacionCampoFlujo(pantalla.laberinto) if usar_campo else None
+            for computadora in pantalla.computadoras:
+                computadora.establecer_navegacion(navegacion)
+            return pantalla
+
+        def simular(pantalla: PantallaJuego):
+            celdas = list(pantalla.laberinto._pasillos)
+            contador = [0]
+
+            def frame():
+                contador[0] += 1
+                if contador[0] % 8 == 0:
+                    col, fila = celdas[(contador[0] // 8) % len(celdas)]
+                    pantalla.jugador.jugador_principal.topleft = (
+                        pantalla.offset_x + col * pantalla.tam_celda,
+                        pantalla.offset_y + fila * pantalla.tam_celda,
+                    )
+                for computadora in pantalla.computadoras:
+                    computadora.perseguir_bfs(
+                        pantalla.jugador,
+                        pantalla.mapa,
+                        pantalla.tam_celda,
+                        pantalla.offset_x,
+                        pantalla.offset_y,
+                    )
+                    computadora.dibujar_computadora_principal(screen)
+
+            return frame
+
+        bfs_ms = _cronometrar(simular(preparar(False)), frames)
+        campo_ms = _cronometrar(simular(preparar(True)), frames)
+        resultados.append(
+            {
+                "enemigos": cantidad,
+                "bfs_ms": bfs_ms,
+                "campo_flujo_ms": campo_ms,
+                "presupuesto_%": campo_ms * 100 / (1000 / 60),
+            }
+        )
+    return resultados
+
+
+def _laberinto_abierto(lado: int, densidad: float, semilla: int = 7) -> dict:
+    """Genera un laberinto abierto lado x lado con obstáculos aleatorios (determinista)."""
+    import random
+
+    generador = random.Random(semilla)
+    mapa = [
+        [
+            1
+            if fila in (0, lado - 1)
+            or col in (0, lado - 1)
+            or generador.random() < densidad
+            else 0
+            for col in range(lado)
+        ]
+        for fila in range(lado)
+    ]
+    return {"mapa": mapa}
+
+
+def _laberinto_pasillos(lado: int, semilla: int = 7) -> dict:
+    """
+    Genera un laberinto perfecto lado x lado (solo pasillos de una celda de ancho).
+
+    Usa backtracking iterativo sobre las celdas de coordenadas impares, con
+    algunos muros extra abiertos para que haya ciclos.
+    """
+    import random
+
+    generador = random.Random(semilla)
+    mapa = [[1] * lado for _ in range(lado)]
+    pila = [(1, 1)]
+    mapa[1][1] = 0
+    while pila:
+        fila, col = pila[-1]
+        opciones = [
+            (fila + df, col + dc, fila + df // 2, col + dc // 2)
+            for df, dc in ((2, 0), (-2, 0), (0, 2), (0, -2))
+            if 0 < fila + df < lado - 1
+            and 0 < col + dc < lado - 1
+            and mapa[fila + df][col + dc] == 1
+        ]
+        if not opciones:
+            pila.pop()
+            continue
+        nf, nc, mf, mc = generador.choice(opciones)
+        mapa[mf][mc] = 0
+        mapa[nf][nc] = 0
+        pila.append((nf, nc))
+
+    # Abrir ~2% de los muros interiores entre pasillos para crear ciclos
+    for _ in range(lado * lado // 50):
+        fila = generador.randrange(1, lado - 1)
+        col = generador.randrange(1, lado - 1)
+        if (fila + col) % 2 == 1:
+            mapa[fila][col] = 0
+    return {"mapa": mapa}
+
+
+def _simular_persecucion(laberinto, estrategia, frames: int, semilla: int = 11):
+    """
+    Simula una persecución celda a celda y retorna (ms_por_frame, nodos_por_frame).
+
+    El jugador hace un paseo aleatorio (una celda cada 8 frames) y la
+    computadora avanza una celda cada 6 frames pidiendo su siguiente paso,
+    igual que perseguir_bfs cuando tiene una estrategia asignada.
+    """
+    import random
+
+    generador = random.Random(semilla)
+    celdas = [(fila, col) for col, fila in laberinto._pasillos]
+    jugador = celdas[len(celdas) // 4]
+    computadora = celdas[-len(celdas) // 4]
+
+    estado = {"jugador": jugador, "computadora": computadora, "frame": 0}
+
+    def frame():
+        estado["frame"] += 1
+        if estado["frame"] % 8 == 0:
+            vecinos = list(estrategia.vecinos(estado["jugador"]))
+            if vecinos:
+                estado["jugador"] = generador.choice(vecinos)
+        if estado["frame"] % 6 == 0:
+            paso = estrategia.siguiente_paso(estado["computadora"], estado["jugador"])
+            if paso is not None and paso != estado["jugador"]:
+                estado["computadora"] = paso
+
+    nodos_previos = estrategia.nodos_expandidos
+    ms = _cronometrar(frame, frames)
+    return ms, (estrategia.nodos_expandidos - nodos_previos) / frames
+
+
+def benchmark_incremental(frames: int = 600) -> list[dict]:
+    """
+    Compara nodos expandidos por frame entre BFS desde cero y D* Lite.
+
+    Usa laberintos abiertos grandes (donde el BFS explora más área) con
+    la misma secuencia de movimientos para ambas estrategias.
+
+    Args:
+        frames: Frames a simular por laberinto
+
+    Returns:
+        Lista de resultados {'lado', 'bfs_nodos', 'dstar_nodos', 'bfs_ms', 'dstar_ms'}
+    """
+    from jugabilidad.navegacion import NavegacionBFS, NavegacionDStarLite
+    from mundo.laberinto import Laberinto
+
+    _inicializar_pygame()
+    resultados = []
+    for lado in (60, 120, 200):
+        laberinto = Laberinto(_laberinto_abierto(lado, densidad=0.1))
+        bfs_ms, bfs_nodos = _simular_persecucion(
+            laberinto, NavegacionBFS(laberinto), frames
+        )
+        dstar_ms, dstar_nodos = _simular_persecucion(
+            laberinto, NavegacionDStarLite(laberinto), frames
+        )
+        resultados.append(
+            {
+                "lado": lado,
+                "bfs_nodos": bfs_nodos,
+                "dstar_nodos": dstar_nodos,
+                "bfs_ms": bfs_ms,
+                "dstar_ms": dstar_ms,
+            }
+        )
+    return resultados
+
+
+def benchmark_uniones(frames: int = 50) -> list[dict]:
+    """
+    Compara nodos expandidos por consulta entre BFS y el grafo de uniones.
+
+    Usa laberintos de pasillos generados (hasta 501x501) y pares de celdas
+    elegidos al azar con semilla fija.
+
+    Args:
+        frames: Consultas a realizar por laberinto
+
+    Returns:
+        Lista de resultados {'lado', 'celdas', 'nodos_grafo', 'construccion_ms',
+        'bfs_nodos', 'grafo_nodos', 'bfs_ms', 'grafo_ms'}
+    """
+    import random
+
+    from jugabilidad.navegacion import NavegacionBFS, NavegacionGrafoUniones
+    from mundo.laberinto import Laberinto
+
+    _inicializar_pygame()
+    resultados = []
+    for lado in (101, 251, 501):
+        laberinto = Laberinto(_laberinto_pasillos(lado))
+        inicio = time.perf_counter()
+        grafo = NavegacionGrafoUniones(laberinto)
+        construccion_ms = (time.perf_counter() - inicio) * 1000
+        bfs = NavegacionBFS(laberinto)
+
+        generador = random.Random(3)
+        celdas = [(fila, col) for col, fila in laberinto._pasillos]
+        pares = [tuple(generador.sample(celdas, 2)) for _ in range(frames)]
+
+        def consultar(estrategia, pares=pares):
+            iterador = iter(pares)
+            return lambda: estrategia.siguiente_paso(*next(iterador))
+
+        bfs_ms = _cronometrar(consultar(bfs), frames)
+        grafo_ms = _cronometrar(consultar(grafo), frames)
+        resultados.append(
+            {
+                "lado": lado,
+                "celdas": len(celdas),
+                "nodos_grafo": len(laberinto.grafo_uniones.nodos),
+                "construccion_ms": construccion_ms,
+                "bfs_nodos": bfs.nodos_expandidos / frames,
+                "grafo_nodos": grafo.nodos_expandidos / frames,
+                "bfs_ms": bfs_ms,
+                "grafo_ms": grafo_ms,
+            }
+        )
+    return resultados
+
+
+def benchmark_hpa(frames: int = 20) -> list[dict]:
+    """
+    Compara BFS contra HPA* en laberintos de hasta 1001x1001 celdas.
+
+    Reporta el tiempo de precomputación, el costo por consulta aislada, el
+    costo por frame de una persecución (donde se reutiliza la ruta abstracta)
+    y cuánto más largas son las rutas jerárquicas respecto de las óptimas.
+
+    Args:
+        frames: Consultas a realizar por laberinto
+
+    Returns:
+        Lista de resultados {'lado', 'construccion_ms', 'bfs_ms', 'hpa_ms',
+        'bfs_nodos', 'hpa_nodos', 'persecucion_ms', 'sobrecosto_%'}
+    """
+    import random
+
+    from jugabilidad.navegacion import NavegacionBFS, NavegacionHPA
+    from mundo.laberinto import Laberinto
+
+    _inicializar_pygame()
+    resultados = []
+    for lado, datos in (
+        (401, _laberinto_abierto(401, densidad=0.25)),
+        (1001, _laberinto_abierto(1001, densidad=0.25)),
+        (1001, _laberinto_pasillos(1001)),
+    ):
+        laberinto = Laberinto(datos)
+        inicio = time.perf_counter()
+        hpa = NavegacionHPA(laberinto)
+        construccion_ms = (time.perf_counter() - inicio) * 1000
+        bfs = NavegacionBFS(laberinto)
+
+        generador = random.Random(5)
+        celdas = [(fila, col) for col, fila in laberinto._pasillos]
+        pares = [tuple(generador.sample(celdas, 2)) for _ in range(frames)]
+
+        def consultar(estrategia, pares=pares):
+            iterador = iter(pares)
+            return lambda: estrategia.siguiente_paso(*next(iterador))
+
+        bfs_ms = _cronometrar(consultar(bfs), frames)
+        hpa_ms = _cronometrar(consultar(hpa), frames)
+        bfs_nodos = bfs.nodos_expandidos / frames
+        hpa_nodos = hpa.nodos_expandidos / frames
+        persecucion_ms, _ = _simular_persecucion(laberinto, hpa, 600)
+
+        optimo = jerarquico = 0
+        for origen, destino in pares[:5]:
+            d_hpa = hpa.distancia(origen, destino)
+            camino = bfs.calcular_camino(origen, destino)
+            if camino and d_hpa is not None:
+                optimo += len(camino) - 1
+                jerarquico += d_hpa
+        resultados.append(
+            {
+                "lado": lado,
+                "construccion_ms": construccion_ms,
+                "bfs_ms": bfs_ms,
+                "hpa_ms": hpa_ms,
+                "bfs_nodos": bfs_nodos,
+                "hpa_nodos": hpa_nodos,
+                "persecucion_ms": persecucion_ms,
+                "sobrecosto_%": (jerarquico - optimo) * 100 / optimo if optimo else 0.0,
+            }
+        )
+    return resultados
+
+
+def benchmark_estrategias(frames: int = 100) -> list[dict]:
+    """
+    Compara BFS, A* y JPS por estilo de mapa con las estadísticas de cada estrategia.
+
+    Sirve para elegir la estrategia más barata (clave "navegacion" del JSON o
+    ConfigJuego.NAVEGACION_POR_DIFICULTAD) según el tipo de laberinto.
+
+    Args:
+        frames: Consultas aleatorias por mapa y estrategia
+
+    Returns:
+        Lista de resultados {'mapa', 'estrategia', 'nodos_por_consulta',
+        'us_por_consulta'}
+    """
+    import random
+
+    from jugabilidad.navegacion import NavegacionAStar, NavegacionBFS, NavegacionJPS
+    from mundo.laberinto import Laberinto
+
+    _inicializar_pygame()
+    mapas = [(ruta.rsplit("/", 1)[-1], ruta) for ruta in LABERINTOS_INCLUIDOS]
+    mapas += [
+        ("arena 200x200", _laberinto_abierto(200, densidad=0.05)),
+        ("abierto 200x200", _laberinto_abierto(200, densidad=0.25)),
+        ("pasillos 201x201", _laberinto_pasillos(201)),
+    ]
+    resultados = []
+    for nombre, datos in mapas:
+        laberinto = Laberinto(datos)
+        generador = random.Random(3)
+        celdas = [(fila, col) for col, fila in laberinto._pasillos]
+        pares = [tuple(generador.sample(celdas, 2)) for _ in range(frames)]
+        for clase in (NavegacionBFS, NavegacionAStar, NavegacionJPS):
+            estrategia = clase(laberinto)
+            for origen, destino in pares:
+                estrategia.siguiente_paso(origen, destino)
+            estadisticas = estrategia.estadisticas()
+            resultados.append(
+                {
+                    "mapa": nombre,
+                    "estrategia": estrategia.nombre,
+                    "nodos_por_consulta": estadisticas["nodos_por_consulta"],
+                    "us_por_consulta": estadisticas["microsegundos_por_consulta"],
+                }
+            )
+    return resultados
+
+
+def benchmark_colisiones(frames: int = 2000) -> list[dict]:
+    """
+    Compara colliderect contra todos los muros con la consulta por celdas.
+
+    Args:
+        frames: Consultas de colisión por laberinto
+
+    Returns:
+        Lista de resultados {'laberinto', 'muros', 'lista_us', 'grilla_us', 'aceleracion'}
+    """
+    import random
+
+    from mundo.colision import GrillaColision
+    from mundo.laberinto import Laberinto
+
+    _inicializar_pygame()
+    tam_celda = 32
+    mapas = [(ruta.rsplit("/", 1)[-1], ruta) for ruta in LABERINTOS_INCLUIDOS]
+    mapas.append(("abierto 200x200", _laberinto_abierto(200, densidad=0.25)))
+    resultados = []
+    for nombre, datos in mapas:
+        laberinto = Laberinto(datos)
+        muros = laberinto.generar_muros_rect(tam_celda, 0, 0)
+        grilla = GrillaColision(laberinto.laberinto, tam_celda)
+        generador = random.Random(9)
+        ancho, alto = laberinto.columnas * tam_celda, laberinto.filas * tam_celda
+        rects = [
+            pygame.Rect(generador.randrange(ancho), generador.randrange(alto), 21, 21)
+            for _ in range(frames)
+        ]
+
+        def consultar(colisiona, rects=rects):
+            iterador = iter(rects)
+            return lambda: colisiona(next(iterador))
+
+        lista_ms = _cronometrar(
+            consultar(lambda r, muros=muros: any(r.colliderect(m) for m in muros)),
+            frames,
+        )
+        grilla_ms = _cronometrar(consultar(grilla.colisiona), frames)
+        resultados.append(
+            {
+                "laberinto": nombre,
+                "muros": len(muros),
+                "lista_us": lista_ms * 1000,
+                "grilla_us": grilla_ms * 1000,
+                "aceleracion": lista_ms / grilla_ms if grilla_ms > 0 else 0.0,
+            }
+        )
+    return resultados
+
+
+def benchmark_simulacion(frames: int = 5000) -> list[dict]:
+    """
+    Mide cuántos frames por segundo avanza la simulación sin ventana.
+
+    El jugador cambia de dirección al azar (semilla fija) y la partida se
+    reinicia al llegar al game over, así siempre hay persecución activa.
+
+    Args:
+        frames: Frames simulados por laberinto
+
+    Returns:
+        Lista de resultados {'laberinto', 'frames', 'us_por_frame', 'frames_por_segundo'}
+    """
+    import random
+
+    from jugabilidad.simulacion import DIRECCIONES_ENTRADA, SimulacionJuego
+
+    resultados = []
+    for ruta in LABERINTOS_INCLUIDOS:
+        generador = random.Random(5)
+        simulacion = SimulacionJuego(ruta)
+        inicio = time.perf_counter()
+        for frame in range(frames):
+            if simulacion.game_over:
+                simulacion = SimulacionJuego(ruta)
+            if frame % 30 == 0:
+                direccion = generador.choice(DIRECCIONES_ENTRADA)
+            simulacion.step(direccion)
+        segundos = time.perf_counter() - inicio
+        resultados.append(
+            {
+                "laberinto": ruta.rsplit("/", 1)[-1],
+                "frames": frames,
+                "us_por_frame": segundos * 1_000_000 / frames,
+                "frames_por_segundo": frames / segundos if segundos > 0 else 0.0,
+            }
+        )
+    return resultados
+
+
+def benchmark_timers(frames: int = 2000) -> list[dict]:
+    """
+    Compara descontar todos los timers de obsequios por frame con el heap de vencimientos.
+
+    La referencia replica el gestor anterior (un diccionario de frames
+    restantes que se recorre completo cada frame). El tiempo de vida supera
+    los frames medidos para comparar solo el costo por frame de los timers:
+    la reposición al vencer es igual en ambos.
+
+    Args:
+        frames: Frames a simular por cantidad de obsequios
+
+    Returns:
+        Lista de resultados {'obsequios', 'recorrer_us', 'heap_us', 'aceleracion'}
+    """
+    from jugabilidad.gestores.gestor_obsequios import GestorObsequios
+    from mundo.laberinto import Laberinto
+
+    class GestorRecorrido(GestorObsequios):
+        """Timers como frames restantes, descontados uno por uno cada frame."""
+
+        def __init__(self, laberinto, tiempo_vida_frames):
+            super().__init__(laberinto, tiempo_vida_frames)
+            self.restantes = dict.fromkeys(laberinto._obsequios, tiempo_vida_frames)
+
+        def actualizar(self):
+            vencidos = []
+            for posicion, restante in self.restantes.items():
+                self.restantes[posicion] = restante - 1
+                if restante - 1 <= 0:
+                    vencidos.append(posicion)
+            for posicion in vencidos:
+                del self.restantes[posicion]
+
+    lado = 100
+    tiempo_vida = frames * 2
+    resultados = []
+    for cantidad in (10, 1000, 5000):
+        obsequios = [
+            {"posicion": [i % lado, i // lado], "valor": 10} for i in range(cantidad)
+        ]
+        datos = {"mapa": [[0] * lado for _ in range(lado)], "obsequios": obsequios}
+
+        recorrido = GestorRecorrido(Laberinto(datos), tiempo_vida)
+        gestor = GestorObsequios(Laberinto(datos), tiempo_vida)
+        recorrer_ms = _cronometrar(recorrido.actualizar, frames)
+        heap_ms = _cronometrar(gestor.actualizar, frames)
+        resultados.append(
+            {
+                "obsequios": cantidad,
+                "recorrer_us": recorrer_ms * 1000,
+                "heap_us": heap_ms * 1000,
+                "aceleracion": recorrer_ms / heap_ms if heap_ms > 0 else 0.0,
+            }
+        )
+    return resultados
+
+
+def benchmark_reposicion(frames: int = 2000) -> list[dict]:
+    """
+    Compara recorrer los pasillos para reponer un obsequio con el índice de celdas libres.
+
+    Cada iteración recolecta un obsequio y repone otro, como cuando el jugador
+    pisa uno. La referencia replica el gestor anterior, que armaba la lista
+    de celdas candidatas recorriendo todo el mapa en cada reposición.
+
+    Args:
+        frames: Reposiciones a medir por tamaño de mapa
+
+    Returns:
+        Lista de resultados {'celdas', 'recorrer_us', 'indice_us', 'aceleracion'}
+    """
+    import random
+
+    from jugabilidad.gestores.gestor_obsequios import GestorObsequios
+    from mundo.laberinto import Laberinto
+    from mundo.obsequio import Obsequio
+
+    class GestorRecorrido(GestorObsequios):
+        """Candidatas armadas recorriendo _pasillos en cada reposición."""
+
+        def crear_nuevo_obsequio(self, valor: int = 10):
+            posiciones_validas = [
+                p
+                for p in self.laberinto._pasillos
+                if p not in self.laberinto._obsequios
+                and p != self.laberinto.jugador_inicio
+                and p != self.laberinto.computadora_inicio
+            ]
+            if posiciones_validas:
+                posicion = self.generador.choice(posiciones_validas)
+                self.laberinto._obsequios[posicion] = Obsequio(posicion, valor)
+                self._programar_vencimiento(posicion)
+
+    def _reponer(gestor):
+        def paso():
+            posicion = next(iter(gestor.laberinto._obsequios))
+            gestor.verificar_recoleccion(posicion)
+
+        return paso
+
+    resultados = []
+    for lado in (20, 60, 150):
+        datos = {
+            "mapa": [[0] * lado for _ in range(lado)],
+            "obsequios": [{"posicion": [i, 0], "valor": 10} for i in range(10)],
+        }
+        recorrido = GestorRecorrido(Laberinto(datos), frames * 2, random.Random(0))
+        gestor = GestorObsequios(Laberinto(datos), frames * 2, random.Random(0))
+        recorrer_ms = _cronometrar(_reponer(recorrido), frames)
+        indice_ms = _cronometrar(_reponer(gestor), frames)
+        resultados.append(
+            {
+                "celdas": lado * lado,
+                "recorrer_us": recorrer_ms * 1000,
+                "indice_us": indice_ms * 1000,
+                "aceleracion": recorrer_ms / indice_ms if indice_ms > 0 else 0.0,
+            }
+        )
+    return resultados
+
+
+def benchmark_recursos(frames: int = 200) -> list[dict]:
+    """
+    Compara cargar y escalar la imagen de cada personaje nuevo contra la caché compartida.
+
+    Cada iteración crea un jugador y un minotauro y pide sus imágenes, como al
+    empezar una partida.
+
+    Args:
+        frames: Pares de personajes a crear
+
+    Returns:
+        Lista con un resultado {'sin_cache_ms', 'con_cache_ms', 'aceleracion', ...}
+    """
+    from personajes.computadora import Computadora
+    from personajes.jugador import Jugador
+    from servicios.gestor_recursos import GestorRecursos
+
+    _inicializar_pygame()
+    recursos = GestorRecursos()
+    recursos.limpiar()
+
+    def sin_cache():
+        for ruta, tamaño in (
+            ("src/assets/imagenes/teseo.png", (50, 50)),
+            ("src/assets/imagenes/minotauro.png", (44, 44)),
+        ):
+            imagen = pygame.image.load(ruta).convert_alpha()
+            pygame.transform.scale(imagen, tamaño)
+
+    def con_cache():
+        _ = Jugador(0, 0, 10).imagen
+        _ = Computadora(0, 0, 10).imagen
+
+    sin_cache_ms = _cronometrar(sin_cache, frames)
+    con_cache_ms = _cronometrar(con_cache, frames)
+    estadisticas = recursos.estadisticas()
+    return [
+        {
+            "sin_cache_ms": sin_cache_ms,
+            "con_cache_ms": con_cache_ms,
+            "aceleracion": sin_cache_ms / con_cache_ms if con_cache_ms else 0.0,
+            "aciertos": estadisticas["aciertos"],
+            "fallos": estadisticas["fallos"],
+            "kb": estadisticas["bytes"] / 1024,
+        }
+    ]
+
+
+def benchmark_sprites(frames: int = 2000) -> list[dict]:
+    """
+    Compara espejar el frame de un sprite en cada frame contra los frames espejados precalculados.
+
+    Usa una hoja sintética de 16 frames de 64x96 (como la de Theseus) y
+    actores mirando a la izquierda.
+
+    Args:
+        frames: Frames a simular por cantidad de actores
+
+    Returns:
+        Lista de resultados {'actores', 'flip_us', 'precalculado_us', 'aceleracion'}
+    """
+    import tempfile
+
+    from personajes.sprite_animado import SpriteAnimado
+
+    _inicializar_pygame()
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "hoja.png")
+        pygame.image.save(pygame.Surface((16 * 64, 96), pygame.SRCALPHA), ruta)
+        sprite = SpriteAnimado(ruta, frame_width=64, frame_height=96)
+    sprite.set_direccion(False)
+
+    def con_flip():
+        frame = sprite.animaciones[sprite.animacion_actual]["frames"][sprite.frame_actual]
+        return pygame.transform.flip(frame, True, False)
+
+    resultados = []
+    for actores in (1, 10, 50):
+
+        def espejar_cada_frame(actores=actores):
+            for _ in range(actores):
+                con_flip()
+
+        def precalculado(actores=actores):
+            for _ in range(actores):
+                sprite.obtener_frame_actual()
+
+        flip_ms = _cronometrar(espejar_cada_frame, frames)
+        precalculado_ms = _cronometrar(precalculado, frames)
+        resultados.append(
+            {
+                "actores": actores,
+                "flip_us": flip_ms * 1000,
+                "precalculado_us": precalculado_ms * 1000,
+                "aceleracion": flip_ms / precalculado_ms if precalculado_ms else 0.0,
+            }
+        )
+    return resultados
+
+
+def benchmark_contadores(frames: int = 2000) -> list[dict]:
+    """
+    Compara rasterizar el puntaje y el reloj del HUD en cada frame contra el atlas de glifos.
+
+    El puntaje cambia en cada frame (como al moverse por celdas, que suma un
+    punto por celda), así que la caché de textos no sirve: cada valor es nuevo.
+
+    Args:
+        frames: Frames a simular
+
+    Returns:
+        Lista con un resultado {'render_us', 'atlas_us', 'aceleracion'}
+    """
+    from interfaz.gestor_fuentes import GestorFuentes
+
+    screen = _inicializar_pygame()
+    fuentes = GestorFuentes()
+    fuente = fuentes.hud_pequeño
+    atlas_puntaje = fuentes.atlas(fuente, (255, 220, 60))
+    atlas_tiempo = fuentes.atlas(fuente, (139, 69, 19))
+    contador = [0]
+
+    def con_render():
+        contador[0] += 1
+        screen.blit(fuente.render(f"{contador[0]:06d}", False, (255, 220, 60)), (0, 0))
+        minutos, segundos = divmod(contador[0] // 60, 60)
+        tiempo = fuente.render(f"{minutos:02d}:{segundos:02d}", False, (139, 69, 19))
+        screen.blit(tiempo, (200, 0))
+
+    def con_atlas():
+        contador[0] += 1
+        atlas_puntaje.dibujar(screen, f"{contador[0]:06d}", (0, 0))
+        minutos, segundos = divmod(contador[0] // 60, 60)
+        atlas_tiempo.dibujar(screen, f"{minutos:02d}:{segundos:02d}", (200, 0))
+
+    render_ms = _cronometrar(con_render, frames)
+    atlas_ms = _cronometrar(con_atlas, frames)
+    return [
+        {
+            "render_us": render_ms * 1000,
+            "atlas_us": atlas_ms * 1000,
+            "aceleracion": render_ms / atlas_ms if atlas_ms else 0.0,
+        }
+    ]
+
+
+def benchmark_hud(frames: int = 1000) -> list[dict]:
+    """
+    Compara reconstruir el HUD completo en cada frame contra la capa retenida.
+
+    En ambos casos el puntaje cambia en cada frame (un punto por celda); la
+    referencia descarta la capa antes de dibujar, como si no existiera.
+
+    Args:
+        frames: Frames a simular
+
+    Returns:
+        Lista con un resultado {'completo_us', 'retenido_us', 'aceleracion'}
+    """
+    from interfaz.gestor_fuentes import GestorFuentes
+    from interfaz.pantallas.pantalla_juego import PantallaJuego
+
+    screen = _inicializar_pygame()
+    pantalla = PantallaJuego("Benchmark", ruta_laberinto=LABERINTOS_INCLUIDOS[0])
+    pantalla.screen = screen
+    pantalla.fuente_pequena = GestorFuentes().hud_pequeño
+
+    def completo():
+        pantalla.jugador.sumar_puntos(1)
+        pantalla._capa_hud = None
+        PantallaJuego._horneadas.pop("fondo_hud", None)
+        pantalla._dibujar_hud()
+
+    def retenido():
+        pantalla.jugador.sumar_puntos(1)
+        pantalla._dibujar_hud()
+
+    completo_ms = _cronometrar(completo, frames)
+    retenido_ms = _cronometrar(retenido, frames)
+    return [
+        {
+            "completo_us": completo_ms * 1000,
+            "retenido_us": retenido_ms * 1000,
+            "aceleracion": completo_ms / retenido_ms if retenido_ms else 0.0,
+        }
+    ]
+
+
+def benchmark_overlays(frames: int = 300) -> list[dict]:
+    """
+    Compara componer los overlays en cada frame contra reutilizarlos.
+
+    La referencia descarta el overlay antes de dibujar, como si se armara
+    de cero en cada frame (velo, caja y textos).
+
+    Args:
+        frames: Frames a simular por overlay
+
+    Returns:
+        Lista de resultados {'overlay', 'compuesto_us', 'reutilizado_us', 'aceleracion'}
+    """
+    from interfaz.gestor_fuentes import GestorFuentes
+    from interfaz.pantallas.pantalla_juego import PantallaJuego
+
+    screen = _inicializar_pygame()
+    pantalla = PantallaJuego("Benchmark", ruta_laberinto=LABERINTOS_INCLUIDOS[0])
+    pantalla.screen = screen
+    fuentes = GestorFuentes()
+    pantalla.fuente_titulo = fuentes.hud_titulo
+    pantalla.fuente_hud = fuentes.hud_normal
+    pantalla.fuente_pequena = fuentes.hud_pequeño
+    pantalla.game_over_timer = 180
+
+    dibujos = {
+        "pausa": pantalla._dibujar_pausa,
+        "confirmacion_salida": pantalla._dibujar_menu_confirmacion_salida,
+        "game_over": pantalla._dibujar_game_over,
+    }
+    resultados = []
+    for nombre, dibujar in dibujos.items():
+
+        def compuesto(nombre=nombre, dibujar=dibujar):
+            PantallaJuego._horneadas.pop(nombre, None)
+            dibujar()
+
+        compuesto_ms = _cronometrar(compuesto, frames)
+        reutilizado_ms = _cronometrar(dibujar, frames)
+        resultados.append(
+            {
+                "overlay": nombre,
+                "compuesto_us": compuesto_ms * 1000,
+                "reutilizado_us": reutilizado_ms * 1000,
+                "aceleracion": compuesto_ms / reutilizado_ms if reutilizado_ms else 0.0,
+            }
+        )
+    return resultados
+
+
+def benchmark_presentacion(frames: int = 600) -> list[dict]:
+    """
+    Compara presentar la ventana entera en cada frame contra rectángulos sucios.
+
+    Ambas pasadas juegan la misma partida (misma semilla y entradas) y solo
+    se cronometra el dibujo y la presentación; el área presentada se mide
+    como fracción de la ventana.
+
+    Args:
+        frames: Frames a jugar por laberinto y modo
+
+    Returns:
+        Lista de resultados {'laberinto', 'completo_us', 'sucios_us',
+        'area_sucia', 'parciales', 'aceleracion'}
+    """
+    from config.config import ConfigJuego
+    from interfaz.gestor_fuentes import GestorFuentes
+    from interfaz.pantallas.pantalla_juego import PantallaJuego
+
+    screen = _inicializar_pygame()
+    fuentes = GestorFuentes()
+    ventana = screen.get_width() * screen.get_height()
+    direcciones = ["right", "down", "left", "up"]
+    actualizar_original = pygame.display.update
+    presentado = [0]
+
+    def actualizar(rects):
+        presentado[0] += sum(rect.width * rect.height for rect in rects)
+        actualizar_original(rects)
+
+    def jugar(ruta, sucios):
+        ConfigJuego.RECTANGULOS_SUCIOS = sucios
+        pantalla = PantallaJuego("Benchmark", ruta_laberinto=ruta, semilla=1)
+        pantalla.screen = screen
+        pantalla.fuente_titulo = fuentes.hud_titulo
+        pantalla.fuente_hud = fuentes.hud_normal
+        pantalla.fuente_pequena = fuentes.hud_pequeño
+        total = 0.0
+        for frame in range(frames):
+            pantalla.simulacion.step(direcciones[(frame // 30) % 4])
+            inicio = time.perf_counter()
+            pantalla._renderizar()
+            total += time.perf_counter() - inicio
+        return total * 1000 / frames, pantalla
+
+    resultados = []
+    original = ConfigJuego.RECTANGULOS_SUCIOS
+    pygame.display.update = actualizar
+    try:
+        for ruta in LABERINTOS_INCLUIDOS:
+            completo_ms, _ = jugar(ruta, False)
+            presentado[0] = 0
+            sucios_ms, pantalla = jugar(ruta, True)
+            area = presentado[0] + pantalla.presentaciones_completas * ventana
+            resultados.append(
+                {
+                    "laberinto": os.path.basename(ruta),
+                    "completo_us": completo_ms * 1000,
+                    "sucios_us": sucios_ms * 1000,
+                    "area_sucia": area / (ventana * frames),
+                    "parciales": pantalla.presentaciones_parciales,
+                    "aceleracion": completo_ms / sucios_ms if sucios_ms else 0.0,
+                }
+            )
+    finally:
+        pygame.display.update = actualizar_original
+        ConfigJuego.RECTANGULOS_SUCIOS = original
+    return resultados
+
+
+def benchmark_cola(frames: int = 300) -> list[dict]:
+    """
+    Compara un blit por entidad contra la cola de dibujo por capas.
+
+    Se dibujan N sprites repartidos en dos capas (obsequios y actores),
+    como en la partida: la referencia llama a blit por cada uno; la cola
+    los agrega y los envía con un Surface.blits por capa.
+
+    Args:
+        frames: Frames a simular por cantidad de entidades
+
+    Returns:
+        Lista de resultados {'entidades', 'blits_us', 'cola_us', 'lotes_por_frame',
+        'aceleracion'}
+    """
+    from interfaz.cola_render import CAPA_ACTORES, CAPA_OBSEQUIOS, ColaRender
+    from mundo.laberinto import Laberinto
+
+    screen = _inicializar_pygame()
+    obsequio = Laberinto.obtener_frames_obsequio()[0]
+    actor = pygame.Surface((50, 50), pygame.SRCALPHA).convert_alpha()
+    actor.fill((200, 50, 50, 255))
+
+    resultados = []
+    for entidades in (10, 100, 1000):
+        posiciones = [((i * 37) % 1150, 100 + (i * 53) % 650) for i in range(entidades)]
+        obsequios = [(obsequio, pos) for pos in posiciones[::2]]
+        actores = posiciones[1::2]
+
+        def individual(obsequios=obsequios, actores=actores):
+            for superficie, pos in obsequios:
+                screen.blit(superficie, pos)
+            for pos in actores:
+                screen.blit(actor, pos)
+
+        cola = ColaRender()
+
+        def encolado(cola=cola, obsequios=obsequios, actores=actores):
+            cola.agregar_varios(CAPA_OBSEQUIOS, obsequios)
+            for pos in actores:
+                cola.agregar(CAPA_ACTORES, actor, pos)
+            cola.vaciar(screen)
+
+        blits_ms = _cronometrar(individual, frames)
+        cola_ms = _cronometrar(encolado, frames)
+        resultados.append(
+            {
+                "entidades": entidades,
+                "blits_us": blits_ms * 1000,
+                "cola_us": cola_ms * 1000,
+                "lotes_por_frame": cola.lotes / cola.frames,
+                "aceleracion": blits_ms / cola_ms if cola_ms else 0.0,
+            }
+        )
+    return resultados
+
+
+def _imprimir_tabla(resultados: list[dict]) -> None:
+    """Imprime una lista de resultados como tabla alineada."""
+    if not resultados:
+        return
+    columnas = list(resultados[0].keys())
+    print("  ".join(f"{c:>16}" for c in columnas))
+    for fila in resultados:
+        valores = []
+        for c in columnas:
+            v = fila[c]
+            valores.append(f"{v:>16.3f}" if isinstance(v, float) else f"{v!s:>16}")
+        print("  ".join(valores))
+
+
+BENCHMARKS = {
+    "fondo": benchmark_fondo,
+    "obsequios": benchmark_obsequios,
+    "rutas": benchmark_rutas,
+    "enemigos": benchmark_enemigos,
+    "incremental": benchmark_incremental,
+    "uniones": benchmark_uniones,
+    "hpa": benchmark_hpa,
+    "estrategias": benchmark_estrategias,
+    "colisiones": benchmark_colisiones,
+    "simulacion": benchmark_simulacion,
+    "timers": benchmark_timers,
+    "reposicion": benchmark_reposicion,
+    "recursos": benchmark_recursos,
+    "sprites": benchmark_sprites,
+    "contadores": benchmark_contadores,
+    "hud": benchmark_hud,
+    "overlays": benchmark_overlays,
+    "presentacion": benchmark_presentacion,
+    "cola": benchmark_cola,
+}
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Benchmarks de Theseus Runner")
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS))
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args(argv)
+
+    _imprimir_tabla(BENCHMARKS[args.benchmark](frames=args.frames))
+
+
+if __name__ == "__main__":
+    main()
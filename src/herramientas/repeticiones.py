@@ -0,0 +1,93 @@
+"""
+Herramienta para verificar y ver partidas grabadas.
+
+Las partidas se graban con ConfigJuego.GRABAR_PARTIDAS = True (se guardan en
+ConfigJuego.CARPETA_GRABACIONES). La verificación las vuelve a simular lo más
+rápido posible, sin ventana, y compara la huella de cada keyframe; la vista
+las reproduce en tiempo real (←/→ saltan entre keyframes).
+
+Uso (desde la raíz del proyecto):
+    python src/herramientas/repeticiones.py verificar src/data/grabaciones/partida.json
+    python src/herramientas/repeticiones.py ver src/data/grabaciones/partida.json --desde 30
+    python src/herramientas/repeticiones.py info src/data/grabaciones/partida.json
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Permitir ejecutar el script directamente (igual que benchmark.py)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.config import ConfigJuego
+from jugabilidad.repeticion import Repeticion, ReproductorRepeticion
+
+
+def verificar(repeticion: Repeticion) -> bool:
+    """Reproduce sin dibujar y reporta si todos los keyframes coinciden."""
+    reproductor = ReproductorRepeticion(repeticion)
+    inicio = time.perf_counter()
+    divergencia = reproductor.verificar()
+    segundos = time.perf_counter() - inicio
+
+    print(
+        f"{reproductor.frame} frames en {segundos:.2f} s "
+        f"({reproductor.frame / segundos if segundos > 0 else 0:.0f} frames/s)"
+    )
+    if divergencia is not None:
+        print(f"DIVERGE en el frame {divergencia} de {reproductor.total_frames}")
+        return False
+    print(f"OK: {len(repeticion.keyframes)} keyframes idénticos")
+    return True
+
+
+def ver(repeticion: Repeticion, desde_segundos: int = 0) -> None:
+    """Abre una ventana y reproduce la partida en tiempo real."""
+    import pygame
+
+    from interfaz.pantallas.pantalla_juego import PantallaJuego
+
+    pygame.init()
+    pygame.display.set_mode((1200, 800))
+    pantalla = PantallaJuego("Repetición", repeticion=repeticion)
+    if desde_segundos:
+        pantalla.ir_a_frame(ConfigJuego.segundos_a_frames(desde_segundos))
+    pantalla.ejecutar()
+    pygame.quit()
+
+
+def info(repeticion: Repeticion) -> None:
+    """Imprime los datos de la grabación."""
+    print(f"laberinto:  {repeticion.laberinto.get('nombre', '?')}")
+    print(f"semilla:    {repeticion.semilla}")
+    print(f"navegacion: {repeticion.navegacion}")
+    print(f"geometria:  {repeticion.geometria}")
+    print(
+        f"frames:     {repeticion.frames} "
+        f"({ConfigJuego.frames_a_segundos(repeticion.frames)} s, "
+        f"{len(repeticion.tramos)} tramos, {len(repeticion.keyframes)} keyframes)"
+    )
+    for nombre, valor in repeticion.parametros.items():
+        print(f"  {nombre} = {valor}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Repeticiones de Theseus Runner")
+    parser.add_argument("accion", choices=["verificar", "ver", "info"])
+    parser.add_argument("archivo")
+    parser.add_argument("--desde", type=int, default=0, help="Segundo inicial (ver)")
+    args = parser.parse_args(argv)
+
+    repeticion = Repeticion.cargar(args.archivo)
+    if args.accion == "verificar":
+        sys.exit(0 if verificar(repeticion) else 1)
+    elif args.accion == "ver":
+        ver(repeticion, args.desde)
+    else:
+        info(repeticion)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,363 @@
+"""
+Simulador de partidas en lote para ajustar la dificultad.
+
+Juega miles de partidas sin ventana (SimulacionJuego) repartidas en un pool
+de procesos, con jugadores automáticos ("políticas") sobre todos los
+laberintos de src/data/laberintos. Cada partida terminada se escribe como una
+línea JSON en cuanto vuelve del worker, y al final se imprime un resumen por
+laberinto y política: supervivencia, distribución de puntajes y capturas por
+minuto.
+
+Los valores de ConfigJuego se pueden sobrescribir para comparar ajustes sin
+tocar el código (se aplican en cada worker antes de jugar).
+
+Uso (desde la raíz del proyecto):
+    python src/herramientas/simulador_lotes.py --partidas 200
+    python src/herramientas/simulador_lotes.py --politicas huida obsequios --procesos 8
+    python src/herramientas/simulador_lotes.py --config VELOCIDAD_INICIAL_ENEMIGO=2.0 \\
+        --config SEGUNDOS_VIDA_OBSEQUIO=6 --salida resultados.jsonl
+"""
+
+import argparse
+import ast
+import glob
+import json
+import os
+import random
+import sys
+import time
+from collections import deque
+from multiprocessing import Pool
+
+# Permitir ejecutar el script directamente (igual que benchmark.py)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.config import ConfigJuego
+from jugabilidad.simulacion import SimulacionJuego
+
+CARPETA_LABERINTOS = "src/data/laberintos"
+
+# Desplazamiento (col, fila) de cada dirección de entrada
+DELTAS_ENTRADA: dict[str, tuple[int, int]] = {
+    "up": (0, -1),
+    "down": (0, 1),
+    "left": (-1, 0),
+    "right": (1, 0),
+}
+
+
+def _distancias(laberinto, origenes: list[tuple[int, int]]) -> dict[tuple[int, int], int]:
+    """BFS desde varias celdas (col, fila) a la vez: distancia al origen más cercano."""
+    distancias = {celda: 0 for celda in origenes if laberinto.es_transitable(celda)}
+    cola = deque(distancias)
+    while cola:
+        col, fila = cola.popleft()
+        siguiente = distancias[(col, fila)] + 1
+        for dc, df in DELTAS_ENTRADA.values():
+            vecino = (col + dc, fila + df)
+            if vecino not in distancias and laberinto.es_transitable(vecino):
+                distancias[vecino] = siguiente
+                cola.append(vecino)
+    return distancias
+
+
+class Politica:
+    """
+    Jugador automático: elige una dirección cuando el jugador puede moverse.
+
+    Las subclases definen 'nombre' y _decidir(). Cada partida crea su propia
+    instancia con un generador aleatorio sembrado, así las partidas son
+    independientes del orden en que las ejecuten los workers.
+    """
+
+    nombre = ""
+
+    def __init__(self, generador: random.Random):
+        self.generador = generador
+
+    def decidir(self, simulacion: SimulacionJuego) -> str | None:
+        """Dirección para este frame, o None mientras el jugador no puede moverse."""
+        gestor = simulacion.gestor_movimiento
+        if gestor.interpolando or gestor.cooldown_actual > 0:
+            return None
+        return self._decidir(simulacion)
+
+    def _decidir(self, simulacion: SimulacionJuego) -> str | None:
+        raise NotImplementedError
+
+    def _direcciones_libres(self, simulacion: SimulacionJuego) -> list[str]:
+        """Direcciones que llevan a una celda transitable desde la del jugador."""
+        col, fila = simulacion.celda_jugador()
+        return [
+            direccion
+            for direccion, (dc, df) in DELTAS_ENTRADA.items()
+            if simulacion.laberinto.es_transitable((col + dc, fila + df))
+        ]
+
+
+class PoliticaQuieto(Politica):
+    """No se mueve: mide cuánto tardan los minotauros en llegar."""
+
+    nombre = "quieto"
+
+    def _decidir(self, simulacion):
+        return None
+
+
+class PoliticaAzar(Politica):
+    """Camina al azar por los pasillos."""
+
+    nombre = "azar"
+
+    def _decidir(self, simulacion):
+        libres = self._direcciones_libres(simulacion)
+        return self.generador.choice(libres) if libres else None
+
+
+class PoliticaHuida(Politica):
+    """Se aleja del minotauro más cercano (distancia por pasillos)."""
+
+    nombre = "huida"
+
+    def _decidir(self, simulacion):
+        return self._huir(simulacion, self._distancias_enemigos(simulacion))
+
+    def _distancias_enemigos(self, simulacion) -> dict[tuple[int, int], int]:
+        return _distancias(
+            simulacion.laberinto,
+            [simulacion.celda_computadora(c) for c in simulacion.computadoras],
+        )
+
+    def _huir(self, simulacion, distancias) -> str | None:
+        col, fila = simulacion.celda_jugador()
+        mejor, mejor_distancia = None, distancias.get((col, fila), 0)
+        direcciones = self._direcciones_libres(simulacion)
+        self.generador.shuffle(direcciones)  # Desempate sin sesgo de orden
+        for direccion in direcciones:
+            dc, df = DELTAS_ENTRADA[direccion]
+            distancia = distancias.get((col + dc, fila + df), 0)
+            if distancia > mejor_distancia:
+                mejor, mejor_distancia = direccion, distancia
+        return mejor
+
+
+class PoliticaObsequios(PoliticaHuida):
+    """Va al obsequio más cercano, salvo que un minotauro esté cerca: entonces huye."""
+
+    nombre = "obsequios"
+    DISTANCIA_PELIGRO = 3  # Celdas
+
+    def _decidir(self, simulacion):
+        distancias = self._distancias_enemigos(simulacion)
+        actual = simulacion.celda_jugador()
+        if distancias.get(actual, self.DISTANCIA_PELIGRO + 1) <= self.DISTANCIA_PELIGRO:
+            return self._huir(simulacion, distancias)
+
+        obsequios = list(simulacion.laberinto._obsequios)
+        if not obsequios:
+            return None
+        # BFS desde los obsequios: bajar por el gradiente lleva al más cercano
+        hacia_obsequio = _distancias(simulacion.laberinto, obsequios)
+        col, fila = actual
+        mejor, mejor_distancia = None, hacia_obsequio.get(actual)
+        for direccion in self._direcciones_libres(simulacion):
+            dc, df = DELTAS_ENTRADA[direccion]
+            distancia = hacia_obsequio.get((col + dc, fila + df))
+            if distancia is not None and (
+                mejor_distancia is None or distancia < mejor_distancia
+            ):
+                mejor, mejor_distancia = direccion, distancia
+        return mejor
+
+
+POLITICAS: dict[str, type[Politica]] = {
+    politica.nombre: politica
+    for politica in (PoliticaQuieto, PoliticaAzar, PoliticaHuida, PoliticaObsequios)
+}
+
+
+def listar_laberintos(carpeta: str = CARPETA_LABERINTOS) -> list[str]:
+    """Rutas de todos los laberintos JSON de la carpeta, ordenadas."""
+    return sorted(glob.glob(os.path.join(carpeta, "*.json")))
+
+
+def aplicar_config(ajustes: dict[str, object]) -> None:
+    """
+    Sobrescribe atributos de ConfigJuego (también usado como initializer del pool).
+
+    Raises:
+        ValueError: Si algún nombre no es un atributo de ConfigJuego
+    """
+    for nombre, valor in ajustes.items():
+        if not hasattr(ConfigJuego, nombre):
+            raise ValueError(f"ConfigJuego no tiene el atributo '{nombre}'")
+        setattr(ConfigJuego, nombre, valor)
+
+
+def jugar_partida(tarea: dict) -> dict:
+    """
+    Juega una partida completa sin ventana.
+
+    Args:
+        tarea: {'laberinto': ruta, 'politica': nombre, 'semilla': int,
+                'max_frames': int}
+
+    Returns:
+        Resultado de la partida (una línea del JSONL)
+    """
+    semilla = tarea["semilla"]
+    politica = POLITICAS[tarea["politica"]](random.Random(semilla))
+    simulacion = SimulacionJuego(tarea["laberinto"], semilla=semilla)
+
+    max_frames = tarea["max_frames"]
+    while not simulacion.game_over and simulacion.frame_count < max_frames:
+        simulacion.step(politica.decidir(simulacion))
+
+    segundos = simulacion.tiempo_transcurrido / ConfigJuego.FPS
+    return {
+        "laberinto": os.path.basename(tarea["laberinto"]),
+        "politica": tarea["politica"],
+        "semilla": semilla,
+        "frames": simulacion.frame_count,
+        "segundos": round(segundos, 3),
+        "game_over": simulacion.game_over,
+        "capturas": simulacion.capturas,
+        "puntaje": simulacion.jugador.puntaje,
+        "capturas_por_minuto": round(simulacion.capturas * 60 / segundos, 3)
+        if segundos > 0
+        else 0.0,
+    }
+
+
+def _percentil(valores: list[float], p: float) -> float:
+    """Percentil p (0-100) por rango más cercano; 0.0 si no hay valores."""
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    indice = max(0, min(len(ordenados) - 1, round(p / 100 * len(ordenados)) - 1))
+    return float(ordenados[indice])
+
+
+def resumir(resultados: list[dict]) -> list[dict]:
+    """
+    Agrega los resultados por laberinto y política.
+
+    Returns:
+        Lista de filas con supervivencia (segundos), puntajes y capturas por minuto
+    """
+    grupos: dict[tuple[str, str], list[dict]] = {}
+    for resultado in resultados:
+        clave = (resultado["laberinto"], resultado["politica"])
+        grupos.setdefault(clave, []).append(resultado)
+
+    filas = []
+    for (laberinto, politica), grupo in sorted(grupos.items()):
+        segundos = [r["segundos"] for r in grupo]
+        puntajes = [r["puntaje"] for r in grupo]
+        minutos = sum(segundos) / 60
+        filas.append(
+            {
+                "laberinto": laberinto,
+                "politica": politica,
+                "partidas": len(grupo),
+                "game_over_pct": 100.0 * sum(r["game_over"] for r in grupo) / len(grupo),
+                "superv_media_s": sum(segundos) / len(grupo),
+                "superv_p50_s": _percentil(segundos, 50),
+                "puntaje_p10": _percentil(puntajes, 10),
+                "puntaje_p50": _percentil(puntajes, 50),
+                "puntaje_p90": _percentil(puntajes, 90),
+                "capturas_min": sum(r["capturas"] for r in grupo) / minutos
+                if minutos > 0
+                else 0.0,
+            }
+        )
+    return filas
+
+
+def _parsear_ajuste(texto: str) -> tuple[str, object]:
+    """Convierte 'NOMBRE=valor' en (NOMBRE, valor) con el tipo literal de Python."""
+    nombre, separador, valor = texto.partition("=")
+    if not separador or not nombre:
+        raise argparse.ArgumentTypeError(f"se esperaba NOMBRE=valor, no '{texto}'")
+    try:
+        return nombre.strip(), ast.literal_eval(valor.strip())
+    except (ValueError, SyntaxError):
+        raise argparse.ArgumentTypeError(
+            f"valor inválido para {nombre}: '{valor}'"
+        ) from None
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Punto de entrada de línea de comandos."""
+    from herramientas.benchmark import _imprimir_tabla
+
+    parser = argparse.ArgumentParser(description="Simulador de partidas en lote")
+    parser.add_argument(
+        "--partidas", type=int, default=100, help="Partidas por laberinto y política"
+    )
+    parser.add_argument(
+        "--politicas", nargs="+", choices=sorted(POLITICAS), default=sorted(POLITICAS)
+    )
+    parser.add_argument("--laberintos", nargs="+", default=None)
+    parser.add_argument("--procesos", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--max-segundos", type=int, default=300, help="Corte por partida (tiempo de juego)"
+    )
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--salida", default="simulacion_lotes.jsonl")
+    parser.add_argument(
+        "--config",
+        type=_parsear_ajuste,
+        action="append",
+        default=[],
+        metavar="NOMBRE=valor",
+        help="Sobrescribe un valor de ConfigJuego (repetible)",
+    )
+    args = parser.parse_args(argv)
+
+    ajustes = dict(args.config)
+    try:
+        aplicar_config(ajustes)  # Valida los nombres antes de lanzar el pool
+    except ValueError as e:
+        parser.error(str(e))
+
+    laberintos = args.laberintos or listar_laberintos()
+    max_frames = ConfigJuego.segundos_a_frames(args.max_segundos)
+    # Intercaladas para que los primeros resultados ya cubran todas las combinaciones
+    tareas = [
+        {
+            "laberinto": laberinto,
+            "politica": politica,
+            "semilla": args.semilla + numero,
+            "max_frames": max_frames,
+        }
+        for numero in range(args.partidas)
+        for laberinto in laberintos
+        for politica in args.politicas
+    ]
+    # Lotes chicos: poco overhead de IPC sin que un worker acapare el final
+    tam_lote = max(1, len(tareas) // (args.procesos * 16))
+
+    resultados = []
+    inicio = time.perf_counter()
+    with open(args.salida, "w", encoding="utf-8") as salida, Pool(
+        args.procesos, initializer=aplicar_config, initargs=(ajustes,)
+    ) as pool:
+        for resultado in pool.imap_unordered(jugar_partida, tareas, tam_lote):
+            if ajustes:
+                resultado["config"] = ajustes
+            salida.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+            salida.flush()
+            resultados.append(resultado)
+    segundos = time.perf_counter() - inicio
+
+    _imprimir_tabla(resumir(resultados))
+    print(
+        f"\n{len(resultados)} partidas en {segundos:.1f} s "
+        f"({len(resultados) / segundos:.1f} partidas/s, {args.procesos} procesos) "
+        f"-> {args.salida}"
+    )
+
+
+if __name__ == "__main__":
+    main()
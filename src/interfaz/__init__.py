@@ -2,9 +2,23 @@
 Módulo de interfaz de usuario.
 
 Contiene todas las pantallas, componentes y elementos visuales del juego.
-Incluye el gestor centralizado de fuentes.
+Incluye el gestor centralizado de fuentes, los atlas de glifos, la cola de
+dibujo por capas, la espera de eventos de los menús y el gestor de escenas
+(el loop principal).
 """
 
+from .atlas_glifos import AtlasGlifos
+from .cola_render import ColaRender
+from .escenas import CONTINUAR, Escena, GestorEscenas
+from .espera_eventos import EsperaEventos
 from .gestor_fuentes import GestorFuentes
 
-__all__ = ["GestorFuentes"]
+__all__ = [
+    "AtlasGlifos",
+    "CONTINUAR",
+    "ColaRender",
+    "Escena",
+    "EsperaEventos",
+    "GestorEscenas",
+    "GestorFuentes",
+]
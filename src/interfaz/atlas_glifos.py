@@ -0,0 +1,97 @@
+"""
+Atlas de glifos para textos que cambian en cada frame.
+
+El puntaje y el reloj del HUD cambian casi todos los frames, así que la caché
+de textos de GestorFuentes no los aprovecha: cada valor nuevo pasaría por el
+rasterizador TTF. El atlas rasteriza una vez cada carácter de una fuente (de
+un tamaño y color) en una sola superficie, y arma las cadenas blitteando los
+recortes de cada glifo con Surface.blits, sin crear superficies nuevas.
+
+Pensado para Press Start 2P (monoespaciada y sin kerning), donde componer
+glifo por glifo da el mismo resultado que renderizar la cadena completa
+(salvo ligaduras como "fi": el atlas es para números y textos cortos).
+"""
+
+import string
+
+import pygame
+
+# Dígitos, ASCII imprimible y las letras acentuadas que usa la interfaz
+CARACTERES_ATLAS = string.printable[:95] + "áéíóúÁÉÍÓÚñÑüÜ¡¿×"
+
+
+class AtlasGlifos:
+    """
+    Glifos pre-rasterizados de una fuente en una sola superficie.
+
+    Los caracteres que no estén en el atlas se rasterizan la primera vez que
+    aparecen y se guardan aparte, así que tampoco se repiten.
+    """
+
+    def __init__(self, fuente, color, antialias=False, caracteres=CARACTERES_ATLAS):
+        """
+        Args:
+            fuente: Objeto Font (define tamaño y estilo)
+            color: Color de los glifos
+            antialias: Si usar antialiasing (False = estilo pixel)
+            caracteres: Caracteres a incluir en el atlas
+        """
+        self.fuente = fuente
+        self.color = tuple(color)
+        self.antialias = antialias
+
+        # {carácter: (superficie, recorte, avance)}
+        self._glifos: dict[str, tuple[pygame.Surface, pygame.Rect, int]] = {}
+
+        # Todos los glifos se rasterizan en una sola línea, separados por un
+        # espacio (sin ligaduras entre vecinos), así comparten la línea base
+        caracteres = "".join(dict.fromkeys(caracteres))  # Sin repetidos
+        linea = " ".join(caracteres)
+        self.superficie = fuente.render(linea, antialias, self.color)
+        try:
+            self.superficie = self.superficie.convert_alpha()  # Blit más rápido
+        except pygame.error:
+            pass  # Sin ventana todavía: se usa tal cual
+        self.alto = self.superficie.get_height()
+
+        for indice, caracter in enumerate(caracteres):
+            x = fuente.size(linea[: 2 * indice])[0]
+            avance = fuente.size(caracter)[0]
+            recorte = pygame.Rect(x, 0, avance, self.alto)
+            self._glifos[caracter] = (self.superficie, recorte, avance)
+
+    def _glifo(self, caracter: str) -> tuple[pygame.Surface, pygame.Rect, int]:
+        """Glifo de un carácter, rasterizándolo aparte si no estaba en el atlas."""
+        # Los agregados tarde se rasterizan solos: su línea base puede diferir
+        glifo = self._glifos.get(caracter)
+        if glifo is None:
+            render = self.fuente.render(caracter, self.antialias, self.color)
+            glifo = (render, render.get_rect(), render.get_width())
+            self._glifos[caracter] = glifo
+        return glifo
+
+    def tamaño(self, texto: str) -> tuple[int, int]:
+        """(ancho, alto) que ocupa el texto, sin dibujarlo."""
+        return sum(self._glifo(c)[2] for c in texto), self.alto
+
+    def dibujar(self, destino: pygame.Surface, texto: str, posicion) -> pygame.Rect:
+        """
+        Dibuja el texto con su esquina superior izquierda en 'posicion'.
+
+        Args:
+            destino: Superficie donde dibujar
+            texto: Texto a dibujar
+            posicion: (x, y) de la esquina superior izquierda
+
+        Returns:
+            pygame.Rect ocupado por el texto
+        """
+        x, y = posicion
+        inicio = x
+        secuencia = []
+        for caracter in texto:
+            superficie, recorte, avance = self._glifo(caracter)
+            secuencia.append((superficie, (x, y), recorte))
+            x += avance
+        destino.blits(secuencia, doreturn=False)
+        return pygame.Rect(inicio, y, x - inicio, self.alto)
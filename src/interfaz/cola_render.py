@@ -0,0 +1,130 @@
+"""
+Cola de dibujo por capas para un frame.
+
+En lugar de que obsequios, actores y HUD llamen a blit cada uno por su lado,
+agregan sus dibujos a una ColaRender y la pantalla la vacía una vez por
+frame: las capas se dibujan en orden y los blits consecutivos de cada capa
+salen en un solo Surface.blits, así el costo en llamadas de Python no crece
+con la cantidad de entidades. Lo que no es un blit (polígonos, círculos de
+respaldo) se agrega como una función que dibuja, respetando su lugar.
+"""
+
+import pygame
+
+# Capas de la partida, de abajo hacia arriba
+CAPA_OBSEQUIOS = 0
+CAPA_ACTORES = 1
+CAPA_HUD = 2  # Franjas de la capa retenida del HUD
+CAPA_HUD_ANIMADO = 3  # Lo del HUD que cambia en cada frame (la estrella)
+
+NOMBRES_CAPAS = {
+    CAPA_OBSEQUIOS: "obsequios",
+    CAPA_ACTORES: "actores",
+    CAPA_HUD: "hud",
+    CAPA_HUD_ANIMADO: "hud_animado",
+}
+
+
+class ColaRender:
+    """
+    Dibujos pendientes del frame, agrupados por capa.
+
+    Uso:
+        cola.agregar(CAPA_ACTORES, imagen, rect)
+        cola.agregar_dibujo(CAPA_HUD_ANIMADO, dibujar_estrella)
+        rects = cola.vaciar(screen)  # {capa: [rects dibujados]}
+    """
+
+    def __init__(self):
+        # {capa: [(superficie, destino, area) o función]} en orden de llegada
+        self._capas: dict[int, list] = {}
+
+        # Contadores acumulados: dibujos por capa y llamadas a blits
+        self.dibujos: dict[int, int] = {}
+        self.lotes = 0
+        self.frames = 0
+
+    def __len__(self) -> int:
+        return sum(len(pendientes) for pendientes in self._capas.values())
+
+    def agregar(self, capa: int, superficie, destino, area=None) -> pygame.Rect:
+        """
+        Agrega un blit a la capa.
+
+        Args:
+            capa: Capa donde dibujar (las menores quedan debajo)
+            superficie: Superficie a dibujar
+            destino: (x, y) o Rect de la esquina superior izquierda
+            area: Recorte de la superficie; None = completa
+
+        Returns:
+            pygame.Rect que ocupará el dibujo (sin recortar a la ventana)
+        """
+        self._capas.setdefault(capa, []).append((superficie, destino, area))
+        tamaño = superficie.get_size() if area is None else pygame.Rect(area).size
+        return pygame.Rect(destino[0], destino[1], *tamaño)
+
+    def agregar_varios(self, capa: int, secuencia) -> None:
+        """Agrega varios blits (superficie, destino) o (superficie, destino, area)."""
+        pendientes = self._capas.setdefault(capa, [])
+        for blit in secuencia:
+            pendientes.append(blit if len(blit) == 3 else (*blit, None))
+
+    def agregar_dibujo(self, capa: int, funcion) -> None:
+        """
+        Agrega un dibujo que no es un blit.
+
+        Args:
+            capa: Capa donde dibujar
+            funcion: Recibe la superficie destino y retorna el Rect dibujado
+        """
+        self._capas.setdefault(capa, []).append(funcion)
+
+    def vaciar(self, destino: pygame.Surface) -> dict[int, list[pygame.Rect]]:
+        """
+        Dibuja todo lo pendiente, capa por capa, y deja la cola vacía.
+
+        Args:
+            destino: Superficie donde dibujar (la ventana)
+
+        Returns:
+            {capa: [pygame.Rect dibujados]}, recortados a destino
+        """
+        dibujados = {}
+        for capa in sorted(self._capas):
+            pendientes = self._capas[capa]
+            if not pendientes:
+                continue
+            rects = []
+            lote = []
+            for pendiente in pendientes:
+                if callable(pendiente):
+                    if lote:
+                        rects.extend(self._dibujar_lote(destino, lote))
+                        lote = []
+                    rects.append(pendiente(destino))
+                else:
+                    lote.append(pendiente)
+            if lote:
+                rects.extend(self._dibujar_lote(destino, lote))
+            self.dibujos[capa] = self.dibujos.get(capa, 0) + len(pendientes)
+            dibujados[capa] = rects
+            pendientes.clear()
+        self.frames += 1
+        return dibujados
+
+    def _dibujar_lote(self, destino: pygame.Surface, lote: list) -> list[pygame.Rect]:
+        """Un Surface.blits para blits consecutivos de una capa."""
+        self.lotes += 1
+        return destino.blits(lote)
+
+    def estadisticas(self) -> dict:
+        """Dibujos por capa (por nombre), lotes enviados y frames vaciados."""
+        return {
+            "dibujos": {
+                NOMBRES_CAPAS.get(capa, capa): cantidad
+                for capa, cantidad in sorted(self.dibujos.items())
+            },
+            "lotes": self.lotes,
+            "frames": self.frames,
+        }
@@ -130,12 +130,16 @@ class Boton:
 
         # Renderizar texto con sombra
         color_texto = PaletaUI.WHITE if self.habilitado else PaletaUI.GRAY
-        texto_render = self.fuente.render(self.texto, True, color_texto)
+        texto_render = GestorFuentes().renderizar(
+            self.fuente, self.texto, True, color_texto
+        )
         texto_rect = texto_render.get_rect(center=self.rect.center)
 
         # Sombra del texto (1px offset)
         if self.habilitado:
-            texto_sombra = self.fuente.render(self.texto, True, PaletaUI.DARK)
+            texto_sombra = GestorFuentes().renderizar(
+                self.fuente, self.texto, True, PaletaUI.DARK
+            )
             sombra_rect = texto_rect.copy()
             sombra_rect.x += 1
             sombra_rect.y += 1
@@ -76,7 +76,9 @@ class BotonAdaptable:
     def _calcular_dimensiones(self):
         """Calcula el ancho y alto óptimos para el texto."""
         # Renderizar el texto para obtener sus dimensiones
-        texto_surface = self.font.render(self.texto, False, self.COLOR_TEXTO)
+        texto_surface = GestorFuentes().renderizar(
+            self.font, self.texto, False, self.COLOR_TEXTO
+        )
         ancho_texto = texto_surface.get_width()
         alto_texto = texto_surface.get_height()
 
@@ -175,7 +177,9 @@ class BotonAdaptable:
             )
 
         # Dibujar texto centrado
-        texto_surface = self.font.render(self.texto, False, color_texto)
+        texto_surface = GestorFuentes().renderizar(
+            self.font, self.texto, False, color_texto
+        )
         texto_rect = texto_surface.get_rect(center=self.rect.center)
 
         # Efecto de presionado (texto se mueve un pixel)
@@ -103,8 +103,12 @@ class HUD:
         self._dibujar_icono_llave(surface, x + 8, y + 4)
 
         # Símbolo × y número
-        texto_x = self.fuente_pequena.render("×", True, PaletaUI.WHITE)
-        numero = self.fuente_grande.render(str(self.llaves), True, PaletaUI.GOLD)
+        texto_x = GestorFuentes().renderizar(
+            self.fuente_pequena, "×", True, PaletaUI.WHITE
+        )
+        numero = GestorFuentes().renderizar(
+            self.fuente_grande, str(self.llaves), True, PaletaUI.GOLD
+        )
 
         surface.blit(texto_x, (x + 30, y + 6))
         surface.blit(numero, (x + 45, y + 4))
@@ -138,11 +142,15 @@ class HUD:
         pygame.draw.rect(surface, PaletaUI.BLUE_LIGHT, panel_rect, 2)
 
         # Texto "PUNTAJE"
-        label = self.fuente_pequena.render("PUNTAJE:", True, PaletaUI.LIGHT)
+        label = GestorFuentes().renderizar(
+            self.fuente_pequena, "PUNTAJE:", True, PaletaUI.LIGHT
+        )
         surface.blit(label, (x + 10, y + 8))
 
         # Valor del puntaje
-        valor = self.fuente_grande.render(str(self.puntaje), True, PaletaUI.WHITE)
+        valor = GestorFuentes().renderizar(
+            self.fuente_grande, str(self.puntaje), True, PaletaUI.WHITE
+        )
         surface.blit(valor, (x + 90, y + 8))
 
     def _dibujar_minimapa(self, surface):
@@ -7,7 +7,8 @@ Incluye:
 
 Requisitos:
 - Llamar a pygame.init() antes de usar.
-- Usar un loop de eventos y un loop de dibujo en cada frame.
+- Usar un loop de eventos y redibujar cuando cambie su estado (ver
+  interfaz.espera_eventos).
 """
 
 import pygame  # Librería para gráficos, ventana y eventos en juegos y apps [web:21]
@@ -39,12 +40,9 @@ class InputTexto:
             placeholder  # Texto de guía cuando no hay entrada del usuario [web:42]
         )
         self.activo = False  # Indica si acepta teclado (tiene foco) [web:21]
-        self.cursor_visible = (
-            True  # Estado del cursor (se alterna para parpadear) [web:21]
-        )
-        self.cursor_timer = (
-            0  # Contador para controlar el parpadeo del cursor por frames [web:21]
-        )
+        # Momento (ms) desde el que se cuenta el parpadeo del cursor: medirlo
+        # en tiempo y no en frames permite no redibujar cuando no cambia nada
+        self.inicio_parpadeo = pygame.time.get_ticks()
 
         # Colores de estados y texto - Estilo pixel art vibrante
         self.COLOR_INACTIVO = (40, 50, 80)  # Fondo cuando no está activo [web:42]
@@ -65,6 +63,21 @@ class InputTexto:
         fuentes = GestorFuentes()
         self.font = fuentes.texto_normal  # Fuente pixel art para el input [web:21]
 
+    MS_PARPADEO_CURSOR = 500  # Medio ciclo del parpadeo del cursor
+
+    @property
+    def cursor_visible(self):
+        """True en la mitad visible del ciclo de parpadeo."""
+        transcurrido = pygame.time.get_ticks() - self.inicio_parpadeo
+        return (transcurrido // self.MS_PARPADEO_CURSOR) % 2 == 0
+
+    def ms_hasta_cambio(self):
+        """Milisegundos hasta que el cursor parpadee, o None si está inactivo."""
+        if not self.activo:
+            return None
+        transcurrido = pygame.time.get_ticks() - self.inicio_parpadeo
+        return self.MS_PARPADEO_CURSOR - transcurrido % self.MS_PARPADEO_CURSOR
+
     def manejar_evento(self, evento):
         """Procesa clicks y teclado del usuario.
 
@@ -78,8 +91,11 @@ class InputTexto:
             self.activo = self.rect.collidepoint(
                 evento.pos
             )  # Fácil de entender y mantener [web:21]
+            self.inicio_parpadeo = pygame.time.get_ticks()
 
         if evento.type == pygame.KEYDOWN and self.activo:
+            # El cursor queda visible mientras se escribe
+            self.inicio_parpadeo = pygame.time.get_ticks()
             if evento.key == pygame.K_RETURN:
                 return True  # Señal de “listo” para que el código externo lo use (ej. enviar) [web:21]
             elif evento.key == pygame.K_BACKSPACE:
@@ -109,10 +125,12 @@ class InputTexto:
 
         # Si hay texto, lo dibujamos; si no, mostramos el placeholder
         if self.texto:
-            texto_surface = self.font.render(self.texto, False, self.COLOR_TEXTO)
+            texto_surface = GestorFuentes().renderizar(
+                self.font, self.texto, False, self.COLOR_TEXTO
+            )
         else:
-            texto_surface = self.font.render(
-                self.placeholder, False, self.COLOR_PLACEHOLDER
+            texto_surface = GestorFuentes().renderizar(
+                self.font, self.placeholder, False, self.COLOR_PLACEHOLDER
             )  # Guía cuando está vacío [web:42]
 
         # Posición: centrado vertical y con un pequeño margen a la izquierda
@@ -123,19 +141,8 @@ class InputTexto:
             texto_surface, texto_rect
         )  # Dibuja el texto en la pantalla [web:21]
 
-        # Cursor que parpadea cuando está activo (controlado por frames)
+        # Cursor que parpadea cuando está activo (controlado por tiempo)
         if self.activo:
-            self.cursor_timer += (
-                1  # Incrementa cada frame para alternar visibilidad [web:21]
-            )
-            if (
-                self.cursor_timer > 30
-            ):  # Umbral del parpadeo (aprox. 0.5s a 60 FPS) [web:21]
-                self.cursor_visible = (
-                    not self.cursor_visible
-                )  # Cambia entre visible/oculto [web:21]
-                self.cursor_timer = 0  # Reinicia el contador [web:21]
-
             if self.cursor_visible:
                 cursor_x = (
                     texto_rect.right + 2
@@ -269,6 +276,8 @@ class Boton:
             )
 
         # Texto centrado (sin antialiasing para efecto pixel)
-        texto_surface = self.font.render(self.texto, False, color_texto)
+        texto_surface = GestorFuentes().renderizar(
+            self.font, self.texto, False, color_texto
+        )
         texto_rect = texto_surface.get_rect(center=self.rect.center)
         screen.blit(texto_surface, texto_rect)
@@ -43,17 +43,23 @@ class TituloArcade:
         ancho_pantalla = screen.get_width()
 
         # Sombra oscura (más alejada)
-        sombra2 = self.font.render(self.texto, False, self.COLOR_SOMBRA_1)
+        sombra2 = GestorFuentes().renderizar(
+            self.font, self.texto, False, self.COLOR_SOMBRA_1
+        )
         rect_sombra2 = sombra2.get_rect(center=(ancho_pantalla // 2 + 4, self.y + 4))
         screen.blit(sombra2, rect_sombra2)
 
         # Sombra cyan (intermedia)
-        sombra1 = self.font.render(self.texto, False, self.COLOR_SOMBRA_2)
+        sombra1 = GestorFuentes().renderizar(
+            self.font, self.texto, False, self.COLOR_SOMBRA_2
+        )
         rect_sombra1 = sombra1.get_rect(center=(ancho_pantalla // 2 + 2, self.y + 2))
         screen.blit(sombra1, rect_sombra1)
 
         # Texto principal (dorado)
-        titulo = self.font.render(self.texto, False, self.COLOR_PRINCIPAL)
+        titulo = GestorFuentes().renderizar(
+            self.font, self.texto, False, self.COLOR_PRINCIPAL
+        )
         rect_titulo = titulo.get_rect(center=(ancho_pantalla // 2, self.y))
         screen.blit(titulo, rect_titulo)
 
@@ -80,7 +86,7 @@ class SubtituloArcade:
     def dibujar(self, screen):
         """Dibuja el subtítulo centrado."""
         ancho_pantalla = screen.get_width()
-        subtitulo = self.font.render(self.texto, False, self.color)
+        subtitulo = GestorFuentes().renderizar(self.font, self.texto, False, self.color)
         rect_subtitulo = subtitulo.get_rect(center=(ancho_pantalla // 2, self.y))
         screen.blit(subtitulo, rect_subtitulo)
 
@@ -149,6 +155,8 @@ class FooterArcade:
         ancho_pantalla = screen.get_width()
         alto_pantalla = screen.get_height()
 
-        footer = self.font.render(self.texto_completo, False, self.color)
+        footer = GestorFuentes().renderizar(
+            self.font, self.texto_completo, False, self.color
+        )
         rect_footer = footer.get_rect(center=(ancho_pantalla // 2, alto_pantalla - 30))
         screen.blit(footer, rect_footer)
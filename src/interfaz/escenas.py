@@ -0,0 +1,200 @@
+"""
+Escenas y gestor de escenas: un solo loop para toda la aplicación.
+
+Cada pantalla (menús, modales, la partida) es una Escena: sabe manejar un
+evento, avanzar un frame y dibujarse, pero no tiene loop ni reloj propios.
+El GestorEscenas mantiene una pila de escenas y corre el único loop del
+juego sobre la ventana que ya existe: la escena de arriba recibe los
+eventos y se dibuja, y cuando termina su resultado se entrega a quien la
+apiló.
+
+Las escenas persistentes (el menú principal, el menú de administración)
+quedan en la pila mientras se muestran las que abren encima, así que al
+volver se reanudan tal como estaban, sin reconstruir botones ni superficies.
+El cambio de escena ocurre dentro del mismo frame: la escena que queda
+arriba se dibuja de inmediato, sin esperar un evento.
+"""
+
+import pygame
+
+from config.config import ConfigJuego
+from interfaz.espera_eventos import EsperaEventos
+
+
+class _Continuar:
+    """Tipo del marcador CONTINUAR (None es un resultado válido de escena)."""
+
+    def __repr__(self):
+        return "CONTINUAR"
+
+
+# Lo que devuelven manejar_evento/actualizar mientras la escena sigue abierta
+CONTINUAR = _Continuar()
+
+
+class Escena:
+    """
+    Base de las pantallas del juego.
+
+    Las subclases implementan manejar_evento y dibujar; las continuas
+    (continua = True, p. ej. la partida) además actualizar, que se llama en
+    cada frame. Las demás son dirigidas por eventos: solo se redibujan
+    cuando cambia algo (ver EsperaEventos), según el estado de self.widgets.
+    """
+
+    continua = False  # True: avanza y se dibuja en cada frame
+    fps = ConfigJuego.FPS  # Tope de frames por segundo mientras está arriba
+    widgets = ()  # Widgets cuyo estado visible (hover, texto...) obliga a redibujar
+
+    def al_entrar(self):
+        """Se llama cada vez que la escena queda arriba (nueva o reanudada)."""
+
+    def manejar_evento(self, evento, mouse_pos):
+        """
+        Procesa un evento de pygame.
+
+        Args:
+            evento: Evento de pygame
+            mouse_pos: Posición actual del mouse
+
+        Returns:
+            CONTINUAR para seguir en la escena; cualquier otro valor la termina
+            y se entrega como resultado (None incluido)
+        """
+        return CONTINUAR
+
+    def actualizar(self):
+        """Avanza un frame (solo escenas continuas): CONTINUAR o un resultado."""
+        return CONTINUAR
+
+    def dibujar(self):
+        """Dibuja la escena y presenta el frame."""
+
+    def ejecutar(self):
+        """
+        Corre esta escena sola hasta que termine.
+
+        Para usar una pantalla fuera del GestorEscenas de la aplicación
+        (herramientas, pruebas manuales).
+
+        Returns:
+            Resultado de la escena
+        """
+        resultados = []
+        gestor = GestorEscenas()
+        gestor.apilar(self, resultados.append)
+        gestor.ejecutar()
+        return resultados[0] if resultados else None
+
+
+class _EntradaPila:
+    """Escena apilada junto con su callback y su espera de eventos."""
+
+    __slots__ = ("escena", "al_terminar", "persistente", "espera")
+
+    def __init__(self, escena, al_terminar, persistente, espera):
+        self.escena = escena
+        self.al_terminar = al_terminar
+        self.persistente = persistente
+        self.espera = espera
+
+
+class GestorEscenas:
+    """
+    Pila de escenas con el único loop principal del juego.
+
+    Uso:
+        gestor = GestorEscenas()
+        gestor.apilar(menu, al_elegir_opcion, persistente=True)
+        gestor.ejecutar()  # Hasta que la pila quede vacía o se llame detener()
+    """
+
+    def __init__(self):
+        self.reloj = pygame.time.Clock()  # Único reloj de la aplicación
+        self._pila: list[_EntradaPila] = []
+        self._activa: _EntradaPila | None = None  # Última entrada dibujada
+        self._detenido = False
+
+        # Contadores (frames del loop y cambios de escena)
+        self.frames = 0
+        self.cambios = 0
+
+    @property
+    def escena_actual(self) -> Escena | None:
+        """Escena de arriba de la pila (None si está vacía)."""
+        return self._pila[-1].escena if self._pila else None
+
+    def __len__(self) -> int:
+        return len(self._pila)
+
+    def __contains__(self, escena) -> bool:
+        return any(entrada.escena is escena for entrada in self._pila)
+
+    def apilar(self, escena: Escena, al_terminar=None, persistente: bool = False):
+        """
+        Pone una escena arriba de la pila; se muestra en el próximo frame.
+
+        Args:
+            escena: Escena a mostrar
+            al_terminar: Función que recibe el resultado de la escena
+            persistente: Si True, la escena sigue en la pila al terminar (el
+                callback decide qué abrir encima); se cierra con quitar()
+        """
+        espera = EsperaEventos(escena.widgets, escena.fps, reloj=self.reloj)
+        self._pila.append(_EntradaPila(escena, al_terminar, persistente, espera))
+
+    def quitar(self, escena: Escena):
+        """Saca una escena de la pila (la de abajo se reanuda en el próximo frame)."""
+        self._pila = [entrada for entrada in self._pila if entrada.escena is not escena]
+        self._activa = None
+
+    def detener(self):
+        """Termina el loop al final del frame actual."""
+        self._detenido = True
+
+    def ejecutar(self):
+        """Corre el loop hasta que la pila quede vacía o se llame detener()."""
+        self._detenido = False
+        while self._pila and not self._detenido:
+            self.frame()
+
+    def frame(self):
+        """Un paso del loop: eventos, actualización y dibujo de la escena de arriba."""
+        entrada = self._pila[-1]
+        escena = entrada.escena
+        self.frames += 1
+
+        if entrada is not self._activa:
+            # Escena nueva o reanudada: se dibuja en este mismo frame
+            self._activa = entrada
+            self.cambios += 1
+            escena.al_entrar()
+            entrada.espera.reiniciar()
+            eventos = pygame.event.get()
+        elif escena.continua:
+            self.reloj.tick(escena.fps)
+            eventos = pygame.event.get()
+        else:
+            eventos = entrada.espera.eventos()
+
+        mouse_pos = pygame.mouse.get_pos()
+        resultado = CONTINUAR
+        for evento in eventos:
+            resultado = escena.manejar_evento(evento, mouse_pos)
+            if resultado is not CONTINUAR:
+                break
+        if resultado is CONTINUAR and escena.continua:
+            resultado = escena.actualizar()
+
+        if resultado is not CONTINUAR:
+            self._terminar(entrada, resultado)
+        elif escena.continua or entrada.espera.hay_que_dibujar(eventos):
+            escena.dibujar()
+
+    def _terminar(self, entrada: _EntradaPila, resultado):
+        """Cierra la escena (salvo persistente) y entrega su resultado."""
+        if not entrada.persistente:
+            self._pila.remove(entrada)
+        self._activa = None  # La escena que quede arriba se vuelve a dibujar
+        if entrada.al_terminar is not None:
+            entrada.al_terminar(resultado)
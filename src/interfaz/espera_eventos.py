@@ -0,0 +1,121 @@
+"""
+Espera de eventos para los menús.
+
+Los menús no tienen nada que animar salvo el cursor de los campos de texto,
+así que en lugar de redibujar y hacer flip a 60 FPS esperan bloqueados en
+pygame.event.wait hasta que llega un evento (o vence un plazo) y solo
+redibujan cuando algo visible cambió: una entrada del usuario, el hover de
+un botón o una animación en curso. Quieto, un menú casi no usa CPU.
+"""
+
+import pygame
+
+from config.config import ConfigJuego
+
+# Atributos de los widgets que cambian lo que se ve (los que falten se ignoran)
+ATRIBUTOS_VISIBLES = (
+    "hover",
+    "presionado",
+    "estado",
+    "texto",
+    "activo",
+    "cursor_visible",
+)
+
+
+def esperar_eventos(espera_ms: int) -> list[pygame.event.Event]:
+    """
+    Bloquea hasta que llegue un evento o pasen 'espera_ms' milisegundos.
+
+    Returns:
+        El evento que despertó la espera y los que ya estaban en cola
+        (lista vacía si venció el plazo)
+    """
+    primero = pygame.event.wait(espera_ms)
+    if primero.type == pygame.NOEVENT:
+        return []
+    return [primero, *pygame.event.get()]
+
+
+def estado_visible(widgets) -> tuple:
+    """Firma de lo que muestran los widgets, para saber si hay que redibujar."""
+    return tuple(
+        tuple(getattr(widget, atributo, None) for atributo in ATRIBUTOS_VISIBLES)
+        for widget in widgets
+    )
+
+
+class EsperaEventos:
+    """
+    Reemplazo de clock.tick(60) + pygame.event.get() en los loops de menú.
+
+    Uso:
+        espera = EsperaEventos([boton1, boton2, input_texto])
+        while True:
+            eventos = espera.eventos()
+            ...manejar eventos...
+            if espera.hay_que_dibujar(eventos):
+                dibujar()
+    """
+
+    def __init__(
+        self,
+        widgets=(),
+        fps: int = ConfigJuego.FPS,
+        espera_maxima_ms: int = ConfigJuego.ESPERA_MAXIMA_MENUS_MS,
+        reloj: pygame.time.Clock | None = None,
+    ):
+        """
+        Args:
+            widgets: Botones, inputs... cuyo estado visible dispara un redibujo.
+                Los que tengan ms_hasta_cambio() (p. ej. el cursor de
+                InputTexto) acortan la espera hasta su próximo cambio
+            fps: Tope de redibujos por segundo cuando llegan muchos eventos
+            espera_maxima_ms: Espera máxima sin eventos
+            reloj: Reloj compartido (None = uno propio)
+        """
+        self.widgets = list(widgets)
+        self.fps = fps
+        self.espera_maxima_ms = espera_maxima_ms
+        self.reloj = reloj or pygame.time.Clock()
+        self._firma = None  # None: el primer frame siempre se dibuja
+
+        # Contadores (para medir cuánto se evita redibujar)
+        self.esperas = 0
+        self.redibujos = 0
+
+    def reiniciar(self):
+        """Olvida el último estado dibujado: el próximo frame se redibuja."""
+        self._firma = None
+
+    def _espera_ms(self) -> int:
+        """Plazo de la próxima espera: la máxima o hasta la próxima animación."""
+        espera = self.espera_maxima_ms
+        for widget in self.widgets:
+            ms_hasta_cambio = getattr(widget, "ms_hasta_cambio", None)
+            proximo = ms_hasta_cambio() if ms_hasta_cambio else None
+            if proximo is not None:
+                espera = min(espera, proximo)
+        return max(1, espera)
+
+    def eventos(self) -> list[pygame.event.Event]:
+        """Espera el próximo evento (o animación) y devuelve los pendientes."""
+        self.reloj.tick(self.fps)  # No superar los FPS si llegan muchos eventos
+        self.esperas += 1
+        return esperar_eventos(self._espera_ms())
+
+    def hay_que_dibujar(self, eventos) -> bool:
+        """
+        True si algo visible puede haber cambiado desde el último dibujo.
+
+        Se redibuja ante cualquier evento que no sea solo mover el mouse
+        (teclas, clicks, ventana expuesta...) o si cambió el estado visible de
+        algún widget (hover, texto, cursor...).
+        """
+        firma = estado_visible(self.widgets)
+        cambio = firma != self._firma
+        self._firma = firma
+        if cambio or any(evento.type != pygame.MOUSEMOTION for evento in eventos):
+            self.redibujos += 1
+            return True
+        return False
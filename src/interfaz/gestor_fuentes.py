@@ -3,12 +3,20 @@ Gestor centralizado de fuentes para evitar recreación innecesaria.
 
 Singleton que mantiene todas las fuentes pre-creadas y listas para usar
 en cualquier pantalla, mejorando el rendimiento y uso de memoria.
+
+También guarda los textos ya renderizados (caché LRU acotada): los rótulos
+que no cambian entre frames se rasterizan una sola vez. Para contadores que
+cambian en cada frame (puntaje, reloj) entrega atlas de glifos.
 """
 
+from collections import OrderedDict
 from pathlib import Path
 
 import pygame
 
+from config.config import ConfigJuego
+from interfaz.atlas_glifos import AtlasGlifos
+
 
 class GestorFuentes:
     """
@@ -122,8 +130,99 @@ class GestorFuentes:
 
                 self.fuente_pixel_nombre = "Default (pygame.font.Font)"
 
+        # Textos ya renderizados {(fuente, texto, antialias, color, fondo): Surface}
+        self._textos: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        self.max_textos = ConfigJuego.MAX_TEXTOS_RENDERIZADOS
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+
+        # Atlas de glifos {(fuente, color, antialias): AtlasGlifos}
+        self._atlas: dict[tuple, AtlasGlifos] = {}
+
         self._inicializado = True
 
+    def renderizar(self, fuente, texto, antialias, color, fondo=None):
+        """
+        Renderiza texto reutilizando la superficie si ya se pidió antes.
+
+        Mismos argumentos que pygame.font.Font.render. La superficie es
+        compartida: no modificarla (usar .copy() si hace falta).
+
+        Args:
+            fuente: Objeto Font a usar
+            texto: Texto a renderizar
+            antialias: Si usar antialiasing
+            color: Color del texto
+            fondo: Color de fondo opcional (None = transparente)
+
+        Returns:
+            Surface con el texto renderizado
+        """
+        clave = (
+            fuente,
+            texto,
+            bool(antialias),
+            tuple(color),
+            None if fondo is None else tuple(fondo),
+        )
+        superficie = self._textos.get(clave)
+        if superficie is not None:
+            self._textos.move_to_end(clave)
+            self.aciertos += 1
+            return superficie
+
+        self.fallos += 1
+        if fondo is None:
+            superficie = fuente.render(texto, antialias, color)
+        else:
+            superficie = fuente.render(texto, antialias, color, fondo)
+        self._textos[clave] = superficie
+        if len(self._textos) > self.max_textos:
+            self._textos.popitem(last=False)
+            self.desalojos += 1
+        return superficie
+
+    def atlas(self, fuente, color, antialias=False) -> AtlasGlifos:
+        """
+        Atlas de glifos de una fuente y color (se crea la primera vez).
+
+        Conviene para textos que cambian casi en cada frame: se dibujan con
+        atlas.dibujar(superficie, texto, (x, y)) sin rasterizar ni crear
+        superficies.
+
+        Args:
+            fuente: Objeto Font a usar
+            color: Color del texto
+            antialias: Si usar antialiasing (default False, estilo pixel)
+
+        Returns:
+            AtlasGlifos compartido
+        """
+        clave = (fuente, tuple(color), bool(antialias))
+        atlas = self._atlas.get(clave)
+        if atlas is None:
+            atlas = AtlasGlifos(fuente, color, antialias)
+            self._atlas[clave] = atlas
+        return atlas
+
+    def estadisticas_textos(self) -> dict:
+        """Contadores de la caché de textos: entradas, aciertos, fallos y desalojos."""
+        consultas = self.aciertos + self.fallos
+        return {
+            "entradas": len(self._textos),
+            "maximo": self.max_textos,
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "desalojos": self.desalojos,
+            "tasa_aciertos": self.aciertos / consultas if consultas else 0.0,
+        }
+
+    def limpiar_textos(self) -> None:
+        """Vacía la caché de textos y reinicia los contadores."""
+        self._textos.clear()
+        self.aciertos = self.fallos = self.desalojos = 0
+
     def render_pixel(self, fuente, texto, color):
         """
         Renderiza texto con estilo pixel art (sin antialiasing).
@@ -136,7 +235,7 @@ class GestorFuentes:
         Returns:
             Surface con el texto renderizado
         """
-        return fuente.render(texto, False, color)  # False = sin antialiasing
+        return self.renderizar(fuente, texto, False, color)  # False = sin antialiasing
 
     @classmethod
     def obtener(cls):
@@ -157,4 +256,4 @@ class GestorFuentes:
             Surface con el texto renderizado
         """
         fuente = getattr(self, fuente_nombre, self.texto_normal)
-        return fuente.render(texto, antialias, color)
+        return self.renderizar(fuente, texto, antialias, color)
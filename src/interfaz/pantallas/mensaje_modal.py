@@ -6,11 +6,12 @@ import pygame
 
 from interfaz.componentes.input_texto import Boton
 from interfaz.componentes.overlay import Overlay, Panel
+from interfaz.escenas import CONTINUAR, Escena
 from interfaz.gestor_fuentes import GestorFuentes
 from config.colores import PaletaColores
 
 
-class MensajeModal:
+class MensajeModal(Escena):
     """Cuadro de diálogo simple para mostrar mensajes y confirmar con OK."""
 
     def __init__(self, screen, titulo, mensaje, tipo="info"):
@@ -26,6 +27,10 @@ class MensajeModal:
         self.font_titulo = fuentes.titulo_pequeño
         self.font_mensaje = fuentes.texto_grande
 
+        # Lo que había en pantalla al abrir el modal: cada redibujo parte de
+        # ahí (el overlay translúcido no se acumula entre redibujos)
+        self.fondo = screen.copy()
+
         # Overlay reutilizable
         self.overlay = Overlay(self.ancho, self.alto, PaletaColores.FONDO_OVERLAY, 200)
 
@@ -41,28 +46,32 @@ class MensajeModal:
 
         # Botón OK centrado bajo el mensaje
         self.btn_ok = Boton(self.ancho // 2 - 85, self.alto // 2 + 60, 170, 55, "OK")
+        self.widgets = [self.btn_ok]
 
         # Color de acento según el tipo
         self.color_acento = PaletaColores.obtener_color_tipo(tipo)
 
     def dibujar(self):
         """Dibuja fondo translúcido, caja con borde, textos y el botón OK."""
-        # Overlay semitransparente
+        # Overlay semitransparente sobre la pantalla de fondo
+        self.screen.blit(self.fondo, (0, 0))
         self.overlay.dibujar(self.screen)
 
         # Panel del modal
         self.panel.dibujar(self.screen)
 
         # Título centrado
-        titulo_surface = self.font_titulo.render(self.titulo, True, self.color_acento)
+        titulo_surface = GestorFuentes().renderizar(
+            self.font_titulo, self.titulo, True, self.color_acento
+        )
         titulo_rect = titulo_surface.get_rect(
             center=(self.ancho // 2, self.alto // 2 - 50)
         )
         self.screen.blit(titulo_surface, titulo_rect)
 
         # Mensaje principal
-        mensaje_surface = self.font_mensaje.render(
-            self.mensaje, True, PaletaColores.TEXTO_PRINCIPAL
+        mensaje_surface = GestorFuentes().renderizar(
+            self.font_mensaje, self.mensaje, True, PaletaColores.TEXTO_PRINCIPAL
         )
         mensaje_rect = mensaje_surface.get_rect(
             center=(self.ancho // 2, self.alto // 2)
@@ -74,23 +83,16 @@ class MensajeModal:
 
         pygame.display.flip()
 
-    def ejecutar(self):
-        """Loop del modal: se cierra con OK, Enter/Escape o al cerrar la ventana."""
-        clock = pygame.time.Clock()
-
-        while True:
-            clock.tick(60)
-            mouse_pos = pygame.mouse.get_pos()
-
-            for evento in pygame.event.get():
-                if evento.type == pygame.QUIT:
-                    return
+    def manejar_evento(self, evento, mouse_pos):
+        """Se cierra (resultado None) con OK, Enter/Escape o al cerrar la ventana."""
+        if evento.type == pygame.QUIT:
+            return None
 
-                if evento.type == pygame.KEYDOWN:
-                    if evento.key in [pygame.K_RETURN, pygame.K_ESCAPE]:
-                        return
+        if evento.type == pygame.KEYDOWN:
+            if evento.key in [pygame.K_RETURN, pygame.K_ESCAPE]:
+                return None
 
-                if self.btn_ok.manejar_evento(evento, mouse_pos):
-                    return
+        if self.btn_ok.manejar_evento(evento, mouse_pos):
+            return None
 
-            self.dibujar()
+        return CONTINUAR
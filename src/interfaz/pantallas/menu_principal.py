@@ -15,9 +15,10 @@ from interfaz.componentes.titulo_arcade import (
     SubtituloArcade,
     TituloArcade,
 )
+from interfaz.escenas import CONTINUAR, Escena
 
 
-class MenuPrincipal:
+class MenuPrincipal(Escena):
     """Menú principal con componentes arcade reutilizables.
 
     Muestra el título y botones adaptables con efectos pixel art.
@@ -37,6 +38,9 @@ class MenuPrincipal:
         # Crear los botones adaptativos
         self._crear_botones()
 
+        # Widgets cuyo hover obliga a redibujar
+        self.widgets = self.botones
+
     def _crear_botones(self):
         """Crea los botones del menú principal con componentes adaptables."""
         opciones = [
@@ -76,27 +80,18 @@ class MenuPrincipal:
 
         pygame.display.flip()
 
-    def ejecutar(self):
-        """Loop del menú: procesa eventos y devuelve la opción elegida."""
-        clock = pygame.time.Clock()
-
-        while True:
-            clock.tick(60)
-            mouse_pos = pygame.mouse.get_pos()
+    def manejar_evento(self, evento, mouse_pos):
+        """Devuelve la opción elegida (4 = salir) o CONTINUAR."""
+        if evento.type == pygame.QUIT:
+            return 4
 
-            for evento in pygame.event.get():
-                if evento.type == pygame.QUIT:
-                    return 4
+        if evento.type == pygame.KEYDOWN:
+            if evento.key == pygame.K_ESCAPE:
+                return 4
 
-                if evento.type == pygame.KEYDOWN:
-                    if evento.key == pygame.K_ESCAPE:
-                        return 4
-
-                # Verifica si algún botón recibió un click válido
-                for boton in self.botones:
-                    if boton.manejar_evento(evento, mouse_pos):
-                        return boton.accion
+        # Verifica si algún botón recibió un click válido
+        for boton in self.botones:
+            if boton.manejar_evento(evento, mouse_pos):
+                return boton.accion
 
-            # Redibujar constantemente para actualizar efectos hover
-            self.dibujar()
-            pygame.display.flip()
+        return CONTINUAR
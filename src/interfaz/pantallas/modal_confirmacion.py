@@ -6,11 +6,12 @@ import pygame
 
 from interfaz.componentes.input_texto import Boton
 from interfaz.componentes.overlay import Overlay, Panel
+from interfaz.escenas import CONTINUAR, Escena
 from interfaz.gestor_fuentes import GestorFuentes
 from config.colores import PaletaColores
 
 
-class ModalConfirmacion:
+class ModalConfirmacion(Escena):
     """
     Modal de confirmación con botones Sí/No.
     Se usa para confirmar acciones críticas como salir o reiniciar datos.
@@ -28,6 +29,10 @@ class ModalConfirmacion:
         self.font_titulo = fuentes.titulo_mini
         self.font_mensaje = fuentes.texto_normal
 
+        # Lo que había en pantalla al abrir el modal: cada redibujo parte de
+        # ahí (el overlay translúcido no se acumula entre redibujos)
+        self.fondo = screen.copy()
+
         # Overlay reutilizable
         self.overlay = Overlay(self.ancho, self.alto, PaletaColores.FONDO_OVERLAY, 220)
 
@@ -44,18 +49,20 @@ class ModalConfirmacion:
         # Botones
         self.btn_si = Boton(self.ancho // 2 - 175, self.alto // 2 + 50, 160, 55, "Sí")
         self.btn_no = Boton(self.ancho // 2 + 15, self.alto // 2 + 50, 160, 55, "No")
+        self.widgets = [self.btn_si, self.btn_no]
 
     def dibujar(self):
         """Dibuja el modal de confirmación."""
-        # Overlay semitransparente
+        # Overlay semitransparente sobre la pantalla de fondo
+        self.screen.blit(self.fondo, (0, 0))
         self.overlay.dibujar(self.screen)
 
         # Panel del modal
         self.panel.dibujar(self.screen)
 
         # Título
-        titulo_surface = self.font_titulo.render(
-            self.titulo, True, PaletaColores.ACENTO_WARNING
+        titulo_surface = GestorFuentes().renderizar(
+            self.font_titulo, self.titulo, True, PaletaColores.ACENTO_WARNING
         )
         titulo_rect = titulo_surface.get_rect(
             center=(self.ancho // 2, self.alto // 2 - 70)
@@ -66,8 +73,8 @@ class ModalConfirmacion:
         lineas = self.mensaje.split("\n")
         y_offset = -20
         for linea in lineas:
-            mensaje_surface = self.font_mensaje.render(
-                linea, True, PaletaColores.TEXTO_PRINCIPAL
+            mensaje_surface = GestorFuentes().renderizar(
+                self.font_mensaje, linea, True, PaletaColores.TEXTO_PRINCIPAL
             )
             mensaje_rect = mensaje_surface.get_rect(
                 center=(self.ancho // 2, self.alto // 2 + y_offset)
@@ -81,33 +88,26 @@ class ModalConfirmacion:
 
         pygame.display.flip()
 
-    def ejecutar(self):
+    def manejar_evento(self, evento, mouse_pos):
         """
-        Loop del modal de confirmación.
+        Maneja un evento del modal de confirmación.
 
         Returns:
-            bool: True si confirmó (Sí), False si canceló (No)
+            True si confirmó (Sí), False si canceló (No), o CONTINUAR
         """
-        clock = pygame.time.Clock()
-
-        while True:
-            clock.tick(60)
-            mouse_pos = pygame.mouse.get_pos()
+        if evento.type == pygame.QUIT:
+            return False
 
-            for evento in pygame.event.get():
-                if evento.type == pygame.QUIT:
-                    return False
+        if evento.type == pygame.KEYDOWN:
+            if evento.key == pygame.K_ESCAPE:
+                return False
+            if evento.key == pygame.K_RETURN:
+                return True
 
-                if evento.type == pygame.KEYDOWN:
-                    if evento.key == pygame.K_ESCAPE:
-                        return False
-                    if evento.key == pygame.K_RETURN:
-                        return True
-
-                # Botones
-                if self.btn_si.manejar_evento(evento, mouse_pos):
-                    return True
-                if self.btn_no.manejar_evento(evento, mouse_pos):
-                    return False
+        # Botones
+        if self.btn_si.manejar_evento(evento, mouse_pos):
+            return True
+        if self.btn_no.manejar_evento(evento, mouse_pos):
+            return False
 
-            self.dibujar()
+        return CONTINUAR
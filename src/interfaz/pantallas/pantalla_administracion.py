@@ -11,10 +11,11 @@ from interfaz.componentes.titulo_arcade import (
     SubtituloArcade,
     TituloArcade,
 )
+from interfaz.escenas import CONTINUAR, Escena
 from interfaz.gestor_fuentes import GestorFuentes
 
 
-class PantallaAdministracion:
+class PantallaAdministracion(Escena):
     """Solicita la clave de administrador y la devuelve para validarla afuera."""
 
     def __init__(self, screen):
@@ -43,6 +44,12 @@ class PantallaAdministracion:
         self.btn_volver = BotonGrande(self.ancho // 2, 365, "Volver")
         self.btn_volver.centrar_horizontalmente(self.ancho)
 
+        self.widgets = [self.input_clave, self.btn_ingresar, self.btn_volver]
+
+    def al_entrar(self):
+        """La clave no se conserva entre visitas a la pantalla."""
+        self.input_clave.texto = ""
+
     def dibujar(self):
         """Dibuja la pantalla de autenticación con input, botones y un hint."""
         self.screen.fill((20, 20, 30))
@@ -60,42 +67,35 @@ class PantallaAdministracion:
         self.btn_volver.dibujar(self.screen)
 
         # Hint con icono de candado
-        hint = self.font_hint.render(
-            "Clave por defecto: admin123", True, (100, 120, 150)
+        hint = GestorFuentes().renderizar(
+            self.font_hint, "Clave por defecto: admin123", True, (100, 120, 150)
         )
         hint_rect = hint.get_rect(center=(self.ancho // 2, self.alto - 40))
         self.screen.blit(hint, hint_rect)
 
         pygame.display.flip()
 
-    def ejecutar(self):
-        """Loop: devuelve la clave con Enter o Ingresar, o None al volver/salir."""
-        clock = pygame.time.Clock()
-
-        while True:
-            clock.tick(60)
-            mouse_pos = pygame.mouse.get_pos()
-
-            for evento in pygame.event.get():
-                if evento.type == pygame.QUIT:
-                    return None
+    def manejar_evento(self, evento, mouse_pos):
+        """Devuelve la clave con Enter o Ingresar, None al volver/salir, o CONTINUAR."""
+        if evento.type == pygame.QUIT:
+            return None
 
-                if evento.type == pygame.KEYDOWN:
-                    if evento.key == pygame.K_ESCAPE:
-                        return None
+        if evento.type == pygame.KEYDOWN:
+            if evento.key == pygame.K_ESCAPE:
+                return None
 
-                # Input: Enter devuelve inmediatamente la clave
-                if self.input_clave.manejar_evento(evento):
-                    clave = self.input_clave.obtener_texto()
-                    return clave
+        # Input: Enter devuelve inmediatamente la clave
+        if self.input_clave.manejar_evento(evento):
+            clave = self.input_clave.obtener_texto()
+            return clave
 
-                # Botón Ingresar: también devuelve la clave
-                if self.btn_ingresar.manejar_evento(evento, mouse_pos):
-                    clave = self.input_clave.obtener_texto()
-                    return clave
+        # Botón Ingresar: también devuelve la clave
+        if self.btn_ingresar.manejar_evento(evento, mouse_pos):
+            clave = self.input_clave.obtener_texto()
+            return clave
 
-                # Botón Volver
-                if self.btn_volver.manejar_evento(evento, mouse_pos):
-                    return None
+        # Botón Volver
+        if self.btn_volver.manejar_evento(evento, mouse_pos):
+            return None
 
-            self.dibujar()
+        return CONTINUAR
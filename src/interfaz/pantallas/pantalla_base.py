@@ -2,22 +2,23 @@
 Clase base abstracta para pantallas del juego.
 
 Proporciona funcionalidad común para reducir código duplicado:
-- Loop principal estandarizado
+- Integración con el loop único de GestorEscenas (es una Escena)
 - Manejo básico de eventos
 - Métodos de dibujo comunes
 """
 
 import pygame
 from abc import ABC, abstractmethod
+from interfaz.escenas import CONTINUAR, Escena
 from interfaz.gestor_fuentes import GestorFuentes
 
 
-class PantallaBase(ABC):
+class PantallaBase(Escena, ABC):
     """
     Clase base abstracta para todas las pantallas del juego.
 
-    Implementa el patrón Template Method para el loop principal
-    y proporciona métodos helper comunes.
+    Implementa el patrón Template Method para el manejo de eventos (el loop
+    lo corre GestorEscenas) y proporciona métodos helper comunes.
     """
 
     def __init__(self, screen):
@@ -41,6 +42,9 @@ class PantallaBase(ABC):
             "info": (100, 100, 120),
         }
 
+        # Widgets cuyo estado visible (hover, texto...) obliga a redibujar
+        self.widgets = []
+
     @abstractmethod
     def dibujar(self):
         """Método abstracto para dibujar la pantalla. Debe ser implementado por subclases."""
@@ -62,35 +66,34 @@ class PantallaBase(ABC):
 
     def ejecutar(self, fps=60):
         """
-        Loop principal estandarizado para todas las pantallas.
+        Corre la pantalla sola (ver Escena.ejecutar).
 
         Args:
-            fps: Frames por segundo (default 60)
+            fps: Tope de frames por segundo (default 60)
 
         Returns:
             Resultado devuelto por manejar_evento_especifico o None
         """
-        clock = pygame.time.Clock()
-
-        while True:
-            clock.tick(fps)
-            mouse_pos = pygame.mouse.get_pos()
+        self.fps = fps
+        return super().ejecutar()
 
-            for evento in pygame.event.get():
-                # Manejo común de eventos
-                if evento.type == pygame.QUIT:
-                    return self.manejar_cierre()
+    def manejar_evento(self, evento, mouse_pos):
+        """
+        Manejo estandarizado de eventos para todas las pantallas.
 
-                if evento.type == pygame.KEYDOWN:
-                    if evento.key == pygame.K_ESCAPE:
-                        return self.manejar_escape()
+        QUIT y Escape se manejan aquí; el resto se delega a la subclase.
+        """
+        # Manejo común de eventos
+        if evento.type == pygame.QUIT:
+            return self.manejar_cierre()
 
-                # Delegar eventos específicos a la subclase
-                resultado = self.manejar_evento_especifico(evento, mouse_pos)
-                if resultado is not None:
-                    return resultado
+        if evento.type == pygame.KEYDOWN:
+            if evento.key == pygame.K_ESCAPE:
+                return self.manejar_escape()
 
-            self.dibujar()
+        # Delegar eventos específicos a la subclase
+        resultado = self.manejar_evento_especifico(evento, mouse_pos)
+        return CONTINUAR if resultado is None else resultado
 
     def manejar_cierre(self):
         """Maneja el cierre de la ventana. Puede ser sobrescrito."""
@@ -117,12 +120,12 @@ class PantallaBase(ABC):
         color = color or self.COLORES["texto"]
 
         # Sombra
-        sombra = self.font_titulo.render(texto, True, (10, 10, 20))
+        sombra = GestorFuentes().renderizar(self.font_titulo, texto, True, (10, 10, 20))
         sombra_rect = sombra.get_rect(center=(self.ancho // 2 + 3, y + 3))
         self.screen.blit(sombra, sombra_rect)
 
         # Título
-        titulo = self.font_titulo.render(texto, True, color)
+        titulo = GestorFuentes().renderizar(self.font_titulo, texto, True, color)
         titulo_rect = titulo.get_rect(center=(self.ancho // 2, y))
         self.screen.blit(titulo, titulo_rect)
 
@@ -139,7 +142,7 @@ class PantallaBase(ABC):
         fuente = fuente or self.font_texto
         color = color or self.COLORES["texto"]
 
-        superficie = fuente.render(texto, True, color)
+        superficie = GestorFuentes().renderizar(fuente, texto, True, color)
         rect = superficie.get_rect(center=(self.ancho // 2, y))
         self.screen.blit(superficie, rect)
 
@@ -152,7 +155,7 @@ class PantallaBase(ABC):
             color: Color del texto
         """
         color = color or self.COLORES["info"]
-        footer = self.font_info.render(texto, True, color)
+        footer = GestorFuentes().renderizar(self.font_info, texto, True, color)
         footer_rect = footer.get_rect(center=(self.ancho // 2, self.alto - 30))
         self.screen.blit(footer, footer_rect)
 
@@ -11,11 +11,12 @@ from interfaz.componentes.titulo_arcade import (
     SubtituloArcade,
     TituloArcade,
 )
+from interfaz.escenas import CONTINUAR, Escena
 from interfaz.gestor_fuentes import GestorFuentes
 from utilidades.helpers import resolver_ruta_laberinto
 
 
-class PantallaCargaLaberinto:
+class PantallaCargaLaberinto(Escena):
     """
     Pantalla para seleccionar y cargar un archivo de laberinto.
     Permite ingresar la ruta del archivo manualmente.
@@ -65,6 +66,22 @@ class PantallaCargaLaberinto:
             centro - 60, btn_y + 55, "Ejemplo", accion="ejemplo"
         )
 
+        self.widgets = [
+            self.input_ruta,
+            self.btn_cargar,
+            self.btn_volver,
+            self.btn_lab1,
+            self.btn_lab2,
+            self.btn_lab3,
+            self.btn_lab_ejemplo,
+        ]
+
+        self.archivo_seleccionado = None
+        self.nombre_archivo = ""
+
+    def al_entrar(self):
+        """La ruta y el archivo elegido no se conservan entre visitas."""
+        self.input_ruta.texto = ""
         self.archivo_seleccionado = None
         self.nombre_archivo = ""
 
@@ -95,7 +112,9 @@ class PantallaCargaLaberinto:
         )
 
         # Texto de acceso rápido
-        acceso_texto = self.font_info.render("Acceso rápido", True, (180, 200, 220))
+        acceso_texto = GestorFuentes().renderizar(
+            self.font_info, "Acceso rápido", True, (180, 200, 220)
+        )
         acceso_rect = acceso_texto.get_rect(center=(self.ancho // 2, linea_y - 18))
         self.screen.blit(acceso_texto, acceso_rect)
 
@@ -106,7 +125,8 @@ class PantallaCargaLaberinto:
         self.btn_lab_ejemplo.dibujar(self.screen)
 
         # Información adicional con icono
-        info = self.font_info.render(
+        info = GestorFuentes().renderizar(
+            self.font_info,
             "Formato: .json | Rutas relativas desde: src/data/",
             True,
             (100, 120, 150),
@@ -116,59 +136,53 @@ class PantallaCargaLaberinto:
 
         pygame.display.flip()
 
-    def ejecutar(self):
+    def manejar_evento(self, evento, mouse_pos):
         """
-        Loop de la pantalla de carga.
+        Maneja un evento de la pantalla de carga.
 
         Returns:
-            tuple: (laberinto, mensaje) si se cargó exitosamente, (None, None) si se canceló
+            tuple: (laberinto, mensaje) al intentar cargar, (None, None) si se
+            canceló, o CONTINUAR
         """
-        clock = pygame.time.Clock()
-
-        while True:
-            clock.tick(60)
-            mouse_pos = pygame.mouse.get_pos()
-
-            for evento in pygame.event.get():
-                if evento.type == pygame.QUIT:
-                    return None, None
-
-                if evento.type == pygame.KEYDOWN:
-                    if evento.key == pygame.K_ESCAPE:
-                        return None, None
-
-                # Manejar input de texto
-                if self.input_ruta.manejar_evento(evento):
-                    # Enter presionado, intentar cargar
-                    ruta = self.input_ruta.obtener_texto()
-                    if ruta:
-                        ruta = resolver_ruta_laberinto(ruta)
-                        laberinto, mensaje = self.admin.cargar_laberinto(ruta)
-                        return laberinto, mensaje
-
-                # Botón Cargar
-                if self.btn_cargar.manejar_evento(evento, mouse_pos):
-                    ruta = self.input_ruta.obtener_texto()
-                    if ruta:
-                        ruta = resolver_ruta_laberinto(ruta)
-                        laberinto, mensaje = self.admin.cargar_laberinto(ruta)
-                        return laberinto, mensaje
-
-                # Botón Volver
-                if self.btn_volver.manejar_evento(evento, mouse_pos):
-                    return None, None
-
-                # Botones de acceso rápido
-                if self.btn_lab1.manejar_evento(evento, mouse_pos):
-                    self.input_ruta.texto = "src/data/laberintos/laberinto1.json"
-
-                if self.btn_lab2.manejar_evento(evento, mouse_pos):
-                    self.input_ruta.texto = "src/data/laberintos/laberinto2.json"
-
-                if self.btn_lab3.manejar_evento(evento, mouse_pos):
-                    self.input_ruta.texto = "src/data/laberintos/laberinto3.json"
-
-                if self.btn_lab_ejemplo.manejar_evento(evento, mouse_pos):
-                    self.input_ruta.texto = "src/data/laberintos/laberinto_ejemplo.json"
-
-            self.dibujar()
+        if evento.type == pygame.QUIT:
+            return None, None
+
+        if evento.type == pygame.KEYDOWN:
+            if evento.key == pygame.K_ESCAPE:
+                return None, None
+
+        # Manejar input de texto
+        if self.input_ruta.manejar_evento(evento):
+            # Enter presionado, intentar cargar
+            ruta = self.input_ruta.obtener_texto()
+            if ruta:
+                ruta = resolver_ruta_laberinto(ruta)
+                laberinto, mensaje = self.admin.cargar_laberinto(ruta)
+                return laberinto, mensaje
+
+        # Botón Cargar
+        if self.btn_cargar.manejar_evento(evento, mouse_pos):
+            ruta = self.input_ruta.obtener_texto()
+            if ruta:
+                ruta = resolver_ruta_laberinto(ruta)
+                laberinto, mensaje = self.admin.cargar_laberinto(ruta)
+                return laberinto, mensaje
+
+        # Botón Volver
+        if self.btn_volver.manejar_evento(evento, mouse_pos):
+            return None, None
+
+        # Botones de acceso rápido
+        if self.btn_lab1.manejar_evento(evento, mouse_pos):
+            self.input_ruta.texto = "src/data/laberintos/laberinto1.json"
+
+        if self.btn_lab2.manejar_evento(evento, mouse_pos):
+            self.input_ruta.texto = "src/data/laberintos/laberinto2.json"
+
+        if self.btn_lab3.manejar_evento(evento, mouse_pos):
+            self.input_ruta.texto = "src/data/laberintos/laberinto3.json"
+
+        if self.btn_lab_ejemplo.manejar_evento(evento, mouse_pos):
+            self.input_ruta.texto = "src/data/laberintos/laberinto_ejemplo.json"
+
+        return CONTINUAR
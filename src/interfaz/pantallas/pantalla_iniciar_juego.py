@@ -11,9 +11,10 @@ from interfaz.componentes.titulo_arcade import (
     SubtituloArcade,
     TituloArcade,
 )
+from interfaz.escenas import CONTINUAR, Escena
 
 
-class PantallaIniciarJuego:
+class PantallaIniciarJuego(Escena):
     """Pantalla para ingresar nombre del jugador y continuar o volver."""
 
     def __init__(self, screen):
@@ -38,6 +39,12 @@ class PantallaIniciarJuego:
         self.btn_volver = BotonGrande(self.ancho // 2, 375, "Volver")
         self.btn_volver.centrar_horizontalmente(self.ancho)
 
+        self.widgets = [self.input_nombre, self.btn_continuar, self.btn_volver]
+
+    def al_entrar(self):
+        """El nombre no se conserva entre visitas a la pantalla."""
+        self.input_nombre.texto = ""
+
     def dibujar(self):
         """Dibuja fondo, textos, input y botones."""
         self.screen.fill((20, 20, 30))
@@ -56,36 +63,29 @@ class PantallaIniciarJuego:
 
         pygame.display.flip()
 
-    def ejecutar(self):
-        """Loop: recoge nombre por Enter o botón, o vuelve con Escape/Volver."""
-        clock = pygame.time.Clock()
-
-        while True:
-            clock.tick(60)
-            mouse_pos = pygame.mouse.get_pos()
-
-            for evento in pygame.event.get():
-                if evento.type == pygame.QUIT:
-                    return None
+    def manejar_evento(self, evento, mouse_pos):
+        """Devuelve el nombre (Enter o botón), None (Escape/Volver) o CONTINUAR."""
+        if evento.type == pygame.QUIT:
+            return None
 
-                if evento.type == pygame.KEYDOWN:
-                    if evento.key == pygame.K_ESCAPE:
-                        return None
+        if evento.type == pygame.KEYDOWN:
+            if evento.key == pygame.K_ESCAPE:
+                return None
 
-                # Input: si manejar_evento devuelve True, se presionó Enter
-                if self.input_nombre.manejar_evento(evento):
-                    nombre = self.input_nombre.obtener_texto()
-                    if nombre:
-                        return nombre
+        # Input: si manejar_evento devuelve True, se presionó Enter
+        if self.input_nombre.manejar_evento(evento):
+            nombre = self.input_nombre.obtener_texto()
+            if nombre:
+                return nombre
 
-                # Botón Continuar: intenta confirmar el nombre
-                if self.btn_continuar.manejar_evento(evento, mouse_pos):
-                    nombre = self.input_nombre.obtener_texto()
-                    if nombre:
-                        return nombre
+        # Botón Continuar: intenta confirmar el nombre
+        if self.btn_continuar.manejar_evento(evento, mouse_pos):
+            nombre = self.input_nombre.obtener_texto()
+            if nombre:
+                return nombre
 
-                # Botón Volver: regresa sin nombre
-                if self.btn_volver.manejar_evento(evento, mouse_pos):
-                    return None
+        # Botón Volver: regresa sin nombre
+        if self.btn_volver.manejar_evento(evento, mouse_pos):
+            return None
 
-            self.dibujar()
+        return CONTINUAR
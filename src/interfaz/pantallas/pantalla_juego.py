@@ -1,25 +1,53 @@
 import math  # Para animaciones y cálculos trigonométricos del HUD
 import os
+import random
+import time
 
 import pygame  # Motor de eventos, dibujo y tiempo
 
 from config.config import Colores, ConfigJuego
-from jugabilidad.gestores.gestor_dificultad import GestorDificultad
+from interfaz.cola_render import (
+    CAPA_ACTORES,
+    CAPA_HUD,
+    CAPA_HUD_ANIMADO,
+    CAPA_OBSEQUIOS,
+    ColaRender,
+)
+from interfaz.escenas import CONTINUAR, Escena
+from interfaz.gestor_fuentes import GestorFuentes
 from jugabilidad.gestores.gestor_movimiento import GestorMovimiento
-from jugabilidad.gestores.gestor_obsequios import GestorObsequios
+from jugabilidad.repeticion import GrabadorPartida, Repeticion, ReproductorRepeticion
+from jugabilidad.simulacion import (
+    EVENTO_CAPTURA,
+    EVENTO_GAME_OVER,
+    EVENTO_OBSEQUIO,
+    SimulacionJuego,
+)
 from mundo.laberinto import Laberinto
-from personajes.computadora import Computadora
-from personajes.jugador import Jugador
 from servicios.sistema_sonido import SistemaSonido
-from utilidades.coordenadas import ConversorCoordenadas
 
 
-class PantallaJuego:
+class PantallaJuego(Escena):
     """Pantalla principal del juego en modo laberinto, con HUD y dificultad progresiva."""
 
-    def __init__(self, nombre_jugador="Jugador"):
-        """Configura pantalla, colores, estados, laberinto, actores y timers."""
-        # Configuración de pantalla y reloj
+    continua = True  # La partida avanza y se dibuja en cada frame
+
+    # Superficies horneadas compartidas por todas las partidas, así sobreviven
+    # al volver al menú: {nombre: (clave, superficie)}, ver _horneada
+    _horneadas: dict[str, tuple] = {}
+
+    def __init__(
+        self, nombre_jugador="Jugador", ruta_laberinto=None, semilla=None, repeticion=None
+    ):
+        """Configura pantalla, colores, estados, laberinto, actores y timers.
+
+        Args:
+            nombre_jugador: Nombre mostrado en el HUD y guardado en el salón de la fama
+            ruta_laberinto: Laberinto a jugar (None = laberinto activo de la configuración)
+            semilla: Semilla de la partida (None = al azar)
+            repeticion: Repeticion (o ruta a una) para ver en lugar de jugar
+        """
+        # Configuración de pantalla
         # Obtener tamaño real de la pantalla actual
         pantalla_actual = pygame.display.get_surface()
         if pantalla_actual:
@@ -30,169 +58,141 @@ class PantallaJuego:
             self.ANCHO = 1200
             self.ALTO = 800
 
-        self.screen = None
-        self.reloj = pygame.time.Clock()
+        self.screen = None  # Se toma la ventana existente en al_entrar
 
-        # Estados y métricas de juego
+        # Estados de la pantalla (el estado de la partida vive en la simulación)
         self.pausado = False
         self.menu_pausa_salir = (
             False  # True cuando se muestra el menú de confirmación de salida
         )
-        self.game_over = False
         self.game_over_timer = 0  # Timer para espera en game over
-        self.frame_count = 0  # Frames acumulados (útil para animaciones HUD)
-        self.tiempo_transcurrido = 0  # En frames; se muestra como mm:ss en HUD
         self.mostrar_distancia = False  # Overlay opcional para depurar
         self.nombre_jugador = nombre_jugador
 
-        # Datos del puntaje final para retornar
-        self.puntaje_final = None
-        self.nombre_laberinto = None
-
-        # Obsequios con vencimiento (desaparecen y reaparecen)
-        self.tiempo_vida_obsequio = ConfigJuego.segundos_a_frames(
-            ConfigJuego.SEGUNDOS_VIDA_OBSEQUIO
-        )
-        self.obsequios_timers = {}  # {(col, fila): frames_restantes}
-
-        # Dificultad progresiva (aumenta velocidad del enemigo cada cierto tiempo)
-        self.velocidad_inicial_enemigo = ConfigJuego.VELOCIDAD_INICIAL_ENEMIGO
-        self.tiempo_incremento_velocidad = ConfigJuego.segundos_a_frames(
-            ConfigJuego.SEGUNDOS_INCREMENTO_VELOCIDAD
-        )
-        self.incremento_velocidad = ConfigJuego.INCREMENTO_VELOCIDAD
-
         # Carga del laberinto desde archivo JSON y acceso a la matriz
         # Intenta cargar el laberinto activo, si no existe usa el predeterminado
         from config.config_laberinto import ConfigLaberinto
 
-        ruta_laberinto = ConfigLaberinto.obtener_laberinto_activo()
+        if isinstance(repeticion, str):
+            repeticion = Repeticion.cargar(repeticion)
+        if repeticion is not None:
+            ruta_laberinto = repeticion.laberinto
+        if not ruta_laberinto:
+            ruta_laberinto = ConfigLaberinto.obtener_laberinto_activo()
         if not ruta_laberinto:
             ruta_laberinto = "src/data/laberintos/laberinto1.json"
 
-        self.laberinto = Laberinto(ruta_laberinto)  # Carga mapa, spawns y obsequios
-        self.mapa = self.laberinto.laberinto  # Matriz de 0 (libre) y 1 (muro)
+        laberinto = Laberinto(ruta_laberinto)  # Carga mapa, spawns y obsequios
+        mapa = laberinto.laberinto
 
         # Ajuste de tamaño de celda para que el laberinto ocupe la mayor área visible
         # Área disponible deja espacio para el HUD y márgenes laterales
         ancho_disponible = self.ANCHO - 40  # 20px a cada lado
         alto_disponible = self.ALTO - 140  # 95px HUD + 45px margen
-        tam_por_ancho = ancho_disponible // len(self.mapa[0])  # Celdas por ancho
-        tam_por_alto = alto_disponible // len(self.mapa)  # Celdas por alto
+        tam_por_ancho = ancho_disponible // len(mapa[0])  # Celdas por ancho
+        tam_por_alto = alto_disponible // len(mapa)  # Celdas por alto
         self.tam_celda = min(tam_por_ancho, tam_por_alto)  # Asegura que quepa
 
         # Offsets para centrar el laberinto en la pantalla
-        ancho_laberinto = len(self.mapa[0]) * self.tam_celda
-        alto_laberinto = len(self.mapa) * self.tam_celda
+        ancho_laberinto = len(mapa[0]) * self.tam_celda
+        alto_laberinto = len(mapa) * self.tam_celda
         self.offset_x = (self.ANCHO - ancho_laberinto) // 2
         self.offset_y = (
             (self.ALTO - alto_laberinto) // 2
         ) + 50  # Bajar un poco más por el HUD
 
-        # Movimiento por celdas con cooldown (estilo "paso a paso")
-        self.movimiento_por_celdas = True  # Si es False, usa movimiento pixel a pixel
-        self.teclas_presionadas = {
-            "up": False,
-            "down": False,
-            "left": False,
-            "right": False,
-        }
-        self.ultima_tecla_presionada = None
-        self.cooldown_movimiento = 0  # Frames que faltan para permitir otra celda
-        self.frames_por_movimiento = ConfigJuego.FRAMES_COOLDOWN_MOVIMIENTO
-
-        # Radios de personajes desde config
-        radio_jugador = ConfigJuego.RADIO_JUGADOR
-        radio_compu = ConfigJuego.RADIO_ENEMIGO
-
-        # Calcular posiciones de spawn usando Laberinto
-        pos_x_jugador, pos_y_jugador = self.laberinto.calcular_posicion_spawn(
-            self.laberinto.jugador_inicio,
-            radio_jugador,
-            self.tam_celda,
-            self.offset_x,
-            self.offset_y,
-        )
-        pos_x_compu, pos_y_compu = self.laberinto.calcular_posicion_spawn(
-            self.laberinto.computadora_inicio,
-            radio_compu,
-            self.tam_celda,
-            self.offset_x,
-            self.offset_y,
-        )
-
-        # Crear actores
-        self.jugador = Jugador(pos_x_jugador, pos_y_jugador, radio_jugador)
-        self.computadora = Computadora(
-            pos_x_compu, pos_y_compu, radio_compu, self.velocidad_inicial_enemigo
-        )
+        # Fondo del laberinto pre-renderizado (se construye en el primer frame)
+        self._fondo_laberinto: pygame.Surface | None = None
+        self._clave_fondo: tuple | None = None
 
-        # Generar muros usando Laberinto
-        self.muros = self.laberinto.generar_muros_rect(
-            self.tam_celda, self.offset_x, self.offset_y
-        )
+        # HUD retenido: fondo fijo y capa con los widgets ya dibujados
+        # {nombre: (valor, rects)}; se construye en el primer frame
+        self._fondo_hud: pygame.Surface | None = None
+        self._capa_hud: pygame.Surface | None = None
+        self._widgets_hud: dict[str, tuple] = {}
 
-        # Posiciones previas para deshacer en colisión (modo pixel a pixel)
-        self.pos_anterior_x = self.jugador.jugador_principal.x
-        self.pos_anterior_y = self.jugador.jugador_principal.y
+        # Rectángulos sucios (ConfigJuego.RECTANGULOS_SUCIOS): áreas de lo
+        # dibujado sobre el fondo en el último frame; None = frame completo
+        self._rects_dinamicos: list[pygame.Rect] | None = None
+        self._contenido_fondo: tuple | None = None
+        self.presentaciones_completas = 0
+        self.presentaciones_parciales = 0
 
-        # Gestor de movimiento (maneja input, colisiones y movimiento del jugador)
-        self.gestor_movimiento = GestorMovimiento(
-            self.jugador,
-            self.muros,
-            self.tam_celda,
-            self.offset_x,
-            self.offset_y,
-            self.mapa,
-            self.frames_por_movimiento,
-            self.movimiento_por_celdas,
-        )
+        # Dibujos del frame agrupados por capa (se envían con Surface.blits)
+        self.cola = ColaRender()
 
-        # Gestor de obsequios (maneja timers, recoleccion y creación)
-        self.gestor_obsequios = GestorObsequios(
-            self.laberinto, self.tiempo_vida_obsequio
-        )
+        # Movimiento por celdas con cooldown (estilo "paso a paso")
+        self.movimiento_por_celdas = True  # Si es False, usa movimiento pixel a pixel
 
-        # Gestor de dificultad progresiva
-        self.gestor_dificultad = GestorDificultad(
-            intervalo_frames=self.tiempo_incremento_velocidad,
-            incremento=self.incremento_velocidad,
-        )
+        # Repetición: la simulación la avanza el reproductor con las entradas
+        # grabadas, en la misma geometría con que se jugó
+        self.reproductor: ReproductorRepeticion | None = None
+        self.grabador: GrabadorPartida | None = None
+        if repeticion is not None:
+            self.reproductor = ReproductorRepeticion(repeticion)
+            self.tam_celda, self.offset_x, self.offset_y = repeticion.geometria
+            self.simulacion = self.reproductor.simulacion
+        else:
+            # Simulación de la partida: actores, gestores y reglas, sin dibujo ni sonido
+            if semilla is None and ConfigJuego.GRABAR_PARTIDAS:
+                semilla = random.randrange(2**31)  # Toda grabación necesita semilla
+            self.simulacion = SimulacionJuego(
+                laberinto,
+                self.tam_celda,
+                self.offset_x,
+                self.offset_y,
+                self.movimiento_por_celdas,
+                semilla=semilla,
+            )
+            if ConfigJuego.GRABAR_PARTIDAS:
+                self.grabador = GrabadorPartida(self.simulacion, ruta_laberinto)
+        self._enlazar_simulacion()
 
         # Sistema de sonido (singleton) y reproducir música de fondo
         self.sistema_sonido = SistemaSonido()
         self.sistema_sonido.reproducir_musica_fondo()
 
-    def _inicializar_timers_obsequios(self):
-        """Crea un timer de vida para cada obsequio inicial del laberinto."""
-        for posicion in self.laberinto._obsequios.keys():
-            self.obsequios_timers[posicion] = self.tiempo_vida_obsequio
-
-    def _verificar_captura(self):
-        """Si la computadora alcanza al jugador, resta vida y hace respawn; si sin vidas, game over."""
-        if self.computadora.verificar_captura(self.jugador, ConfigJuego.MARGEN_CAPTURA):
-            # Reproducir sonido de captura
-            self.sistema_sonido.reproducir_captura()
-
-            self.jugador.perder_vida()
-            if not self.jugador.esta_vivo():
-                self.game_over = True
-                self.game_over_timer = ConfigJuego.segundos_a_frames(
-                    ConfigJuego.SEGUNDOS_ESPERA_GAME_OVER
-                )
-                # Guardar datos para retornar al final
-                self.puntaje_final = self.jugador.puntaje
-                self.nombre_laberinto = self.laberinto.nombre
-                return True
-
-            # Respawn usando métodos de los personajes
-            self.jugador.respawn()
-            self.computadora.respawn()
-
-        return False
+    def _enlazar_simulacion(self):
+        """Accesos directos a lo que dibuja la pantalla (se rehacen si cambia la simulación)."""
+        self.laberinto = self.simulacion.laberinto
+        self.mapa = self.simulacion.mapa  # Matriz de 0 (libre) y 1 (muro)
+        self.jugador = self.simulacion.jugador
+        self.computadoras = self.simulacion.computadoras
+        self.computadora = self.simulacion.computadora  # Referencia para HUD
+        self.navegacion = self.simulacion.navegacion
+        self.muros = self.simulacion.muros
+        self.gestor_movimiento = self.simulacion.gestor_movimiento
+        self.gestor_obsequios = self.simulacion.gestor_obsequios
+        self.gestor_dificultad = self.simulacion.gestor_dificultad
+        self.velocidad_inicial_enemigo = self.simulacion.velocidad_inicial_enemigo
+
+    @property
+    def game_over(self) -> bool:
+        """Indica si la partida terminó (sin vidas)"""
+        return self.simulacion.game_over
+
+    @property
+    def frame_count(self) -> int:
+        """Frames simulados (útil para animaciones HUD)"""
+        return self.simulacion.frame_count
+
+    @property
+    def tiempo_transcurrido(self) -> int:
+        """Tiempo de juego en frames; se muestra como mm:ss en HUD"""
+        return self.simulacion.tiempo_transcurrido
+
+    @property
+    def puntaje_final(self) -> int | None:
+        """Puntaje al momento del game over"""
+        return self.simulacion.puntaje_final
+
+    @property
+    def nombre_laberinto(self) -> str | None:
+        """Nombre del laberinto jugado, registrado al game over"""
+        return self.simulacion.nombre_laberinto
 
     def _actualizar(self):
-        """Actualiza movimiento, IA, obsequios, dificultad y tiempo, si no está pausado o en game over."""
+        """Avanza la simulación con el teclado y reproduce los sonidos de sus eventos."""
         if self.pausado:
             return
 
@@ -202,68 +202,39 @@ class PantallaJuego:
                 self.game_over_timer -= 1
             return
 
-        self.frame_count += 1  # Avanza contador de frames
-
-        # Movimiento del jugador
-        self.gestor_movimiento.procesar_entrada_teclado()
-
-        # Enemigo persigue con BFS sobre la grilla del laberinto
-        self.computadora.perseguir_bfs(
-            self.jugador, self.mapa, self.tam_celda, self.offset_x, self.offset_y
-        )
-
-        # Timers de obsequios y su reposición al vencer
-        self.gestor_obsequios.actualizar()
-
-        # Recolección de obsequios por celda
-        self._verificar_recoleccion_obsequios()
-
-        # Verifica captura del jugador
-        self._verificar_captura()
-
-        # Escala de dificultad con el tiempo
-        self.gestor_dificultad.actualizar_velocidad(
-            self.computadora, self.tiempo_transcurrido, self.velocidad_inicial_enemigo
-        )
-
-        # Tiempo total transcurrido (en frames)
-        self.tiempo_transcurrido += 1
-
-    def _verificar_recoleccion_obsequios(self):
-        """Si el jugador pisa una celda con obsequio, suma puntos y reposiciona otro."""
-        # Centro actual del jugador en píxeles
-        jug_cx, jug_cy = self.jugador.jugador_principal.center
-        # Celda donde está parado
-        fila, col = ConversorCoordenadas.pixel_a_celda(
-            jug_cx, jug_cy, self.tam_celda, self.offset_x, self.offset_y
-        )
-        posicion_celda = (col, fila)
-
-        # Verificar y recolectar obsequio usando el gestor
-        puntos = self.gestor_obsequios.verificar_recoleccion(posicion_celda)
-        if puntos > 0:
-            # Reproducir sonido de recolección
-            self.sistema_sonido.reproducir_obsequio()
-            self.jugador.sumar_puntos(puntos)
+        if self.reproductor is not None:
+            eventos = self.reproductor.avanzar()
+        elif self.grabador is not None:
+            eventos = self.grabador.step(GestorMovimiento.leer_direccion_teclado())
+        else:
+            eventos = self.simulacion.step(GestorMovimiento.leer_direccion_teclado())
+
+        for evento in eventos:
+            if evento == EVENTO_OBSEQUIO:
+                self.sistema_sonido.reproducir_obsequio()
+            elif evento == EVENTO_CAPTURA:
+                self.sistema_sonido.reproducir_captura()
+            elif evento == EVENTO_GAME_OVER:
+                self.game_over_timer = ConfigJuego.segundos_a_frames(
+                    ConfigJuego.SEGUNDOS_ESPERA_GAME_OVER
+                )
 
     def _renderizar(self):
         """Dibuja laberinto, obsequios, actores, overlays y HUD; luego actualiza pantalla."""
+        if ConfigJuego.RECTANGULOS_SUCIOS and self._renderizar_sucios():
+            return
+
         self.screen.fill(Colores.FONDO)
 
         # Laberinto
         self._dibujar_laberinto()
 
-        # Obsequios animados
-        self.laberinto.dibujar_obsequios(
-            self.screen, self.frame_count, self.tam_celda, self.offset_x, self.offset_y
-        )
-
-        # Actores
-        self.jugador.dibujar_jugador_principal(self.screen)
-        self.computadora.dibujar_computadora_principal(self.screen)
+        # Obsequios, actores y HUD: en la cola por capas, enviados en pocos blits
+        self._encolar_dinamicos()
+        self._encolar_hud()
+        dinamicos = self._rects_dinamicos_de(self.cola.vaciar(self.screen))
 
-        # HUD y overlays
-        self._dibujar_hud()
+        # Overlays
         if self.pausado:
             if self.menu_pausa_salir:
                 self._dibujar_menu_confirmacion_salida()
@@ -272,9 +243,99 @@ class PantallaJuego:
         if self.game_over:
             self._dibujar_game_over()
 
+        # Con un overlay encima no hay frame parcial posible: el próximo es completo
+        overlay = self.pausado or self.game_over
+        self._rects_dinamicos = None if overlay else dinamicos
+        self.presentaciones_completas += 1
         pygame.display.flip()  # Presenta el frame
 
-    # funcion irrelevante, eliminar a futuro
+    def _encolar_dinamicos(self):
+        """Encola lo que cambia en cada frame: obsequios, actores y estrella del HUD."""
+        self.laberinto.encolar_obsequios(
+            self.cola,
+            CAPA_OBSEQUIOS,
+            self.frame_count,
+            self.tam_celda,
+            self.offset_x,
+            self.offset_y,
+        )
+        self.jugador.encolar_dibujo(self.cola, CAPA_ACTORES)
+        for computadora in self.computadoras:
+            computadora.encolar_dibujo(self.cola, CAPA_ACTORES)
+        self.cola.agregar_dibujo(CAPA_HUD_ANIMADO, self._dibujar_estrella_hud)
+
+    @staticmethod
+    def _rects_dinamicos_de(dibujados: dict) -> list[pygame.Rect]:
+        """Áreas dibujadas por la cola, salvo las franjas fijas del HUD."""
+        return [
+            rect
+            for capa, rects in dibujados.items()
+            if capa != CAPA_HUD
+            for rect in rects
+        ]
+
+    def _renderizar_sucios(self) -> bool:
+        """
+        Frame parcial: restaura desde el fondo solo lo que cambió y lo presenta.
+
+        Se restauran las áreas de los obsequios, actores y estrella del frame
+        anterior y las de los widgets del HUD que cambiaron; se vuelve a
+        dibujar lo dinámico y se presentan solo esos rectángulos con
+        display.update. Si el área sucia pasa ConfigJuego.UMBRAL_AREA_SUCIA
+        (fracción de la ventana), se presenta la ventana entera con flip.
+
+        Returns:
+            False si hace falta un frame completo (el primero, con overlay o
+            con el laberinto cambiado); True si el frame ya se presentó
+        """
+        if self._rects_dinamicos is None or self.pausado or self.game_over:
+            return False
+        if self._fondo_laberinto is None or (
+            self._clave_fondo_laberinto() != self._clave_fondo
+        ):
+            return False
+
+        fondo = self._fondo_ventana()
+        sucios = self._rects_dinamicos + self._actualizar_capa_hud()
+        for rect in sucios:
+            self._restaurar(fondo, rect)
+
+        self._encolar_dinamicos()
+        dinamicos = self._rects_dinamicos_de(self.cola.vaciar(self.screen))
+        self._rects_dinamicos = dinamicos
+        sucios += dinamicos
+
+        ancho, alto = self.screen.get_size()
+        area = sum(rect.width * rect.height for rect in sucios)
+        if area > ConfigJuego.UMBRAL_AREA_SUCIA * ancho * alto:
+            self.presentaciones_completas += 1
+            pygame.display.flip()
+        else:
+            self.presentaciones_parciales += 1
+            pygame.display.update(sucios)
+        return True
+
+    def _fondo_ventana(self) -> pygame.Surface:
+        """Ventana sin nada dinámico (fondo y laberinto), para restaurar áreas."""
+
+        def construir():
+            fondo = pygame.Surface(self.screen.get_size()).convert()
+            fondo.fill(Colores.FONDO)
+            fondo.blit(self._fondo_laberinto, (self.offset_x, self.offset_y))
+            return fondo
+
+        clave = (self._contenido_fondo, self.screen.get_size())
+        return self._horneada("fondo_ventana", clave, construir)
+
+    def _restaurar(self, fondo: pygame.Surface, rect: pygame.Rect):
+        """Devuelve un área de la ventana al fondo (laberinto y capa del HUD)."""
+        rect = rect.clip(self.screen.get_rect())
+        self.screen.blit(fondo, rect, rect)
+        for y, alto in self.FRANJAS_HUD:
+            franja = rect.clip((0, y, self.ANCHO, alto))
+            if franja:
+                self.screen.blit(self._capa_hud, franja, franja)
+
     def _dibujar_linea_distancia(self):
         """Para depurar: línea entre jugador y enemigo y texto con distancia."""
         pos_jugador = self.jugador.jugador_principal.center
@@ -285,233 +346,318 @@ class PantallaJuego:
         dy = pos_enemigo[1] - pos_jugador[1]
         distancia = math.sqrt(dx**2 + dy**2)
 
-        dist_texto = self.fuente_pequena.render(
-            f"Dist: {int(distancia)}", True, (255, 255, 255)
+        dist_texto = GestorFuentes().renderizar(
+            self.fuente_pequena, f"Dist: {int(distancia)}", True, (255, 255, 255)
         )
         self.screen.blit(dist_texto, (pos_jugador[0] + 20, pos_jugador[1] - 20))
 
-    def _dibujar_laberinto(self):
-        """Dibuja el laberinto con estética mitológica griega (Mito de Teseo y el Minotauro)."""
-        import math
+    def _clave_fondo_laberinto(self) -> tuple:
+        """Clave que identifica el fondo pre-renderizado: tamaño, offsets, ventana y layout."""
+        return (
+            self.tam_celda,
+            self.offset_x,
+            self.offset_y,
+            self.ANCHO,
+            self.ALTO,
+            self.laberinto.version_mapa,
+        )
+
+    def _construir_fondo_laberinto(self) -> pygame.Surface:
+        """
+        Renderiza el laberinto completo en una superficie fuera de pantalla.
+
+        El mapa no cambia durante la partida, así que los miles de llamadas a
+        pygame.draw de muros y mosaicos se hacen una sola vez y luego cada frame
+        solo cuesta un blit.
+        """
+        ancho = len(self.mapa[0]) * self.tam_celda
+        alto = len(self.mapa) * self.tam_celda
+        fondo = pygame.Surface((ancho, alto))
+        if pygame.display.get_surface() is not None:
+            fondo = fondo.convert()  # Mismo formato que la ventana: blit más rápido
 
         for fila in range(len(self.mapa)):
             for col in range(len(self.mapa[0])):
-                x = col * self.tam_celda + self.offset_x
-                y = fila * self.tam_celda + self.offset_y
-
+                x = col * self.tam_celda
+                y = fila * self.tam_celda
                 if self.mapa[fila][col] == 1:
-                    # === MUROS DE PIEDRA ANTIGUA (ESTILO GRIEGO) ===
-                    # Base de mármol/piedra caliza
-                    color_base = (210, 195, 170)  # Tono mármol beige
-                    pygame.draw.rect(
-                        self.screen,
-                        color_base,
-                        (x, y, self.tam_celda, self.tam_celda),
-                    )
-
-                    # Textura de bloques de piedra (vetas y grietas)
-                    block_size = self.tam_celda // 3
-                    for i in range(3):
-                        for j in range(3):
-                            bx = x + i * block_size + 1
-                            by = y + j * block_size + 1
-                            # Variación de color para simular vetas de mármol
-                            veta = ((i * 7 + j * 5 + fila * 3 + col * 2) % 15) - 7
-                            color_piedra = (
-                                min(255, max(0, 210 + veta)),
-                                min(255, max(0, 195 + veta)),
-                                min(255, max(0, 170 + veta)),
-                            )
-                            pygame.draw.rect(
-                                self.screen,
-                                color_piedra,
-                                (bx, by, block_size - 2, block_size - 2),
-                            )
-                            # Líneas de separación entre bloques (mortero)
-                            pygame.draw.line(
-                                self.screen,
-                                (180, 165, 145),
-                                (bx, by),
-                                (bx + block_size - 2, by),
-                                1,
-                            )
-                            pygame.draw.line(
-                                self.screen,
-                                (180, 165, 145),
-                                (bx, by),
-                                (bx, by + block_size - 2),
-                                1,
-                            )
-
-                    # Borde de bronce/terracota (pilares antiguos)
-                    pygame.draw.rect(
-                        self.screen,
-                        (184, 115, 51),  # Bronce oxidado
-                        (x, y, self.tam_celda, self.tam_celda),
-                        2,
-                    )
-
-                    # Sombra interior para profundidad
-                    pygame.draw.line(
-                        self.screen,
-                        (150, 140, 120),
-                        (x + 2, y + 2),
-                        (x + self.tam_celda - 2, y + 2),
-                        1,
-                    )
-                    pygame.draw.line(
-                        self.screen,
-                        (150, 140, 120),
-                        (x + 2, y + 2),
-                        (x + 2, y + self.tam_celda - 2),
-                        1,
-                    )
+                    self._dibujar_celda_muro(fondo, x, y, fila, col)
                 else:
-                    # === PASILLOS CON MOSAICO GRECO-ROMANO ===
-                    # Base terracota/arcilla
-                    base_terracota = (156, 102, 68)  # Terracota
-                    pygame.draw.rect(
-                        self.screen,
-                        base_terracota,
-                        (x, y, self.tam_celda, self.tam_celda),
-                    )
-
-                    # Patrón de mosaico (baldosas pequeñas)
-                    tile_size = self.tam_celda // 4
-                    for tx in range(4):
-                        for ty in range(4):
-                            tile_x = x + tx * tile_size + 1
-                            tile_y = y + ty * tile_size + 1
-
-                            # Variación de color para mosaico (crema/beige/terracota)
-                            patron = (tx + ty + fila + col) % 3
-                            if patron == 0:
-                                tile_color = (198, 156, 109)  # Crema oscuro
-                            elif patron == 1:
-                                tile_color = (176, 141, 105)  # Beige
-                            else:
-                                tile_color = (166, 123, 91)  # Terracota claro
-
-                            pygame.draw.rect(
-                                self.screen,
-                                tile_color,
-                                (tile_x, tile_y, tile_size - 2, tile_size - 2),
-                            )
-
-                    # Detalle central: símbolo griego ocasional
-                    if (fila + col) % 7 == 0:
-                        center_x = x + self.tam_celda // 2
-                        center_y = y + self.tam_celda // 2
-                        # Pequeña cruz griega o meandro
-                        pygame.draw.circle(
-                            self.screen,
-                            (184, 115, 51),  # Bronce
-                            (center_x, center_y),
-                            2,
-                        )
-
-                    # Borde sutil de separación
-                    pygame.draw.rect(
-                        self.screen,
-                        (140, 90, 60),
-                        (x, y, self.tam_celda, self.tam_celda),
-                        1,
-                    )
+                    self._dibujar_celda_pasillo(fondo, x, y, fila, col)
+
+        return fondo
+
+    def _dibujar_laberinto(self):
+        """Dibuja el laberinto desde el fondo cacheado, reconstruyéndolo solo si cambió el layout."""
+        clave = self._clave_fondo_laberinto()
+        if self._fondo_laberinto is None or clave != self._clave_fondo:
+            # Otra partida en el mismo laberinto pudo dejarlo horneado; entre
+            # partidas la versión no alcanza, así que se agrega el contenido
+            contenido = (*clave, tuple(map(tuple, self.mapa)))
+            self._fondo_laberinto = self._horneada(
+                "fondo_laberinto", contenido, self._construir_fondo_laberinto
+            )
+            self._clave_fondo = clave
+            self._contenido_fondo = contenido
+
+        self.screen.blit(self._fondo_laberinto, (self.offset_x, self.offset_y))
+
+    def _dibujar_celda_muro(self, superficie, x, y, fila, col):
+        """Dibuja un muro de piedra antigua (estilo griego) en la celda indicada."""
+        # Base de mármol/piedra caliza
+        color_base = (210, 195, 170)  # Tono mármol beige
+        pygame.draw.rect(
+            superficie,
+            color_base,
+            (x, y, self.tam_celda, self.tam_celda),
+        )
+
+        # Textura de bloques de piedra (vetas y grietas)
+        block_size = self.tam_celda // 3
+        for i in range(3):
+            for j in range(3):
+                bx = x + i * block_size + 1
+                by = y + j * block_size + 1
+                # Variación de color para simular vetas de mármol
+                veta = ((i * 7 + j * 5 + fila * 3 + col * 2) % 15) - 7
+                color_piedra = (
+                    min(255, max(0, 210 + veta)),
+                    min(255, max(0, 195 + veta)),
+                    min(255, max(0, 170 + veta)),
+                )
+                pygame.draw.rect(
+                    superficie,
+                    color_piedra,
+                    (bx, by, block_size - 2, block_size - 2),
+                )
+                # Líneas de separación entre bloques (mortero)
+                pygame.draw.line(
+                    superficie,
+                    (180, 165, 145),
+                    (bx, by),
+                    (bx + block_size - 2, by),
+                    1,
+                )
+                pygame.draw.line(
+                    superficie,
+                    (180, 165, 145),
+                    (bx, by),
+                    (bx, by + block_size - 2),
+                    1,
+                )
+
+        # Borde de bronce/terracota (pilares antiguos)
+        pygame.draw.rect(
+            superficie,
+            (184, 115, 51),  # Bronce oxidado
+            (x, y, self.tam_celda, self.tam_celda),
+            2,
+        )
+
+        # Sombra interior para profundidad
+        pygame.draw.line(
+            superficie,
+            (150, 140, 120),
+            (x + 2, y + 2),
+            (x + self.tam_celda - 2, y + 2),
+            1,
+        )
+        pygame.draw.line(
+            superficie,
+            (150, 140, 120),
+            (x + 2, y + 2),
+            (x + 2, y + self.tam_celda - 2),
+            1,
+        )
+
+    def _dibujar_celda_pasillo(self, superficie, x, y, fila, col):
+        """Dibuja un pasillo con mosaico greco-romano en la celda indicada."""
+        # Base terracota/arcilla
+        base_terracota = (156, 102, 68)  # Terracota
+        pygame.draw.rect(
+            superficie,
+            base_terracota,
+            (x, y, self.tam_celda, self.tam_celda),
+        )
+
+        # Patrón de mosaico (baldosas pequeñas)
+        tile_size = self.tam_celda // 4
+        for tx in range(4):
+            for ty in range(4):
+                tile_x = x + tx * tile_size + 1
+                tile_y = y + ty * tile_size + 1
+
+                # Variación de color para mosaico (crema/beige/terracota)
+                patron = (tx + ty + fila + col) % 3
+                if patron == 0:
+                    tile_color = (198, 156, 109)  # Crema oscuro
+                elif patron == 1:
+                    tile_color = (176, 141, 105)  # Beige
+                else:
+                    tile_color = (166, 123, 91)  # Terracota claro
+
+                pygame.draw.rect(
+                    superficie,
+                    tile_color,
+                    (tile_x, tile_y, tile_size - 2, tile_size - 2),
+                )
+
+        # Detalle central: símbolo griego ocasional
+        if (fila + col) % 7 == 0:
+            center_x = x + self.tam_celda // 2
+            center_y = y + self.tam_celda // 2
+            # Pequeña cruz griega o meandro
+            pygame.draw.circle(
+                superficie,
+                (184, 115, 51),  # Bronce
+                (center_x, center_y),
+                2,
+            )
+
+        # Borde sutil de separación
+        pygame.draw.rect(
+            superficie,
+            (140, 90, 60),
+            (x, y, self.tam_celda, self.tam_celda),
+            1,
+        )
+
+    # Alto del panel del HUD (incluye la doble línea inferior) y franjas
+    # (y, alto) que cubre: entre el panel y la última línea queda una fila
+    # libre que deja ver el laberinto
+    ALTO_HUD = 98
+    FRANJAS_HUD = ((0, 95), (96, 2))
+
+    def _construir_fondo_hud(self) -> pygame.Surface:
+        """
+        Renderiza la parte fija del HUD: panel de mármol, líneas y caja del puntaje.
+
+        Los widgets (nombre, puntaje, tiempo, vidas, dificultad, controles) se
+        dibujan encima en la capa del HUD solo cuando cambia su valor; al
+        borrarlos se restaura este fondo en el área que ocupaban.
+        """
+        fondo = pygame.Surface((self.ANCHO, self.ALTO_HUD))
+        if pygame.display.get_surface() is not None:
+            fondo = fondo.convert()  # Mismo formato que la ventana: blit más rápido
 
-    def _dibujar_hud(self):
-        """Panel superior con nombre, vidas, puntaje, dificultad, tiempo y controles - estilo mitológico griego."""
         # Panel base mármol/pergamino
         panel_rect = pygame.Rect(0, 0, self.ANCHO, 95)
-        pygame.draw.rect(self.screen, (210, 195, 170), panel_rect)  # Mármol beige
+        pygame.draw.rect(fondo, (210, 195, 170), panel_rect)  # Mármol beige
 
         # Línea superior de bronce
-        pygame.draw.line(self.screen, (184, 115, 51), (0, 0), (self.ANCHO, 0), 3)
+        pygame.draw.line(fondo, (184, 115, 51), (0, 0), (self.ANCHO, 0), 3)
 
         # Doble línea inferior (estilo columnas griegas)
-        pygame.draw.line(self.screen, (184, 115, 51), (0, 93), (self.ANCHO, 93), 2)
-        pygame.draw.line(self.screen, (139, 90, 43), (0, 96), (self.ANCHO, 96), 2)
-
-        # === FILA SUPERIOR ===
-        # IZQUIERDA: Nombre del jugador
-        nombre_texto = f"{self.nombre_jugador}"
-        nombre_surf = self.fuente_pequena.render(
-            nombre_texto, False, (139, 69, 19)
-        )  # Marrón antiguo
-        self.screen.blit(nombre_surf, (15, 8))
-
-        # CENTRO: Puntaje con estrella
-        x_puntaje = self.ANCHO // 2 - 80
-        y_puntaje = 8
+        pygame.draw.line(fondo, (184, 115, 51), (0, 93), (self.ANCHO, 93), 2)
+        pygame.draw.line(fondo, (139, 90, 43), (0, 96), (self.ANCHO, 96), 2)
 
         # Caja del puntaje (estilo papiro/pergamino)
+        x_puntaje, y_puntaje = self._posicion_puntaje()
         puntaje_box = pygame.Rect(x_puntaje - 5, y_puntaje - 3, 160, 28)
         pygame.draw.rect(
-            self.screen, (198, 156, 109), puntaje_box, border_radius=4
+            fondo, (198, 156, 109), puntaje_box, border_radius=4
         )  # Crema oscuro
         pygame.draw.rect(
-            self.screen, (184, 115, 51), puntaje_box, 2, border_radius=4
+            fondo, (184, 115, 51), puntaje_box, 2, border_radius=4
         )  # Borde bronce
 
-        # Estrella animada más pequeña
-        x_estrella = x_puntaje + 5
-        y_estrella_center = y_puntaje + 11
-        radio_ext = 8
-        radio_int = 3
-        puntos_estrella = []
-        rotacion = (self.frame_count % 120) * 0.05
-        for i in range(10):
-            angulo = rotacion + math.pi / 2 + (i * math.pi / 5)
-            radio = radio_ext if i % 2 == 0 else radio_int
-            px = x_estrella + radio * math.cos(angulo)
-            py = y_estrella_center - radio * math.sin(angulo)
-            puntos_estrella.append((px, py))
-        pygame.draw.polygon(self.screen, (255, 220, 60), puntos_estrella)
+        return fondo
+
+    def _posicion_puntaje(self) -> tuple[int, int]:
+        """Esquina del bloque del puntaje (caja, estrella y número)."""
+        return self.ANCHO // 2 - 80, 8
+
+    def _valores_hud(self) -> dict:
+        """Valor actual de cada widget; se redibuja solo el que cambió."""
+        return {
+            "nombre": self.nombre_jugador,
+            "puntaje": self.jugador.puntaje,
+            "tiempo": self.tiempo_transcurrido // 60,  # El reloj muestra segundos
+            "vidas": self.jugador.vidas,
+            "dificultad": self.computadora.velocidad / self.velocidad_inicial_enemigo,
+            "controles": None,  # Fijo: se dibuja una sola vez
+        }
 
-        # Texto del puntaje
-        puntaje_texto = f"{self.jugador.puntaje:06d}"
-        puntaje_surf = self.fuente_pequena.render(puntaje_texto, False, (255, 220, 60))
-        self.screen.blit(puntaje_surf, (x_puntaje + 22, y_puntaje + 3))
+    def _dibujar_widget_hud(self, superficie, nombre, valor) -> list[pygame.Rect]:
+        """
+        Dibuja un widget del HUD sobre 'superficie'.
 
-        # DERECHA: Tiempo
-        tiempo_min = self.tiempo_transcurrido // 3600
-        tiempo_seg = (self.tiempo_transcurrido % 3600) // 60
-        tiempo_texto = f"{tiempo_min:02d}:{tiempo_seg:02d}"
-        tiempo_surf = self.fuente_pequena.render(
-            tiempo_texto, False, (139, 69, 19)
-        )  # Marrón antiguo
-        tiempo_rect = tiempo_surf.get_rect(right=self.ANCHO - 15, y=8)
-        self.screen.blit(tiempo_surf, tiempo_rect)
-
-        # === FILA INFERIOR ===
-        # IZQUIERDA: Vidas con corazones compactos
-        x_vidas = 15
-        y_vidas = 48
-        for i in range(self.jugador.vidas):
-            cx = x_vidas + (i * 28)
-
-            # Corazón más pequeño (rojo terracota)
-            pygame.draw.circle(self.screen, (178, 34, 34), (cx + 4, y_vidas + 4), 4)
-            pygame.draw.circle(self.screen, (178, 34, 34), (cx + 12, y_vidas + 4), 4)
-            puntos = [
-                (cx, y_vidas + 5),
-                (cx + 16, y_vidas + 5),
-                (cx + 8, y_vidas + 15),
-            ]
-            pygame.draw.polygon(self.screen, (178, 34, 34), puntos)
-            # Brillo
-            pygame.draw.circle(self.screen, (205, 92, 92), (cx + 6, y_vidas + 2), 2)
-
-        # CENTRO: Dificultad con barra
+        Returns:
+            Rectángulos que ocupó (para borrarlo cuando cambie)
+        """
+        fuentes = GestorFuentes()
+
+        if nombre == "nombre":
+            # IZQUIERDA: Nombre del jugador (marrón antiguo)
+            nombre_surf = fuentes.renderizar(
+                self.fuente_pequena, f"{valor}", False, (139, 69, 19)
+            )
+            return [superficie.blit(nombre_surf, (15, 8))]
+
+        if nombre == "puntaje":
+            # CENTRO: Puntaje (cambia casi cada frame: atlas de glifos)
+            x_puntaje, y_puntaje = self._posicion_puntaje()
+            atlas = fuentes.atlas(self.fuente_pequena, (255, 220, 60))
+            posicion = (x_puntaje + 22, y_puntaje + 3)
+            return [atlas.dibujar(superficie, f"{valor:06d}", posicion)]
+
+        if nombre == "tiempo":
+            # DERECHA: Tiempo (marrón antiguo)
+            tiempo_min, tiempo_seg = divmod(valor, 60)
+            tiempo_texto = f"{tiempo_min:02d}:{tiempo_seg:02d}"
+            atlas = fuentes.atlas(self.fuente_pequena, (139, 69, 19))
+            ancho_tiempo, _ = atlas.tamaño(tiempo_texto)
+            posicion = (self.ANCHO - 15 - ancho_tiempo, 8)
+            return [atlas.dibujar(superficie, tiempo_texto, posicion)]
+
+        if nombre == "vidas":
+            # IZQUIERDA: Vidas con corazones compactos
+            rects = []
+            x_vidas = 15
+            y_vidas = 48
+            for i in range(valor):
+                cx = x_vidas + (i * 28)
+
+                # Corazón más pequeño (rojo terracota)
+                rojo = (178, 34, 34)
+                rects.append(
+                    pygame.draw.circle(superficie, rojo, (cx + 4, y_vidas + 4), 4)
+                )
+                rects.append(
+                    pygame.draw.circle(superficie, rojo, (cx + 12, y_vidas + 4), 4)
+                )
+                puntos = [
+                    (cx, y_vidas + 5),
+                    (cx + 16, y_vidas + 5),
+                    (cx + 8, y_vidas + 15),
+                ]
+                rects.append(pygame.draw.polygon(superficie, rojo, puntos))
+                # Brillo
+                pygame.draw.circle(superficie, (205, 92, 92), (cx + 6, y_vidas + 2), 2)
+            return rects
+
+        if nombre == "dificultad":
+            return self._dibujar_dificultad_hud(superficie, valor)
+
+        # DERECHA: Controles compactos
+        controles_texto = "WASD: Mover  P: Pausa  ESC: Salir"
+        controles_surf = fuentes.renderizar(
+            self.fuente_pequena, controles_texto, False, (101, 67, 33)  # Marrón oscuro
+        )
+        controles_rect = controles_surf.get_rect(right=self.ANCHO - 15, y=70)
+        return [superficie.blit(controles_surf, controles_rect)]
+
+    def _dibujar_dificultad_hud(self, superficie, nivel_dificultad) -> list:
+        """CENTRO (fila inferior): texto de dificultad con barra de progreso."""
         x_dif = self.ANCHO // 2 - 70
         y_dif = 50
-        nivel_dificultad = self.computadora.velocidad / self.velocidad_inicial_enemigo
 
         # Texto de dificultad
         dif_texto = f"Dificultad {nivel_dificultad:.1f}x"
-        dif_surf = self.fuente_pequena.render(
-            dif_texto, False, (178, 34, 34)
+        dif_surf = GestorFuentes().renderizar(
+            self.fuente_pequena, dif_texto, False, (178, 34, 34)
         )  # Rojo terracota
-        self.screen.blit(dif_surf, (x_dif, y_dif))
+        rects = [superficie.blit(dif_surf, (x_dif, y_dif))]
 
         # Barra de progreso debajo del texto
         barra_ancho = 120
@@ -520,11 +666,13 @@ class PantallaJuego:
         barra_y = y_dif + 20
 
         # Fondo de la barra (bronce oscuro)
-        pygame.draw.rect(
-            self.screen,
-            (101, 67, 33),  # Marrón oscuro
-            (barra_x, barra_y, barra_ancho, barra_alto),
-            border_radius=4,
+        rects.append(
+            pygame.draw.rect(
+                superficie,
+                (101, 67, 33),  # Marrón oscuro
+                (barra_x, barra_y, barra_ancho, barra_alto),
+                border_radius=4,
+            )
         )
 
         # Relleno según dificultad (máximo 3x)
@@ -541,7 +689,7 @@ class PantallaJuego:
 
         if relleno_ancho > 0:
             pygame.draw.rect(
-                self.screen,
+                superficie,
                 color_barra,
                 (barra_x, barra_y, relleno_ancho, barra_alto),
                 border_radius=4,
@@ -549,29 +697,133 @@ class PantallaJuego:
 
         # Borde de la barra
         pygame.draw.rect(
-            self.screen,
+            superficie,
             (184, 115, 51),  # Bronce
             (barra_x, barra_y, barra_ancho, barra_alto),
             1,
             border_radius=4,
         )
+        return rects
 
-        # DERECHA: Controles compactos
-        controles_texto = "WASD: Mover  P: Pausa  ESC: Salir"
-        controles_surf = self.fuente_pequena.render(
-            controles_texto, False, (101, 67, 33)  # Marrón oscuro
-        )
-        controles_rect = controles_surf.get_rect(right=self.ANCHO - 15, y=70)
-        self.screen.blit(controles_surf, controles_rect)
+    def _actualizar_capa_hud(self) -> list[pygame.Rect]:
+        """
+        Redibuja en la capa del HUD solo los widgets cuyo valor cambió.
+
+        Returns:
+            Áreas de la capa que cambiaron (valores borrados y nuevos)
+        """
+        cambios = []
+        if self._capa_hud is None or self._fondo_hud is None:
+            self._fondo_hud = self._horneada(
+                "fondo_hud", (self.ANCHO,), self._construir_fondo_hud
+            )
+            self._capa_hud = self._fondo_hud.copy()
+            self._widgets_hud = {}
+            cambios.append(self._capa_hud.get_rect())
+
+        for nombre, valor in self._valores_hud().items():
+            anterior = self._widgets_hud.get(nombre)
+            if anterior is not None and anterior[0] == valor:
+                continue
+            if anterior is not None:
+                # Borrar el valor anterior restaurando el fondo en su área
+                for rect in anterior[1]:
+                    self._capa_hud.blit(self._fondo_hud, rect, rect)
+                cambios.extend(anterior[1])
+            rects = self._dibujar_widget_hud(self._capa_hud, nombre, valor)
+            self._widgets_hud[nombre] = (valor, rects)
+            cambios.extend(rects)
+        return cambios
+
+    def _encolar_hud(self):
+        """Panel superior con nombre, vidas, puntaje, dificultad, tiempo y controles - estilo mitológico griego."""
+        # Capa retenida: fondo fijo + widgets redibujados solo al cambiar
+        self._actualizar_capa_hud()
+        for y, alto in self.FRANJAS_HUD:
+            self.cola.agregar(
+                CAPA_HUD, self._capa_hud, (0, y), pygame.Rect(0, y, self.ANCHO, alto)
+            )
+
+    def _dibujar_hud(self):
+        """Dibuja el HUD completo en el acto (capa retenida y estrella)."""
+        self._encolar_hud()
+        self.cola.agregar_dibujo(CAPA_HUD_ANIMADO, self._dibujar_estrella_hud)
+        self.cola.vaciar(self.screen)
+
+    def _dibujar_estrella_hud(self, superficie: pygame.Surface) -> pygame.Rect:
+        """Estrella animada junto al puntaje (lo único del HUD que cambia siempre)."""
+        x_puntaje, y_puntaje = self._posicion_puntaje()
+        x_estrella = x_puntaje + 5
+        y_estrella_center = y_puntaje + 11
+        radio_ext = 8
+        radio_int = 3
+        puntos_estrella = []
+        rotacion = (self.frame_count % 120) * 0.05
+        for i in range(10):
+            angulo = rotacion + math.pi / 2 + (i * math.pi / 5)
+            radio = radio_ext if i % 2 == 0 else radio_int
+            px = x_estrella + radio * math.cos(angulo)
+            py = y_estrella_center - radio * math.sin(angulo)
+            puntos_estrella.append((px, py))
+        return pygame.draw.polygon(superficie, (255, 220, 60), puntos_estrella)
+
+    @classmethod
+    def _horneada(cls, nombre: str, clave: tuple, construir) -> pygame.Surface:
+        """
+        Superficie compartida entre partidas, reconstruida solo si cambia su clave.
+
+        Se guarda una por nombre (la última clave pedida). Las superficies
+        son compartidas: no deben modificarse después de construidas.
+
+        Args:
+            nombre: Identificador ("fondo_laberinto", "pausa"...)
+            clave: Valores de los que depende la superficie
+            construir: Función sin argumentos que la construye
+        """
+        guardada = cls._horneadas.get(nombre)
+        if guardada is not None and guardada[0] == clave:
+            return guardada[1]
+        superficie = construir()
+        cls._horneadas[nombre] = (clave, superficie)
+        return superficie
+
+    def _overlay(self, nombre: str, clave: tuple, componer) -> pygame.Surface:
+        """
+        Overlay de pantalla completa pre-compuesto, reutilizado entre frames.
+
+        La primera vez (o si cambian el tamaño de ventana, las fuentes o la
+        clave) se crea una superficie con el velo oscuro translúcido y se
+        llama a componer(superficie) para dibujar encima la caja y los textos
+        fijos. Los frames siguientes el overlay cuesta un solo blit, también
+        en las partidas siguientes (ver _horneada).
+
+        Args:
+            nombre: Identificador del overlay ("pausa", "game_over"...)
+            clave: Valores de los que depende lo compuesto (p. ej. el puntaje final)
+            componer: Función que dibuja el contenido fijo sobre la superficie
+
+        Returns:
+            Superficie del tamaño de la ventana, con alpha por píxel
+        """
+        fuentes = (self.fuente_titulo, self.fuente_hud, self.fuente_pequena)
+        clave = (self.ANCHO, self.ALTO, *fuentes, *clave)
+
+        def construir():
+            superficie = pygame.Surface((self.ANCHO, self.ALTO), pygame.SRCALPHA)
+            superficie.fill((20, 15, 10, 200))  # Pergamino oscuro translúcido
+            componer(superficie)
+            if pygame.display.get_surface() is not None:
+                superficie = superficie.convert_alpha()
+            return superficie
+
+        return self._horneada(nombre, clave, construir)
 
     def _dibujar_pausa(self):
         """Overlay translúcido y texto de pausa con estilo mitológico griego."""
-        # Overlay oscuro (pergamino oscuro)
-        overlay = pygame.Surface((self.ANCHO, self.ALTO))
-        overlay.set_alpha(200)
-        overlay.fill((20, 15, 10))  # Pergamino oscuro
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._overlay("pausa", (), self._componer_pausa), (0, 0))
 
+    def _componer_pausa(self, superficie):
+        """Caja y textos de pausa (fijos: se componen una sola vez)."""
         # Caja central estilo templo griego
         caja_ancho = 500
         caja_alto = 250
@@ -580,39 +832,43 @@ class PantallaJuego:
 
         caja_rect = pygame.Rect(caja_x, caja_y, caja_ancho, caja_alto)
         pygame.draw.rect(
-            self.screen, (210, 195, 170), caja_rect, border_radius=15
+            superficie, (210, 195, 170), caja_rect, border_radius=15
         )  # Mármol
 
         # Doble borde de bronce
-        pygame.draw.rect(self.screen, (184, 115, 51), caja_rect, 4, border_radius=15)
+        pygame.draw.rect(superficie, (184, 115, 51), caja_rect, 4, border_radius=15)
         caja_rect2 = pygame.Rect(caja_x - 3, caja_y - 3, caja_ancho + 6, caja_alto + 6)
-        pygame.draw.rect(self.screen, (139, 90, 43), caja_rect2, 2, border_radius=15)
+        pygame.draw.rect(superficie, (139, 90, 43), caja_rect2, 2, border_radius=15)
         caja_rect3 = pygame.Rect(
             caja_x - 6, caja_y - 6, caja_ancho + 12, caja_alto + 12
         )
-        pygame.draw.rect(self.screen, (101, 67, 33), caja_rect3, 1, border_radius=15)
+        pygame.draw.rect(superficie, (101, 67, 33), caja_rect3, 1, border_radius=15)
 
         # Título PAUSA con triple sombra (estilo griego)
         y_titulo = caja_y + 60
         # Sombra 3
-        titulo_s3 = self.fuente_titulo.render("PAUSA", False, (101, 67, 33))
+        titulo_s3 = GestorFuentes().renderizar(
+            self.fuente_titulo, "PAUSA", False, (101, 67, 33)
+        )
         titulo_s3_rect = titulo_s3.get_rect(center=(self.ANCHO // 2 + 4, y_titulo + 4))
-        self.screen.blit(titulo_s3, titulo_s3_rect)
-        # Sombra 2
-        titulo_s2 = self.fuente_titulo.render("PAUSA", False, (184, 115, 51))  # Bronce
+        superficie.blit(titulo_s3, titulo_s3_rect)
+        # Sombra 2 (bronce)
+        titulo_s2 = GestorFuentes().renderizar(
+            self.fuente_titulo, "PAUSA", False, (184, 115, 51)
+        )
         titulo_s2_rect = titulo_s2.get_rect(center=(self.ANCHO // 2 + 2, y_titulo + 2))
-        self.screen.blit(titulo_s2, titulo_s2_rect)
+        superficie.blit(titulo_s2, titulo_s2_rect)
         # Texto principal
-        titulo = self.fuente_titulo.render(
-            "PAUSA", False, (139, 69, 19)
+        titulo = GestorFuentes().renderizar(
+            self.fuente_titulo, "PAUSA", False, (139, 69, 19)
         )  # Marrón antiguo
         titulo_rect = titulo.get_rect(center=(self.ANCHO // 2, y_titulo))
-        self.screen.blit(titulo, titulo_rect)
+        superficie.blit(titulo, titulo_rect)
 
         # Línea decorativa (bronce)
         linea_y = y_titulo + 50
         pygame.draw.line(
-            self.screen,
+            superficie,
             (184, 115, 51),  # Bronce
             (self.ANCHO // 2 - 150, linea_y),
             (self.ANCHO // 2 + 150, linea_y),
@@ -621,18 +877,20 @@ class PantallaJuego:
 
         # Instrucciones con icono
         y_instruccion = linea_y + 40
-        instruccion = self.fuente_hud.render(
+        instruccion = GestorFuentes().renderizar(
+            self.fuente_hud,
             "Presiona P para continuar", False, (34, 139, 34)  # Verde oliva
         )
         instruccion_rect = instruccion.get_rect(center=(self.ANCHO // 2, y_instruccion))
-        self.screen.blit(instruccion, instruccion_rect)
+        superficie.blit(instruccion, instruccion_rect)
 
         # Tip adicional
-        tip = self.fuente_pequena.render(
+        tip = GestorFuentes().renderizar(
+            self.fuente_pequena,
             "ESC para salir al menú", False, (101, 67, 33)  # Marrón
         )
         tip_rect = tip.get_rect(center=(self.ANCHO // 2, y_instruccion + 35))
-        self.screen.blit(tip, tip_rect)
+        superficie.blit(tip, tip_rect)
 
     def _dibujar_game_over(self):
         """Overlay de game over mostrando las métricas finales de la partida."""
@@ -641,127 +899,145 @@ class PantallaJuego:
             self.sistema_sonido.pausar_musica()
             self._musica_pausada = True
 
-        overlay = pygame.Surface((self.ANCHO, self.ALTO))
-        overlay.set_alpha(200)
-        overlay.fill((20, 15, 10))  # Pergamino oscuro
+        # Lo fijo se compone una vez (las métricas ya no cambian); solo la
+        # cuenta regresiva se dibuja en cada frame
+        clave = (
+            self.jugador.puntaje,
+            self.tiempo_transcurrido // 60,
+            self.computadora.velocidad,
+        )
+        overlay = self._overlay("game_over", clave, self._componer_game_over)
         self.screen.blit(overlay, (0, 0))
 
+        # Mostrar mensaje según si puede salir o no
+        y_instruccion = 500
+        if self.game_over_timer > 0:
+            segundos_restantes = ConfigJuego.frames_a_segundos(self.game_over_timer) + 1
+            instruccion = GestorFuentes().renderizar(
+                self.fuente_pequena,
+                f"Espera {segundos_restantes} segundos...",
+                True,
+                (101, 67, 33),  # Marrón oscuro
+            )
+        else:
+            instruccion = GestorFuentes().renderizar(
+                self.fuente_pequena,
+                "Presiona cualquier tecla para volver al menú",
+                True,
+                (107, 142, 35),  # Verde oliva
+            )
+        instruccion_rect = instruccion.get_rect(center=(self.ANCHO // 2, y_instruccion))
+        self.screen.blit(instruccion, instruccion_rect)
+
+    def _componer_game_over(self, superficie):
+        """Caja, título y métricas finales del game over (fijas al terminar)."""
         # Caja para mostrar información (estilo mármol)
         caja_rect = pygame.Rect(self.ANCHO // 2 - 350, 100, 700, 450)
         pygame.draw.rect(
-            self.screen, (210, 195, 170), caja_rect, border_radius=15
+            superficie, (210, 195, 170), caja_rect, border_radius=15
         )  # Mármol
         pygame.draw.rect(
-            self.screen, (178, 34, 34), caja_rect, 3, border_radius=15
+            superficie, (178, 34, 34), caja_rect, 3, border_radius=15
         )  # Rojo terracota
 
-        titulo = self.fuente_titulo.render(
-            "GAME OVER", True, (139, 69, 19)
+        titulo = GestorFuentes().renderizar(
+            self.fuente_titulo, "GAME OVER", True, (139, 69, 19)
         )  # Marrón antiguo
         titulo_rect = titulo.get_rect(center=(self.ANCHO // 2, 140))
-        self.screen.blit(titulo, titulo_rect)
+        superficie.blit(titulo, titulo_rect)
 
         # Información de la partida actual
         y_info = 200
-        puntaje = self.fuente_hud.render(
+        puntaje = GestorFuentes().renderizar(
+            self.fuente_hud,
             f"Tu Puntaje: {self.jugador.puntaje}", True, (218, 165, 32)  # Oro
         )
         puntaje_rect = puntaje.get_rect(center=(self.ANCHO // 2, y_info))
-        self.screen.blit(puntaje, puntaje_rect)
+        superficie.blit(puntaje, puntaje_rect)
 
         tiempo_segundos = self.tiempo_transcurrido // 60
         # Calcular dificultad
         nivel_dificultad = self.computadora.velocidad / self.velocidad_inicial_enemigo
-        tiempo_texto = self.fuente_pequena.render(
+        tiempo_texto = GestorFuentes().renderizar(
+            self.fuente_pequena,
             f"Tiempo: {tiempo_segundos} segundos | Dificultad: {nivel_dificultad:.1f}x",
             True,
             (101, 67, 33),  # Marrón oscuro
         )
         tiempo_rect = tiempo_texto.get_rect(center=(self.ANCHO // 2, y_info + 40))
-        self.screen.blit(tiempo_texto, tiempo_rect)
+        superficie.blit(tiempo_texto, tiempo_rect)
 
         # Mensaje indicando que el puntaje será guardado
-        mensaje = self.fuente_pequena.render(
+        mensaje = GestorFuentes().renderizar(
+            self.fuente_pequena,
             "Tu puntaje ha sido guardado", True, (107, 142, 35)  # Verde oliva
         )
         mensaje_rect = mensaje.get_rect(center=(self.ANCHO // 2, y_info + 100))
-        self.screen.blit(mensaje, mensaje_rect)
-
-        # Mostrar mensaje según si puede salir o no
-        y_instruccion = 500
-        if self.game_over_timer > 0:
-            segundos_restantes = ConfigJuego.frames_a_segundos(self.game_over_timer) + 1
-            instruccion = self.fuente_pequena.render(
-                f"Espera {segundos_restantes} segundos...",
-                True,
-                (101, 67, 33),  # Marrón oscuro
-            )
-        else:
-            instruccion = self.fuente_pequena.render(
-                "Presiona cualquier tecla para volver al menú",
-                True,
-                (107, 142, 35),  # Verde oliva
-            )
-        instruccion_rect = instruccion.get_rect(center=(self.ANCHO // 2, y_instruccion))
-        self.screen.blit(instruccion, instruccion_rect)
+        superficie.blit(mensaje, mensaje_rect)
 
     def _dibujar_victoria(self):
         """Overlay de victoria (no se usa en modo infinito, se deja por si se activa)."""
-        overlay = pygame.Surface((self.ANCHO, self.ALTO))
-        overlay.set_alpha(200)
-        overlay.fill((20, 15, 10))  # Pergamino oscuro
+        clave = (self.jugador.puntaje, self.tiempo_transcurrido // 60)
+        overlay = self._overlay("victoria", clave, self._componer_victoria)
         self.screen.blit(overlay, (0, 0))
 
+    def _componer_victoria(self, superficie):
+        """Caja y textos de victoria."""
         caja_rect = pygame.Rect(self.ANCHO // 2 - 300, self.ALTO // 2 - 150, 600, 300)
         pygame.draw.rect(
-            self.screen, (210, 195, 170), caja_rect, border_radius=15
+            superficie, (210, 195, 170), caja_rect, border_radius=15
         )  # Mármol
         pygame.draw.rect(
-            self.screen, (107, 142, 35), caja_rect, 3, border_radius=15
+            superficie, (107, 142, 35), caja_rect, 3, border_radius=15
         )  # Verde oliva
 
-        titulo = self.fuente_titulo.render(
-            "¡VICTORIA!", True, (139, 69, 19)
+        titulo = GestorFuentes().renderizar(
+            self.fuente_titulo, "¡VICTORIA!", True, (139, 69, 19)
         )  # Marrón antiguo
         titulo_rect = titulo.get_rect(center=(self.ANCHO // 2, self.ALTO // 2 - 80))
-        self.screen.blit(titulo, titulo_rect)
+        superficie.blit(titulo, titulo_rect)
 
-        mensaje = self.fuente_hud.render(
+        mensaje = GestorFuentes().renderizar(
+            self.fuente_hud,
             "¡Todos los obsequios recolectados!", True, (218, 165, 32)  # Oro
         )
         mensaje_rect = mensaje.get_rect(center=(self.ANCHO // 2, self.ALTO // 2 - 30))
-        self.screen.blit(mensaje, mensaje_rect)
+        superficie.blit(mensaje, mensaje_rect)
 
-        puntaje = self.fuente_hud.render(
+        puntaje = GestorFuentes().renderizar(
+            self.fuente_hud,
             f"Puntaje Final: {self.jugador._puntaje}", True, (218, 165, 32)  # Oro
         )
         puntaje_rect = puntaje.get_rect(center=(self.ANCHO // 2, self.ALTO // 2 + 20))
-        self.screen.blit(puntaje, puntaje_rect)
+        superficie.blit(puntaje, puntaje_rect)
 
         tiempo_min = self.tiempo_transcurrido // 3600
         tiempo_seg = (self.tiempo_transcurrido % 3600) // 60
-        tiempo = self.fuente_pequena.render(
+        tiempo = GestorFuentes().renderizar(
+            self.fuente_pequena,
             f"Tiempo: {tiempo_min:02d}:{tiempo_seg:02d}", True, (200, 200, 200)
         )
         tiempo_rect = tiempo.get_rect(center=(self.ANCHO // 2, self.ALTO // 2 + 60))
-        self.screen.blit(tiempo, tiempo_rect)
+        superficie.blit(tiempo, tiempo_rect)
 
-        instruccion = self.fuente_pequena.render(
+        instruccion = GestorFuentes().renderizar(
+            self.fuente_pequena,
             "Presiona cualquier tecla para volver", True, (150, 150, 150)
         )
         instruccion_rect = instruccion.get_rect(
             center=(self.ANCHO // 2, self.ALTO // 2 + 100)
         )
-        self.screen.blit(instruccion, instruccion_rect)
+        superficie.blit(instruccion, instruccion_rect)
 
     def _dibujar_menu_confirmacion_salida(self):
         """Dibuja un menú de confirmación al presionar ESC con estética griega."""
-        # Overlay oscuro
-        overlay = pygame.Surface((self.ANCHO, self.ALTO))
-        overlay.set_alpha(200)
-        overlay.fill((20, 15, 10))  # Tono pergamino oscuro
+        overlay = self._overlay(
+            "confirmacion_salida", (), self._componer_confirmacion_salida
+        )
         self.screen.blit(overlay, (0, 0))
 
+    def _componer_confirmacion_salida(self, superficie):
+        """Caja, título y opciones del menú de confirmación (fijos)."""
         # Caja de diálogo estilo templo griego
         caja_ancho = 700
         caja_alto = 400
@@ -770,25 +1046,25 @@ class PantallaJuego:
 
         # Fondo de mármol
         caja_rect = pygame.Rect(caja_x, caja_y, caja_ancho, caja_alto)
-        pygame.draw.rect(self.screen, (210, 195, 170), caja_rect, border_radius=10)
+        pygame.draw.rect(superficie, (210, 195, 170), caja_rect, border_radius=10)
 
         # Borde de bronce doble
-        pygame.draw.rect(self.screen, (184, 115, 51), caja_rect, 4, border_radius=10)
+        pygame.draw.rect(superficie, (184, 115, 51), caja_rect, 4, border_radius=10)
         caja_rect2 = pygame.Rect(
             caja_x + 8, caja_y + 8, caja_ancho - 16, caja_alto - 16
         )
-        pygame.draw.rect(self.screen, (139, 90, 43), caja_rect2, 3, border_radius=8)
+        pygame.draw.rect(superficie, (139, 90, 43), caja_rect2, 3, border_radius=8)
 
         # Sombra interior para profundidad
         pygame.draw.line(
-            self.screen,
+            superficie,
             (180, 165, 145),
             (caja_x + 12, caja_y + 12),
             (caja_x + caja_ancho - 12, caja_y + 12),
             2,
         )
         pygame.draw.line(
-            self.screen,
+            superficie,
             (180, 165, 145),
             (caja_x + 12, caja_y + 12),
             (caja_x + 12, caja_y + caja_alto - 12),
@@ -797,24 +1073,25 @@ class PantallaJuego:
 
         # Título
         y_titulo = caja_y + 70
-        titulo = self.fuente_titulo.render(
-            "¿ABANDONAR EL LABERINTO?", False, (139, 69, 19)
+        titulo = GestorFuentes().renderizar(
+            self.fuente_titulo, "¿ABANDONAR EL LABERINTO?", False, (139, 69, 19)
         )
         titulo_rect = titulo.get_rect(center=(self.ANCHO // 2, y_titulo))
-        self.screen.blit(titulo, titulo_rect)
+        superficie.blit(titulo, titulo_rect)
 
         # Subtítulo mitológico
         y_subtitulo = y_titulo + 60
-        subtitulo = self.fuente_hud.render(
+        subtitulo = GestorFuentes().renderizar(
+            self.fuente_hud,
             "Teseo desea escapar del laberinto...", False, (101, 67, 33)
         )
         subtitulo_rect = subtitulo.get_rect(center=(self.ANCHO // 2, y_subtitulo))
-        self.screen.blit(subtitulo, subtitulo_rect)
+        superficie.blit(subtitulo, subtitulo_rect)
 
         # Separador decorativo (línea greco-romana)
         y_separador = y_subtitulo + 50
         pygame.draw.line(
-            self.screen,
+            superficie,
             (184, 115, 51),
             (caja_x + 50, y_separador),
             (caja_x + caja_ancho - 50, y_separador),
@@ -825,7 +1102,8 @@ class PantallaJuego:
         y_opciones = y_separador + 50
 
         # Opción 1: Salir al menú (S)
-        opcion1 = self.fuente_hud.render(
+        opcion1 = GestorFuentes().renderizar(
+            self.fuente_hud,
             "[S] Salir al Menú Principal", False, (178, 34, 34)  # Rojo terracota
         )
         opcion1_rect = opcion1.get_rect(center=(self.ANCHO // 2, y_opciones))
@@ -836,12 +1114,13 @@ class PantallaJuego:
             opcion1_rect.width + 30,
             opcion1_rect.height + 16,
         )
-        pygame.draw.rect(self.screen, (198, 156, 109), fondo1, border_radius=5)
-        pygame.draw.rect(self.screen, (139, 69, 19), fondo1, 2, border_radius=5)
-        self.screen.blit(opcion1, opcion1_rect)
+        pygame.draw.rect(superficie, (198, 156, 109), fondo1, border_radius=5)
+        pygame.draw.rect(superficie, (139, 69, 19), fondo1, 2, border_radius=5)
+        superficie.blit(opcion1, opcion1_rect)
 
         # Opción 2: Continuar jugando (N o ESC)
-        opcion2 = self.fuente_hud.render(
+        opcion2 = GestorFuentes().renderizar(
+            self.fuente_hud,
             "[N / ESC] Continuar Jugando", False, (34, 139, 34)  # Verde oliva
         )
         opcion2_rect = opcion2.get_rect(center=(self.ANCHO // 2, y_opciones + 60))
@@ -852,99 +1131,128 @@ class PantallaJuego:
             opcion2_rect.width + 30,
             opcion2_rect.height + 16,
         )
-        pygame.draw.rect(self.screen, (198, 156, 109), fondo2, border_radius=5)
-        pygame.draw.rect(self.screen, (139, 69, 19), fondo2, 2, border_radius=5)
-        self.screen.blit(opcion2, opcion2_rect)
-
-    def manejar_eventos(self):
-        """Lee eventos de ventana y teclado; maneja pausa, debug, modo de movimiento y salida."""
-        for evento in pygame.event.get():
-            if evento.type == pygame.QUIT:
-                return "salir"
-
-            if evento.type == pygame.KEYDOWN:
-                # Manejar menú de confirmación de salida
-                if self.menu_pausa_salir:
-                    if evento.key == pygame.K_s:  # Salir al menú
-                        return "salir"
-                    elif (
-                        evento.key == pygame.K_n or evento.key == pygame.K_ESCAPE
-                    ):  # Cancelar y continuar jugando
-                        self.menu_pausa_salir = False
-                        self.pausado = False
-                        self.sistema_sonido.reanudar_musica()
-                    return None
-
-                if evento.key == pygame.K_ESCAPE:
-                    # Mostrar menú de confirmación
-                    if not self.pausado:
-                        self.pausado = True
-                        self.menu_pausa_salir = True
-                        self.sistema_sonido.pausar_musica()
-                    else:
-                        # Si ya está pausado, cancelar el menú
-                        self.menu_pausa_salir = False
-                        self.pausado = False
-                        self.sistema_sonido.reanudar_musica()
-                if evento.key == pygame.K_p:
-                    self.pausado = not self.pausado
-                    self.menu_pausa_salir = False  # Resetear menú de salida
-                    # Pausar/reanudar música según el estado
-                    if self.pausado:
-                        self.sistema_sonido.pausar_musica()
-                    else:
-                        self.sistema_sonido.reanudar_musica()
-                if evento.key == pygame.K_d:
-                    self.mostrar_distancia = not self.mostrar_distancia
-                if evento.key == pygame.K_m:
-                    self.movimiento_por_celdas = not self.movimiento_por_celdas
-                if evento.key == pygame.K_u:
-                    # Alternar música de fondo
-                    self.sistema_sonido.alternar_musica()
-
-                # En game over, cualquier tecla (menos 'p') sale SOLO si pasaron los 5 segundos
-                if (
-                    self.game_over
-                    and evento.key != pygame.K_p
-                    and self.game_over_timer == 0
-                ):
-                    return "salir"
-
-        return None  # No hay acción global
-
-    def ejecutar(self):
-        """Crea la ventana, inicializa fuentes y corre el loop hasta salir.
-
-        Retorna:
-            dict | None: Datos del puntaje {'nombre': str, 'puntaje': int, 'laberinto': str} si hubo game over, None si salió antes
-        """
-        if not pygame.get_init():
-            pygame.init()
-
-        self.screen = pygame.display.set_mode((self.ANCHO, self.ALTO))
+        pygame.draw.rect(superficie, (198, 156, 109), fondo2, border_radius=5)
+        pygame.draw.rect(superficie, (139, 69, 19), fondo2, 2, border_radius=5)
+        superficie.blit(opcion2, opcion2_rect)
+
+    def ir_a_frame(self, frame: int):
+        """En una repetición, salta al frame pedido (simula sin dibujar desde la instantánea más cercana)."""
+        self.reproductor.ir_a(frame)
+        self.simulacion = self.reproductor.simulacion
+        self._enlazar_simulacion()
+        self.game_over_timer = 0
+
+    def _guardar_grabacion(self):
+        """Guarda la partida grabada en la carpeta de grabaciones."""
+        os.makedirs(ConfigJuego.CARPETA_GRABACIONES, exist_ok=True)
+        nombre = time.strftime("partida_%Y%m%d_%H%M%S.json")
+        self.grabador.guardar(os.path.join(ConfigJuego.CARPETA_GRABACIONES, nombre))
+
+    def manejar_evento(self, evento, mouse_pos):
+        """Maneja pausa, debug, modo de movimiento y salida (un evento por llamada)."""
+        if evento.type == pygame.QUIT:
+            return self._terminar_partida()
+
+        if evento.type == pygame.KEYDOWN:
+            # Manejar menú de confirmación de salida
+            if self.menu_pausa_salir:
+                if evento.key == pygame.K_s:  # Salir al menú
+                    return self._terminar_partida()
+                elif (
+                    evento.key == pygame.K_n or evento.key == pygame.K_ESCAPE
+                ):  # Cancelar y continuar jugando
+                    self.menu_pausa_salir = False
+                    self.pausado = False
+                    self.sistema_sonido.reanudar_musica()
+                return CONTINUAR
+
+            if evento.key == pygame.K_ESCAPE:
+                # Mostrar menú de confirmación
+                if not self.pausado:
+                    self.pausado = True
+                    self.menu_pausa_salir = True
+                    self.sistema_sonido.pausar_musica()
+                else:
+                    # Si ya está pausado, cancelar el menú
+                    self.menu_pausa_salir = False
+                    self.pausado = False
+                    self.sistema_sonido.reanudar_musica()
+            if evento.key == pygame.K_p:
+                self.pausado = not self.pausado
+                self.menu_pausa_salir = False  # Resetear menú de salida
+                # Pausar/reanudar música según el estado
+                if self.pausado:
+                    self.sistema_sonido.pausar_musica()
+                else:
+                    self.sistema_sonido.reanudar_musica()
+            if evento.key == pygame.K_d:
+                self.mostrar_distancia = not self.mostrar_distancia
+            if evento.key == pygame.K_m:
+                self.movimiento_por_celdas = not self.movimiento_por_celdas
+            if evento.key == pygame.K_u:
+                # Alternar música de fondo
+                self.sistema_sonido.alternar_musica()
+            if self.reproductor is not None and evento.key in (
+                pygame.K_LEFT,
+                pygame.K_RIGHT,
+            ):
+                # Repetición: saltar un intervalo de keyframes atrás/adelante
+                salto = ConfigJuego.segundos_a_frames(
+                    ConfigJuego.SEGUNDOS_ENTRE_KEYFRAMES
+                )
+                if evento.key == pygame.K_LEFT:
+                    salto = -salto
+                self.ir_a_frame(self.reproductor.frame + salto)
+                return CONTINUAR
+
+            # En game over, cualquier tecla (menos 'p') sale SOLO si pasaron los 5 segundos
+            if (
+                self.game_over
+                and evento.key != pygame.K_p
+                and self.game_over_timer == 0
+            ):
+                return self._terminar_partida()
+
+        return CONTINUAR  # No hay acción global
+
+    def al_entrar(self):
+        """Toma la ventana existente e inicializa las fuentes."""
+        self.screen = pygame.display.get_surface()
+        if self.screen is None:
+            # Sin ventana (p. ej. una herramienta que no la creó): crearla una vez
+            self.screen = pygame.display.set_mode((self.ANCHO, self.ALTO))
         pygame.display.set_caption(ConfigJuego.TITULO)
+        self._rects_dinamicos = None  # La ventana pudo cambiar: frame completo
 
         # Fuentes para títulos y HUD desde GestorFuentes
-        from interfaz.gestor_fuentes import GestorFuentes
-
         fuentes = GestorFuentes()
         self.fuente_titulo = fuentes.hud_titulo
         self.fuente_hud = fuentes.hud_normal
         self.fuente_pequena = fuentes.hud_pequeño
 
-        ejecutando = True
-        while ejecutando:
-            self.reloj.tick(ConfigJuego.FPS)  # Usar FPS de config
-            resultado = self.manejar_eventos()
-            if resultado == "salir":
-                ejecutando = False
+    def actualizar(self):
+        """Avanza un frame de la partida."""
+        self._actualizar()
+        return CONTINUAR
+
+    def dibujar(self):
+        """Dibuja y presenta el frame."""
+        self._renderizar()
 
-            self._actualizar()
-            self._renderizar()
+    def _terminar_partida(self):
+        """Detiene la música, guarda la grabación y arma el resultado de la escena.
 
+        Retorna:
+            dict | None: Datos del puntaje {'nombre': str, 'puntaje': int, 'laberinto': str} si hubo game over, None si salió antes
+        """
         # Detener la música al salir
         self.sistema_sonido.detener_musica()
 
+        if self.grabador is not None:
+            self._guardar_grabacion()
+        if self.reproductor is not None:
+            return None  # Ver una repetición no registra puntajes
+
         # Retornar datos del puntaje si hubo game over
         if self.game_over and self.puntaje_final is not None:
             # Convertir frames a segundos
@@ -10,9 +10,10 @@ from interfaz.componentes.titulo_arcade import (
     SubtituloArcade,
     TituloArcade,
 )
+from interfaz.escenas import CONTINUAR, Escena
 
 
-class PantallaMenuAdministrador:
+class PantallaMenuAdministrador(Escena):
     """
     Menú administrativo con opciones para cargar laberinto,
     reiniciar salón de fama y volver al menú principal.
@@ -31,6 +32,9 @@ class PantallaMenuAdministrador:
         # Crear botones verticales
         self._crear_botones()
 
+        # Widgets cuyo hover obliga a redibujar
+        self.widgets = self.botones
+
     def _crear_botones(self):
         """Crea los botones del menú administrativo con estilo arcade."""
         y_inicial = 210
@@ -64,30 +68,24 @@ class PantallaMenuAdministrador:
 
         pygame.display.flip()
 
-    def ejecutar(self):
+    def manejar_evento(self, evento, mouse_pos):
         """
-        Loop del menú administrativo.
+        Maneja un evento del menú administrativo.
 
         Returns:
             int: Opción seleccionada (1=Cargar Laberinto, 2=Reiniciar Salón, 3=Volver)
+            o CONTINUAR
         """
-        clock = pygame.time.Clock()
-
-        while True:
-            clock.tick(60)
-            mouse_pos = pygame.mouse.get_pos()
+        if evento.type == pygame.QUIT:
+            return 3  # Volver
 
-            for evento in pygame.event.get():
-                if evento.type == pygame.QUIT:
-                    return 3  # Volver
+        if evento.type == pygame.KEYDOWN:
+            if evento.key == pygame.K_ESCAPE:
+                return 3  # Volver
 
-                if evento.type == pygame.KEYDOWN:
-                    if evento.key == pygame.K_ESCAPE:
-                        return 3  # Volver
-
-                # Verificar clicks en botones
-                for boton in self.botones:
-                    if boton.manejar_evento(evento, mouse_pos):
-                        return boton.accion
+        # Verificar clicks en botones
+        for boton in self.botones:
+            if boton.manejar_evento(evento, mouse_pos):
+                return boton.accion
 
-            self.dibujar()
+        return CONTINUAR
@@ -7,10 +7,11 @@ import pygame
 from config.colores import PaletaColores
 from interfaz.componentes.boton_adaptable import BotonGrande
 from interfaz.componentes.titulo_arcade import LineaDecorativa, TituloArcade
+from interfaz.escenas import CONTINUAR, Escena
 from interfaz.gestor_fuentes import GestorFuentes
 
 
-class PantallaSalonFama:
+class PantallaSalonFama(Escena):
     """Muestra los mejores puntajes con un listado sencillo."""
 
     def __init__(self, screen, salon_fama):
@@ -33,6 +34,7 @@ class PantallaSalonFama:
 
         # Botón volver (se posicionará dinámicamente en dibujar())
         self.btn_volver = BotonGrande(0, 0, "Volver", accion="volver")
+        self.widgets = [self.btn_volver]
 
     def dibujar(self):
         """Dibuja título, podio, tabla de récords y botón volver con estética arcade."""
@@ -52,13 +54,15 @@ class PantallaSalonFama:
         if not registros:
             # Mensaje cuando no hay registros
             y_center = self.alto // 2 - 50
-            texto_surface = self.font_header.render(
+            texto_surface = GestorFuentes().renderizar(
+                self.font_header,
                 "No hay registros todavía", False, PaletaColores.ACENTO_INFO
             )
             texto_rect = texto_surface.get_rect(center=(self.ancho // 2, y_center))
             self.screen.blit(texto_surface, texto_rect)
 
-            ayuda = self.font_info.render(
+            ayuda = GestorFuentes().renderizar(
+                self.font_info,
                 "¡Juega una partida para empezar a competir!", False, (150, 150, 170)
             )
             ayuda_rect = ayuda.get_rect(center=(self.ancho // 2, y_center + 40))
@@ -96,8 +100,8 @@ class PantallaSalonFama:
         ]
         x_spacing = self.ancho // 4
         for i, texto in enumerate(stats_texto):
-            stat_surface = self.font_stats.render(
-                texto, False, PaletaColores.ACENTO_INFO
+            stat_surface = GestorFuentes().renderizar(
+                self.font_stats, texto, False, PaletaColores.ACENTO_INFO
             )
             stat_rect = stat_surface.get_rect(center=(x_spacing * (i + 1), y_stats))
             self.screen.blit(stat_surface, stat_rect)
@@ -148,8 +152,8 @@ class PantallaSalonFama:
             pygame.draw.rect(self.screen, config["color_borde"], rect_tarjeta, 3)
 
             # Emoji y posición
-            emoji_surface = self.font_podio.render(
-                config["emoji"], False, config["color_borde"]
+            emoji_surface = GestorFuentes().renderizar(
+                self.font_podio, config["emoji"], False, config["color_borde"]
             )
             emoji_rect = emoji_surface.get_rect(
                 center=(x + ancho_tarjeta // 2, y_podio + 20)
@@ -158,7 +162,9 @@ class PantallaSalonFama:
 
             # Nombre del jugador
             nombre = reg["nombre_jugador"][:12]
-            nombre_surface = self.font_data.render(nombre, False, (255, 255, 255))
+            nombre_surface = GestorFuentes().renderizar(
+                self.font_data, nombre, False, (255, 255, 255)
+            )
             nombre_rect = nombre_surface.get_rect(
                 center=(x + ancho_tarjeta // 2, y_podio + 45)
             )
@@ -166,8 +172,8 @@ class PantallaSalonFama:
 
             # Puntaje
             puntaje_text = f"{reg['puntaje']} pts"
-            puntaje_surface = self.font_header.render(
-                puntaje_text, False, config["color_borde"]
+            puntaje_surface = GestorFuentes().renderizar(
+                self.font_header, puntaje_text, False, config["color_borde"]
             )
             puntaje_rect = puntaje_surface.get_rect(
                 center=(x + ancho_tarjeta // 2, y_podio + 65)
@@ -179,7 +185,9 @@ class PantallaSalonFama:
             minutos = tiempo_seg // 60
             segundos = tiempo_seg % 60
             tiempo_texto = f"{minutos}:{segundos:02d}"
-            tiempo_surface = self.font_info.render(tiempo_texto, False, (180, 220, 255))
+            tiempo_surface = GestorFuentes().renderizar(
+                self.font_info, tiempo_texto, False, (180, 220, 255)
+            )
             tiempo_rect = tiempo_surface.get_rect(
                 center=(x + ancho_tarjeta // 2, y_podio + 82)
             )
@@ -187,7 +195,9 @@ class PantallaSalonFama:
 
             # Laberinto
             laberinto = reg["laberinto"][:20]
-            lab_surface = self.font_info.render(laberinto, False, (180, 180, 200))
+            lab_surface = GestorFuentes().renderizar(
+                self.font_info, laberinto, False, (180, 180, 200)
+            )
             lab_rect = lab_surface.get_rect(
                 center=(x + ancho_tarjeta // 2, y_podio + 98)
             )
@@ -202,8 +212,8 @@ class PantallaSalonFama:
         y_inicio_tabla = 280
 
         # Título de la tabla
-        titulo_tabla = self.font_header.render(
-            "Otros récords", False, PaletaColores.ACENTO_INFO
+        titulo_tabla = GestorFuentes().renderizar(
+            self.font_header, "Otros récords", False, PaletaColores.ACENTO_INFO
         )
         titulo_rect = titulo_tabla.get_rect(center=(self.ancho // 2, y_inicio_tabla))
         self.screen.blit(titulo_tabla, titulo_rect)
@@ -214,8 +224,8 @@ class PantallaSalonFama:
         x_positions = [100, 180, 340, 440, 540]
 
         for header, x in zip(headers, x_positions, strict=True):
-            texto_header = self.font_data.render(
-                header, False, PaletaColores.ACENTO_INFO
+            texto_header = GestorFuentes().renderizar(
+                self.font_data, header, False, PaletaColores.ACENTO_INFO
             )
             self.screen.blit(texto_header, (x, y_headers))
 
@@ -253,30 +263,25 @@ class PantallaSalonFama:
             ]
 
             for dato, x in zip(datos, x_positions, strict=True):
-                texto_dato = self.font_info.render(dato, False, color)
+                texto_dato = GestorFuentes().renderizar(
+                    self.font_info, dato, False, color
+                )
                 self.screen.blit(texto_dato, (x, y_pos))
 
             ultima_y = y_pos + 25
 
         return ultima_y
 
-    def ejecutar(self):
-        """Loop de lectura: cierra con Volver, Escape o al cerrar ventana."""
-        clock = pygame.time.Clock()
-
-        while True:
-            clock.tick(60)
-            mouse_pos = pygame.mouse.get_pos()
-
-            for evento in pygame.event.get():
-                if evento.type == pygame.QUIT:
-                    return
+    def manejar_evento(self, evento, mouse_pos):
+        """Pantalla de lectura: cierra con Volver, Escape o al cerrar ventana."""
+        if evento.type == pygame.QUIT:
+            return None
 
-                if evento.type == pygame.KEYDOWN:
-                    if evento.key == pygame.K_ESCAPE:
-                        return
+        if evento.type == pygame.KEYDOWN:
+            if evento.key == pygame.K_ESCAPE:
+                return None
 
-                if self.btn_volver.manejar_evento(evento, mouse_pos):
-                    return
+        if self.btn_volver.manejar_evento(evento, mouse_pos):
+            return None
 
-            self.dibujar()
+        return CONTINUAR
@@ -3,20 +3,22 @@ Gestor de movimiento y colisiones para el jugador.
 
 Maneja:
 - Movimiento por celdas con cooldown
-- Detección de colisiones con muros
+- Detección de colisiones con muros (por celdas, sin recorrer la lista de muros)
 - Validación de límites del laberinto
 - Sistema de historial para revertir movimientos inválidos
 """
 
 import pygame
 
+from mundo.colision import GrillaColision
+
 
 class GestorMovimiento:
     """
     Gestiona el movimiento del jugador y las colisiones.
 
     Responsabilidades:
-    - Procesar entrada del teclado
+    - Procesar entrada del teclado (o una dirección dada, sin leer el teclado)
     - Mover jugador por celdas con cooldown
     - Detectar colisiones con muros
     - Validar límites del laberinto
@@ -56,6 +58,9 @@ class GestorMovimiento:
         self.frames_cooldown = frames_cooldown
         self.movimiento_por_celdas = movimiento_por_celdas
 
+        # Colisiones consultando solo las celdas que cubre el jugador
+        self.grilla_colision = GrillaColision(mapa, tam_celda, offset_x, offset_y)
+
         # Sistema de cooldown
         self.cooldown_actual = 0
         self.ultima_tecla: str | None = None
@@ -92,10 +97,26 @@ class GestorMovimiento:
         Returns:
             True si NO hay colisión, False si está chocando
         """
-        for muro in self.muros:
-            if self.jugador.jugador_principal.colliderect(muro):
-                return False
-        return True
+        return not self.grilla_colision.colisiona(self.jugador.jugador_principal)
+
+    @staticmethod
+    def leer_direccion_teclado() -> str | None:
+        """
+        Lee la dirección pedida por el teclado en este frame.
+
+        Returns:
+            "up", "down", "left", "right" (prioridad en ese orden) o None
+        """
+        keys = pygame.key.get_pressed()
+        if keys[pygame.K_UP] or keys[pygame.K_w]:
+            return "up"
+        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
+            return "down"
+        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+            return "left"
+        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+            return "right"
+        return None
 
     def procesar_entrada_teclado(self):
         """
@@ -103,6 +124,15 @@ class GestorMovimiento:
 
         Maneja cooldown para evitar movimientos múltiples en un frame.
         """
+        self.procesar_entrada(self.leer_direccion_teclado())
+
+    def procesar_entrada(self, tecla_actual: str | None):
+        """
+        Mueve al jugador según una dirección ya decidida (teclado, script o replay).
+
+        Args:
+            tecla_actual: "up", "down", "left", "right" o None si no hay entrada
+        """
         # Actualizar interpolación si está activa
         if self.interpolando:
             self._actualizar_interpolacion()
@@ -112,19 +142,6 @@ class GestorMovimiento:
             self.cooldown_actual -= 1
             return
 
-        keys = pygame.key.get_pressed()
-
-        # Determinar dirección presionada (prioridad: arriba, abajo, izquierda, derecha)
-        tecla_actual = None
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
-            tecla_actual = "up"
-        elif keys[pygame.K_DOWN] or keys[pygame.K_s]:
-            tecla_actual = "down"
-        elif keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            tecla_actual = "left"
-        elif keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            tecla_actual = "right"
-
         if tecla_actual:
             if self.movimiento_por_celdas:
                 self._mover_por_celdas(tecla_actual)
@@ -181,7 +198,7 @@ class GestorMovimiento:
 
         # Validar colisión con muros
         temp_rect = pygame.Rect(nueva_x, nueva_y, rect.width, rect.height)
-        if not any(temp_rect.colliderect(m) for m in self.muros):
+        if not self.grilla_colision.colisiona(temp_rect):
             # Iniciar interpolación en lugar de mover instantáneamente
             self.interpolando = True
             self.pos_inicio_x = rect.x
@@ -204,6 +221,10 @@ class GestorMovimiento:
         """
         Mueve al jugador píxel a píxel (modo legacy).
 
+        El desplazamiento se recorta con un barrido AABB sobre la grilla: el
+        jugador avanza hasta quedar pegado a la pared en lugar de quedarse
+        en el lugar si el paso completo chocaba.
+
         Args:
             direccion: "up", "down", "left" o "right"
         """
@@ -211,22 +232,16 @@ class GestorMovimiento:
         rect = self.jugador.jugador_principal
         velocidad = self.jugador.velocidad
 
-        # Calcular desplazamiento para el sprite
+        # Calcular desplazamiento deseado
         dx = 0
         dy = 0
-
-        # Aplicar movimiento
         if direccion == "up":
-            rect.y -= velocidad
             dy = -velocidad
         elif direccion == "down":
-            rect.y += velocidad
             dy = velocidad
         elif direccion == "left":
-            rect.x -= velocidad
             dx = -velocidad
         elif direccion == "right":
-            rect.x += velocidad
             dx = velocidad
 
         # Aplicar límites del laberinto
@@ -235,14 +250,18 @@ class GestorMovimiento:
         limite_y_min = self.offset_y
         limite_y_max = self.offset_y + (len(self.mapa) * self.tam_celda) - rect.height
 
-        rect.x = max(limite_x_min, min(rect.x, limite_x_max))
-        rect.y = max(limite_y_min, min(rect.y, limite_y_max))
+        dx = max(limite_x_min, min(rect.x + dx, limite_x_max)) - rect.x
+        dy = max(limite_y_min, min(rect.y + dy, limite_y_max)) - rect.y
 
-        # Revertir si hay colisión
-        if not self.detectar_colision():
-            self.revertir_posicion()
+        # Recortar contra los muros
+        dx, dy = self.grilla_colision.barrer(rect, dx, dy)
+
+        if dx == 0 and dy == 0:
             self.jugador.actualizar_movimiento(0, 0)  # Dejar de animar
         else:
+            rect.x += dx
+            rect.y += dy
+
             # Actualizar estado de movimiento del sprite
             self.jugador.actualizar_movimiento(dx, dy)
 
@@ -252,6 +271,7 @@ class GestorMovimiento:
     def actualizar_muros(self, nuevos_muros: list[pygame.Rect]):
         """Actualiza la lista de muros (útil si el laberinto cambia)."""
         self.muros = nuevos_muros
+        self.grilla_colision = GrillaColision.desde_muros(nuevos_muros, self.tam_celda)
 
     def _actualizar_interpolacion(self):
         """
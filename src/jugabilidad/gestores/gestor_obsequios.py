@@ -6,10 +6,20 @@ Maneja el ciclo de vida completo de los obsequios:
 - Actualización de timers (vencimiento)
 - Recolección de obsequios
 - Creación de nuevos obsequios en posiciones válidas
+
+Los timers se guardan como el tick absoluto en que vence cada obsequio, en un
+heap ordenado por vencimiento: cada frame solo se mira la cima, así que el
+costo no depende de cuántos obsequios haya mientras ninguno venza.
+
+Las celdas donde puede aparecer un obsequio nuevo se mantienen en un índice
+de celdas libres que se actualiza con cada aparición, recolección y
+vencimiento, en lugar de recorrer todos los pasillos en cada reposición.
 """
 
+import heapq
 import random
 
+from mundo.celdas_libres import CeldasLibres, CeldasLibresPonderadas
 from mundo.obsequio import Obsequio
 
 
@@ -24,42 +34,80 @@ class GestorObsequios:
     - Crear nuevos obsequios en posiciones válidas
     """
 
-    def __init__(self, laberinto, tiempo_vida_frames: int):
+    def __init__(
+        self,
+        laberinto,
+        tiempo_vida_frames: int,
+        generador: random.Random | None = None,
+        pesos: dict[tuple[int, int], float] | None = None,
+    ):
         """
         Inicializa el gestor de obsequios.
 
         Args:
             laberinto: Instancia del laberinto con obsequios iniciales
             tiempo_vida_frames: Número de frames antes de que expire un obsequio
+            generador: Generador aleatorio para ubicar obsequios nuevos; con uno
+                       sembrado las posiciones son reproducibles (None = sin semilla)
+            pesos: Peso de cada celda para ubicar obsequios nuevos (ver
+                   pesos_por_distancia); None = todas las celdas libres por igual
         """
         self.laberinto = laberinto
         self.tiempo_vida_obsequio = tiempo_vida_frames
-        self.obsequios_timers: dict[tuple[int, int], int] = {}
+        self.generador = generador if generador is not None else random.Random()
+
+        # Frames contados por actualizar(); los vencimientos son ticks absolutos
+        self.tick = 0
+        self._vencimientos: dict[tuple[int, int], int] = {}  # {posición: tick}
+        # (tick, posición) por vencimiento; las entradas de obsequios ya
+        # recolectados se descartan al llegar a la cima (borrado perezoso)
+        self._heap_vencimientos: list[tuple[int, tuple[int, int]]] = []
         self._inicializar_timers()
 
+        # Celdas donde puede aparecer un obsequio (se rehace si cambia el mapa)
+        self.pesos = pesos
+        self._celdas_libres: CeldasLibres | None = None
+        self._spawns: set[tuple[int, int]] = set()
+        self._version_mapa = -1
+
     def _inicializar_timers(self):
         """Crea un timer de vida para cada obsequio inicial del laberinto."""
         for posicion in self.laberinto._obsequios.keys():
-            self.obsequios_timers[posicion] = self.tiempo_vida_obsequio
+            self._programar_vencimiento(posicion)
+
+    def _programar_vencimiento(self, posicion: tuple[int, int]) -> None:
+        """Hace que el obsequio en 'posicion' venza dentro de tiempo_vida_obsequio frames."""
+        vencimiento = self.tick + self.tiempo_vida_obsequio
+        self._vencimientos[posicion] = vencimiento
+        heapq.heappush(self._heap_vencimientos, (vencimiento, posicion))
+
+    @property
+    def obsequios_timers(self) -> dict[tuple[int, int], int]:
+        """Frames restantes de cada obsequio activo {(col, fila): frames}."""
+        return {
+            posicion: vencimiento - self.tick
+            for posicion, vencimiento in self._vencimientos.items()
+        }
 
     def actualizar(self):
         """
-        Actualiza los timers de todos los obsequios activos.
+        Avanza un frame y repone los obsequios que vencen en él.
 
-        Resta 1 frame a cada timer. Si un obsequio expira (timer <= 0),
-        lo elimina y crea uno nuevo en otra posición.
+        Un obsequio vence después de tiempo_vida_obsequio llamadas; al vencer
+        se elimina y se crea uno nuevo en otra posición. Solo se revisa la
+        cima del heap: O(1) si nada vence, O(k log n) si vencen k obsequios.
         """
-        obsequios_expirados = []
-        for posicion, tiempo_restante in self.obsequios_timers.items():
-            self.obsequios_timers[posicion] = tiempo_restante - 1
-            if self.obsequios_timers[posicion] <= 0:
-                obsequios_expirados.append(posicion)
-
-        for posicion in obsequios_expirados:
+        self.tick += 1
+        heap = self._heap_vencimientos
+        while heap and heap[0][0] <= self.tick:
+            vencimiento, posicion = heapq.heappop(heap)
+            if self._vencimientos.get(posicion) != vencimiento:
+                continue  # Recolectado o reprogramado desde que se agregó
+            del self._vencimientos[posicion]
             if posicion in self.laberinto._obsequios:
                 valor = self.laberinto._obsequios[posicion].valor
                 del self.laberinto._obsequios[posicion]
-                del self.obsequios_timers[posicion]
+                self._liberar_celda(posicion)
                 self.crear_nuevo_obsequio(valor)
 
     def verificar_recoleccion(self, posicion_celda: tuple[int, int]) -> int:
@@ -74,44 +122,82 @@ class GestorObsequios:
         """
         puntos = self.laberinto.recolectar_obsequio(posicion_celda)
         if puntos > 0:
-            # Eliminar timer y crear nuevo obsequio
-            if posicion_celda in self.obsequios_timers:
-                del self.obsequios_timers[posicion_celda]
+            # Eliminar timer (su entrada del heap queda obsoleta) y crear nuevo obsequio
+            self._vencimientos.pop(posicion_celda, None)
+            self._liberar_celda(posicion_celda)
             self.crear_nuevo_obsequio()
         return puntos
 
+    def _indice_celdas_libres(self) -> CeldasLibres:
+        """Índice de celdas libres, al día con los cambios del mapa desde la última vez."""
+        version = self.laberinto.version_mapa
+        if self._celdas_libres is not None and self._version_mapa != version:
+            # Celdas cambiadas con cambiar_celda: se corrigen solo esas
+            cambiadas = self.laberinto.celdas_cambiadas_desde(self._version_mapa)
+            if cambiadas is not None:
+                self._aplicar_cambios(cambiadas)
+                self._version_mapa = version
+
+        if self._celdas_libres is None or self._version_mapa != version:
+            self._spawns = {
+                self.laberinto.jugador_inicio,
+                *self.laberinto.spawns_computadoras,
+            }
+            ocupadas = self._spawns | self.laberinto._obsequios.keys()
+            celdas = (p for p in self.laberinto._pasillos if p not in ocupadas)
+            if self.pesos is None:
+                self._celdas_libres = CeldasLibres(celdas)
+            else:
+                self._celdas_libres = CeldasLibresPonderadas(celdas, self.pesos)
+            self._version_mapa = version
+        return self._celdas_libres
+
+    def _aplicar_cambios(self, cambiadas: list[int]) -> None:
+        """Agrega o quita del índice las celdas (índices planos) que cambiaron."""
+        columnas = self.laberinto.columnas
+        for indice in cambiadas:
+            fila, col = divmod(indice, columnas)
+            posicion = (col, fila)
+            if (
+                self.laberinto.es_transitable(posicion)
+                and posicion not in self._spawns
+                and posicion not in self.laberinto._obsequios
+            ):
+                self._celdas_libres.agregar(posicion)
+            else:
+                self._celdas_libres.quitar(posicion)
+
+    def _liberar_celda(self, posicion: tuple[int, int]) -> None:
+        """Vuelve a ofrecer una celda que dejó de tener obsequio."""
+        if self._celdas_libres is None:
+            return  # El índice se arma completo al pedirlo
+        libres = self._indice_celdas_libres()  # Al día con el mapa
+        if posicion not in self._spawns and self.laberinto.es_transitable(posicion):
+            libres.agregar(posicion)
+
     def crear_nuevo_obsequio(self, valor: int = 10):
         """
         Coloca un obsequio en una celda libre aleatoria.
 
-        Busca celdas que sean:
-        - Pasillos válidos (verificados con _pasillos del laberinto)
-        - Sin obsequios existentes
-        - No sean posiciones de spawn
+        Las celdas candidatas son pasillos sin obsequio que no sean posiciones
+        de spawn; se toman del índice de celdas libres, así que elegir una
+        cuesta O(1) (O(log n) con pesos) en lugar de recorrer el mapa.
 
         Args:
             valor: Valor en puntos del obsequio (por defecto 10)
         """
-        # Usar directamente la lista de pasillos procesados del laberinto
-        # para garantizar que solo se elijan celdas realmente transitables
-        posiciones_validas = []
-
-        for posicion in self.laberinto._pasillos:
-            # Verificar que:
-            # 1. No haya ya un obsequio en esa posición
-            # 2. No sea la posición de spawn del jugador
-            # 3. No sea la posición de spawn del enemigo
-            if (
-                posicion not in self.laberinto._obsequios
-                and posicion != self.laberinto.jugador_inicio
-                and posicion != self.laberinto.computadora_inicio
-            ):
-                posiciones_validas.append(posicion)
-
-        if posiciones_validas:
-            nueva_posicion = random.choice(posiciones_validas)
-            self.laberinto._obsequios[nueva_posicion] = Obsequio(nueva_posicion, valor)
-            self.obsequios_timers[nueva_posicion] = self.tiempo_vida_obsequio
+        libres = self._indice_celdas_libres()
+        while True:
+            nueva_posicion = libres.elegir(self.generador)
+            if nueva_posicion is None:
+                return  # No queda lugar
+            libres.quitar(nueva_posicion)
+            # Un obsequio agregado por fuera del gestor pudo ocupar la celda
+            if nueva_posicion not in self.laberinto._obsequios:
+                break
+
+        self.laberinto._obsequios[nueva_posicion] = Obsequio(nueva_posicion, valor)
+        self._programar_vencimiento(nueva_posicion)
 
     def obtener_cantidad_activos(self) -> int:
         """Retorna la cantidad de obsequios actualmente en el laberinto."""
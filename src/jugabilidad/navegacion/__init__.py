@@ -0,0 +1,30 @@
+"""
+Módulo de navegación de enemigos.
+
+Contiene las estrategias de búsqueda de caminos que usa la computadora para
+perseguir al jugador, y la fábrica que elige la más adecuada para cada laberinto.
+"""
+
+from .astar import NavegacionAStar
+from .campo_flujo import NavegacionCampoFlujo
+from .dstar_lite import NavegacionDStarLite
+from .estrategia import EstrategiaNavegacion, NavegacionBFS
+from .grafo_uniones import NavegacionGrafoUniones
+from .hpa import NavegacionHPA
+from .jps import NavegacionJPS
+from .selector import ESTRATEGIAS_NAVEGACION, crear_navegacion
+from .tabla_rutas import NavegacionTablaRutas
+
+__all__ = [
+    "ESTRATEGIAS_NAVEGACION",
+    "EstrategiaNavegacion",
+    "NavegacionAStar",
+    "NavegacionBFS",
+    "NavegacionCampoFlujo",
+    "NavegacionDStarLite",
+    "NavegacionGrafoUniones",
+    "NavegacionHPA",
+    "NavegacionJPS",
+    "NavegacionTablaRutas",
+    "crear_navegacion",
+]
@@ -0,0 +1,106 @@
+"""
+Campo de flujo compartido hacia el jugador.
+
+En lugar de que cada enemigo busque su propio camino, se hace un único BFS
+inverso desde la celda del jugador cada vez que este entra en una celda
+nueva. El resultado guarda, para cada celda del mapa, a qué vecina moverse;
+cualquier cantidad de enemigos lo consulta en O(1).
+"""
+
+from array import array
+
+from .estrategia import EstrategiaNavegacion
+
+
+class NavegacionCampoFlujo(EstrategiaNavegacion):
+    """Un BFS por cambio de celda del objetivo, compartido por todos los perseguidores."""
+
+    nombre = "campo_flujo"
+
+    def __init__(self, laberinto):
+        super().__init__(laberinto)
+        self._objetivo: tuple[int, int] | None = None
+        # Índice plano fila * columnas + col; -1 = celda sin ruta al objetivo
+        self._siguientes = array("i")
+        self._distancias = array("i")
+        self.recalculos = 0
+
+    @property
+    def objetivo(self) -> tuple[int, int] | None:
+        """Celda (fila, col) para la que está calculado el campo actual."""
+        return self._objetivo
+
+    def reconstruir(self, cambiadas: list[int] | None = None) -> None:
+        """Invalida el campo: se recalcula en la próxima consulta."""
+        self._objetivo = None
+
+    def actualizar_objetivo(self, objetivo: tuple[int, int]) -> None:
+        """
+        Recalcula el campo si el objetivo cambió de celda (o cambió el mapa).
+
+        Args:
+            objetivo: Celda (fila, col) hacia la que fluyen todos los caminos
+        """
+        self._sincronizar()
+        if objetivo != self._objetivo:
+            self._propagar(objetivo)
+
+    def _propagar(self, objetivo: tuple[int, int]) -> None:
+        """BFS inverso desde el objetivo sobre la grilla compacta del laberinto."""
+        columnas = self.laberinto.columnas
+        total = self.laberinto.filas * columnas
+        grilla = self.laberinto._grilla
+
+        siguientes = array("i", [-1]) * total
+        distancias = array("i", [-1]) * total
+        self._objetivo = objetivo
+        self.recalculos += 1
+
+        fila, col = objetivo
+        origen = fila * columnas + col
+        distancias[origen] = 0
+        siguientes[origen] = origen
+
+        frontera = [origen]
+        distancia = 0
+        expandidos = 0
+        while frontera:
+            distancia += 1
+            expandidos += len(frontera)
+            nueva_frontera = []
+            for u in frontera:
+                c = u % columnas
+                for v in (
+                    u + columnas if u + columnas < total else -1,
+                    u - columnas,
+                    u + 1 if c + 1 < columnas else -1,
+                    u - 1 if c > 0 else -1,
+                ):
+                    if v >= 0 and distancias[v] < 0 and not grilla[v]:
+                        distancias[v] = distancia
+                        siguientes[v] = u
+                        nueva_frontera.append(v)
+            frontera = nueva_frontera
+
+        self.nodos_expandidos += expandidos
+        self._siguientes = siguientes
+        self._distancias = distancias
+
+    def _siguiente_paso(self, inicio, objetivo):
+        self.actualizar_objetivo(objetivo)
+        fila, col = inicio
+        siguiente = self._siguientes[fila * self.laberinto.columnas + col]
+        if siguiente < 0:
+            return None
+        return divmod(siguiente, self.laberinto.columnas)
+
+    def distancia(self, inicio: tuple[int, int], objetivo: tuple[int, int]) -> int | None:
+        """
+        Distancia en pasos de inicio al objetivo, o None si no hay ruta.
+        """
+        if not (self.es_transitable(inicio) and self.es_transitable(objetivo)):
+            return None
+        self.actualizar_objetivo(objetivo)
+        fila, col = inicio
+        d = self._distancias[fila * self.laberinto.columnas + col]
+        return None if d < 0 else d
@@ -0,0 +1,205 @@
+"""
+Planificador incremental D* Lite para la persecución.
+
+La búsqueda está enraizada en la celda del jugador (objetivo) y enfocada con
+heurística Manhattan hacia la computadora (inicio). Entre consultas se
+conserva el árbol de búsqueda:
+
+- Si la computadora avanza, solo se acumula km (no se invalida nada)
+- Si el jugador cambia de celda, la raíz se mueve: se actualiza el rhs de la
+  raíz vieja y de la nueva y se reparan solo los nodos afectados
+- Si cambian celdas del mapa, se reparan esas celdas y sus vecinas
+
+Las celdas se manejan con índice plano fila * columnas + col.
+"""
+
+import heapq
+from array import array
+
+from .estrategia import EstrategiaNavegacion
+
+INFINITO = 1 << 30
+
+
+class NavegacionDStarLite(EstrategiaNavegacion):
+    """D* Lite con objetivo móvil: repara el árbol previo en lugar de buscar desde cero."""
+
+    nombre = "dstar_lite"
+
+    def __init__(self, laberinto):
+        super().__init__(laberinto)
+        self._reiniciar()
+
+    def _reiniciar(self) -> None:
+        """Descarta el árbol de búsqueda y copia la grilla actual del laberinto."""
+        self._columnas = self.laberinto.columnas
+        self._filas = self.laberinto.filas
+        self._grilla = bytearray(self.laberinto._grilla)
+        total = self._filas * self._columnas
+        self._g = array("i", [INFINITO]) * total
+        self._rhs = array("i", [INFINITO]) * total
+        self._cola: list[tuple[int, int, int]] = []
+        self._en_cola: dict[int, tuple[int, int]] = {}
+        self._km = 0
+        self._raiz: int | None = None
+        self._inicio: int | None = None
+
+    def reconstruir(self, cambiadas: list[int] | None = None) -> None:
+        """
+        Repara el árbol solo alrededor de las celdas que cambiaron en el mapa.
+
+        Args:
+            cambiadas: Índices planos que registró cambiar_celda; con None (o
+                si cambió el tamaño del mapa) se descarta el árbol
+        """
+        if (
+            cambiadas is None
+            or self._filas != self.laberinto.filas
+            or self._columnas != self.laberinto.columnas
+        ):
+            self._reiniciar()
+            return
+
+        grilla = self.laberinto._grilla
+        modificadas = []
+        for u in dict.fromkeys(cambiadas):
+            if self._grilla[u] != grilla[u]:
+                self._grilla[u] = grilla[u]
+                modificadas.append(u)
+        if self._raiz is None:
+            return
+        for u in modificadas:
+            self._actualizar_vertice(u)
+            for v in self._vecinos(u):
+                self._actualizar_vertice(v)
+
+    # ------------------------------------------------------------------
+    # Grilla e índices
+    # ------------------------------------------------------------------
+    def _vecinos(self, u: int) -> list[int]:
+        """Vecinos transitables de u (u puede ser un muro recién colocado)."""
+        columnas = self._columnas
+        total = len(self._grilla)
+        grilla = self._grilla
+        c = u % columnas
+        resultado = []
+        if u + columnas < total and not grilla[u + columnas]:
+            resultado.append(u + columnas)
+        if u >= columnas and not grilla[u - columnas]:
+            resultado.append(u - columnas)
+        if c + 1 < columnas and not grilla[u + 1]:
+            resultado.append(u + 1)
+        if c > 0 and not grilla[u - 1]:
+            resultado.append(u - 1)
+        return resultado
+
+    def _heuristica(self, a: int, b: int) -> int:
+        """Distancia Manhattan entre dos índices planos."""
+        fa, ca = divmod(a, self._columnas)
+        fb, cb = divmod(b, self._columnas)
+        return abs(fa - fb) + abs(ca - cb)
+
+    # ------------------------------------------------------------------
+    # Cola de prioridad con borrado perezoso
+    # ------------------------------------------------------------------
+    def _clave(self, u: int) -> tuple[int, int]:
+        m = min(self._g[u], self._rhs[u])
+        if m >= INFINITO:
+            return (INFINITO, INFINITO)
+        return (m + self._heuristica(u, self._inicio) + self._km, m)
+
+    def _encolar(self, u: int, clave: tuple[int, int]) -> None:
+        self._en_cola[u] = clave
+        heapq.heappush(self._cola, (clave[0], clave[1], u))
+        # Compactar si se acumularon demasiadas entradas obsoletas
+        if len(self._cola) > 4 * len(self._en_cola) + 64:
+            self._cola = [(k[0], k[1], v) for v, k in self._en_cola.items()]
+            heapq.heapify(self._cola)
+
+    def _tope(self) -> tuple[tuple[int, int], int] | None:
+        """Entrada válida de menor clave (descartando las obsoletas), o None."""
+        cola = self._cola
+        while cola:
+            k1, k2, u = cola[0]
+            if self._en_cola.get(u) == (k1, k2):
+                return (k1, k2), u
+            heapq.heappop(cola)
+        return None
+
+    # ------------------------------------------------------------------
+    # D* Lite
+    # ------------------------------------------------------------------
+    def _actualizar_vertice(self, u: int) -> None:
+        if u != self._raiz:
+            if self._grilla[u]:
+                rhs = INFINITO
+            else:
+                g = self._g
+                rhs = min((g[v] for v in self._vecinos(u)), default=INFINITO)
+                rhs = INFINITO if rhs >= INFINITO else rhs + 1
+            self._rhs[u] = rhs
+        self._en_cola.pop(u, None)
+        if self._g[u] != self._rhs[u]:
+            self._encolar(u, self._clave(u))
+
+    def _calcular_camino_mas_corto(self) -> None:
+        g = self._g
+        rhs = self._rhs
+        inicio = self._inicio
+        while True:
+            tope = self._tope()
+            if tope is None:
+                break
+            clave_vieja, u = tope
+            if clave_vieja >= self._clave(inicio) and rhs[inicio] == g[inicio]:
+                break
+
+            clave_nueva = self._clave(u)
+            if clave_vieja < clave_nueva:
+                self._encolar(u, clave_nueva)
+                continue
+
+            self.nodos_expandidos += 1
+            if g[u] > rhs[u]:
+                # Sobre-consistente: se fija su distancia y se propaga a los vecinos
+                g[u] = rhs[u]
+                del self._en_cola[u]
+                for v in self._vecinos(u):
+                    self._actualizar_vertice(v)
+            else:
+                # Sub-consistente: se invalida y se recalcula junto a sus vecinos
+                g[u] = INFINITO
+                self._actualizar_vertice(u)
+                for v in self._vecinos(u):
+                    self._actualizar_vertice(v)
+
+    def _siguiente_paso(self, inicio, objetivo):
+        columnas = self._columnas
+        s = inicio[0] * columnas + inicio[1]
+        o = objetivo[0] * columnas + objetivo[1]
+
+        if self._raiz is None:
+            self._raiz = o
+            self._inicio = s
+            self._rhs[o] = 0
+            self._encolar(o, self._clave(o))
+        else:
+            if s != self._inicio:
+                # La computadora se movió: las claves viejas siguen siendo cotas inferiores
+                self._km += self._heuristica(self._inicio, s)
+                self._inicio = s
+            if o != self._raiz:
+                # El jugador cambió de celda: mover la raíz del árbol
+                anterior = self._raiz
+                self._raiz = o
+                self._actualizar_vertice(anterior)
+                self._rhs[o] = 0
+                self._actualizar_vertice(o)
+
+        self._calcular_camino_mas_corto()
+
+        g = self._g
+        if g[s] >= INFINITO:
+            return None
+        mejor = min(self._vecinos(s), key=g.__getitem__)
+        return divmod(mejor, columnas)
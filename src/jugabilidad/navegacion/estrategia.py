@@ -0,0 +1,201 @@
+"""
+Estrategias de navegación sobre la grilla del laberinto.
+
+Todas las estrategias trabajan con celdas (fila, col), igual que el BFS
+original de Computadora, y leen la transitabilidad directamente de la grilla
+compacta de Laberinto. Si el mapa cambia (version_mapa), la estrategia se
+actualiza antes de responder la siguiente consulta; recibe las celdas que
+cambiaron (Laberinto.celdas_cambiadas_desde) para no recorrer todo el mapa.
+"""
+
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Hashable
+
+# Orden de exploración de vecinos: abajo, arriba, derecha, izquierda (igual que el BFS original)
+DIRECCIONES = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+class EstrategiaNavegacion(ABC):
+    """Interfaz para estrategias de búsqueda de caminos de la computadora."""
+
+    nombre = "base"
+
+    def __init__(self, laberinto):
+        """
+        Inicializa la estrategia sobre un laberinto ya cargado.
+
+        Args:
+            laberinto: Instancia de Laberinto (se consulta su grilla y version_mapa)
+        """
+        self.laberinto = laberinto
+        self._version = laberinto.version_mapa
+
+        # Contadores para comparar estrategias (ver estadisticas())
+        self.consultas = 0
+        self.nodos_expandidos = 0
+        self.tiempo_ns = 0
+
+    def siguiente_paso(
+        self,
+        inicio: tuple[int, int],
+        objetivo: tuple[int, int],
+        perseguidor: Hashable | None = None,
+    ) -> tuple[int, int] | None:
+        """
+        Retorna la celda vecina a la que hay que moverse para acercarse al objetivo.
+
+        Args:
+            inicio: Celda actual (fila, col)
+            objetivo: Celda destino (fila, col)
+            perseguidor: Quién pregunta (p. ej. la Computadora). Solo lo usan
+                las estrategias que guardan estado por perseguidor (HPA)
+
+        Returns:
+            Celda (fila, col) del siguiente paso, el propio objetivo si ya se
+            llegó, o None si no hay camino
+        """
+        self._sincronizar()
+        self.consultas += 1
+        inicio_ns = time.perf_counter_ns()
+        paso = None
+        if self.es_transitable(inicio) and self.es_transitable(objetivo):
+            paso = objetivo if inicio == objetivo else self._siguiente_paso(inicio, objetivo)
+        self.tiempo_ns += time.perf_counter_ns() - inicio_ns
+        return paso
+
+    def calcular_camino(
+        self, inicio: tuple[int, int], objetivo: tuple[int, int]
+    ) -> list[tuple[int, int]] | None:
+        """
+        Calcula el camino completo inicio -> objetivo (ambos incluidos).
+
+        La implementación por defecto encadena siguiente_paso; las estrategias
+        que buscan el camino entero de una vez la sobrescriben.
+
+        Returns:
+            Lista de celdas (fila, col) o None si no hay camino
+        """
+        if not (self.es_transitable(inicio) and self.es_transitable(objetivo)):
+            return None
+        camino = [inicio]
+        actual = inicio
+        limite = self.laberinto.filas * self.laberinto.columnas
+        while actual != objetivo:
+            actual = self.siguiente_paso(actual, objetivo)
+            if actual is None or len(camino) > limite:
+                return None
+            camino.append(actual)
+        return camino
+
+    def estadisticas(self) -> dict[str, float]:
+        """
+        Resumen de costo de las consultas respondidas hasta ahora.
+
+        El tiempo no incluye la precomputación ni las reconstrucciones por
+        cambios del mapa, solo la resolución de cada consulta.
+
+        Returns:
+            Diccionario con consultas, nodos_expandidos, nodos_por_consulta y
+            microsegundos_por_consulta
+        """
+        consultas = max(self.consultas, 1)
+        return {
+            "consultas": self.consultas,
+            "nodos_expandidos": self.nodos_expandidos,
+            "nodos_por_consulta": self.nodos_expandidos / consultas,
+            "microsegundos_por_consulta": self.tiempo_ns / 1000 / consultas,
+        }
+
+    def reiniciar_estadisticas(self) -> None:
+        """Pone en cero los contadores de consultas, nodos y tiempo."""
+        self.consultas = 0
+        self.nodos_expandidos = 0
+        self.tiempo_ns = 0
+
+    @abstractmethod
+    def _siguiente_paso(
+        self, inicio: tuple[int, int], objetivo: tuple[int, int]
+    ) -> tuple[int, int] | None:
+        """Resuelve la consulta; inicio y objetivo ya son transitables y distintos."""
+        pass
+
+    # Gancho opcional: las estrategias sin precomputación no lo sobrescriben
+    def reconstruir(self, cambiadas: list[int] | None = None) -> None:  # noqa: B027
+        """
+        Recalcula las estructuras precomputadas tras un cambio del mapa.
+
+        Args:
+            cambiadas: Índices planos de las celdas que cambiaron desde la
+                última sincronización, o None si hay que reconstruir todo
+        """
+        pass
+
+    def _sincronizar(self) -> None:
+        """Reconstruye la estrategia si el laberinto cambió desde la última consulta."""
+        version = self.laberinto.version_mapa
+        if self._version != version:
+            cambiadas = self.laberinto.celdas_cambiadas_desde(self._version)
+            self._version = version
+            self.reconstruir(cambiadas)
+
+    def es_transitable(self, celda: tuple[int, int]) -> bool:
+        """Verifica si la celda (fila, col) es un pasillo dentro del mapa."""
+        fila, col = celda
+        return self.laberinto.es_transitable((col, fila))
+
+    def vecinos(self, celda: tuple[int, int]):
+        """Genera las celdas adyacentes transitables de una celda (fila, col)."""
+        fila, col = celda
+        es_transitable = self.laberinto.es_transitable
+        for df, dc in DIRECCIONES:
+            nf, nc = fila + df, col + dc
+            if es_transitable((nc, nf)):
+                yield (nf, nc)
+
+
+class NavegacionBFS(EstrategiaNavegacion):
+    """Búsqueda en amplitud desde cero en cada consulta (comportamiento original)."""
+
+    nombre = "bfs"
+
+    def _siguiente_paso(self, inicio, objetivo):
+        camino = self._buscar(inicio, objetivo)
+        return camino[1] if camino else None
+
+    def calcular_camino(self, inicio, objetivo):
+        self._sincronizar()
+        self.consultas += 1
+        inicio_ns = time.perf_counter_ns()
+        camino = None
+        if self.es_transitable(inicio) and self.es_transitable(objetivo):
+            camino = self._buscar(inicio, objetivo)
+        self.tiempo_ns += time.perf_counter_ns() - inicio_ns
+        return camino
+
+    def _buscar(self, inicio, objetivo):
+        """BFS inicio -> objetivo; retorna el camino reconstruido o None."""
+        cola = deque([inicio])
+        visitado: dict[tuple[int, int], tuple[int, int] | None] = {inicio: None}
+
+        while cola:
+            actual = cola.popleft()
+            self.nodos_expandidos += 1
+            if actual == objetivo:
+                break
+            for v in self.vecinos(actual):
+                if v not in visitado:
+                    visitado[v] = actual
+                    cola.append(v)
+
+        if objetivo not in visitado:
+            return None
+
+        camino = []
+        cur = objetivo
+        while cur is not None:
+            camino.append(cur)
+            cur = visitado[cur]
+        camino.reverse()
+        return camino
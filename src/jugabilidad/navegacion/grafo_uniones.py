@@ -0,0 +1,122 @@
+"""
+Navegación sobre el grafo comprimido de uniones del laberinto.
+
+La búsqueda (Dijkstra) recorre solo nodos de unión y callejones; la celda de
+inicio y la de destino, si están en medio de un pasillo, se enganchan a los
+dos extremos de ese pasillo. De la ruta encontrada solo se baja a nivel de
+celdas el primer tramo, que es lo que necesita la computadora para moverse.
+"""
+
+import heapq
+
+from .estrategia import EstrategiaNavegacion
+
+INFINITO = float("inf")
+
+
+class NavegacionGrafoUniones(EstrategiaNavegacion):
+    """Dijkstra sobre nodos de unión con aristas ponderadas por el largo del pasillo."""
+
+    nombre = "uniones"
+
+    def __init__(self, laberinto):
+        super().__init__(laberinto)
+        self._grafo = laberinto.grafo_uniones
+
+    def reconstruir(self, cambiadas: list[int] | None = None) -> None:
+        """Toma el grafo que el laberinto corrigió (o rehízo) tras el cambio de mapa."""
+        self._grafo = self.laberinto.grafo_uniones
+
+    def _enganches(self, celda: int) -> list[tuple[int, int, int]]:
+        """
+        Extremos del pasillo de una celda: [(nodo, distancia, celda vecina hacia el nodo)].
+        """
+        grafo = self._grafo
+        a, b, celdas = grafo.aristas[grafo.arista_de_celda[celda]]
+        i = grafo.indice_en_arista[celda]
+        largo = len(celdas)
+        return [
+            (a, i + 1, celdas[i - 1] if i > 0 else a),
+            (b, largo - i, celdas[i + 1] if i + 1 < largo else b),
+        ]
+
+    def _resolver(self, inicio: int, objetivo: int) -> tuple[float, int | None]:
+        """Retorna (distancia, primera celda del camino) entre dos índices planos."""
+        grafo = self._grafo
+        mejor_costo, mejor_paso = INFINITO, None
+
+        # Fuentes: el propio nodo o los dos extremos del pasillo de inicio
+        if grafo.es_nodo[inicio]:
+            fuentes = [(inicio, 0, None)]
+        else:
+            fuentes = self._enganches(inicio)
+
+        # Destinos: nodo -> [(distancia extra, primera celda si el nodo es el inicio)]
+        destinos: dict[int, list[tuple[int, int | None]]] = {}
+        if grafo.es_nodo[objetivo]:
+            destinos[objetivo] = [(0, None)]
+        else:
+            a, b, celdas = grafo.aristas[grafo.arista_de_celda[objetivo]]
+            j = grafo.indice_en_arista[objetivo]
+            destinos.setdefault(a, []).append((j + 1, celdas[0]))
+            destinos.setdefault(b, []).append((len(celdas) - j, celdas[-1]))
+
+            # Inicio y objetivo en el mismo pasillo: camino directo por el pasillo
+            if grafo.arista_de_celda[inicio] == grafo.arista_de_celda[objetivo]:
+                i = grafo.indice_en_arista[inicio]
+                mejor_costo = abs(i - j)
+                mejor_paso = celdas[i + 1] if j > i else celdas[i - 1]
+
+        distancia: dict[int, int] = {}
+        primer_paso: dict[int, int | None] = {}
+        cola: list[tuple[int, int]] = []
+        for nodo, costo, paso in fuentes:
+            if costo < distancia.get(nodo, INFINITO):
+                distancia[nodo] = costo
+                primer_paso[nodo] = paso
+                heapq.heappush(cola, (costo, nodo))
+
+        while cola:
+            d, u = heapq.heappop(cola)
+            if d > distancia[u]:
+                continue
+            if d >= mejor_costo:
+                break
+            self.nodos_expandidos += 1
+
+            paso_u = primer_paso[u]
+            for extra, paso_desde_inicio in destinos.get(u, ()):
+                if d + extra < mejor_costo:
+                    mejor_costo = d + extra
+                    mejor_paso = paso_u if paso_u is not None else paso_desde_inicio
+
+            for v, peso, id_arista in grafo.adyacencia[u]:
+                nd = d + peso
+                if nd < distancia.get(v, INFINITO):
+                    distancia[v] = nd
+                    primer_paso[v] = (
+                        paso_u if paso_u is not None else grafo.primera_celda(u, id_arista)
+                    )
+                    heapq.heappush(cola, (nd, v))
+
+        return mejor_costo, mejor_paso
+
+    def _siguiente_paso(self, inicio, objetivo):
+        columnas = self.laberinto.columnas
+        _, paso = self._resolver(
+            inicio[0] * columnas + inicio[1], objetivo[0] * columnas + objetivo[1]
+        )
+        return None if paso is None else divmod(paso, columnas)
+
+    def distancia(self, inicio: tuple[int, int], objetivo: tuple[int, int]) -> int | None:
+        """Distancia en pasos entre dos celdas (fila, col), o None si no hay ruta."""
+        self._sincronizar()
+        if not (self.es_transitable(inicio) and self.es_transitable(objetivo)):
+            return None
+        if inicio == objetivo:
+            return 0
+        columnas = self.laberinto.columnas
+        costo, _ = self._resolver(
+            inicio[0] * columnas + inicio[1], objetivo[0] * columnas + objetivo[1]
+        )
+        return None if costo == INFINITO else int(costo)
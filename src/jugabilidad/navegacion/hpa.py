@@ -0,0 +1,498 @@
+"""
+Planificador jerárquico HPA* para laberintos muy grandes.
+
+El mapa se divide en clusters de TAM_CLUSTER_HPA x TAM_CLUSTER_HPA celdas.
+Al cargar el laberinto se precomputan:
+
+- Entradas: en cada borde entre dos clusters vecinos, los tramos donde ambos
+  lados son transitables aportan una transición (dos si el tramo es largo).
+  Las celdas de cada transición son los nodos del grafo abstracto.
+- Costos internos: un BFS restringido al cluster desde cada nodo da la
+  distancia a los demás nodos del mismo cluster.
+
+Cada consulta engancha el inicio y el objetivo a los nodos de su cluster,
+hace A* sobre el grafo abstracto y refina solo el primer tramo (dentro del
+cluster de inicio) para obtener el siguiente paso. Si el objetivo está en un
+cluster contiguo también se busca directo sobre ambos, así las persecuciones
+cortas no rodean hasta la transición del borde. Las rutas son casi óptimas:
+pueden ser unos pocos pasos más largas que las del BFS.
+
+La ruta abstracta se guarda y se sigue en las consultas siguientes mientras
+el objetivo no salga de su cluster, así que la mayoría de los pasos solo
+cuestan un BFS dentro de un cluster. Cada perseguidor (el argumento
+perseguidor de siguiente_paso) tiene su propia ruta, y solo la sigue desde la
+celda a la que lo mandó, así nadie usa una ruta calculada para otro.
+
+Si cambia el mapa, solo se recalculan los clusters afectados y sus vecinos.
+"""
+
+import heapq
+from collections import deque
+from collections.abc import Hashable
+
+from config.config import ConfigJuego
+
+from .estrategia import EstrategiaNavegacion
+
+INFINITO = float("inf")
+
+# Tramos de borde de al menos este largo aportan dos transiciones (una por extremo)
+LARGO_ENTRADA_DOBLE = 6
+
+# Rutas abstractas recordadas a la vez (una por perseguidor; se olvida la
+# del que hace más tiempo que no pregunta)
+MAX_RUTAS_GUARDADAS = 64
+
+
+class NavegacionHPA(EstrategiaNavegacion):
+    """A* sobre el grafo abstracto de entradas entre clusters, con refinamiento local."""
+
+    nombre = "hpa"
+
+    def __init__(self, laberinto, tam_cluster: int | None = None):
+        """
+        Args:
+            laberinto: Instancia de Laberinto ya cargada
+            tam_cluster: Lado de cada cluster en celdas (default: ConfigJuego.TAM_CLUSTER_HPA)
+        """
+        super().__init__(laberinto)
+        self.tam_cluster = tam_cluster or ConfigJuego.TAM_CLUSTER_HPA
+        self._construir()
+
+    # ------------------------------------------------------------------
+    # Precomputación
+    # ------------------------------------------------------------------
+    def _construir(self) -> None:
+        """Calcula todas las entradas y costos internos desde cero."""
+        self._filas = self.laberinto.filas
+        self._columnas = self.laberinto.columnas
+        self._grilla = bytearray(self.laberinto._grilla)
+        k = self.tam_cluster
+        self._clusters_f = (self._filas + k - 1) // k
+        self._clusters_c = (self._columnas + k - 1) // k
+
+        # Borde (cluster_a, cluster_b) -> [(celda en a, celda en b), ...]
+        self._transiciones: dict[tuple, list[tuple[int, int]]] = {}
+        # Nodo -> celdas vecinas en otro cluster (aristas de costo 1)
+        self._entre: dict[int, list[int]] = {}
+        # Cluster -> {nodo: [(otro nodo del cluster, distancia), ...]}
+        self._internas: dict[tuple[int, int], dict[int, list[tuple[int, int]]]] = {}
+        # Ruta abstracta de cada perseguidor: {"objetivo", "nodos" (deque),
+        # "ultimo" nodo alcanzado, "desde" y "paso": última consulta respondida}
+        self._rutas: dict[Hashable, dict] = {}
+        self._perseguidor: Hashable | None = None
+
+        for borde in self._todos_los_bordes():
+            self._calcular_borde(borde)
+        for cf in range(self._clusters_f):
+            for cc in range(self._clusters_c):
+                self._calcular_cluster((cf, cc))
+
+    def reconstruir(self, cambiadas: list[int] | None = None) -> None:
+        """
+        Recalcula solo los clusters donde cambiaron celdas (y sus vecinos).
+
+        Args:
+            cambiadas: Índices planos que registró cambiar_celda; con None (o
+                si cambió el tamaño del mapa) se recalcula todo
+        """
+        if (
+            cambiadas is None
+            or self._filas != self.laberinto.filas
+            or self._columnas != self.laberinto.columnas
+        ):
+            self._construir()
+            return
+
+        grilla = self.laberinto._grilla
+        sucios = set()
+        for u in cambiadas:
+            if self._grilla[u] != grilla[u]:
+                self._grilla[u] = grilla[u]
+                sucios.add(self._cluster_de(u))
+        if not sucios:
+            return
+        self._rutas = {}
+
+        bordes = {borde for c in sucios for borde in self._bordes_de(c)}
+        for borde in bordes:
+            self._calcular_borde(borde)
+        afectados = {c for borde in bordes for c in borde}
+        for cluster in afectados:
+            self._calcular_cluster(cluster)
+
+    @staticmethod
+    def _son_vecinos(a: tuple[int, int], b: tuple[int, int]) -> bool:
+        """True si los clusters se tocan por un lado o una esquina, o son el mismo."""
+        return abs(a[0] - b[0]) <= 1 and abs(a[1] - b[1]) <= 1
+
+    def _cluster_de(self, u: int) -> tuple[int, int]:
+        fila, col = divmod(u, self._columnas)
+        return (fila // self.tam_cluster, col // self.tam_cluster)
+
+    def _limites(self, cluster: tuple[int, int]) -> tuple[int, int, int, int]:
+        """(fila_min, fila_max, col_min, col_max) del cluster, límites exclusivos al final."""
+        k = self.tam_cluster
+        cf, cc = cluster
+        return (
+            cf * k,
+            min((cf + 1) * k, self._filas),
+            cc * k,
+            min((cc + 1) * k, self._columnas),
+        )
+
+    def _todos_los_bordes(self):
+        for cf in range(self._clusters_f):
+            for cc in range(self._clusters_c):
+                if cc + 1 < self._clusters_c:
+                    yield ((cf, cc), (cf, cc + 1))
+                if cf + 1 < self._clusters_f:
+                    yield ((cf, cc), (cf + 1, cc))
+
+    def _bordes_de(self, cluster: tuple[int, int]) -> list[tuple]:
+        cf, cc = cluster
+        bordes = []
+        if cc > 0:
+            bordes.append(((cf, cc - 1), cluster))
+        if cc + 1 < self._clusters_c:
+            bordes.append((cluster, (cf, cc + 1)))
+        if cf > 0:
+            bordes.append(((cf - 1, cc), cluster))
+        if cf + 1 < self._clusters_f:
+            bordes.append((cluster, (cf + 1, cc)))
+        return bordes
+
+    def _calcular_borde(self, borde: tuple) -> None:
+        """Recalcula las transiciones de un borde entre dos clusters vecinos."""
+        for a, b in self._transiciones.get(borde, []):
+            self._entre[a].remove(b)
+            self._entre[b].remove(a)
+
+        (cf_a, cc_a), (cf_b, cc_b) = borde
+        columnas = self._columnas
+        fila_min, fila_max, col_min, col_max = self._limites(borde[0])
+        if cc_b != cc_a:
+            # Borde vertical: columna derecha de a contra columna izquierda de b
+            pares = [
+                (f * columnas + col_max - 1, f * columnas + col_max)
+                for f in range(fila_min, fila_max)
+            ]
+        else:
+            # Borde horizontal: fila inferior de a contra fila superior de b
+            pares = [
+                ((fila_max - 1) * columnas + c, fila_max * columnas + c)
+                for c in range(col_min, col_max)
+            ]
+
+        grilla = self._grilla
+        transiciones = []
+        tramo: list[tuple[int, int]] = []
+        for par in pares + [None]:
+            if par is not None and not grilla[par[0]] and not grilla[par[1]]:
+                tramo.append(par)
+                continue
+            if tramo:
+                if len(tramo) >= LARGO_ENTRADA_DOBLE:
+                    transiciones.extend((tramo[0], tramo[-1]))
+                else:
+                    transiciones.append(tramo[len(tramo) // 2])
+                tramo = []
+
+        self._transiciones[borde] = transiciones
+        for a, b in transiciones:
+            self._entre.setdefault(a, []).append(b)
+            self._entre.setdefault(b, []).append(a)
+
+    def _nodos_de(self, cluster: tuple[int, int]) -> set[int]:
+        """Celdas del cluster que participan en alguna transición."""
+        nodos = set()
+        for borde in self._bordes_de(cluster):
+            lado = 0 if borde[0] == cluster else 1
+            for par in self._transiciones.get(borde, []):
+                nodos.add(par[lado])
+        return nodos
+
+    def _calcular_cluster(self, cluster: tuple[int, int]) -> None:
+        """Distancias internas entre todos los nodos del cluster."""
+        nodos = self._nodos_de(cluster)
+        internas: dict[int, list[tuple[int, int]]] = {nodo: [] for nodo in nodos}
+        if len(nodos) > 1:
+            # Adyacencia local (índices 0..n-1) para que cada BFS use solo listas
+            fila_min, fila_max, col_min, col_max = self._limites(cluster)
+            columnas = self._columnas
+            grilla = self._grilla
+            celdas = [
+                f * columnas + c
+                for f in range(fila_min, fila_max)
+                for c in range(col_min, col_max)
+                if not grilla[f * columnas + c]
+            ]
+            local = {celda: i for i, celda in enumerate(celdas)}
+            adyacencia = []
+            for celda in celdas:
+                col = celda % columnas
+                vecinos = [celda + columnas, celda - columnas]
+                if col + 1 < col_max:
+                    vecinos.append(celda + 1)
+                if col > col_min:
+                    vecinos.append(celda - 1)
+                adyacencia.append([local[v] for v in vecinos if v in local])
+            lista_nodos = list(nodos)
+            indices = [local[n] for n in lista_nodos]
+            for nodo, origen in zip(lista_nodos, indices, strict=True):
+                distancias = [-1] * len(celdas)
+                distancias[origen] = 0
+                frontera = [origen]
+                d = 0
+                while frontera:
+                    d += 1
+                    nueva_frontera = []
+                    for u in frontera:
+                        for v in adyacencia[u]:
+                            if distancias[v] < 0:
+                                distancias[v] = d
+                                nueva_frontera.append(v)
+                    frontera = nueva_frontera
+                internas[nodo] = [
+                    (otro, distancias[i])
+                    for otro, i in zip(lista_nodos, indices, strict=True)
+                    if otro != nodo and distancias[i] >= 0
+                ]
+        self._internas[cluster] = internas
+
+    def _bfs_en_cluster(
+        self, origen: int, cluster: tuple[int, int], contar: bool = True
+    ) -> tuple[dict[int, int], dict[int, int]]:
+        """BFS restringido a las celdas del cluster; retorna (distancias, padres)."""
+        return self._bfs_en_region(origen, self._limites(cluster), contar)
+
+    def _bfs_en_region(
+        self, origen: int, limites: tuple[int, int, int, int], contar: bool = True
+    ) -> tuple[dict[int, int], dict[int, int]]:
+        """BFS restringido a un rectángulo (mismos límites que _limites)."""
+        fila_min, fila_max, col_min, col_max = limites
+        columnas = self._columnas
+        grilla = self._grilla
+        distancias = {origen: 0}
+        padres = {origen: origen}
+        cola = deque([origen])
+        while cola:
+            u = cola.popleft()
+            fila, col = divmod(u, columnas)
+            d = distancias[u] + 1
+            for v, dentro in (
+                (u + columnas, fila + 1 < fila_max),
+                (u - columnas, fila > fila_min),
+                (u + 1, col + 1 < col_max),
+                (u - 1, col > col_min),
+            ):
+                if dentro and not grilla[v] and v not in distancias:
+                    distancias[v] = d
+                    padres[v] = u
+                    cola.append(v)
+        if contar:
+            self.nodos_expandidos += len(distancias)
+        return distancias, padres
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+    def _resolver(
+        self, inicio: int, objetivo: int
+    ) -> tuple[float, int | None, list[int]]:
+        """
+        Busca la ruta entre dos índices planos.
+
+        Returns:
+            (costo, primera celda, nodos abstractos de la ruta en orden); la
+            lista está vacía si la mejor ruta no sale del cluster de inicio
+        """
+        cluster_inicio = self._cluster_de(inicio)
+        cluster_objetivo = self._cluster_de(objetivo)
+        dist_inicio, padres = self._bfs_en_cluster(inicio, cluster_inicio)
+
+        def primer_paso(destino: int) -> int:
+            """Sube por los padres del BFS de inicio hasta la celda vecina al inicio."""
+            while padres[destino] != inicio:
+                destino = padres[destino]
+            return destino
+
+        mejor_costo, mejor_paso, mejor_nodo = INFINITO, None, None
+        if objetivo in dist_inicio:
+            mejor_costo, mejor_paso = dist_inicio[objetivo], primer_paso(objetivo)
+        elif self._son_vecinos(cluster_inicio, cluster_objetivo):
+            # Objetivo en un cluster contiguo: un BFS sobre ambos da el camino
+            # exacto, que la única transición del borde puede alargar mucho
+            a, b = self._limites(cluster_inicio), self._limites(cluster_objetivo)
+            region = (
+                min(a[0], b[0]),
+                max(a[1], b[1]),
+                min(a[2], b[2]),
+                max(a[3], b[3]),
+            )
+            dist_region, padres_region = self._bfs_en_region(inicio, region)
+            if objetivo in dist_region:
+                mejor_costo = dist_region[objetivo]
+                mejor_paso = objetivo
+                while padres_region[mejor_paso] != inicio:
+                    mejor_paso = padres_region[mejor_paso]
+
+        # Enganche del objetivo: distancia desde cada nodo de su cluster
+        dist_objetivo, _ = self._bfs_en_cluster(objetivo, cluster_objetivo)
+        salidas = {
+            n: dist_objetivo[n]
+            for n in self._internas[cluster_objetivo]
+            if n in dist_objetivo
+        }
+
+        columnas = self._columnas
+        fo, co = divmod(objetivo, columnas)
+
+        def heuristica(u: int) -> int:
+            f, c = divmod(u, columnas)
+            return abs(f - fo) + abs(c - co)
+
+        # A* abstracto; 'pasos' guarda la primera celda de la ruta hacia cada nodo
+        distancia: dict[int, int] = {}
+        pasos: dict[int, int | None] = {}
+        padres_abstractos: dict[int, int | None] = {}
+        cola: list[tuple[int, int, int]] = []
+        for nodo in self._internas[cluster_inicio]:
+            if nodo in dist_inicio:
+                d = dist_inicio[nodo]
+                distancia[nodo] = d
+                pasos[nodo] = primer_paso(nodo) if nodo != inicio else None
+                padres_abstractos[nodo] = None
+                heapq.heappush(cola, (d + heuristica(nodo), d, nodo))
+
+        while cola:
+            f, d, u = heapq.heappop(cola)
+            if d > distancia[u]:
+                continue
+            if f >= mejor_costo:
+                break
+            self.nodos_expandidos += 1
+
+            paso_u = pasos[u]
+            if u in salidas and d + salidas[u] < mejor_costo:
+                mejor_costo = d + salidas[u]
+                mejor_paso = paso_u
+                mejor_nodo = u
+
+            vecinos = [(v, 1) for v in self._entre.get(u, ())]
+            if paso_u is not None:
+                # Desde el inicio los nodos del cluster ya están enganchados por BFS
+                vecinos.extend(self._internas[self._cluster_de(u)].get(u, ()))
+            for v, costo in vecinos:
+                nd = d + costo
+                if nd < distancia.get(v, INFINITO):
+                    distancia[v] = nd
+                    pasos[v] = paso_u if paso_u is not None else v
+                    padres_abstractos[v] = u
+                    heapq.heappush(cola, (nd + heuristica(v), nd, v))
+
+        nodos = []
+        while mejor_nodo is not None:
+            nodos.append(mejor_nodo)
+            mejor_nodo = padres_abstractos[mejor_nodo]
+        nodos.reverse()
+        return mejor_costo, mejor_paso, nodos
+
+    def _seguir_ruta(self, ruta: dict, inicio: int, objetivo: int) -> int | None:
+        """
+        Siguiente celda según una ruta abstracta guardada, o None si no sirve.
+
+        La ruta sirve si el objetivo sigue en el mismo cluster (y alcanzable
+        desde el último nodo) y su próximo nodo está en el cluster del inicio,
+        o es la otra celda de la transición en la que está parado el inicio.
+        """
+        cluster_objetivo = self._cluster_de(objetivo)
+        nodos = ruta["nodos"]
+        if self._cluster_de(ruta["objetivo"]) != cluster_objetivo:
+            return None
+        if ruta["objetivo"] != objetivo:
+            # El objetivo se movió dentro de su cluster: validar el último tramo
+            dist_objetivo, _ = self._bfs_en_cluster(objetivo, cluster_objetivo)
+            if not nodos or nodos[-1] not in dist_objetivo:
+                return None
+            ruta["objetivo"] = objetivo
+
+        # Si el inicio ya es un nodo de la ruta, se descarta lo recorrido
+        if inicio in nodos:
+            while nodos[0] != inicio:
+                nodos.popleft()
+            ruta["ultimo"] = nodos.popleft()
+        if not nodos:
+            return None
+
+        siguiente = nodos[0]
+        cluster_inicio = self._cluster_de(inicio)
+        if self._cluster_de(siguiente) != cluster_inicio:
+            cruza = ruta["ultimo"] == inicio and siguiente in self._entre.get(inicio, ())
+            return siguiente if cruza else None
+
+        distancias, padres = self._bfs_en_cluster(inicio, cluster_inicio)
+        if siguiente not in distancias:
+            return None
+        while padres[siguiente] != inicio:
+            siguiente = padres[siguiente]
+        return siguiente
+
+    def siguiente_paso(self, inicio, objetivo, perseguidor=None):
+        """
+        Igual que EstrategiaNavegacion.siguiente_paso; 'perseguidor' elige la
+        ruta abstracta guardada (None cuenta como un único perseguidor).
+        """
+        self._perseguidor = perseguidor
+        return super().siguiente_paso(inicio, objetivo, perseguidor)
+
+    def _siguiente_paso(self, inicio, objetivo):
+        columnas = self._columnas
+        s = inicio[0] * columnas + inicio[1]
+        o = objetivo[0] * columnas + objetivo[1]
+
+        # La ruta del perseguidor sirve si lo dejó en s (o ya le respondió
+        # desde s); si no, se descarta y se busca de nuevo
+        propia = self._rutas.pop(self._perseguidor, None)
+        if propia is not None and s in (propia["paso"], propia["desde"]):
+            lejos = not self._son_vecinos(self._cluster_de(s), self._cluster_de(o))
+            if lejos and propia["nodos"]:
+                paso = self._seguir_ruta(propia, s, o)
+                if paso is not None:
+                    propia["desde"], propia["paso"] = s, paso
+                    self._guardar_ruta(propia)
+                    return divmod(paso, columnas)
+
+        _, paso, nodos = self._resolver(s, o)
+        if paso is None:
+            return None
+        if nodos:
+            self._guardar_ruta(
+                {
+                    "objetivo": o,
+                    "nodos": deque(nodos),
+                    "ultimo": None,
+                    "desde": s,
+                    "paso": paso,
+                }
+            )
+        return divmod(paso, columnas)
+
+    def _guardar_ruta(self, ruta: dict) -> None:
+        """Guarda la ruta del perseguidor actual como la más reciente."""
+        self._rutas[self._perseguidor] = ruta
+        if len(self._rutas) > MAX_RUTAS_GUARDADAS:
+            del self._rutas[next(iter(self._rutas))]
+
+    def distancia(self, inicio: tuple[int, int], objetivo: tuple[int, int]) -> int | None:
+        """Largo de la ruta jerárquica (casi óptima), o None si no hay ruta."""
+        self._sincronizar()
+        if not (self.es_transitable(inicio) and self.es_transitable(objetivo)):
+            return None
+        if inicio == objetivo:
+            return 0
+        columnas = self._columnas
+        costo, _, _ = self._resolver(
+            inicio[0] * columnas + inicio[1], objetivo[0] * columnas + objetivo[1]
+        )
+        return None if costo == INFINITO else int(costo)
@@ -0,0 +1,210 @@
+"""
+Jump point search (JPS) para grillas de 4 vecinos.
+
+Pensada para mapas tipo arena (salas abiertas con pocos obstáculos), donde
+A* agrega al heap casi todas las celdas de un rectángulo alrededor del camino.
+JPS recorre en línea recta sin encolar nada hasta encontrar un "punto de
+salto": el objetivo, una celda con un vecino forzado (un obstáculo que se
+termina al costado del avance) o, al avanzar en vertical, una celda desde la
+que un barrido horizontal encuentra un punto de salto. Solo esos puntos pasan
+por el heap, y como los tramos entre ellos son rectos su costo es la
+distancia Manhattan, así que el camino sigue siendo óptimo.
+
+Los barridos celda por celda no dependen del objetivo, así que se
+precalculan al cargar el mapa (saltos y alcances por dirección, como en
+JPS+): durante la búsqueda cada salto es una consulta O(1) más la
+comprobación de si el objetivo aparece antes.
+
+En laberintos de pasillos casi todas las celdas tienen vecinos forzados y la
+ventaja desaparece; para esos mapas conviene el grafo de uniones.
+"""
+
+import heapq
+from array import array
+
+from .astar import NavegacionAStar
+
+
+class NavegacionJPS(NavegacionAStar):
+    """A* sobre puntos de salto: barridos rectos en lugar de expandir celda por celda."""
+
+    nombre = "jps"
+
+    def reconstruir(self, cambiadas: list[int] | None = None) -> None:
+        """
+        Copia la grilla y precalcula, para cada celda y dirección, el próximo
+        punto de salto que no depende del objetivo y hasta dónde llega la
+        vista antes de un muro.
+        """
+        super().reconstruir(cambiadas)
+        grilla = self._grilla
+        ancho = self._ancho
+        total = len(grilla)
+        # _saltos[d][u]: próximo punto de salto desde u en la dirección d (-1 = muro)
+        # _alcances[d][u]: última celda transitable desde u en la dirección d
+        self._saltos = {}
+        self._alcances = {}
+
+        # Horizontal: vecino forzado si arriba o abajo termina un muro
+        for d in (1, -1):
+            saltos = array("i", [-1]) * total
+            alcances = array("i", [0]) * total
+            for u in range(total - 1, -1, -1) if d > 0 else range(total):
+                if grilla[u]:
+                    continue
+                v = u + d
+                if grilla[v]:
+                    alcances[u] = u
+                    continue
+                alcances[u] = alcances[v]
+                forzado = (not grilla[v - ancho] and grilla[v - ancho - d]) or (
+                    not grilla[v + ancho] and grilla[v + ancho - d]
+                )
+                saltos[u] = v if forzado else saltos[v]
+            self._saltos[d] = saltos
+            self._alcances[d] = alcances
+
+        # Vertical: vecino forzado a los costados, o una fila desde la que
+        # el barrido horizontal encuentra un punto de salto
+        derecha, izquierda = self._saltos[1], self._saltos[-1]
+        for d in (ancho, -ancho):
+            saltos = array("i", [-1]) * total
+            alcances = array("i", [0]) * total
+            for u in range(total - 1, -1, -1) if d > 0 else range(total):
+                if grilla[u]:
+                    continue
+                v = u + d
+                if grilla[v]:
+                    alcances[u] = u
+                    continue
+                alcances[u] = alcances[v]
+                es_salto = (
+                    (not grilla[v - 1] and grilla[v - 1 - d])
+                    or (not grilla[v + 1] and grilla[v + 1 - d])
+                    or derecha[v] >= 0
+                    or izquierda[v] >= 0
+                )
+                saltos[u] = v if es_salto else saltos[v]
+            self._saltos[d] = saltos
+            self._alcances[d] = alcances
+
+    def _saltar(self, u: int, d: int, objetivo: int) -> int | None:
+        """
+        Próximo punto de salto desde u en la dirección d.
+
+        Al salto precalculado solo le falta el caso del objetivo: que esté en
+        el mismo tramo recto (horizontal), o que la fila del objetivo se cruce
+        antes del salto y desde ahí el objetivo se vea en línea recta (vertical).
+
+        Args:
+            u: Índice de partida (grilla con borde)
+            d: Desplazamiento de la dirección (±1 horizontal, ±ancho vertical)
+            objetivo: Índice del objetivo
+
+        Returns:
+            Índice del punto de salto, o None si se choca con un muro
+        """
+        salto = self._saltos[d][u]
+        pasos_alcance = (self._alcances[d][u] - u) // d
+        pasos_salto = (salto - u) // d if salto >= 0 else pasos_alcance + 1
+
+        ancho = self._ancho
+        if d == 1 or d == -1:
+            if objetivo // ancho == u // ancho:
+                pasos = (objetivo - u) * d
+                if 0 < pasos <= pasos_alcance and pasos < pasos_salto:
+                    return objetivo
+        else:
+            pasos = (objetivo // ancho - u // ancho) * (1 if d > 0 else -1)
+            if 0 < pasos <= pasos_alcance and pasos < pasos_salto:
+                cruce = u + pasos * d
+                if cruce == objetivo or self._visible(cruce, objetivo):
+                    return cruce
+        return salto if salto >= 0 else None
+
+    def _visible(self, u: int, objetivo: int) -> bool:
+        """Indica si el objetivo, en la misma fila que u, se ve sin muros en medio."""
+        d = 1 if objetivo > u else -1
+        return (objetivo - u) * d <= (self._alcances[d][u] - u) * d
+
+    def _direcciones(self, u: int, padre: int | None) -> tuple[int, ...]:
+        """Direcciones a explorar desde u según de dónde se llegó (poda de JPS)."""
+        if padre is None:
+            return self._desplazamientos
+        ancho = self._ancho
+        if u // ancho == padre // ancho:
+            d = 1 if u > padre else -1
+            return (d, ancho, -ancho)
+        d = ancho if u > padre else -ancho
+        return (d, 1, -1)
+
+    def _buscar(self, inicio: int, objetivo: int) -> dict[int, int | None] | None:
+        """
+        A* sobre puntos de salto.
+
+        Returns:
+            Diccionario {punto de salto: punto anterior}, o None si el objetivo
+            no es alcanzable. Entre dos puntos consecutivos el tramo es recto.
+        """
+        ancho = self._ancho
+        fo, co = divmod(objetivo, ancho)
+
+        costo = {inicio: 0}
+        padres: dict[int, int | None] = {inicio: None}
+        cerrados = set()
+        h = self._heuristica(inicio, objetivo)
+        abiertos = [(h, h, inicio)]
+
+        while abiertos:
+            _, _, u = heapq.heappop(abiertos)
+            if u in cerrados:
+                continue
+            cerrados.add(u)
+            self.nodos_expandidos += 1
+            if u == objetivo:
+                return padres
+
+            fu, cu = divmod(u, ancho)
+            for d in self._direcciones(u, padres[u]):
+                salto = self._saltar(u, d, objetivo)
+                if salto is None or salto in cerrados:
+                    continue
+                fs, cs = divmod(salto, ancho)
+                g = costo[u] + abs(fs - fu) + abs(cs - cu)
+                if g >= costo.get(salto, g + 1):
+                    continue
+                costo[salto] = g
+                padres[salto] = u
+                h = abs(fs - fo) + abs(cs - co)
+                heapq.heappush(abiertos, (g + h, h, salto))
+        return None
+
+    def _direccion(self, desde: int, hasta: int) -> int:
+        """Desplazamiento unitario del tramo recto desde -> hasta."""
+        if desde // self._ancho == hasta // self._ancho:
+            return 1 if hasta > desde else -1
+        return self._ancho if hasta > desde else -self._ancho
+
+    def _siguiente_paso(self, inicio, objetivo):
+        o = self._indice(objetivo)
+        s = self._indice(inicio)
+        padres = self._buscar(s, o)
+        if padres is None:
+            return None
+        # Primer punto de salto después del inicio
+        actual = o
+        while padres[actual] != s:
+            actual = padres[actual]
+        return self._celda(s + self._direccion(s, actual))
+
+    def _camino(self, inicio, objetivo):
+        o = self._indice(objetivo)
+        padres = self._buscar(self._indice(inicio), o)
+        if padres is None:
+            return None
+        puntos = self._reconstruir_camino(padres, o)
+        camino = [puntos[0]]
+        for desde, hasta in zip(puntos[:-1], puntos[1:], strict=True):
+            d = self._direccion(desde, hasta)
+            camino.extend(range(desde + d, hasta + d, d))
+        return [self._celda(u) for u in camino]
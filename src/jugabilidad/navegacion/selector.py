@@ -0,0 +1,83 @@
+"""
+Selección automática de la estrategia de navegación para un laberinto.
+"""
+
+from config.config import ConfigJuego
+
+from .astar import NavegacionAStar
+from .campo_flujo import NavegacionCampoFlujo
+from .dstar_lite import NavegacionDStarLite
+from .estrategia import EstrategiaNavegacion, NavegacionBFS
+from .grafo_uniones import NavegacionGrafoUniones
+from .hpa import NavegacionHPA
+from .jps import NavegacionJPS
+from .tabla_rutas import NavegacionTablaRutas
+
+# Estrategias elegibles por nombre (clave "navegacion" del JSON o por dificultad)
+ESTRATEGIAS_NAVEGACION: dict[str, type[EstrategiaNavegacion]] = {
+    clase.nombre: clase
+    for clase in (
+        NavegacionBFS,
+        NavegacionAStar,
+        NavegacionJPS,
+        NavegacionTablaRutas,
+        NavegacionCampoFlujo,
+        NavegacionDStarLite,
+        NavegacionGrafoUniones,
+        NavegacionHPA,
+    )
+}
+
+
+def crear_navegacion(laberinto, nombre: str | None = None) -> EstrategiaNavegacion:
+    """
+    Crea la estrategia de navegación para un laberinto.
+
+    Si se pide una estrategia por nombre se usa esa. El nombre sale, en orden,
+    del argumento, de la clave "navegacion" del laberinto o de
+    ConfigJuego.NAVEGACION_POR_DIFICULTAD según su dificultad. Si no hay
+    ninguno, o si se pidió la tabla de rutas y no entra en los límites de
+    memoria, se elige la más barata que entra en memoria:
+
+    - Mapas muy grandes (>= MIN_CELDAS_HPA celdas): planificador jerárquico HPA*
+    - Laberintos pequeños: tabla de rutas precomputada (consultas O(1))
+    - Laberintos de pasillos: Dijkstra sobre el grafo de uniones, si comprime
+      al menos FACTOR_COMPRESION_GRAFO_UNIONES veces las celdas transitables
+    - Resto (mapas abiertos): campo de flujo compartido (un BFS por cambio de
+      celda del jugador, sin importar cuántos enemigos)
+
+    Args:
+        laberinto: Instancia de Laberinto ya cargada
+        nombre: Clave de ESTRATEGIAS_NAVEGACION (opcional)
+
+    Returns:
+        Estrategia lista para asignar a Computadora.establecer_navegacion
+
+    Raises:
+        ValueError: Si el nombre no corresponde a ninguna estrategia
+    """
+    if nombre is None:
+        nombre = laberinto.navegacion or ConfigJuego.NAVEGACION_POR_DIFICULTAD.get(
+            laberinto.dificultad
+        )
+    if nombre is not None:
+        if nombre not in ESTRATEGIAS_NAVEGACION:
+            raise ValueError(f"Estrategia de navegación desconocida: {nombre}")
+        clase = ESTRATEGIAS_NAVEGACION[nombre]
+        if clase is not NavegacionTablaRutas or NavegacionTablaRutas.entra_en_memoria(
+            len(laberinto._pasillos)
+        ):
+            return clase(laberinto)
+
+    if laberinto.filas * laberinto.columnas >= ConfigJuego.MIN_CELDAS_HPA:
+        return NavegacionHPA(laberinto)
+
+    num_celdas = len(laberinto._pasillos)
+    if NavegacionTablaRutas.entra_en_memoria(num_celdas):
+        return NavegacionTablaRutas(laberinto)
+    if (
+        len(laberinto.grafo_uniones.nodos) * ConfigJuego.FACTOR_COMPRESION_GRAFO_UNIONES
+        <= num_celdas
+    ):
+        return NavegacionGrafoUniones(laberinto)
+    return NavegacionCampoFlujo(laberinto)
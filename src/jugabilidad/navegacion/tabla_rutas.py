@@ -0,0 +1,256 @@
+"""
+Tabla de rutas precomputada para laberintos pequeños.
+
+Al cargar el laberinto se ejecuta un BFS desde cada celda transitable y se
+guardan, para cada par (desde, hacia), la distancia y la celda del siguiente
+paso. Cada consulta de la persecución queda reducida a una búsqueda O(1).
+
+Si cambian celdas del mapa solo se rehacen los BFS de los destinos cuyas
+rutas pasaban por la celda cerrada, o que la celda abierta acorta; para los
+demás basta con completar la fila de la celda nueva.
+"""
+
+from array import array
+
+from config.config import ConfigJuego
+
+from .estrategia import DIRECCIONES, EstrategiaNavegacion
+
+# Marca de "sin ruta" en las tablas (máximo valor de un unsigned short)
+SIN_RUTA = 0xFFFF
+
+
+class NavegacionTablaRutas(EstrategiaNavegacion):
+    """Distancias y siguiente paso para todos los pares de celdas transitables."""
+
+    nombre = "tabla"
+
+    # Bytes por par de celdas: distancia (H) + siguiente paso (H)
+    BYTES_POR_PAR = 4
+
+    def __init__(self, laberinto):
+        """
+        Args:
+            laberinto: Instancia de Laberinto ya cargada
+
+        Raises:
+            ValueError: Si las tablas no entran en los límites de memoria
+                (ver entra_en_memoria)
+        """
+        super().__init__(laberinto)
+        # Índice -> celda (fila, col); None = lugar libre para una celda nueva
+        self._celdas: list[tuple[int, int] | None] = []
+        self._indice: dict[tuple[int, int], int] = {}
+        self._adyacencia: list[list[int]] = []
+        self._libres: list[int] = []
+        self._distancias = array("H")
+        self._siguientes = array("H")
+        self._construir()
+
+    @classmethod
+    def estimar_bytes(cls, num_celdas: int) -> int:
+        """Memoria aproximada que ocuparían las tablas para 'num_celdas' transitables."""
+        return num_celdas * num_celdas * cls.BYTES_POR_PAR
+
+    @classmethod
+    def entra_en_memoria(cls, num_celdas: int) -> bool:
+        """
+        Verifica si las tablas para 'num_celdas' respetan los límites de ConfigJuego.
+
+        Args:
+            num_celdas: Celdas transitables (o lugares reservados) de la tabla
+
+        Returns:
+            True si no pasa MAX_CELDAS_TABLA_RUTAS ni MAX_BYTES_TABLA_RUTAS y
+            los índices caben en un unsigned short
+        """
+        return (
+            num_celdas < SIN_RUTA
+            and num_celdas <= ConfigJuego.MAX_CELDAS_TABLA_RUTAS
+            and cls.estimar_bytes(num_celdas) <= ConfigJuego.MAX_BYTES_TABLA_RUTAS
+        )
+
+    def _verificar_memoria(self, num_celdas: int) -> None:
+        """Lanza ValueError antes de reservar tablas que no entran en memoria."""
+        if not self.entra_en_memoria(num_celdas):
+            raise ValueError(
+                f"Demasiadas celdas para la tabla de rutas: {num_celdas} "
+                f"({self.estimar_bytes(num_celdas)} bytes; límites "
+                f"{ConfigJuego.MAX_CELDAS_TABLA_RUTAS} celdas y "
+                f"{ConfigJuego.MAX_BYTES_TABLA_RUTAS} bytes)"
+            )
+
+    def reconstruir(self, cambiadas: list[int] | None = None) -> None:
+        """
+        Actualiza las tablas tras un cambio del mapa.
+
+        Args:
+            cambiadas: Índices planos que registró cambiar_celda; con None se
+                construyen las tablas desde cero
+
+        Raises:
+            ValueError: Si las celdas abiertas hacen que las tablas ya no
+                entren en los límites de memoria
+        """
+        if cambiadas is None:
+            self._construir()
+            return
+        columnas = self.laberinto.columnas
+        for indice in dict.fromkeys(cambiadas):
+            celda = divmod(indice, columnas)
+            transitable = self.es_transitable(celda)
+            if transitable and celda not in self._indice:
+                self._abrir(celda)
+            elif not transitable and celda in self._indice:
+                self._cerrar(celda)
+
+    def _construir(self) -> None:
+        """
+        Construye las tablas con un BFS por cada celda destino.
+
+        Como la grilla es no dirigida, el BFS desde el destino da la distancia
+        de todas las celdas hacia él, y el padre de cada celda en ese árbol es
+        justamente su siguiente paso hacia el destino.
+        """
+        celdas = [(fila, col) for col, fila in self.laberinto._pasillos]
+        n = len(celdas)
+        self._verificar_memoria(n)
+
+        self._celdas = celdas
+        self._indice = {celda: i for i, celda in enumerate(celdas)}
+        self._adyacencia = [self._vecinos_en_tabla(celda) for celda in celdas]
+        self._libres = []
+        # Índice en tabla: desde * n + hacia
+        self._distancias = array("H", [SIN_RUTA]) * (n * n)
+        self._siguientes = array("H", [SIN_RUTA]) * (n * n)
+        for destino in range(n):
+            self._bfs_destino(destino)
+
+    def _vecinos_en_tabla(self, celda: tuple[int, int]) -> list[int]:
+        """Índices de las celdas vecinas que están en la tabla."""
+        fila, col = celda
+        indice = self._indice
+        return [
+            indice[vecina]
+            for vecina in ((fila + df, col + dc) for df, dc in DIRECCIONES)
+            if vecina in indice
+        ]
+
+    def _bfs_destino(self, destino: int) -> None:
+        """Rehace la columna de un destino: distancia y siguiente paso de cada celda."""
+        n = len(self._celdas)
+        distancias = self._distancias
+        siguientes = self._siguientes
+        adyacencia = self._adyacencia
+        distancias[destino::n] = array("H", [SIN_RUTA]) * n
+        siguientes[destino::n] = array("H", [SIN_RUTA]) * n
+
+        distancias[destino * n + destino] = 0
+        siguientes[destino * n + destino] = destino
+        frontera = [destino]
+        distancia = 0
+        while frontera:
+            distancia += 1
+            nueva_frontera = []
+            for u in frontera:
+                for v in adyacencia[u]:
+                    k = v * n + destino
+                    if distancias[k] == SIN_RUTA:
+                        distancias[k] = distancia
+                        siguientes[k] = u
+                        nueva_frontera.append(v)
+            frontera = nueva_frontera
+
+    def _cerrar(self, celda: tuple[int, int]) -> None:
+        """Quita una celda que pasó a ser muro."""
+        u = self._indice.pop(celda)
+        n = len(self._celdas)
+        vecinos = self._adyacencia[u]
+        for v in vecinos:
+            self._adyacencia[v].remove(u)
+        self._adyacencia[u] = []
+        self._celdas[u] = None
+        self._libres.append(u)
+
+        siguientes = self._siguientes
+        vacia = array("H", [SIN_RUTA]) * n
+        self._distancias[u * n : (u + 1) * n] = vacia
+        siguientes[u * n : (u + 1) * n] = vacia
+        self._distancias[u::n] = vacia
+        siguientes[u::n] = vacia
+
+        # Un muro no acorta rutas: solo cambian los destinos cuyo árbol pasaba
+        # por la celda, es decir, a los que algún vecino llegaba a través de ella
+        for destino in range(n):
+            if self._celdas[destino] is not None and any(
+                siguientes[v * n + destino] == u for v in vecinos
+            ):
+                self._bfs_destino(destino)
+
+    def _abrir(self, celda: tuple[int, int]) -> None:
+        """Agrega una celda que pasó a ser pasillo."""
+        if not self._libres:
+            self._ampliar()
+        u = self._libres.pop()
+        n = len(self._celdas)
+        self._celdas[u] = celda
+        self._indice[celda] = u
+        vecinos = self._vecinos_en_tabla(celda)
+        self._adyacencia[u] = vecinos
+        for v in vecinos:
+            self._adyacencia[v].append(u)
+
+        # Si las distancias de los vecinos hacia un destino difieren en 2 o
+        # menos, pasar por la celda nueva no acorta ninguna ruta: basta con
+        # completar su fila. Si no (o si une zonas separadas), se rehace el BFS.
+        distancias = self._distancias
+        siguientes = self._siguientes
+        for destino in range(n):
+            if destino == u or self._celdas[destino] is None:
+                continue
+            candidatos = [(distancias[v * n + destino], v) for v in vecinos]
+            minima, mejor = min(candidatos, default=(SIN_RUTA, u))
+            if minima == SIN_RUTA:
+                continue
+            if max(candidatos)[0] - minima <= 2:
+                distancias[u * n + destino] = minima + 1
+                siguientes[u * n + destino] = mejor
+            else:
+                self._bfs_destino(destino)
+        self._bfs_destino(u)
+
+    def _ampliar(self) -> None:
+        """Agrega lugares libres a las tablas, copiando las filas existentes."""
+        n = len(self._celdas)
+        m = n + max(8, n // 8)
+        if not self.entra_en_memoria(m):
+            m = n + 1
+        self._verificar_memoria(m)
+
+        for nombre in ("_distancias", "_siguientes"):
+            vieja = getattr(self, nombre)
+            nueva = array("H", [SIN_RUTA]) * (m * m)
+            for fila in range(n):
+                nueva[fila * m : fila * m + n] = vieja[fila * n : (fila + 1) * n]
+            setattr(self, nombre, nueva)
+        self._celdas.extend([None] * (m - n))
+        self._adyacencia.extend([] for _ in range(m - n))
+        # Al final los más bajos, así pop() usa primero los primeros lugares
+        self._libres.extend(range(m - 1, n - 1, -1))
+
+    def _siguiente_paso(self, inicio, objetivo):
+        n = len(self._celdas)
+        siguiente = self._siguientes[self._indice[inicio] * n + self._indice[objetivo]]
+        return None if siguiente == SIN_RUTA else self._celdas[siguiente]
+
+    def distancia(self, inicio: tuple[int, int], objetivo: tuple[int, int]) -> int | None:
+        """
+        Distancia en pasos entre dos celdas (fila, col), o None si no hay ruta.
+        """
+        self._sincronizar()
+        i = self._indice.get(inicio)
+        j = self._indice.get(objetivo)
+        if i is None or j is None:
+            return None
+        d = self._distancias[i * len(self._celdas) + j]
+        return None if d == SIN_RUTA else d
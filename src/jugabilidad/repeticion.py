@@ -0,0 +1,362 @@
+"""
+Grabación y repetición determinista de partidas.
+
+Una repetición guarda solo lo necesario para volver a jugar la partida frame a
+frame sobre SimulacionJuego: el laberinto, la semilla, la geometría, la
+estrategia de navegación, los parámetros de ConfigJuego que influyen en la
+simulación y la entrada de cada frame. Las entradas se comprimen por tramos
+(run-length): "R3.5D3" = derecha 3 frames, nada 5 frames, abajo 3 frames.
+
+Cada cierto intervalo se anota además un keyframe con la huella del estado.
+Al reproducir, las huellas permiten detectar el primer keyframe donde la
+repetición deja de coincidir, y las instantáneas que el reproductor toma en
+esos mismos frames permiten saltar a cualquier punto sin simular desde el
+principio.
+
+Formato del archivo (JSON):
+    {
+        "version": 1,
+        "laberinto": {...},            # Datos del laberinto jugado
+        "semilla": 1234,
+        "geometria": [tam_celda, offset_x, offset_y],
+        "navegacion": "tabla",
+        "parametros": {"VELOCIDAD_INICIAL_ENEMIGO": 1.5, ...},
+        "entradas": "R3.5D3...",
+        "keyframes": {"300": "huella", ...}
+    }
+"""
+
+import copy
+import json
+import re
+from contextlib import contextmanager
+
+from config.config import ConfigJuego
+
+from .simulacion import SimulacionJuego
+
+VERSION_FORMATO = 1
+
+# Letra de cada entrada en el archivo ("." = sin entrada)
+CODIGOS_ENTRADA: dict[str | None, str] = {
+    "up": "U",
+    "down": "D",
+    "left": "L",
+    "right": "R",
+    None: ".",
+}
+ENTRADAS_POR_CODIGO = {codigo: entrada for entrada, codigo in CODIGOS_ENTRADA.items()}
+_TRAMO = re.compile(r"([UDLR.])(\d+)")
+
+# Valores de ConfigJuego que cambian el resultado de la simulación
+PARAMETROS_GRABADOS = (
+    "VELOCIDAD_INICIAL_ENEMIGO",
+    "INCREMENTO_VELOCIDAD",
+    "SEGUNDOS_INCREMENTO_VELOCIDAD",
+    "SEGUNDOS_VIDA_OBSEQUIO",
+    "FRAMES_COOLDOWN_MOVIMIENTO",
+    "MARGEN_CAPTURA",
+    "RADIO_JUGADOR",
+    "RADIO_ENEMIGO",
+)
+
+
+def codificar_entradas(tramos: list[list]) -> str:
+    """Convierte tramos [[entrada, frames], ...] en el texto compacto del archivo."""
+    return "".join(f"{CODIGOS_ENTRADA[entrada]}{frames}" for entrada, frames in tramos)
+
+
+def decodificar_entradas(texto: str) -> list[list]:
+    """
+    Convierte el texto compacto del archivo en tramos [[entrada, frames], ...].
+
+    Raises:
+        ValueError: Si el texto no es una secuencia válida de tramos
+    """
+    tramos = []
+    posicion = 0
+    for coincidencia in _TRAMO.finditer(texto):
+        if coincidencia.start() != posicion:
+            break
+        tramos.append([ENTRADAS_POR_CODIGO[coincidencia[1]], int(coincidencia[2])])
+        posicion = coincidencia.end()
+    if posicion != len(texto):
+        raise ValueError(f"Entradas inválidas cerca de la posición {posicion}")
+    return tramos
+
+
+def _datos_laberinto(laberinto: str | dict) -> dict:
+    """Datos JSON del laberinto, leyendo el archivo si se pasa una ruta."""
+    if isinstance(laberinto, dict):
+        return copy.deepcopy(laberinto)
+    with open(laberinto, encoding="utf-8") as archivo:
+        return json.load(archivo)
+
+
+@contextmanager
+def _config_temporal(parametros: dict):
+    """Aplica valores de ConfigJuego mientras dura el bloque y restaura los previos."""
+    previos = {nombre: getattr(ConfigJuego, nombre) for nombre in parametros}
+    try:
+        for nombre, valor in parametros.items():
+            setattr(ConfigJuego, nombre, valor)
+        yield
+    finally:
+        for nombre, valor in previos.items():
+            setattr(ConfigJuego, nombre, valor)
+
+
+class Repeticion:
+    """Entradas de una partida y todo lo necesario para volver a simularla."""
+
+    def __init__(
+        self,
+        laberinto: str | dict,
+        semilla: int,
+        geometria: tuple[int, int, int],
+        navegacion: str,
+        parametros: dict | None = None,
+        tramos: list[list] | None = None,
+        keyframes: dict[int, str] | None = None,
+    ):
+        """
+        Args:
+            laberinto: Ruta o datos del laberinto (se guardan los datos)
+            semilla: Semilla de la simulación
+            geometria: (tam_celda, offset_x, offset_y) con que se jugó
+            navegacion: Nombre de la estrategia de los minotauros
+            parametros: Valores de PARAMETROS_GRABADOS (default: los actuales)
+            tramos: Entradas ya grabadas como [[entrada, frames], ...]
+            keyframes: {frame: huella del estado al terminar ese frame}
+        """
+        self.laberinto = _datos_laberinto(laberinto)
+        self.semilla = semilla
+        self.geometria = tuple(geometria)
+        self.navegacion = navegacion
+        self.parametros = (
+            dict(parametros)
+            if parametros is not None
+            else {nombre: getattr(ConfigJuego, nombre) for nombre in PARAMETROS_GRABADOS}
+        )
+        self.tramos: list[list] = tramos or []
+        self.keyframes: dict[int, str] = keyframes or {}
+        self.frames = sum(frames for _, frames in self.tramos)
+
+    def agregar_entrada(self, entrada: str | None) -> None:
+        """Suma la entrada de un frame, extendiendo el último tramo si es igual."""
+        if self.tramos and self.tramos[-1][0] == entrada:
+            self.tramos[-1][1] += 1
+        else:
+            self.tramos.append([entrada, 1])
+        self.frames += 1
+
+    def entradas(self) -> list[str | None]:
+        """Entrada de cada frame (índice 0 = primer frame)."""
+        lista: list[str | None] = []
+        for entrada, frames in self.tramos:
+            lista.extend([entrada] * frames)
+        return lista
+
+    def crear_simulacion(self) -> SimulacionJuego:
+        """Simulación en el frame 0, con la misma configuración que la grabada."""
+        tam_celda, offset_x, offset_y = self.geometria
+        with _config_temporal(self.parametros):
+            return SimulacionJuego(
+                copy.deepcopy(self.laberinto),
+                tam_celda,
+                offset_x,
+                offset_y,
+                semilla=self.semilla,
+                navegacion=self.navegacion,
+            )
+
+    def a_diccionario(self) -> dict:
+        """Representación JSON de la repetición."""
+        return {
+            "version": VERSION_FORMATO,
+            "laberinto": self.laberinto,
+            "semilla": self.semilla,
+            "geometria": list(self.geometria),
+            "navegacion": self.navegacion,
+            "parametros": self.parametros,
+            "entradas": codificar_entradas(self.tramos),
+            "keyframes": {str(frame): huella for frame, huella in self.keyframes.items()},
+        }
+
+    @classmethod
+    def desde_diccionario(cls, datos: dict) -> "Repeticion":
+        """
+        Reconstruye una repetición a partir de a_diccionario().
+
+        Raises:
+            ValueError: Si la versión del formato no es compatible o faltan datos
+        """
+        if datos.get("version") != VERSION_FORMATO:
+            raise ValueError(f"Versión de repetición no soportada: {datos.get('version')}")
+        try:
+            return cls(
+                datos["laberinto"],
+                datos["semilla"],
+                datos["geometria"],
+                datos["navegacion"],
+                datos["parametros"],
+                decodificar_entradas(datos["entradas"]),
+                {int(frame): huella for frame, huella in datos["keyframes"].items()},
+            )
+        except KeyError as e:
+            raise ValueError(f"Falta el campo {e} en la repetición") from e
+
+    def guardar(self, ruta: str) -> None:
+        """Escribe la repetición como JSON."""
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            json.dump(self.a_diccionario(), archivo, ensure_ascii=False)
+
+    @classmethod
+    def cargar(cls, ruta: str) -> "Repeticion":
+        """Lee una repetición guardada con guardar()."""
+        with open(ruta, encoding="utf-8") as archivo:
+            return cls.desde_diccionario(json.load(archivo))
+
+
+class GrabadorPartida:
+    """Avanza una simulación sembrada y graba sus entradas y keyframes."""
+
+    def __init__(
+        self,
+        simulacion: SimulacionJuego,
+        laberinto: str | dict,
+        frames_por_keyframe: int | None = None,
+    ):
+        """
+        Args:
+            simulacion: Simulación recién creada (frame 0) con semilla
+            laberinto: Ruta o datos del laberinto con que se creó
+            frames_por_keyframe: Intervalo entre keyframes
+                                 (default: ConfigJuego.SEGUNDOS_ENTRE_KEYFRAMES)
+
+        Raises:
+            ValueError: Si la simulación no tiene semilla o ya avanzó
+        """
+        if simulacion.semilla is None:
+            raise ValueError("Solo se pueden grabar simulaciones con semilla")
+        if simulacion.frame_count != 0:
+            raise ValueError("La grabación debe empezar en el frame 0")
+        self.simulacion = simulacion
+        self.frames_por_keyframe = frames_por_keyframe or ConfigJuego.segundos_a_frames(
+            ConfigJuego.SEGUNDOS_ENTRE_KEYFRAMES
+        )
+        self.repeticion = Repeticion(
+            laberinto,
+            simulacion.semilla,
+            (simulacion.tam_celda, simulacion.offset_x, simulacion.offset_y),
+            simulacion.navegacion.nombre,
+        )
+
+    def step(self, entrada: str | None = None) -> list[str]:
+        """Igual que SimulacionJuego.step, grabando la entrada del frame."""
+        simulacion = self.simulacion
+        if simulacion.game_over:
+            return []
+        self.repeticion.agregar_entrada(entrada)
+        eventos = simulacion.step(entrada)
+        if simulacion.frame_count % self.frames_por_keyframe == 0:
+            self.repeticion.keyframes[simulacion.frame_count] = simulacion.huella()
+        return eventos
+
+    def guardar(self, ruta: str) -> Repeticion:
+        """Cierra la grabación con un keyframe del último frame y la escribe."""
+        simulacion = self.simulacion
+        if simulacion.frame_count:
+            self.repeticion.keyframes[simulacion.frame_count] = simulacion.huella()
+        self.repeticion.guardar(ruta)
+        return self.repeticion
+
+
+class ReproductorRepeticion:
+    """
+    Vuelve a simular una repetición frame a frame, con búsqueda por keyframes.
+
+    La simulación actual está en 'simulacion'; tras ir_a() puede ser otro
+    objeto (restaurado de una instantánea), así que no conviene guardarla.
+    """
+
+    def __init__(self, repeticion: Repeticion, frames_por_instantanea: int | None = None):
+        """
+        Args:
+            repeticion: Repetición a reproducir
+            frames_por_instantanea: Cada cuántos frames guardar una instantánea
+                                    para búsquedas (default: el de los keyframes)
+        """
+        self.repeticion = repeticion
+        self.frames_por_instantanea = frames_por_instantanea or (
+            ConfigJuego.segundos_a_frames(ConfigJuego.SEGUNDOS_ENTRE_KEYFRAMES)
+        )
+        self._entradas = repeticion.entradas()
+        self.simulacion = repeticion.crear_simulacion()
+        self._instantaneas: dict[int, bytes] = {0: self.simulacion.instantanea()}
+        # Frames de keyframes cuya huella no coincidió
+        self.divergencias: list[int] = []
+
+    @property
+    def frame(self) -> int:
+        """Frames ya reproducidos."""
+        return self.simulacion.frame_count
+
+    @property
+    def total_frames(self) -> int:
+        """Frames grabados."""
+        return len(self._entradas)
+
+    @property
+    def terminado(self) -> bool:
+        """Indica si ya no quedan entradas por reproducir."""
+        return self.frame >= self.total_frames or self.simulacion.game_over
+
+    def avanzar(self) -> list[str]:
+        """Simula el próximo frame grabado y retorna sus eventos."""
+        if self.terminado:
+            return []
+        simulacion = self.simulacion
+        eventos = simulacion.step(self._entradas[simulacion.frame_count])
+        frame = simulacion.frame_count
+
+        esperada = self.repeticion.keyframes.get(frame)
+        if (
+            esperada is not None
+            and frame not in self.divergencias
+            and simulacion.huella() != esperada
+        ):
+            self.divergencias.append(frame)
+        if frame % self.frames_por_instantanea == 0 and frame not in self._instantaneas:
+            self._instantaneas[frame] = simulacion.instantanea()
+        return eventos
+
+    def ir_a(self, frame: int) -> None:
+        """
+        Deja la simulación en el frame pedido (acotado a lo grabado).
+
+        Vuelve a la instantánea más cercana anterior y simula desde ahí sin
+        dibujar; hacia adelante continúa desde el frame actual si está más cerca.
+        """
+        frame = max(0, min(frame, self.total_frames))
+        base = max(f for f in self._instantaneas if f <= frame)
+        if not (base <= self.frame <= frame):
+            self.simulacion = SimulacionJuego.restaurar(self._instantaneas[base])
+        while self.frame < frame and not self.terminado:
+            self.avanzar()
+
+    def verificar(self) -> int | None:
+        """
+        Reproduce toda la partida lo más rápido posible comparando keyframes.
+
+        Returns:
+            Primer frame donde la huella no coincide (o donde la partida terminó
+            antes de lo grabado), o None si la repetición es idéntica
+        """
+        self.ir_a(0)
+        self.divergencias.clear()
+        while not self.terminado:
+            self.avanzar()
+        if self.frame < self.total_frames:
+            self.divergencias.append(self.frame)  # Game over antes de tiempo
+        return self.divergencias[0] if self.divergencias else None
@@ -0,0 +1,280 @@
+"""
+Núcleo de simulación del juego, sin ventana ni sonido.
+
+Reúne el laberinto, los personajes, los gestores de movimiento, obsequios y
+dificultad y las reglas de captura. Cada llamada a step() avanza un frame con
+la dirección pedida por el jugador y retorna los eventos que ocurrieron, para
+que quien lo use (PantallaJuego, tests, herramientas) decida cómo mostrarlos.
+
+No lee el teclado, no reproduce sonidos y no crea superficies: corre sin
+pygame.display y sin limitador de frames.
+
+Con una semilla la partida es determinista: todo el azar sale de un único
+generador propio y las velocidades se aplican por frame (no por tiempo real),
+así la misma secuencia de entradas produce siempre el mismo estado, frame a
+frame. Sobre eso se construyen la grabación y repetición de partidas.
+"""
+
+import hashlib
+import pickle
+import random
+
+from config.config import ConfigJuego
+from mundo.laberinto import Laberinto
+from personajes.computadora import Computadora
+from personajes.jugador import Jugador
+from utilidades.coordenadas import ConversorCoordenadas
+
+from .gestores.gestor_dificultad import GestorDificultad
+from .gestores.gestor_movimiento import GestorMovimiento
+from .gestores.gestor_obsequios import GestorObsequios
+from .navegacion import crear_navegacion
+
+# Eventos que puede retornar SimulacionJuego.step
+EVENTO_OBSEQUIO = "obsequio"  # El jugador recolectó un obsequio
+EVENTO_CAPTURA = "captura"  # Un minotauro alcanzó al jugador
+EVENTO_GAME_OVER = "game_over"  # La captura se llevó la última vida
+
+DIRECCIONES_ENTRADA = ("up", "down", "left", "right")
+
+
+class SimulacionJuego:
+    """
+    Estado completo de una partida que avanza de a un frame con step().
+
+    Las posiciones se manejan en píxeles, igual que en pantalla: tam_celda y
+    los offsets definen la geometría (con los valores por defecto, celdas de
+    ConfigJuego.TAM_CELDA desde el origen).
+    """
+
+    def __init__(
+        self,
+        laberinto: Laberinto | str | dict,
+        tam_celda: int | None = None,
+        offset_x: int = 0,
+        offset_y: int = 0,
+        movimiento_por_celdas: bool = True,
+        semilla: int | None = None,
+        navegacion: str | None = None,
+    ):
+        """
+        Crea el laberinto, los actores y los gestores de la partida.
+
+        Args:
+            laberinto: Laberinto ya cargado, o ruta/diccionario para cargarlo
+            tam_celda: Tamaño de celda en píxeles (default: ConfigJuego.TAM_CELDA)
+            offset_x: Posición x en píxeles de la columna 0
+            offset_y: Posición y en píxeles de la fila 0
+            movimiento_por_celdas: True para movimiento discreto, False para continuo
+            semilla: Semilla del generador aleatorio (None = partida no reproducible)
+            navegacion: Estrategia de los minotauros (None = la que elija el laberinto)
+        """
+        if not isinstance(laberinto, Laberinto):
+            laberinto = Laberinto(laberinto)
+        self.laberinto = laberinto
+        self.mapa = laberinto.laberinto  # Matriz de 0 (libre) y 1 (muro)
+        self.tam_celda = tam_celda or ConfigJuego.TAM_CELDA
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+        self.semilla = semilla
+        self.generador = random.Random(semilla)  # Única fuente de azar de la partida
+
+        # Estado de la partida
+        self.game_over = False
+        self.frame_count = 0  # Frames simulados (también sirve para animaciones)
+        self.tiempo_transcurrido = 0  # En frames
+        self.capturas = 0
+        self.puntaje_final: int | None = None
+        self.nombre_laberinto: str | None = None
+
+        # Parámetros de juego
+        self.velocidad_inicial_enemigo = ConfigJuego.VELOCIDAD_INICIAL_ENEMIGO
+        self.tiempo_vida_obsequio = ConfigJuego.segundos_a_frames(
+            ConfigJuego.SEGUNDOS_VIDA_OBSEQUIO
+        )
+        self.tiempo_incremento_velocidad = ConfigJuego.segundos_a_frames(
+            ConfigJuego.SEGUNDOS_INCREMENTO_VELOCIDAD
+        )
+        self.incremento_velocidad = ConfigJuego.INCREMENTO_VELOCIDAD
+        self.frames_por_movimiento = ConfigJuego.FRAMES_COOLDOWN_MOVIMIENTO
+        self.margen_captura = ConfigJuego.MARGEN_CAPTURA
+
+        # Actores en sus spawns
+        pos_x_jugador, pos_y_jugador = laberinto.calcular_posicion_spawn(
+            laberinto.jugador_inicio,
+            ConfigJuego.RADIO_JUGADOR,
+            self.tam_celda,
+            offset_x,
+            offset_y,
+        )
+        self.jugador = Jugador(pos_x_jugador, pos_y_jugador, ConfigJuego.RADIO_JUGADOR)
+
+        # Un minotauro por spawn del laberinto (el principal + "inicio_enemigos")
+        self.computadoras: list[Computadora] = []
+        for spawn in laberinto.spawns_computadoras:
+            pos_x_compu, pos_y_compu = laberinto.calcular_posicion_spawn(
+                spawn, ConfigJuego.RADIO_ENEMIGO, self.tam_celda, offset_x, offset_y
+            )
+            self.computadoras.append(
+                Computadora(
+                    pos_x_compu,
+                    pos_y_compu,
+                    ConfigJuego.RADIO_ENEMIGO,
+                    self.velocidad_inicial_enemigo,
+                )
+            )
+        self.computadora = self.computadoras[0]  # Referencia para HUD y dificultad
+
+        # Navegación precomputada al cargar el laberinto, compartida por todos
+        # los minotauros (tabla de rutas o campo de flujo según el tamaño)
+        self.navegacion = crear_navegacion(laberinto, navegacion)
+        for computadora in self.computadoras:
+            computadora.establecer_navegacion(self.navegacion)
+
+        self.muros = laberinto.generar_muros_rect(self.tam_celda, offset_x, offset_y)
+
+        self.gestor_movimiento = GestorMovimiento(
+            self.jugador,
+            self.muros,
+            self.tam_celda,
+            offset_x,
+            offset_y,
+            self.mapa,
+            self.frames_por_movimiento,
+            movimiento_por_celdas,
+        )
+        self.gestor_obsequios = GestorObsequios(
+            laberinto, self.tiempo_vida_obsequio, self.generador
+        )
+        self.gestor_dificultad = GestorDificultad(
+            intervalo_frames=self.tiempo_incremento_velocidad,
+            incremento=self.incremento_velocidad,
+        )
+
+    def step(self, entrada: str | None = None) -> list[str]:
+        """
+        Avanza la partida un frame.
+
+        Args:
+            entrada: Dirección pedida por el jugador en este frame
+                     ("up", "down", "left", "right") o None
+
+        Returns:
+            Eventos del frame (EVENTO_OBSEQUIO, EVENTO_CAPTURA, EVENTO_GAME_OVER),
+            en el orden en que ocurrieron. Tras el game over no avanza más.
+        """
+        if self.game_over:
+            return []
+
+        eventos: list[str] = []
+        self.frame_count += 1
+
+        # Movimiento del jugador
+        self.gestor_movimiento.procesar_entrada(entrada)
+
+        # Enemigos persiguen sobre la grilla del laberinto (navegación compartida)
+        for computadora in self.computadoras:
+            computadora.perseguir_bfs(
+                self.jugador, self.mapa, self.tam_celda, self.offset_x, self.offset_y
+            )
+
+        # Timers de obsequios y su reposición al vencer
+        self.gestor_obsequios.actualizar()
+
+        # Recolección de obsequios por celda
+        puntos = self.gestor_obsequios.verificar_recoleccion(self.celda_jugador())
+        if puntos > 0:
+            self.jugador.sumar_puntos(puntos)
+            eventos.append(EVENTO_OBSEQUIO)
+
+        # Captura del jugador
+        eventos.extend(self._verificar_captura())
+
+        # Escala de dificultad con el tiempo
+        for computadora in self.computadoras:
+            self.gestor_dificultad.actualizar_velocidad(
+                computadora, self.tiempo_transcurrido, self.velocidad_inicial_enemigo
+            )
+
+        self.tiempo_transcurrido += 1
+        return eventos
+
+    def _verificar_captura(self) -> list[str]:
+        """Si algún minotauro alcanza al jugador, resta vida y hace respawn; si sin vidas, game over."""
+        if not any(
+            computadora.verificar_captura(self.jugador, self.margen_captura)
+            for computadora in self.computadoras
+        ):
+            return []
+
+        self.capturas += 1
+        self.jugador.perder_vida()
+        if not self.jugador.esta_vivo():
+            self.game_over = True
+            self.puntaje_final = self.jugador.puntaje
+            self.nombre_laberinto = self.laberinto.nombre
+            return [EVENTO_CAPTURA, EVENTO_GAME_OVER]
+
+        self.jugador.respawn()
+        for computadora in self.computadoras:
+            computadora.respawn()
+        return [EVENTO_CAPTURA]
+
+    def celda_jugador(self) -> tuple[int, int]:
+        """Celda (col, fila) donde está parado el centro del jugador."""
+        jug_cx, jug_cy = self.jugador.jugador_principal.center
+        fila, col = ConversorCoordenadas.pixel_a_celda(
+            jug_cx, jug_cy, self.tam_celda, self.offset_x, self.offset_y
+        )
+        return (col, fila)
+
+    def celda_computadora(self, computadora: Computadora | None = None) -> tuple[int, int]:
+        """Celda (col, fila) del centro de un minotauro (por defecto el principal)."""
+        cx, cy = (computadora or self.computadora).computadora_principal.center
+        fila, col = ConversorCoordenadas.pixel_a_celda(
+            cx, cy, self.tam_celda, self.offset_x, self.offset_y
+        )
+        return (col, fila)
+
+    def huella(self) -> str:
+        """
+        Resumen corto del estado de la partida.
+
+        Dos simulaciones con la misma huella en el mismo frame están en el
+        mismo estado observable (posiciones, velocidades, vidas, puntaje,
+        obsequios con sus timers y estado del generador aleatorio).
+        """
+        gestor = self.gestor_movimiento
+        timers = self.gestor_obsequios.obsequios_timers
+        estado = (
+            self.frame_count,
+            self.tiempo_transcurrido,
+            self.capturas,
+            self.game_over,
+            tuple(self.jugador.jugador_principal),
+            self.jugador.vidas,
+            self.jugador.puntaje,
+            gestor.interpolando,
+            gestor.frames_interpolacion,
+            gestor.cooldown_actual,
+            tuple(
+                (tuple(c.computadora_principal), c.velocidad) for c in self.computadoras
+            ),
+            tuple(
+                sorted(
+                    (posicion, obsequio.valor, timers.get(posicion))
+                    for posicion, obsequio in self.laberinto._obsequios.items()
+                )
+            ),
+            self.generador.getstate(),
+        )
+        return hashlib.sha1(repr(estado).encode()).hexdigest()[:16]
+
+    def instantanea(self) -> bytes:
+        """Copia completa del estado para volver a este frame con restaurar()."""
+        return pickle.dumps(self, pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def restaurar(instantanea: bytes) -> "SimulacionJuego":
+        """Simulación independiente en el estado guardado por instantanea()."""
+        return pickle.loads(instantanea)
@@ -5,9 +5,22 @@ Contiene los modelos de datos que representan el mundo del juego
 (laberinto, obsequios, salón de la fama, registros).
 """
 
+from .celdas_libres import CeldasLibres, CeldasLibresPonderadas, pesos_por_distancia
+from .colision import GrillaColision
+from .grafo_uniones import GrafoUniones
 from .laberinto import Laberinto
 from .obsequio import Obsequio
 from .registro import Registro
 from .salon_fama import SalonFama
 
-__all__ = ["Laberinto", "Obsequio", "Registro", "SalonFama"]
+__all__ = [
+    "CeldasLibres",
+    "CeldasLibresPonderadas",
+    "GrafoUniones",
+    "GrillaColision",
+    "Laberinto",
+    "Obsequio",
+    "Registro",
+    "SalonFama",
+    "pesos_por_distancia",
+]
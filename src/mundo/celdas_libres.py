@@ -0,0 +1,190 @@
+"""
+Índices de celdas libres con muestreo aleatorio.
+
+Sirven para ubicar obsequios nuevos sin recorrer todo el mapa: el conjunto se
+mantiene al día con altas y bajas a medida que los obsequios aparecen y se
+recolectan, y elegir una celda al azar no depende del tamaño del laberinto.
+"""
+
+import random
+from collections import deque
+from collections.abc import Iterable, Iterator
+
+
+class CeldasLibres:
+    """
+    Conjunto de celdas con alta, baja y elección uniforme en O(1).
+
+    Las celdas se guardan en un arreglo denso más un diccionario
+    {celda: índice}; para quitar una se la reemplaza por la última del arreglo
+    (swap-remove), así el arreglo nunca tiene huecos y elegir al azar es
+    tomar un índice cualquiera.
+    """
+
+    def __init__(self, celdas: Iterable[tuple[int, int]] = ()):
+        self._celdas: list[tuple[int, int]] = []
+        self._indices: dict[tuple[int, int], int] = {}
+        for celda in celdas:
+            self.agregar(celda)
+
+    def __len__(self) -> int:
+        return len(self._celdas)
+
+    def __contains__(self, celda) -> bool:
+        return celda in self._indices
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return iter(self._celdas)
+
+    def agregar(self, celda: tuple[int, int]) -> bool:
+        """Agrega la celda; retorna False si ya estaba."""
+        if celda in self._indices:
+            return False
+        self._indices[celda] = len(self._celdas)
+        self._celdas.append(celda)
+        return True
+
+    def quitar(self, celda: tuple[int, int]) -> bool:
+        """Quita la celda moviendo la última a su lugar; retorna False si no estaba."""
+        indice = self._indices.pop(celda, None)
+        if indice is None:
+            return False
+        ultima = self._celdas.pop()
+        if indice < len(self._celdas):
+            self._celdas[indice] = ultima
+            self._indices[ultima] = indice
+        return True
+
+    def elegir(self, generador: random.Random) -> tuple[int, int] | None:
+        """Celda uniforme al azar, o None si no hay celdas."""
+        if not self._celdas:
+            return None
+        return self._celdas[generador.randrange(len(self._celdas))]
+
+
+class CeldasLibresPonderadas(CeldasLibres):
+    """
+    Variante donde cada celda se elige con probabilidad proporcional a su peso.
+
+    Los pesos se acumulan en un árbol de Fenwick sobre las posiciones del
+    arreglo denso: alta, baja, cambio de peso y elección cuestan O(log n).
+    """
+
+    def __init__(
+        self,
+        celdas: Iterable[tuple[int, int]] = (),
+        pesos: dict[tuple[int, int], float] | None = None,
+    ):
+        """
+        Args:
+            celdas: Celdas iniciales
+            pesos: Peso de cada celda (>= 0); las que no figuran pesan 1
+        """
+        self.pesos: dict[tuple[int, int], float] = dict(pesos or {})
+        self._arbol: list[float] = [0.0]  # Fenwick 1-indexado
+        super().__init__(celdas)
+
+    def _peso(self, celda: tuple[int, int]) -> float:
+        return self.pesos.get(celda, 1.0)
+
+    def _sumar(self, indice: int, delta: float) -> None:
+        """Suma delta al peso de la posición 'indice' (0-indexada) del arreglo."""
+        arbol = self._arbol
+        i = indice + 1
+        while i < len(arbol):
+            arbol[i] += delta
+            i += i & -i
+
+    def _reconstruir_arbol(self, capacidad: int) -> None:
+        """Rehace el árbol en O(n) con lugar para 'capacidad' celdas."""
+        arbol = [0.0] * (capacidad + 1)
+        for indice, celda in enumerate(self._celdas):
+            arbol[indice + 1] += self._peso(celda)
+        for i in range(1, capacidad + 1):
+            padre = i + (i & -i)
+            if padre <= capacidad:
+                arbol[padre] += arbol[i]
+        self._arbol = arbol
+
+    @property
+    def peso_total(self) -> float:
+        """Suma de los pesos de todas las celdas."""
+        total = 0.0
+        i = len(self._celdas)
+        while i > 0:
+            total += self._arbol[i]
+            i -= i & -i
+        return total
+
+    def agregar(self, celda: tuple[int, int]) -> bool:
+        if not super().agregar(celda):
+            return False
+        if len(self._celdas) >= len(self._arbol):
+            self._reconstruir_arbol(2 * len(self._celdas))
+        else:
+            self._sumar(len(self._celdas) - 1, self._peso(celda))
+        return True
+
+    def quitar(self, celda: tuple[int, int]) -> bool:
+        indice = self._indices.get(celda)
+        if indice is None:
+            return False
+        ultimo = len(self._celdas) - 1
+        ultima = self._celdas[ultimo]
+        # La última celda pasa a ocupar el lugar de la quitada
+        self._sumar(indice, self._peso(ultima) - self._peso(celda))
+        self._sumar(ultimo, -self._peso(ultima))
+        return super().quitar(celda)
+
+    def cambiar_peso(self, celda: tuple[int, int], peso: float) -> None:
+        """Cambia el peso de una celda (esté o no en el conjunto)."""
+        indice = self._indices.get(celda)
+        if indice is not None:
+            self._sumar(indice, peso - self._peso(celda))
+        self.pesos[celda] = peso
+
+    def elegir(self, generador: random.Random) -> tuple[int, int] | None:
+        """Celda al azar con probabilidad proporcional a su peso (None si no hay)."""
+        n = len(self._celdas)
+        total = self.peso_total
+        if n == 0 or total <= 0:
+            return None
+        objetivo = generador.random() * total
+        # Descenso por el árbol: mayor prefijo con suma <= objetivo
+        arbol = self._arbol
+        posicion = 0
+        paso = 1 << (len(arbol) - 1).bit_length()
+        while paso:
+            siguiente = posicion + paso
+            if siguiente <= n and arbol[siguiente] <= objetivo:
+                posicion = siguiente
+                objetivo -= arbol[siguiente]
+            paso >>= 1
+        # Redondeo: nunca pasar de la última celda
+        return self._celdas[min(posicion, n - 1)]
+
+
+def pesos_por_distancia(
+    laberinto, origenes: Iterable[tuple[int, int]], exponente: float = 1.0
+) -> dict[tuple[int, int], float]:
+    """
+    Peso de cada pasillo según su distancia (por pasillos) a los orígenes.
+
+    Con exponente > 0 las celdas lejanas pesan más (obsequios lejos del
+    jugador); con exponente < 0, las cercanas. Las celdas inalcanzables no
+    aparecen (pesan 1 en CeldasLibresPonderadas).
+
+    Args:
+        laberinto: Laberinto con es_transitable((col, fila))
+        origenes: Celdas (col, fila) desde donde medir
+        exponente: Potencia aplicada a (distancia + 1)
+    """
+    distancias = {celda: 0 for celda in origenes if laberinto.es_transitable(celda)}
+    cola = deque(distancias)
+    while cola:
+        col, fila = cola.popleft()
+        for vecino in ((col + 1, fila), (col - 1, fila), (col, fila + 1), (col, fila - 1)):
+            if vecino not in distancias and laberinto.es_transitable(vecino):
+                distancias[vecino] = distancias[(col, fila)] + 1
+                cola.append(vecino)
+    return {celda: float(d + 1) ** exponente for celda, d in distancias.items()}
@@ -0,0 +1,149 @@
+"""
+Colisiones contra la grilla de celdas del laberinto.
+
+Los muros son celdas completas alineadas a la grilla, así que para saber si
+un rectángulo choca alcanza con mirar las pocas celdas que cubre, en lugar
+de comparar contra el Rect de cada muro. El costo de una consulta depende
+del tamaño del rectángulo (o del desplazamiento, en un barrido), no de la
+cantidad de muros del laberinto.
+"""
+
+import pygame
+
+
+class GrillaColision:
+    """
+    Consulta de colisiones por celdas sobre la matriz del laberinto.
+
+    Lee la matriz directamente (1=muro), así que los cambios hechos sobre la
+    misma lista (Laberinto.cambiar_celda) se ven sin reconstruir nada. Fuera
+    del mapa no hay muros: los límites los controla quien mueve al personaje.
+    """
+
+    def __init__(
+        self, mapa: list[list[int]], tam_celda: int, offset_x: int = 0, offset_y: int = 0
+    ):
+        """
+        Args:
+            mapa: Matriz del laberinto (0=pasillo, 1=muro)
+            tam_celda: Tamaño de cada celda en píxeles
+            offset_x: Posición x en píxeles de la columna 0
+            offset_y: Posición y en píxeles de la fila 0
+        """
+        self.mapa = mapa
+        self.tam_celda = tam_celda
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+
+    @classmethod
+    def desde_muros(
+        cls, muros: list[pygame.Rect], tam_celda: int | None = None
+    ) -> "GrillaColision":
+        """
+        Construye la grilla a partir de Rects de muros alineados a celdas.
+
+        Pensado para quien solo tiene la lista de Laberinto.generar_muros_rect:
+        el tamaño de celda se toma del primer muro si no se indica, y el
+        origen de la grilla se deduce de su posición.
+        """
+        if not muros:
+            return cls([], tam_celda or 1)
+        tam = tam_celda or muros[0].width
+        offset_x, offset_y = muros[0].x % tam, muros[0].y % tam
+        celdas = [((m.x - offset_x) // tam, (m.y - offset_y) // tam) for m in muros]
+        columnas = max(col for col, _ in celdas) + 1
+        filas = max(fila for _, fila in celdas) + 1
+        mapa = [[0] * columnas for _ in range(filas)]
+        for col, fila in celdas:
+            mapa[fila][col] = 1
+        return cls(mapa, tam, offset_x, offset_y)
+
+    def es_muro(self, col: int, fila: int) -> bool:
+        """Indica si la celda (col, fila) es un muro; fuera del mapa no lo es."""
+        if fila < 0 or col < 0 or fila >= len(self.mapa):
+            return False
+        fila_mapa = self.mapa[fila]
+        return col < len(fila_mapa) and fila_mapa[col] == 1
+
+    def _rango_columnas(self, izquierda: int, derecha: int) -> range:
+        """Columnas que cubre el intervalo de píxeles [izquierda, derecha)."""
+        tam = self.tam_celda
+        return range(
+            (izquierda - self.offset_x) // tam, (derecha - 1 - self.offset_x) // tam + 1
+        )
+
+    def _rango_filas(self, arriba: int, abajo: int) -> range:
+        """Filas que cubre el intervalo de píxeles [arriba, abajo)."""
+        tam = self.tam_celda
+        return range(
+            (arriba - self.offset_y) // tam, (abajo - 1 - self.offset_y) // tam + 1
+        )
+
+    def colisiona(self, rect: pygame.Rect) -> bool:
+        """
+        Verifica si el rect se superpone con algún muro.
+
+        Equivale a probar colliderect contra los Rects de todos los muros,
+        pero solo revisa las celdas que el rect cubre.
+        """
+        if rect.width <= 0 or rect.height <= 0:
+            return False
+        filas = self._rango_filas(rect.top, rect.bottom)
+        for col in self._rango_columnas(rect.left, rect.right):
+            for fila in filas:
+                if self.es_muro(col, fila):
+                    return True
+        return False
+
+    def barrer(self, rect: pygame.Rect, dx: int, dy: int) -> tuple[int, int]:
+        """
+        Barrido AABB: cuánto puede desplazarse el rect antes de tocar un muro.
+
+        Resuelve primero el eje x y después el y (desde la posición ya
+        desplazada), así el rect se desliza a lo largo de las paredes en
+        lugar de frenarse en seco. Supone que el rect no está dentro de un muro.
+
+        Args:
+            rect: Rect a desplazar (no se modifica)
+            dx: Desplazamiento horizontal deseado en píxeles
+            dy: Desplazamiento vertical deseado en píxeles
+
+        Returns:
+            (dx, dy) permitidos, con el mismo signo y como mucho el mismo
+            valor absoluto que los pedidos
+        """
+        dx = self._barrer_x(rect.left, rect.right, rect.top, rect.bottom, dx)
+        dy = self._barrer_y(rect.left + dx, rect.right + dx, rect.top, rect.bottom, dy)
+        return dx, dy
+
+    def _barrer_x(self, izquierda, derecha, arriba, abajo, dx) -> int:
+        """Desplazamiento horizontal permitido para la caja dada."""
+        if dx == 0:
+            return 0
+        tam = self.tam_celda
+        filas = self._rango_filas(arriba, abajo)
+        if dx > 0:
+            columnas = self._rango_columnas(derecha, derecha + dx)
+        else:
+            columnas = reversed(self._rango_columnas(izquierda + dx, izquierda))
+        for col in columnas:
+            if any(self.es_muro(col, fila) for fila in filas):
+                borde = self.offset_x + col * tam
+                return borde - derecha if dx > 0 else borde + tam - izquierda
+        return dx
+
+    def _barrer_y(self, izquierda, derecha, arriba, abajo, dy) -> int:
+        """Desplazamiento vertical permitido para la caja dada."""
+        if dy == 0:
+            return 0
+        tam = self.tam_celda
+        columnas = self._rango_columnas(izquierda, derecha)
+        if dy > 0:
+            filas = self._rango_filas(abajo, abajo + dy)
+        else:
+            filas = reversed(self._rango_filas(arriba + dy, arriba))
+        for fila in filas:
+            if any(self.es_muro(col, fila) for col in columnas):
+                borde = self.offset_y + fila * tam
+                return borde - abajo if dy > 0 else borde + tam - arriba
+        return dy
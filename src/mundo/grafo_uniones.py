@@ -0,0 +1,220 @@
+"""
+Grafo comprimido de uniones del laberinto.
+
+La mayoría de las celdas de un laberinto son tramos de pasillo con exactamente
+dos vecinos transitables. El grafo conserva como nodos solo las uniones
+(3 o 4 vecinos) y los callejones sin salida (0 o 1 vecino), y reemplaza cada
+pasillo entre ellos por una arista con peso igual a su largo en pasos.
+
+Todas las celdas se identifican con el índice plano fila * columnas + col,
+el mismo que usa la grilla compacta de Laberinto.
+
+Cuando cambian celdas del mapa (Laberinto.cambiar_celda) el grafo no se
+reconstruye: se corrigen solo los pasillos que pasan por esas celdas.
+"""
+
+from array import array
+
+
+class GrafoUniones:
+    """
+    Nodos en uniones y callejones, aristas ponderadas a lo largo de los pasillos.
+
+    Atributos:
+        nodos: Índices de las celdas que son nodos del grafo
+        es_nodo: bytearray con 1 en las celdas que son nodos
+        aristas: Lista de (nodo_a, nodo_b, celdas interiores ordenadas de a hacia b);
+            None en los lugares de aristas borradas por actualizar_celdas
+        adyacencia: {nodo: [(vecino, peso, id_arista), ...]}
+        arista_de_celda: Para cada celda de pasillo, id de su arista (-1 si no tiene)
+        indice_en_arista: Posición de la celda dentro de las celdas de su arista
+    """
+
+    def __init__(self, grilla, filas: int, columnas: int, version: int = 0):
+        """
+        Construye el grafo recorriendo la grilla una sola vez.
+
+        Args:
+            grilla: Secuencia de bytes (1=muro, 0=transitable) de filas * columnas
+            filas: Cantidad de filas del mapa
+            columnas: Cantidad de columnas del mapa
+            version: version_mapa del laberinto con que se construyó
+        """
+        self.filas = filas
+        self.columnas = columnas
+        self.version = version
+        self._grilla = grilla
+
+        total = filas * columnas
+        self.es_nodo = bytearray(total)
+        self.nodos: list[int] = []
+        self.aristas: list[tuple[int, int, tuple[int, ...]]] = []
+        self.adyacencia: dict[int, list[tuple[int, int, int]]] = {}
+        self.arista_de_celda = array("i", [-1]) * total
+        self.indice_en_arista = array("i", [-1]) * total
+
+        # Nodos: celdas transitables cuyo grado no es 2
+        for u in range(total):
+            if not grilla[u] and len(self.vecinos(u)) != 2:
+                self._agregar_nodo(u)
+
+        for nodo in list(self.nodos):
+            self._trazar_aristas(nodo)
+
+        # Ciclos sin uniones: se elige una celda cualquiera del ciclo como nodo
+        for u in range(total):
+            if not grilla[u] and not self.es_nodo[u] and self.arista_de_celda[u] < 0:
+                self._agregar_nodo(u)
+                self._trazar_aristas(u)
+
+    @classmethod
+    def desde_laberinto(cls, laberinto) -> "GrafoUniones":
+        """Construye el grafo a partir de la grilla compacta de un Laberinto."""
+        return cls(
+            laberinto._grilla, laberinto.filas, laberinto.columnas, laberinto.version_mapa
+        )
+
+    def vecinos(self, u: int) -> list[int]:
+        """Celdas transitables adyacentes a u (índices planos)."""
+        columnas = self.columnas
+        grilla = self._grilla
+        total = len(grilla)
+        c = u % columnas
+        resultado = []
+        if u + columnas < total and not grilla[u + columnas]:
+            resultado.append(u + columnas)
+        if u >= columnas and not grilla[u - columnas]:
+            resultado.append(u - columnas)
+        if c + 1 < columnas and not grilla[u + 1]:
+            resultado.append(u + 1)
+        if c > 0 and not grilla[u - 1]:
+            resultado.append(u - 1)
+        return resultado
+
+    def adyacentes(self, u: int) -> list[int]:
+        """Celdas del mapa que tocan a u (sean muros o no)."""
+        columnas = self.columnas
+        c = u % columnas
+        resultado = []
+        if u + columnas < len(self._grilla):
+            resultado.append(u + columnas)
+        if u >= columnas:
+            resultado.append(u - columnas)
+        if c + 1 < columnas:
+            resultado.append(u + 1)
+        if c > 0:
+            resultado.append(u - 1)
+        return resultado
+
+    def actualizar_celdas(self, cambiadas, version: int) -> None:
+        """
+        Corrige el grafo tras cambios de celdas ya aplicados en la grilla.
+
+        Un cambio solo altera el grado de la celda y de sus vecinas, así que
+        se borran los pasillos que pasan por ellas o salen de ellas, se
+        recalcula cuáles son nodos y se vuelven a trazar los pasillos desde
+        los extremos que quedaron sueltos. El costo depende del largo de
+        esos pasillos, no del tamaño del mapa.
+
+        Args:
+            cambiadas: Índices planos de las celdas que cambiaron
+            version: version_mapa del laberinto después de los cambios
+        """
+        zona = set()
+        for u in cambiadas:
+            zona.add(u)
+            zona.update(self.adyacentes(u))
+
+        # Pasillos que pasan por la zona o salen de un nodo de la zona
+        borrar = set()
+        for u in zona:
+            if self.arista_de_celda[u] >= 0:
+                borrar.add(self.arista_de_celda[u])
+            if self.es_nodo[u]:
+                borrar.update(id_arista for _, _, id_arista in self.adyacencia[u])
+                # Los lazos no están en la adyacencia: se ubican por sus celdas
+                for v in self.adyacentes(u):
+                    if self.arista_de_celda[v] >= 0:
+                        borrar.add(self.arista_de_celda[v])
+
+        extremos = set()
+        sueltas = set()
+        for id_arista in borrar:
+            a, b, celdas = self.aristas[id_arista]
+            self.aristas[id_arista] = None
+            for celda in celdas:
+                self.arista_de_celda[celda] = -1
+                self.indice_en_arista[celda] = -1
+            for nodo in (a, b):
+                self.adyacencia[nodo] = [
+                    arista for arista in self.adyacencia[nodo] if arista[2] != id_arista
+                ]
+            extremos.update((a, b))
+            sueltas.update(celdas)
+
+        # Nodos de la zona según el grado nuevo
+        for u in zona:
+            debe_ser_nodo = not self._grilla[u] and len(self.vecinos(u)) != 2
+            if self.es_nodo[u] and not debe_ser_nodo:
+                self.es_nodo[u] = 0
+                self.nodos.remove(u)
+                del self.adyacencia[u]
+            elif debe_ser_nodo and not self.es_nodo[u]:
+                self._agregar_nodo(u)
+
+        for nodo in extremos | zona:
+            if self.es_nodo[nodo]:
+                self._trazar_aristas(nodo)
+
+        # Ciclos que quedaron sin ningún nodo (igual que al construir)
+        for u in sueltas | zona:
+            if not self._grilla[u] and not self.es_nodo[u] and self.arista_de_celda[u] < 0:
+                self._agregar_nodo(u)
+                self._trazar_aristas(u)
+
+        self.version = version
+
+    def primera_celda(self, nodo: int, id_arista: int) -> int:
+        """Celda a la que se avanza al salir de 'nodo' por la arista indicada."""
+        a, b, celdas = self.aristas[id_arista]
+        if nodo == a:
+            return celdas[0] if celdas else b
+        return celdas[-1] if celdas else a
+
+    def _agregar_nodo(self, u: int) -> None:
+        self.es_nodo[u] = 1
+        self.nodos.append(u)
+        self.adyacencia[u] = []
+
+    def _trazar_aristas(self, nodo: int) -> None:
+        """Sigue cada pasillo que sale del nodo hasta el próximo nodo."""
+        for siguiente in self.vecinos(nodo):
+            if not self.es_nodo[siguiente] and self.arista_de_celda[siguiente] >= 0:
+                continue  # Pasillo ya registrado desde el otro extremo
+
+            anterior, actual = nodo, siguiente
+            celdas = []
+            while not self.es_nodo[actual]:
+                celdas.append(actual)
+                a, b = self.vecinos(actual)
+                anterior, actual = actual, (b if a == anterior else a)
+
+            if not celdas and any(
+                v == actual and peso == 1 for v, peso, _ in self.adyacencia[nodo]
+            ):
+                continue  # Nodos adyacentes: se registra una sola vez
+            self._agregar_arista(nodo, actual, celdas)
+
+    def _agregar_arista(self, a: int, b: int, celdas: list[int]) -> None:
+        id_arista = len(self.aristas)
+        self.aristas.append((a, b, tuple(celdas)))
+        for i, celda in enumerate(celdas):
+            self.arista_de_celda[celda] = id_arista
+            self.indice_en_arista[celda] = i
+
+        # Los lazos (a == b) no acortan caminos entre nodos: solo sirven para
+        # ubicar celdas de ese pasillo, no se agregan a la adyacencia
+        if a != b:
+            peso = len(celdas) + 1
+            self.adyacencia[a].append((b, peso, id_arista))
+            self.adyacencia[b].append((a, peso, id_arista))
@@ -1,13 +1,65 @@
+import bisect
 import json
+import math
 import os
+from collections.abc import Iterator, Sequence
 
 import pygame
 
+from .grafo_uniones import GrafoUniones
 from .obsequio import Obsequio
 
 AZUL = (0, 0, 255)
 
 
+class VistaCeldas(Sequence):
+    """
+    Vista de solo lectura sobre un conjunto de celdas del laberinto.
+
+    Conserva el orden de recorrido del mapa (como la lista que se usaba antes)
+    pero responde a `posicion in vista` en O(1) usando un set interno.
+    Laberinto.cambiar_celda la actualiza en O(1) con _agregar/_quitar; la
+    lista ordenada se rehace recién cuando alguien vuelve a recorrerla.
+    """
+
+    __slots__ = ("_lista", "_conjunto")
+
+    def __init__(self, lista: list[tuple[int, int]]):
+        self._lista: list[tuple[int, int]] | None = lista
+        self._conjunto = set(lista)
+
+    def _ordenada(self) -> list[tuple[int, int]]:
+        if self._lista is None:
+            # Orden del mapa: por fila y luego por columna
+            self._lista = sorted(self._conjunto, key=lambda p: (p[1], p[0]))
+        return self._lista
+
+    def _agregar(self, posicion: tuple[int, int]) -> None:
+        if posicion not in self._conjunto:
+            self._conjunto.add(posicion)
+            self._lista = None
+
+    def _quitar(self, posicion: tuple[int, int]) -> None:
+        if posicion in self._conjunto:
+            self._conjunto.discard(posicion)
+            self._lista = None
+
+    def __contains__(self, posicion) -> bool:
+        return posicion in self._conjunto
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return iter(self._ordenada())
+
+    def __len__(self) -> int:
+        return len(self._conjunto)
+
+    def __getitem__(self, indice):
+        return self._ordenada()[indice]
+
+    def __repr__(self) -> str:
+        return f"VistaCeldas({len(self._conjunto)} celdas)"
+
+
 class Laberinto:
     """
     Clase que representa el laberinto del juego.
@@ -26,6 +78,21 @@ class Laberinto:
 
     TAM_CELDA = 32  # Tamaño predeterminado de cada celda en píxeles
 
+    # Animación de obsequios pre-renderizada: un ciclo de 240 frames (4 s a 60 FPS)
+    # muestreado cada 5 frames. Las frecuencias completan un número entero de
+    # oscilaciones por ciclo para que la animación cierre sin saltos.
+    CICLO_ANIMACION_OBSEQUIO = 240
+    PASO_ANIMACION_OBSEQUIO = 5
+    RADIO_MAX_OBSEQUIO = 26  # Radio base + pulsación + aura exterior
+    _FREQ_BRILLO = 6 * math.pi / CICLO_ANIMACION_OBSEQUIO  # ~0.08 rad/frame
+    _FREQ_TAMANO = 5 * math.pi / CICLO_ANIMACION_OBSEQUIO  # ~0.06 rad/frame
+    _FREQ_ROTACION = 9 * (2 * math.pi / 8) / CICLO_ANIMACION_OBSEQUIO  # ~0.03
+    _frames_obsequio: list[pygame.Surface] | None = None
+
+    # Cambios de celda recordados para las actualizaciones incrementales (ver
+    # celdas_cambiadas_desde); al pasarse se olvidan los más viejos
+    MAX_REGISTRO_CAMBIOS = 4096
+
     def __init__(self, archivo_json_o_datos: str | dict):
         """
         Inicializa un nuevo laberinto cargando desde un archivo JSON o directamente desde un diccionario de datos.
@@ -34,9 +101,11 @@ class Laberinto:
         {
             "nombre": "Nombre del laberinto",
             "dificultad": "normal",
+            "navegacion": "astar",  # opcional, fuerza la estrategia del enemigo
             "mapa": [[0, 1, 0, ...], ...],
             "jugador_inicio": [col, fila],
             "computadora_inicio": [col, fila],
+            "inicio_enemigos": [{"col": c, "fila": f}, ...],  # opcional
             "obsequios": [{"posicion": [col, fila], "valor": 10}, ...]
         }
 
@@ -45,24 +114,43 @@ class Laberinto:
                                   o un diccionario con los datos del laberinto.
         """
         # Estructuras de datos principales
-        self._muros: list[tuple[int, int]] = []  # Lista de posiciones de muros
-        self._pasillos: list[tuple[int, int]] = []  # Lista de posiciones transitables
+        self._muros = VistaCeldas([])  # Posiciones de muros
+        self._pasillos = VistaCeldas([])  # Posiciones transitables
+
+        # Grilla compacta: un byte por celda (1=muro, 0=transitable), índice fila*columnas+col
+        self._grilla = bytearray()
+        self.filas = 0
+        self.columnas = 0
         self._obsequios: dict[tuple[int, int], Obsequio] = (
             {}
         )  # Diccionario {posición: Obsequio}
         self.laberinto: list[list[int]] = []  # Matriz 2D del mapa (0=pasillo, 1=muro)
 
+        # Se incrementa cada vez que cambia la estructura del mapa; las cachés
+        # que dependen del layout (fondo pre-renderizado, etc.) la usan como clave
+        self.version_mapa = 0
+        # Cambios hechos con cambiar_celda: [(version_mapa, índice plano)] en
+        # orden; antes de _version_registro solo se sabe que cambió todo
+        self._registro_cambios: list[tuple[int, int]] = []
+        self._version_registro = 0
+
+        # Grafo comprimido de uniones (se construye al pedirlo y se rehace si cambia el mapa)
+        self._grafo_uniones: GrafoUniones | None = None
+
         # Metadatos del laberinto
         self.nombre = "Laberinto"
         self.dificultad = "normal"
+        # Estrategia de navegación pedida por el mapa (None = elección automática)
+        self.navegacion: str | None = None
 
         # Posiciones iniciales (formato: columna, fila)
         self.jugador_inicio: tuple[int, int] = (1, 1)
         self.computadora_inicio: tuple[int, int] = (18, 12)
+        # Minotauros adicionales (clave opcional "inicio_enemigos" del JSON)
+        self.enemigos_inicio: list[tuple[int, int]] = []
 
-        # Crear superficie de color para pasillos
-        self.imagen_pasillo = pygame.Surface((self.TAM_CELDA, self.TAM_CELDA))
-        self.imagen_pasillo.fill((50, 50, 50))
+        # Superficie de color para pasillos (se crea al dibujar, ver imagen_pasillo)
+        self._imagen_pasillo: pygame.Surface | None = None
 
         if isinstance(archivo_json_o_datos, dict):
             self._cargar_desde_diccionario(archivo_json_o_datos)
@@ -159,6 +247,7 @@ class Laberinto:
         # Metadatos
         self.nombre = datos.get("nombre", "Laberinto")
         self.dificultad = datos.get("dificultad", "normal")
+        self.navegacion = datos.get("navegacion")
 
         # Matriz del mapa (lista 2D con 0=pasillo, 1=muro)
         self.laberinto = datos["mapa"]
@@ -172,6 +261,12 @@ class Laberinto:
             col, fila = datos["inicio_computadora"].values()
             self.computadora_inicio = (col, fila)
 
+        # Enemigos adicionales: lista de {"col", "fila"} o [col, fila]
+        self.enemigos_inicio = [
+            (pos["col"], pos["fila"]) if isinstance(pos, dict) else tuple(pos)
+            for pos in datos.get("inicio_enemigos", [])
+        ]
+
         # === PASO 5: Procesar el mapa ===
         # Identificar qué celdas son muros y cuáles pasillos
         self._procesar_laberinto()
@@ -188,22 +283,119 @@ class Laberinto:
         """
         Procesa el mapa para clasificar cada celda como muro o pasillo.
 
-        Itera sobre toda la matriz del laberinto y genera dos listas:
-        - _muros: Posiciones con valor 1 (no transitables)
-        - _pasillos: Posiciones con valor 0 (transitables)
+        Recorre la matriz una sola vez y genera:
+        - _grilla: bytearray con un byte por celda (1=muro, 0=transitable)
+        - _muros: Vista de posiciones con valor 1 (no transitables)
+        - _pasillos: Vista de posiciones con valor 0 (transitables)
 
-        Estas listas se usan para validación rápida de movimiento.
+        Todas las consultas de movimiento (es_paso_valido, es_muro, ...) son
+        O(1) sobre la grilla, incluso en mapas de cientos de celdas por lado.
         """
-        self._muros = []
-        self._pasillos = []
+        self.filas = len(self.laberinto)
+        self.columnas = len(self.laberinto[0]) if self.filas else 0
+        self._grilla = bytearray(self.filas * self.columnas)
+        muros = []
+        pasillos = []
+        self.version_mapa += 1
 
-        for fila in range(len(self.laberinto)):
-            for col in range(len(self.laberinto[0])):
+        for fila, valores in enumerate(self.laberinto):
+            base = fila * self.columnas
+            for col, valor in enumerate(valores):
                 posicion = (col, fila)
-                if self.laberinto[fila][col] == 1:
-                    self._muros.append(posicion)  # Es una pared
+                if valor == 1:
+                    self._grilla[base + col] = 1
+                    muros.append(posicion)  # Es una pared
                 else:
-                    self._pasillos.append(posicion)  # Es un pasillo
+                    pasillos.append(posicion)  # Es un pasillo
+
+        self._muros = VistaCeldas(muros)
+        self._pasillos = VistaCeldas(pasillos)
+        self._registro_cambios = []  # Mapa nuevo: no hay cambios que sumar
+        self._version_registro = self.version_mapa
+
+    @property
+    def grafo_uniones(self) -> GrafoUniones:
+        """
+        Grafo de uniones y pasillos del mapa actual.
+
+        Se construye la primera vez que se pide (al crear la navegación, es
+        decir, al cargar la partida). Si cambió version_mapa se corrigen solo
+        los pasillos que pasan por las celdas cambiadas, o se reconstruye si
+        se cargó un mapa nuevo.
+        """
+        grafo = self._grafo_uniones
+        if grafo is None or grafo.version != self.version_mapa:
+            cambiadas = None if grafo is None else self.celdas_cambiadas_desde(grafo.version)
+            if cambiadas is None:
+                self._grafo_uniones = GrafoUniones.desde_laberinto(self)
+            else:
+                grafo.actualizar_celdas(cambiadas, self.version_mapa)
+        return self._grafo_uniones
+
+    def celdas_cambiadas_desde(self, version: int) -> list[int] | None:
+        """
+        Celdas modificadas con cambiar_celda después de una versión del mapa.
+
+        Args:
+            version: version_mapa con que se construyó la estructura a actualizar
+
+        Returns:
+            Índices planos (fila * columnas + col) de las celdas cambiadas, o
+            None si desde entonces se cargó un mapa nuevo (o el registro ya no
+            llega tan atrás) y hay que reconstruir todo
+        """
+        if version < self._version_registro:
+            return None
+        inicio = bisect.bisect_right(
+            self._registro_cambios, version, key=lambda cambio: cambio[0]
+        )
+        return [indice for _, indice in self._registro_cambios[inicio:]]
+
+    def cambiar_celda(self, posicion: tuple[int, int], valor: int) -> None:
+        """
+        Cambia una celda del mapa (0=pasillo, 1=muro) y actualiza los índices.
+
+        La grilla y las vistas de muros y pasillos se corrigen en el lugar, en
+        O(1). Incrementa version_mapa y registra la celda, así el fondo
+        pre-renderizado, el grafo de uniones y las estrategias de navegación
+        se actualizan solos (estos dos últimos, solo alrededor de la celda).
+
+        Args:
+            posicion: Celda (col, fila) a modificar
+            valor: Nuevo valor de la celda
+
+        Raises:
+            ValueError: Si la posición está fuera del mapa
+        """
+        if not self.esta_dentro(posicion):
+            raise ValueError(f"Posición fuera del laberinto: {posicion}")
+        col, fila = posicion
+        if self.laberinto[fila][col] == valor:
+            return
+        self.laberinto[fila][col] = valor
+
+        indice = fila * self.columnas + col
+        if valor == 1:
+            self._grilla[indice] = 1
+            self._pasillos._quitar(posicion)
+            self._muros._agregar(posicion)
+        else:
+            self._grilla[indice] = 0
+            self._muros._quitar(posicion)
+            self._pasillos._agregar(posicion)
+
+        self.version_mapa += 1
+        self._registro_cambios.append((self.version_mapa, indice))
+        if len(self._registro_cambios) > self.MAX_REGISTRO_CAMBIOS:
+            # Olvidar la mitad más vieja: quien venga de antes reconstruye todo
+            mitad = len(self._registro_cambios) // 2
+            self._version_registro = self._registro_cambios[mitad - 1][0]
+            del self._registro_cambios[:mitad]
+
+    @property
+    def spawns_computadoras(self) -> list[tuple[int, int]]:
+        """Posiciones (col, fila) de todos los minotauros: el principal y los adicionales."""
+        return [self.computadora_inicio, *self.enemigos_inicio]
 
     def validar_estructura(self, datos: dict) -> bool:
         """
@@ -238,6 +430,45 @@ class Laberinto:
 
         return True
 
+    def esta_dentro(self, posicion: tuple[int, int]) -> bool:
+        """
+        Verifica si una posición (col, fila) está dentro de los límites del mapa.
+
+        Parámetros:
+            posicion: Coordenadas (col, fila) a verificar
+        Retorna:
+            bool: True si la celda existe en el mapa
+        """
+        col, fila = posicion
+        return 0 <= col < self.columnas and 0 <= fila < self.filas
+
+    def es_muro(self, posicion: tuple[int, int]) -> bool:
+        """
+        Verifica en O(1) si una posición (col, fila) bloquea el paso.
+
+        Las posiciones fuera del mapa cuentan como muro.
+
+        Parámetros:
+            posicion: Coordenadas (col, fila) a verificar
+        Retorna:
+            bool: True si es un muro o está fuera del mapa
+        """
+        col, fila = posicion
+        if not (0 <= col < self.columnas and 0 <= fila < self.filas):
+            return True
+        return self._grilla[fila * self.columnas + col] == 1
+
+    def es_transitable(self, posicion: tuple[int, int]) -> bool:
+        """
+        Verifica en O(1) si una posición (col, fila) es un pasillo dentro del mapa.
+
+        Parámetros:
+            posicion: Coordenadas (col, fila) a verificar
+        Retorna:
+            bool: True si es un pasillo
+        """
+        return not self.es_muro(posicion)
+
     def es_paso_valido(self, posicion: tuple[int, int]) -> bool:
         """
         Verifica si una posición es válida para el movimiento del jugador.
@@ -247,7 +478,7 @@ class Laberinto:
         Retorna:
             bool: True si es un pasillo u obsequio, False si es un muro
         """
-        return posicion in self._pasillos or posicion in self._obsequios
+        return self.es_transitable(posicion) or posicion in self._obsequios
 
     def obtener_obsequio(self, posicion: tuple[int, int]) -> Obsequio | None:
         """
@@ -279,6 +510,20 @@ class Laberinto:
             return obsequio.valor
         return 0  # No había obsequio en esa posición
 
+    def __getstate__(self) -> dict:
+        """Estado para pickle sin superficies (se vuelven a crear al dibujar)."""
+        estado = self.__dict__.copy()
+        estado["_imagen_pasillo"] = None
+        return estado
+
+    @property
+    def imagen_pasillo(self) -> pygame.Surface:
+        """Superficie de un pasillo para dibujar_laberinto (creada al primer uso)."""
+        if self._imagen_pasillo is None:
+            self._imagen_pasillo = pygame.Surface((self.TAM_CELDA, self.TAM_CELDA))
+            self._imagen_pasillo.fill((50, 50, 50))
+        return self._imagen_pasillo
+
     def obtener_rectangulos(self):
         """
         Genera los rectángulos de colisión para los muros del laberinto.
@@ -286,15 +531,7 @@ class Laberinto:
         Retorna:
             list: Lista de objetos Rect de pygame que representan los muros
         """
-        rectangulos = []
-        for fila in range(len(self.laberinto)):
-            for col in range(len(self.laberinto[0])):
-                if self.laberinto[fila][col] == 1:  # 1 representa un muro
-                    x = col * self.TAM_CELDA
-                    y = fila * self.TAM_CELDA
-                    rect = pygame.Rect(x, y, self.TAM_CELDA, self.TAM_CELDA)
-                    rectangulos.append(rect)
-        return rectangulos
+        return self.generar_muros_rect(self.TAM_CELDA, 0, 0)
 
     def dibujar_laberinto(self, pantalla):
         """
@@ -317,6 +554,95 @@ class Laberinto:
                     # Dibuja pasillo con imagen
                     pantalla.blit(self.imagen_pasillo, (x, y))
 
+    @classmethod
+    def _renderizar_frame_obsequio(cls, paso: int) -> pygame.Surface:
+        """
+        Dibuja un frame del ovillo dorado (Hilo de Ariadna) en una superficie propia.
+
+        Args:
+            paso: Índice del frame dentro del ciclo de animación
+
+        Returns:
+            Superficie con transparencia centrada en el ovillo
+        """
+        frame = paso * cls.PASO_ANIMACION_OBSEQUIO
+        lado = 2 * (cls.RADIO_MAX_OBSEQUIO + 2)
+        superficie = pygame.Surface((lado, lado), pygame.SRCALPHA)
+        cx = cy = lado // 2
+
+        # === Efecto de pulsación del resplandor ===
+        pulso_brillo = abs(math.sin(frame * cls._FREQ_BRILLO)) * 0.3 + 0.7
+        pulso_tamano = abs(math.sin(frame * cls._FREQ_TAMANO)) * 2
+
+        radio_base = 9
+        radio_ovillo = radio_base + pulso_tamano
+
+        # === Aura dorada exterior (resplandor mítico) ===
+        for r in range(5, 0, -1):
+            intensidad = int(255 * pulso_brillo * (r / 5.0))
+            color_aura = (intensidad, int(intensidad * 0.84), 0)  # Dorado
+            pygame.draw.circle(
+                superficie, color_aura, (cx, cy), int(radio_ovillo + r * 3), 1
+            )
+
+        # === Ovillo base (círculo dorado) ===
+        color_oro = (218, 165, 32)  # Oro antiguo
+        pygame.draw.circle(superficie, color_oro, (cx, cy), int(radio_ovillo))
+
+        # === Líneas de hilo enrollado (textura del ovillo) ===
+        num_lineas = 8
+        for i in range(num_lineas):
+            angulo = (frame * cls._FREQ_ROTACION + i * (2 * math.pi / num_lineas)) % (
+                2 * math.pi
+            )
+
+            # Líneas curvas simulando hilo enrollado
+            inicio_x = cx + (radio_ovillo - 3) * math.cos(angulo)
+            inicio_y = cy + (radio_ovillo - 3) * math.sin(angulo)
+            fin_x = cx + (radio_ovillo - 7) * math.cos(angulo + 0.5)
+            fin_y = cy + (radio_ovillo - 7) * math.sin(angulo + 0.5)
+
+            pygame.draw.line(
+                superficie,
+                (184, 134, 11),  # Oro más oscuro para textura
+                (int(inicio_x), int(inicio_y)),
+                (int(fin_x), int(fin_y)),
+                2,
+            )
+
+        # === Borde brillante del ovillo ===
+        color_brillo = (
+            int(255 * pulso_brillo),
+            int(215 * pulso_brillo),
+            int(100 * pulso_brillo),
+        )
+        pygame.draw.circle(superficie, color_brillo, (cx, cy), int(radio_ovillo), 2)
+
+        # === Destello central (núcleo del hilo) ===
+        pygame.draw.circle(superficie, (255, 235, 150), (cx - 2, cy - 2), 3)
+        pygame.draw.circle(superficie, (255, 255, 200), (cx - 2, cy - 2), 1)
+
+        return superficie
+
+    @classmethod
+    def obtener_frames_obsequio(cls) -> list[pygame.Surface]:
+        """
+        Retorna los frames pre-renderizados de la animación del obsequio.
+
+        El ovillo tiene un tamaño fijo (RADIO_MAX_OBSEQUIO), así que los
+        frames se generan una sola vez y se comparten entre todos los
+        laberintos, cualquiera sea el tamaño de celda.
+
+        Returns:
+            Lista con un frame por cada paso del ciclo de animación
+        """
+        if cls._frames_obsequio is None:
+            pasos = cls.CICLO_ANIMACION_OBSEQUIO // cls.PASO_ANIMACION_OBSEQUIO
+            cls._frames_obsequio = [
+                cls._renderizar_frame_obsequio(paso) for paso in range(pasos)
+            ]
+        return cls._frames_obsequio
+
     def dibujar_obsequios(
         self, pantalla, frame_count=0, tam_celda=None, offset_x=0, offset_y=0
     ):
@@ -329,77 +655,62 @@ class Laberinto:
         - Efecto de resplandor mítico
         - Tema mitológico griego
 
+        La animación está pre-renderizada (ver obtener_frames_obsequio), así
+        que cada obsequio cuesta un único blit sin importar cuántos haya.
+
         Args:
             pantalla: Superficie de pygame donde se dibujarán los obsequios
             frame_count: Contador de frames para animación (opcional, default=0)
             tam_celda: Tamaño de celda en píxeles (si None, usa self.TAM_CELDA)
             offset_x: Desplazamiento horizontal para centrado del laberinto
             offset_y: Desplazamiento vertical para centrado del laberinto
+
+        Returns:
+            Lista de pygame.Rect con el área de cada obsequio dibujado
+        """
+        if not self._obsequios:
+            return []
+        return pantalla.blits(
+            self._blits_obsequios(frame_count, tam_celda, offset_x, offset_y)
+        )
+
+    def encolar_obsequios(
+        self, cola, capa, frame_count=0, tam_celda=None, offset_x=0, offset_y=0
+    ):
         """
-        import math
+        Agrega los obsequios a una ColaRender en lugar de dibujarlos.
+
+        Args:
+            cola: ColaRender del frame
+            capa: Capa de la cola donde van los obsequios
+            frame_count, tam_celda, offset_x, offset_y: Igual que dibujar_obsequios
+        """
+        if self._obsequios:
+            cola.agregar_varios(
+                capa, self._blits_obsequios(frame_count, tam_celda, offset_x, offset_y)
+            )
 
+    def _blits_obsequios(self, frame_count, tam_celda, offset_x, offset_y) -> list:
+        """Secuencia (frame, (x, y)) para dibujar todos los obsequios con blits."""
         # Usar tam_celda pasado o el predeterminado
         celda_size = tam_celda if tam_celda is not None else self.TAM_CELDA
 
-        # Dibujar cada obsequio con animación
-        for posicion, obsequio in self._obsequios.items():
-            col, fila = posicion
-
-            # Calcular posición en píxeles (centro de la celda)
-            cx = col * celda_size + celda_size // 2 + offset_x
-            cy = fila * celda_size + celda_size // 2 + offset_y
-
-            # === Efecto de pulsación del resplandor ===
-            pulso_brillo = abs(math.sin(frame_count * 0.08)) * 0.3 + 0.7
-            pulso_tamano = abs(math.sin(frame_count * 0.06)) * 2
-
-            radio_base = 9
-            radio_ovillo = radio_base + pulso_tamano
-
-            # === Aura dorada exterior (resplandor mítico) ===
-            for r in range(5, 0, -1):
-                intensidad = int(255 * pulso_brillo * (r / 5.0))
-                color_aura = (intensidad, int(intensidad * 0.84), 0)  # Dorado
-                pygame.draw.circle(
-                    pantalla, color_aura, (cx, cy), int(radio_ovillo + r * 3), 1
-                )
-
-            # === Ovillo base (círculo dorado) ===
-            color_oro = (218, 165, 32)  # Oro antiguo
-            pygame.draw.circle(pantalla, color_oro, (cx, cy), int(radio_ovillo))
-
-            # === Líneas de hilo enrollado (textura del ovillo) ===
-            num_lineas = 8
-            for i in range(num_lineas):
-                angulo = (frame_count * 0.03 + i * (2 * math.pi / num_lineas)) % (
-                    2 * math.pi
-                )
-
-                # Líneas curvas simulando hilo enrollado
-                inicio_x = cx + (radio_ovillo - 3) * math.cos(angulo)
-                inicio_y = cy + (radio_ovillo - 3) * math.sin(angulo)
-                fin_x = cx + (radio_ovillo - 7) * math.cos(angulo + 0.5)
-                fin_y = cy + (radio_ovillo - 7) * math.sin(angulo + 0.5)
-
-                pygame.draw.line(
-                    pantalla,
-                    (184, 134, 11),  # Oro más oscuro para textura
-                    (int(inicio_x), int(inicio_y)),
-                    (int(fin_x), int(fin_y)),
-                    2,
-                )
-
-            # === Borde brillante del ovillo ===
-            color_brillo = (
-                int(255 * pulso_brillo),
-                int(215 * pulso_brillo),
-                int(100 * pulso_brillo),
-            )
-            pygame.draw.circle(pantalla, color_brillo, (cx, cy), int(radio_ovillo), 2)
+        # Frame de la animación correspondiente al frame_count actual
+        frames = self.obtener_frames_obsequio()
+        paso = (frame_count % self.CICLO_ANIMACION_OBSEQUIO) // (
+            self.PASO_ANIMACION_OBSEQUIO
+        )
+        frame = frames[paso]
+        centro = frame.get_width() // 2
+
+        # Esquina superior izquierda del frame para que quede centrado en la celda
+        base_x = celda_size // 2 + offset_x - centro
+        base_y = celda_size // 2 + offset_y - centro
 
-            # === Destello central (núcleo del hilo) ===
-            pygame.draw.circle(pantalla, (255, 235, 150), (cx - 2, cy - 2), 3)
-            pygame.draw.circle(pantalla, (255, 255, 200), (cx - 2, cy - 2), 1)
+        return [
+            (frame, (col * celda_size + base_x, fila * celda_size + base_y))
+            for col, fila in self._obsequios
+        ]
 
     def generar_muros_rect(
         self, tam_celda: int, offset_x: int, offset_y: int
@@ -415,15 +726,12 @@ class Laberinto:
         Returns:
             Lista de pygame.Rect, uno por cada muro
         """
-        muros = []
-        for fila in range(len(self.laberinto)):
-            for col in range(len(self.laberinto[0])):
-                if self.laberinto[fila][col] == 1:  # 1 = muro
-                    x = col * tam_celda + offset_x
-                    y = fila * tam_celda + offset_y
-                    rect = pygame.Rect(x, y, tam_celda, tam_celda)
-                    muros.append(rect)
-        return muros
+        return [
+            pygame.Rect(
+                col * tam_celda + offset_x, fila * tam_celda + offset_y, tam_celda, tam_celda
+            )
+            for col, fila in self._muros
+        ]
 
     def calcular_posicion_spawn(
         self,
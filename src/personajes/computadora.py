@@ -4,6 +4,8 @@ from collections import deque
 import pygame
 
 from config.config import ConfigJuego
+from mundo.colision import GrillaColision
+from servicios.gestor_recursos import GestorRecursos
 from utilidades.coordenadas import ConversorCoordenadas
 
 from .personaje import Personaje
@@ -20,11 +22,9 @@ class Computadora(Personaje):
         self.spawn_x = x
         self.spawn_y = y
 
-        # Cargar imagen de la computadora (minotauro)
-        self.imagen = pygame.image.load(
-            "src/assets/imagenes/minotauro.png"
-        ).convert_alpha()
-        self.imagen = pygame.transform.scale(self.imagen, (44, 44))
+        # Imagen del minotauro: se carga al dibujarlo por primera vez, así la
+        # simulación sin ventana no necesita pygame.display
+        self._imagen: pygame.Surface | None = None
 
         # Contador de frames para animación de esfera pulsante
         self._frame_count = 0
@@ -39,11 +39,43 @@ class Computadora(Personaje):
         self._bfs_target_cell: tuple[int, int] | None = None  # Celda objetivo previa
         self._bfs_recalc_cooldown = 0  # Contador para recalcular camino
 
+        # Estrategia de navegación opcional (si es None se usa el BFS propio)
+        self.navegacion = None
+
+        # Colisiones del movimiento legacy (ver actualizar_muros_cache)
+        self._grilla_colision: GrillaColision | None = None
+
+    @property
+    def imagen(self) -> pygame.Surface:
+        """Imagen del minotauro (requiere una ventana creada la primera vez)."""
+        if self._imagen is None:
+            self._imagen = GestorRecursos().imagen(
+                "src/assets/imagenes/minotauro.png", (44, 44)
+            )
+        return self._imagen
+
+    @imagen.setter
+    def imagen(self, valor: pygame.Surface) -> None:
+        """Reemplaza la imagen del minotauro."""
+        self._imagen = valor
+
     @property
     def computadora_principal(self) -> pygame.Rect:
         """Rect de colisión de la computadora (propiedad de solo lectura)."""
         return self._rect
 
+    def establecer_navegacion(self, navegacion) -> None:
+        """
+        Asigna la estrategia de navegación usada por perseguir_bfs.
+
+        Args:
+            navegacion: EstrategiaNavegacion (tabla de rutas, BFS, ...) o None
+                        para volver al BFS propio sobre la matriz
+        """
+        self.navegacion = navegacion
+        self._bfs_camino = None
+        self._bfs_target_cell = None
+
     def _calcular_camino_bfs(
         self, mapa: list[list[int]], start: tuple[int, int], goal: tuple[int, int]
     ):
@@ -104,6 +136,8 @@ class Computadora(Personaje):
         - Recalcula camino solo si el jugador cambia de celda
         - O cada 'recalc_every' frames para adaptarse a movimientos
         - Movimiento suave interpolando entre centros de celdas
+        - Con una estrategia de navegación asignada solo se pide el siguiente
+          paso (consulta O(1) con tabla de rutas) en lugar del camino completo
         """
         # Obtener posiciones actuales en el grid
         comp_cx, comp_cy = self._rect.center
@@ -126,11 +160,18 @@ class Computadora(Personaje):
             self._bfs_camino is None  # Primera vez
             or self._bfs_target_cell != objetivo  # Jugador cambió de celda
             or self._bfs_recalc_cooldown == 0  # Timeout de recálculo
+            or (self.navegacion is not None and len(self._bfs_camino) <= 1)
         )
 
         if necesita_recalculo:
             start = (fila_c, col_c)
-            path = self._calcular_camino_bfs(mapa, start, objetivo)
+            if self.navegacion is not None:
+                siguiente = self.navegacion.siguiente_paso(
+                    start, objetivo, perseguidor=self
+                )
+                path = None if siguiente is None else [start, siguiente]
+            else:
+                path = self._calcular_camino_bfs(mapa, start, objetivo)
             self._bfs_camino = path
             self._bfs_target_cell = objetivo
             self._bfs_recalc_cooldown = recalc_every
@@ -231,12 +272,11 @@ class Computadora(Personaje):
                 self._rect.height,
             )
 
-            # Verificar colisión con muros
-            hay_colision = False
-            for muro in getattr(self, "_muros_cache", []):
-                if temp_rect.colliderect(muro):
-                    hay_colision = True
-                    break
+            # Verificar colisión con muros (solo las celdas que cubre el rect)
+            hay_colision = (
+                self._grilla_colision is not None
+                and self._grilla_colision.colisiona(temp_rect)
+            )
 
             # Si no hay colisión, aplicar este movimiento
             if not hay_colision:
@@ -246,24 +286,42 @@ class Computadora(Personaje):
         # Si ningún movimiento funciona, quedarse en posición actual
 
     def actualizar_muros_cache(self, muros):
-        """Guarda referencia a muros para optimizar verificación de colisiones"""
+        """Guarda los muros e indexa sus celdas para verificar colisiones"""
         self._muros_cache = muros
+        self._grilla_colision = GrillaColision.desde_muros(muros)
 
     def colisiona_con_muros(self, muros):
         """Método legacy - colisiones ahora manejadas por BFS"""
         self.actualizar_muros_cache(muros)
         return False
 
+    def encolar_dibujo(self, cola, capa):
+        """
+        Agrega el dibujo de la computadora a una ColaRender en lugar de dibujarlo.
+
+        Con imagen es un blit más del lote de la capa; sin ella se encola
+        el dibujo de respaldo (dibujar_computadora_principal).
+        """
+        try:
+            rect_imagen = self.imagen.get_rect(center=self._rect.center)
+        except AttributeError:
+            cola.agregar_dibujo(capa, self.dibujar_computadora_principal)
+            return
+        cola.agregar(capa, self.imagen, rect_imagen)
+
     def dibujar_computadora_principal(self, screen):
         """
         Dibuja a la computadora en la pantalla con su imagen.
         Si no se carga correctamente, dibuja un círculo rojo como respaldo.
+
+        Returns:
+            pygame.Rect del área dibujada
         """
         try:
             # Obtener la posición donde se dibujará (centrando la imagen)
             centro = self._rect.center
             rect_imagen = self.imagen.get_rect(center=centro)
-            screen.blit(self.imagen, rect_imagen)
+            return screen.blit(self.imagen, rect_imagen)
         except AttributeError:
             # En caso de error o si no hay imagen, dibujar círculo con efecto pulsante
             centro = self._rect.center
@@ -279,8 +337,8 @@ class Computadora(Personaje):
             intensidad = int(200 + 55 * abs(math.sin(self._frame_count * 0.15)))
             color_principal = (intensidad, 50, 50)
 
-            # Círculo principal con pulsación
-            pygame.draw.circle(screen, color_principal, centro, int(radio_pulso))
+            # Círculo principal con pulsación (contiene todo lo demás)
+            area = pygame.draw.circle(screen, color_principal, centro, int(radio_pulso))
 
             # Borde blanco para contraste
             pygame.draw.circle(screen, (255, 255, 255), centro, int(radio_pulso), 2)
@@ -296,6 +354,7 @@ class Computadora(Personaje):
             pygame.draw.circle(
                 screen, (255, 255, 255), (centro[0] + ojo_offset, centro[1] - 2), 2
             )
+            return area
 
     def mover(self, direccion: str) -> None:
         """
@@ -3,6 +3,7 @@ import math
 import pygame
 
 from config.config import ConfigJuego
+from servicios.gestor_recursos import GestorRecursos
 
 from .personaje import Personaje
 
@@ -36,9 +37,9 @@ class Jugador(Personaje):
         self.spawn_x = x
         self.spawn_y = y
 
-        # Cargar imagen del jugador
-        self.imagen = pygame.image.load("src/assets/imagenes/teseo.png").convert_alpha()
-        self.imagen = pygame.transform.scale(self.imagen, (50, 50))
+        # Imagen del jugador: se carga al dibujarlo por primera vez, así la
+        # simulación sin ventana no necesita pygame.display
+        self._imagen: pygame.Surface | None = None
 
         # Rect de colisión más ajustado al círculo visual
         # Usamos FACTOR_RECT_COLISION para mejor precisión
@@ -73,6 +74,20 @@ class Jugador(Personaje):
 
     # === PROPERTIES PARA ENCAPSULACIÓN ===
 
+    @property
+    def imagen(self) -> pygame.Surface:
+        """Imagen del jugador (requiere una ventana creada la primera vez)"""
+        if self._imagen is None:
+            self._imagen = GestorRecursos().imagen(
+                "src/assets/imagenes/teseo.png", (50, 50)
+            )
+        return self._imagen
+
+    @imagen.setter
+    def imagen(self, valor: pygame.Surface) -> None:
+        """Reemplaza la imagen del jugador"""
+        self._imagen = valor
+
     @property
     def vidas(self) -> int:
         """Obtiene el número de vidas restantes"""
@@ -118,20 +133,37 @@ class Jugador(Personaje):
         """
         return self._vidas > 0
 
+    def encolar_dibujo(self, cola, capa):
+        """
+        Agrega el dibujo del jugador a una ColaRender en lugar de dibujarlo.
+
+        Con imagen es un blit más del lote de la capa; sin ella se encola
+        el dibujo de respaldo (dibujar_jugador_principal).
+        """
+        try:
+            rect_imagen = self.imagen.get_rect(center=self._rect.center)
+        except AttributeError:
+            cola.agregar_dibujo(capa, self.dibujar_jugador_principal)
+            return
+        cola.agregar(capa, self.imagen, rect_imagen)
+
     def dibujar_jugador_principal(self, pantalla):
         """
         Dibuja al jugador en la pantalla con su imagen.
         Si no se carga correctamente, dibuja un círculo rojo como respaldo.
+
+        Returns:
+            pygame.Rect del área dibujada
         """
         try:
             # Obtener la posición donde se dibujará (centrando la imagen)
             centro = self._rect.center
             rect_imagen = self.imagen.get_rect(center=centro)
-            pantalla.blit(self.imagen, rect_imagen)
+            return pantalla.blit(self.imagen, rect_imagen)
         except AttributeError:
             # En caso de error o si no hay imagen, dibujar círculo
             centro = self._rect.center
-            pygame.draw.circle(pantalla, (255, 0, 0), centro, self.radio)
+            return pygame.draw.circle(pantalla, (255, 0, 0), centro, self.radio)
 
     def actualizar_movimiento(self, dx, dy):
         """
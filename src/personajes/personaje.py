@@ -68,6 +68,15 @@ class Personaje(ABC):
         # Permite cambiar el tamaño del personaje.
         self._radio = nuevo_radio
 
+    def __getstate__(self) -> dict:
+        # Estado para copiar con pickle (instantáneas de la simulación).
+        # La imagen no se copia: las superficies de pygame no se pueden
+        # serializar y se vuelven a cargar la próxima vez que se dibuja.
+        estado = self.__dict__.copy()
+        if "_imagen" in estado:
+            estado["_imagen"] = None
+        return estado
+
     @abstractmethod
     def mover(self, direccion: str) -> None:
         # Este método es obligatorio en las clases hijas.
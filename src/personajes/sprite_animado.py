@@ -1,13 +1,16 @@
 """
 Sistema de sprites animados para personajes del juego.
 
-Maneja la carga y animación de spritesheets con metadata.
+Maneja la carga y animación de spritesheets con metadata. Las hojas y los
+frames recortados (y reescalados) salen de la caché compartida de
+GestorRecursos, así que varias instancias del mismo sprite no repiten el
+trabajo.
 """
 
 import json
 from pathlib import Path
 
-import pygame
+from servicios.gestor_recursos import GestorRecursos
 
 
 class SpriteAnimado:
@@ -18,7 +21,7 @@ class SpriteAnimado:
     - Carga spritesheet con metadata JSON
     - Soporte para múltiples animaciones
     - Control de velocidad de animación
-    - Flip horizontal automático
+    - Flip horizontal automático (frames espejados precalculados)
     """
 
     def __init__(self, spritesheet_path, frame_width=32, frame_height=48):
@@ -30,14 +33,13 @@ class SpriteAnimado:
             frame_width: Ancho de cada frame individual
             frame_height: Alto de cada frame individual
         """
-        # Cargar spritesheet
-        try:
-            self.spritesheet = pygame.image.load(spritesheet_path).convert_alpha()
-        except pygame.error:
-            # Si no hay display configurado, cargar sin convert_alpha
-            self.spritesheet = pygame.image.load(spritesheet_path)
-
-        # Dimensiones de frames
+        # Cargar spritesheet (sin display configurado queda sin convert_alpha)
+        self.ruta = spritesheet_path
+        self.spritesheet = GestorRecursos().imagen(spritesheet_path)
+
+        # Dimensiones de frames (en la hoja y en pantalla)
+        self.ancho_hoja = frame_width
+        self.alto_hoja = frame_height
         self.frame_width = frame_width
         self.frame_height = frame_height
 
@@ -50,18 +52,9 @@ class SpriteAnimado:
         # Dirección
         self.flip_horizontal = False
 
-        # Extraer frames del spritesheet
-        self._extraer_frames()
-
-    def _extraer_frames(self):
-        """Extrae todos los frames del spritesheet."""
         # Theseus spritesheet: 1024x96
         # Estructura: idle(2), run(6), jump(2), slide(2), death(4) = 16 frames
         # Frame size: 64x96 (32x48 base escalado x2)
-
-        ancho_sheet = self.spritesheet.get_width()
-        frames_totales = ancho_sheet // self.frame_width
-
         self.animaciones = {
             "idle": {"frames": [], "inicio": 0, "cantidad": 2},
             "run": {"frames": [], "inicio": 2, "cantidad": 6},
@@ -70,26 +63,36 @@ class SpriteAnimado:
             "death": {"frames": [], "inicio": 12, "cantidad": 4},
         }
 
-        # Extraer cada frame
-        for anim_nombre, anim_data in self.animaciones.items():
-            inicio = anim_data["inicio"]
-            cantidad = anim_data["cantidad"]
+        # Extraer frames del spritesheet
+        self._extraer_frames()
 
-            for i in range(cantidad):
-                x = (inicio + i) * self.frame_width
-                y = 0
+    def _extraer_frames(self, tamaño=None):
+        """
+        Extrae los frames de cada animación de self.animaciones.
 
-                # Crear superficie para el frame
-                frame = pygame.Surface(
-                    (self.frame_width, self.frame_height), pygame.SRCALPHA
-                )
-                frame.blit(
-                    self.spritesheet,
-                    (0, 0),
-                    (x, y, self.frame_width, self.frame_height),
-                )
+        Cada animación guarda también sus frames espejados ("frames_espejados"),
+        así mirar a la izquierda no crea una superficie nueva en cada frame.
 
-                anim_data["frames"].append(frame)
+        Args:
+            tamaño: (ancho, alto) en pantalla; None = tamaño en la hoja
+        """
+        recursos = GestorRecursos()
+        for anim_data in self.animaciones.values():
+            inicio = anim_data["inicio"]
+            recortes = [
+                ((inicio + i) * self.ancho_hoja, 0, self.ancho_hoja, self.alto_hoja)
+                for i in range(anim_data["cantidad"])
+            ]
+            anim_data["frames"] = [
+                recursos.imagen(self.ruta, tamaño, recorte=r) for r in recortes
+            ]
+            anim_data["frames_espejados"] = [
+                recursos.imagen(self.ruta, tamaño, flip=True, recorte=r)
+                for r in recortes
+            ]
+
+        if tamaño is not None:
+            self.frame_width, self.frame_height = tamaño
 
     def cambiar_animacion(self, nombre_animacion):
         """
@@ -123,11 +126,9 @@ class SpriteAnimado:
             pygame.Surface: Frame actual con flip aplicado si corresponde
         """
         anim_data = self.animaciones[self.animacion_actual]
-        frame = anim_data["frames"][self.frame_actual]
-
         if self.flip_horizontal:
-            return pygame.transform.flip(frame, True, False)
-        return frame
+            return anim_data["frames_espejados"][self.frame_actual]
+        return anim_data["frames"][self.frame_actual]
 
     def set_direccion(self, moviendo_derecha):
         """
@@ -162,21 +163,10 @@ class SpriteTheseusRunner:
             self._reescalar_frames()
 
     def _reescalar_frames(self):
-        """Reescala todos los frames del sprite."""
-        nuevo_ancho = int(self.sprite.frame_width * self.escala)
-        nuevo_alto = int(self.sprite.frame_height * self.escala)
-
-        for anim_data in self.sprite.animaciones.values():
-            frames_reescalados = []
-            for frame in anim_data["frames"]:
-                frame_reescalado = pygame.transform.scale(
-                    frame, (nuevo_ancho, nuevo_alto)
-                )
-                frames_reescalados.append(frame_reescalado)
-            anim_data["frames"] = frames_reescalados
-
-        self.sprite.frame_width = nuevo_ancho
-        self.sprite.frame_height = nuevo_alto
+        """Reescala todos los frames del sprite, en ambas orientaciones."""
+        nuevo_ancho = int(self.sprite.ancho_hoja * self.escala)
+        nuevo_alto = int(self.sprite.alto_hoja * self.escala)
+        self.sprite._extraer_frames((nuevo_ancho, nuevo_alto))
 
     def actualizar(
         self, moviendo=False, saltando=False, muriendo=False, direccion_derecha=True
@@ -255,21 +245,10 @@ class SpriteMinotaurRunner:
             self._reescalar_frames()
 
     def _reescalar_frames(self):
-        """Reescala todos los frames del sprite."""
-        nuevo_ancho = int(self.sprite.frame_width * self.escala)
-        nuevo_alto = int(self.sprite.frame_height * self.escala)
-
-        for anim_data in self.sprite.animaciones.values():
-            frames_reescalados = []
-            for frame in anim_data["frames"]:
-                frame_reescalado = pygame.transform.scale(
-                    frame, (nuevo_ancho, nuevo_alto)
-                )
-                frames_reescalados.append(frame_reescalado)
-            anim_data["frames"] = frames_reescalados
-
-        self.sprite.frame_width = nuevo_ancho
-        self.sprite.frame_height = nuevo_alto
+        """Reescala todos los frames del sprite, en ambas orientaciones."""
+        nuevo_ancho = int(self.sprite.ancho_hoja * self.escala)
+        nuevo_alto = int(self.sprite.alto_hoja * self.escala)
+        self.sprite._extraer_frames((nuevo_ancho, nuevo_alto))
 
     def actualizar(
         self,
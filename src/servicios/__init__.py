@@ -2,10 +2,11 @@
 Módulo de servicios del juego.
 
 Contiene servicios globales y utilidades del sistema
-(administrador, sistema de sonido).
+(administrador, sistema de sonido, caché de imágenes).
 """
 
 from .administrador import Administrador
+from .gestor_recursos import GestorRecursos
 from .sistema_sonido import SistemaSonido
 
-__all__ = ["Administrador", "SistemaSonido"]
+__all__ = ["Administrador", "GestorRecursos", "SistemaSonido"]
@@ -6,6 +6,7 @@ from datetime import datetime
 from utilidades.helpers import guardar_json, resolver_ruta_laberinto
 
 from config.config_laberinto import ConfigLaberinto
+from jugabilidad.navegacion import ESTRATEGIAS_NAVEGACION
 from mundo.laberinto import Laberinto
 from mundo.salon_fama import SalonFama
 
@@ -184,6 +185,23 @@ class Administrador:
         elif not self._validar_posicion(datos["inicio_computadora"]):
             errores.append("- La posición 'inicio_computadora' tiene formato inválido")
 
+        # Validar minotauros adicionales (opcional)
+        if "inicio_enemigos" in datos:
+            enemigos = datos["inicio_enemigos"]
+            if not isinstance(enemigos, list) or not all(
+                self._validar_posicion(p) for p in enemigos
+            ):
+                errores.append(
+                    "- 'inicio_enemigos' debe ser una lista de posiciones válidas"
+                )
+
+        # Validar estrategia de navegación del enemigo (opcional)
+        if "navegacion" in datos and datos["navegacion"] not in ESTRATEGIAS_NAVEGACION:
+            errores.append(
+                "- 'navegacion' debe ser una de: "
+                + ", ".join(sorted(ESTRATEGIAS_NAVEGACION))
+            )
+
         return errores
 
     def _validar_posicion(self, posicion) -> bool:
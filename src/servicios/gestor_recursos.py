@@ -0,0 +1,172 @@
+"""
+Caché compartida de imágenes y recortes de spritesheets.
+
+Cada imagen se lee del disco una sola vez y cada variante (tamaño, flip,
+modo de conversión, recorte) se calcula una sola vez: todos los personajes,
+pantallas y partidas reciben la misma superficie. La caché lleva la cuenta de
+la memoria de píxeles que ocupa y descarta las entradas usadas hace más
+tiempo cuando se pasa del presupuesto (LRU).
+
+Las superficies entregadas son compartidas: quien necesite modificarlas debe
+trabajar sobre una copia (surface.copy()).
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+from config.config import ConfigJuego
+
+# Modos de conversión al formato de la ventana
+MODO_ALPHA = "alpha"  # convert_alpha(): conserva transparencia
+MODO_OPACO = "opaco"  # convert(): sin transparencia, blit más rápido
+MODO_CRUDO = "crudo"  # Tal como se leyó del archivo (no requiere ventana)
+MODOS = (MODO_ALPHA, MODO_OPACO, MODO_CRUDO)
+
+Clave = tuple[str, tuple | None, tuple[int, int] | None, bool, str]
+
+
+class GestorRecursos:
+    """
+    Singleton con la caché LRU de superficies del juego.
+
+    Las entradas se identifican por (ruta, recorte, tamaño, flip, modo). Las
+    variantes se derivan de otras entradas de la caché (la imagen cruda, el
+    recorte sin escalar...), así que un fallo solo cuesta la transformación
+    que falta. Los contadores incluyen esas consultas intermedias.
+    """
+
+    _instancia = None
+
+    def __new__(cls):
+        if cls._instancia is None:
+            cls._instancia = super().__new__(cls)
+            cls._instancia._inicializado = False
+        return cls._instancia
+
+    def __init__(self):
+        # Solo inicializar una vez
+        if self._inicializado:
+            return
+
+        self.presupuesto_bytes = ConfigJuego.PRESUPUESTO_MEMORIA_RECURSOS
+        self._superficies: OrderedDict[Clave, pygame.Surface] = OrderedDict()
+        self.bytes_usados = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+
+        self._inicializado = True
+
+    @classmethod
+    def obtener(cls):
+        """Método alternativo para obtener la instancia."""
+        return cls()
+
+    @staticmethod
+    def bytes_superficie(superficie: pygame.Surface) -> int:
+        """Memoria de píxeles de una superficie (ancho x alto x bytes por píxel)."""
+        ancho, alto = superficie.get_size()
+        return ancho * alto * superficie.get_bytesize()
+
+    def imagen(
+        self,
+        ruta: str,
+        tamaño: tuple[int, int] | None = None,
+        flip: bool = False,
+        modo: str = MODO_ALPHA,
+        recorte: tuple[int, int, int, int] | None = None,
+    ) -> pygame.Surface:
+        """
+        Superficie compartida para una imagen o un recorte de ella.
+
+        Si la conversión al formato de la ventana falla (todavía no hay
+        ventana), se entrega la versión cruda sin guardarla bajo el modo
+        pedido, para convertirla cuando la ventana exista.
+
+        Args:
+            ruta: Archivo de imagen
+            tamaño: (ancho, alto) final; None = tamaño original
+            flip: True para espejar horizontalmente
+            modo: MODO_ALPHA, MODO_OPACO o MODO_CRUDO
+            recorte: (x, y, ancho, alto) dentro de la imagen; None = completa
+
+        Returns:
+            pygame.Surface (no modificar: es compartida)
+        """
+        if modo not in MODOS:
+            raise ValueError(f"Modo de conversión desconocido: {modo!r}")
+        if recorte is not None:
+            recorte = tuple(recorte)
+        if tamaño is not None:
+            tamaño = tuple(tamaño)
+
+        clave = (ruta, recorte, tamaño, flip, modo)
+        superficie = self._superficies.get(clave)
+        if superficie is not None:
+            self._superficies.move_to_end(clave)
+            self.aciertos += 1
+            return superficie
+        self.fallos += 1
+
+        try:
+            superficie = self._crear(ruta, recorte, tamaño, flip, modo)
+        except pygame.error:
+            if modo == MODO_CRUDO:
+                raise
+            # Sin ventana no hay formato al cual convertir
+            return self.imagen(ruta, tamaño, flip, MODO_CRUDO, recorte)
+
+        self._guardar(clave, superficie)
+        return superficie
+
+    def _crear(self, ruta, recorte, tamaño, flip, modo) -> pygame.Surface:
+        """Deriva la variante pedida a partir de la anterior en la cadena."""
+        if modo != MODO_CRUDO:
+            base = self.imagen(ruta, tamaño, flip, MODO_CRUDO, recorte)
+            return base.convert_alpha() if modo == MODO_ALPHA else base.convert()
+        if flip:
+            derecha = self.imagen(ruta, tamaño, False, modo, recorte)
+            return pygame.transform.flip(derecha, True, False)
+        if tamaño is not None:
+            original = self.imagen(ruta, None, False, modo, recorte)
+            return pygame.transform.scale(original, tamaño)
+        if recorte is not None:
+            # Copia: un subsurface mantendría viva la hoja completa
+            return self.imagen(ruta, modo=modo).subsurface(recorte).copy()
+        return pygame.image.load(ruta)
+
+    def _guardar(self, clave: Clave, superficie: pygame.Surface) -> None:
+        """Agrega una entrada y desaloja las menos usadas si se pasa del presupuesto."""
+        self._superficies[clave] = superficie
+        self.bytes_usados += self.bytes_superficie(superficie)
+        # La entrada recién agregada nunca se desaloja (aunque sola no entre)
+        while self.bytes_usados > self.presupuesto_bytes and len(self._superficies) > 1:
+            _, vieja = self._superficies.popitem(last=False)
+            self.bytes_usados -= self.bytes_superficie(vieja)
+            self.desalojos += 1
+
+    def limpiar(self) -> None:
+        """Vacía la caché y reinicia los contadores."""
+        self._superficies.clear()
+        self.bytes_usados = 0
+        self.aciertos = self.fallos = self.desalojos = 0
+
+    def estadisticas(self) -> dict:
+        """Contadores de uso: entradas, memoria, aciertos, fallos y desalojos."""
+        consultas = self.aciertos + self.fallos
+        return {
+            "entradas": len(self._superficies),
+            "bytes": self.bytes_usados,
+            "presupuesto": self.presupuesto_bytes,
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "desalojos": self.desalojos,
+            "tasa_aciertos": self.aciertos / consultas if consultas else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._superficies)
+
+    def __contains__(self, clave) -> bool:
+        return clave in self._superficies
@@ -236,5 +236,97 @@ class TestCargaArchivosReales:
             pytest.skip("Archivo laberinto1.json no encontrado")
 
 
+class TestIndiceCeldas:
+    """Consultas O(1) de transitabilidad sobre la grilla del laberinto"""
+
+    def test_es_muro_y_es_transitable(self, mapa_valido):
+        """Las consultas coinciden con los valores del mapa"""
+        laberinto = Laberinto(mapa_valido)
+
+        assert laberinto.es_muro((0, 0))
+        assert laberinto.es_muro((2, 2))
+        assert laberinto.es_transitable((1, 1))
+        assert laberinto.es_transitable((3, 2))
+
+    def test_fuera_del_mapa_cuenta_como_muro(self, mapa_valido):
+        """Las posiciones fuera de los límites no son transitables"""
+        laberinto = Laberinto(mapa_valido)
+
+        for posicion in [(-1, 0), (0, -1), (5, 1), (1, 5)]:
+            assert not laberinto.esta_dentro(posicion)
+            assert laberinto.es_muro(posicion)
+            assert not laberinto.es_paso_valido(posicion)
+
+    def test_vistas_compatibles_con_listas(self, mapa_valido):
+        """_muros y _pasillos siguen funcionando como secuencias de posiciones"""
+        laberinto = Laberinto(mapa_valido)
+
+        assert len(laberinto._muros) == 17
+        assert len(laberinto._pasillos) == 8
+        assert (1, 1) in laberinto._pasillos
+        assert (1, 1) not in laberinto._muros
+        assert laberinto._pasillos[0] == (1, 1)
+        assert set(laberinto._pasillos) | set(laberinto._muros) == {
+            (col, fila) for fila in range(5) for col in range(5)
+        }
+
+    def test_spawns_de_enemigos_adicionales(self, mapa_valido):
+        """'inicio_enemigos' agrega minotauros al spawn principal"""
+        mapa_valido["inicio_computadora"] = {"col": 3, "fila": 3}
+        mapa_valido["inicio_enemigos"] = [{"col": 1, "fila": 3}, [3, 1]]
+        laberinto = Laberinto(mapa_valido)
+
+        assert laberinto.enemigos_inicio == [(1, 3), (3, 1)]
+        assert laberinto.spawns_computadoras == [(3, 3), (1, 3), (3, 1)]
+
+    def test_laberinto_grande(self):
+        """Un mapa de 300x300 se carga y consulta sin degradación cuadrática"""
+        lado = 300
+        mapa = [
+            [1 if fila % 2 == 1 and col % 4 != 0 else 0 for col in range(lado)]
+            for fila in range(lado)
+        ]
+        laberinto = Laberinto({"mapa": mapa})
+
+        assert laberinto.filas == lado
+        assert laberinto.columnas == lado
+        for fila in range(lado):
+            for col in range(lado):
+                assert laberinto.es_muro((col, fila)) == (mapa[fila][col] == 1)
+        assert len(laberinto._muros) + len(laberinto._pasillos) == lado * lado
+
+    def test_cambiar_celda_sin_reprocesar(self, mapa_valido, monkeypatch):
+        """cambiar_celda corrige grilla y vistas en el lugar y registra la celda"""
+        laberinto = Laberinto(mapa_valido)
+        version = laberinto.version_mapa
+        monkeypatch.setattr(laberinto, "_procesar_laberinto", pytest.fail)
+
+        laberinto.cambiar_celda((2, 2), 0)
+        laberinto.cambiar_celda((1, 1), 1)
+
+        assert not laberinto.es_muro((2, 2))
+        assert laberinto.es_muro((1, 1))
+        assert (2, 2) in laberinto._pasillos and (2, 2) not in laberinto._muros
+        assert (1, 1) in laberinto._muros and (1, 1) not in laberinto._pasillos
+        assert len(laberinto._pasillos) == 8
+        assert laberinto._pasillos[0] == (2, 1)
+        assert laberinto.celdas_cambiadas_desde(version) == [12, 6]
+        assert laberinto.celdas_cambiadas_desde(version + 1) == [6]
+        assert laberinto.celdas_cambiadas_desde(laberinto.version_mapa) == []
+
+    def test_registro_de_cambios_acotado(self, mapa_valido, monkeypatch):
+        """Si el registro ya no llega a una versión, pide reconstruir todo"""
+        monkeypatch.setattr(Laberinto, "MAX_REGISTRO_CAMBIOS", 4)
+        laberinto = Laberinto(mapa_valido)
+        version = laberinto.version_mapa
+
+        for _ in range(3):
+            laberinto.cambiar_celda((2, 2), 0)
+            laberinto.cambiar_celda((2, 2), 1)
+
+        assert laberinto.celdas_cambiadas_desde(version) is None
+        assert laberinto.celdas_cambiadas_desde(laberinto.version_mapa - 1) == [12]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -209,3 +209,219 @@ class TestDimensionesPantallas:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestEsperaEventos:
+    """Tests del loop de menús dirigido por eventos"""
+
+    @pytest.fixture
+    def boton(self, pantalla_test):
+        from interfaz.componentes.boton_adaptable import BotonGrande
+
+        return BotonGrande(100, 100, "Jugar", 1)
+
+    def _mover_mouse(self, boton, pos):
+        evento = pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=())
+        boton.manejar_evento(evento, pos)
+        return [evento]
+
+    def test_sin_cambios_no_redibuja(self, boton):
+        """Quieto o moviendo el mouse fuera de los botones no se redibuja"""
+        from interfaz.espera_eventos import EsperaEventos
+
+        espera = EsperaEventos([boton])
+        assert espera.hay_que_dibujar([])  # El primer frame siempre se dibuja
+        assert not espera.hay_que_dibujar([])
+        assert not espera.hay_que_dibujar(self._mover_mouse(boton, (0, 0)))
+        assert not espera.hay_que_dibujar(self._mover_mouse(boton, (5, 5)))
+
+    def test_cambio_de_hover_redibuja(self, boton):
+        """Entrar o salir de un botón obliga a redibujar una vez"""
+        from interfaz.espera_eventos import EsperaEventos
+
+        espera = EsperaEventos([boton])
+        espera.hay_que_dibujar([])
+        assert espera.hay_que_dibujar(self._mover_mouse(boton, boton.rect.center))
+        assert not espera.hay_que_dibujar(
+            self._mover_mouse(boton, (boton.rect.centerx + 1, boton.rect.centery))
+        )
+        assert espera.hay_que_dibujar(self._mover_mouse(boton, (0, 0)))
+
+    def test_teclas_redibujan(self, boton):
+        """Cualquier evento que no sea mover el mouse redibuja"""
+        from interfaz.espera_eventos import EsperaEventos
+
+        espera = EsperaEventos([boton])
+        espera.hay_que_dibujar([])
+        tecla = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, unicode="a")
+        assert espera.hay_que_dibujar([tecla])
+
+    def test_espera_vence_sin_eventos(self):
+        """Sin eventos la espera devuelve una lista vacía al vencer el plazo"""
+        from interfaz.espera_eventos import esperar_eventos
+
+        pygame.event.clear()
+        assert esperar_eventos(10) == []
+
+        pygame.event.post(pygame.event.Event(pygame.USEREVENT))
+        assert [e.type for e in esperar_eventos(1000)] == [pygame.USEREVENT]
+
+    def test_cursor_activo_acorta_la_espera(self, pantalla_test):
+        """Un input con foco despierta el loop a tiempo para parpadear"""
+        from interfaz.componentes.input_texto import InputTexto
+        from interfaz.espera_eventos import EsperaEventos
+
+        campo = InputTexto(10, 10, 200, 40)
+        espera = EsperaEventos([campo], espera_maxima_ms=1000)
+        assert espera._espera_ms() == 1000
+
+        campo.activo = True
+        assert espera._espera_ms() <= InputTexto.MS_PARPADEO_CURSOR
+
+
+class EscenaPrueba:
+    """Fábrica de escenas de prueba que terminan al recibir un USEREVENT"""
+
+    @staticmethod
+    def crear(resultado="hecho", continua=False):
+        from interfaz.escenas import CONTINUAR, Escena
+
+        class _Escena(Escena):
+            def __init__(self):
+                self.entradas = 0
+                self.dibujos = 0
+                self.actualizaciones = 0
+
+            def al_entrar(self):
+                self.entradas += 1
+
+            def manejar_evento(self, evento, mouse_pos):
+                if evento.type == pygame.USEREVENT:
+                    return resultado
+                return CONTINUAR
+
+            def actualizar(self):
+                self.actualizaciones += 1
+                return CONTINUAR
+
+            def dibujar(self):
+                self.dibujos += 1
+
+        _Escena.continua = continua
+        return _Escena()
+
+
+class TestGestorEscenas:
+    """Tests de la pila de escenas con un único loop"""
+
+    @pytest.fixture
+    def gestor(self, pantalla_test):
+        from interfaz.escenas import GestorEscenas
+
+        pygame.event.clear()
+        return GestorEscenas()
+
+    def _terminar_escena_actual(self, gestor):
+        pygame.event.post(pygame.event.Event(pygame.USEREVENT))
+        gestor.frame()
+
+    def test_resultado_llega_al_callback(self, gestor):
+        """Al terminar, la escena sale de la pila y entrega su resultado"""
+        resultados = []
+        escena = EscenaPrueba.crear(resultado=None)
+        gestor.apilar(escena, resultados.append)
+
+        gestor.frame()
+        assert escena.dibujos == 1  # La escena nueva se dibuja sin esperar
+        self._terminar_escena_actual(gestor)
+
+        assert resultados == [None]  # None también es un resultado
+        assert len(gestor) == 0
+
+    def test_escena_persistente_se_reanuda(self, gestor):
+        """El menú persistente se reanuda (sin reconstruirse) al cerrar lo de encima"""
+        menu = EscenaPrueba.crear(resultado=1)
+        submenu = EscenaPrueba.crear()
+        gestor.apilar(menu, lambda _: gestor.apilar(submenu), persistente=True)
+
+        gestor.frame()
+        self._terminar_escena_actual(gestor)  # El menú elige una opción
+        assert gestor.escena_actual is submenu
+        assert menu in gestor
+
+        gestor.frame()
+        self._terminar_escena_actual(gestor)  # Se cierra el submenú
+        assert gestor.escena_actual is menu
+
+        dibujos = menu.dibujos
+        gestor.frame()  # El cambio de escena se dibuja en un solo frame
+        assert menu.dibujos == dibujos + 1
+        assert menu.entradas == 2
+
+    def test_quitar_y_detener(self, gestor):
+        """quitar() saca una escena persistente y detener() corta el loop"""
+        menu = EscenaPrueba.crear()
+        submenu = EscenaPrueba.crear(resultado=3)
+
+        def al_elegir(opcion):
+            gestor.quitar(submenu)
+            gestor.detener()
+
+        gestor.apilar(menu)
+        gestor.apilar(submenu, al_elegir, persistente=True)
+        pygame.event.post(pygame.event.Event(pygame.USEREVENT))
+        gestor.ejecutar()
+
+        assert gestor.escena_actual is menu
+        assert menu.dibujos == 0  # El loop se detuvo antes de reanudarlo
+
+    def test_escena_continua_avanza_cada_frame(self, gestor):
+        """Las escenas continuas se actualizan y dibujan en cada frame"""
+        partida = EscenaPrueba.crear(continua=True)
+        gestor.apilar(partida)
+        for _ in range(3):
+            gestor.frame()
+        assert partida.actualizaciones == 3
+        assert partida.dibujos == 3
+
+    def test_partida_usa_la_ventana_existente(self, pantalla_test, monkeypatch):
+        """Entrar a la partida no vuelve a crear la ventana"""
+        from interfaz.pantallas.pantalla_juego import PantallaJuego
+
+        pantalla = PantallaJuego(
+            "Tester", ruta_laberinto="src/data/laberintos/laberinto1.json"
+        )
+
+        def no_crear(*args, **kwargs):
+            raise AssertionError("set_mode no debe llamarse")
+
+        monkeypatch.setattr(pygame.display, "set_mode", no_crear)
+        pantalla.al_entrar()
+        assert pantalla.screen is pygame.display.get_surface()
+
+    @pytest.mark.parametrize("nombre_clase", ["iniciar_juego", "carga_laberinto"])
+    def test_pantalla_reabierta_sin_texto_anterior(
+        self, gestor, pantalla_test, nombre_clase
+    ):
+        """Una pantalla reutilizada no muestra lo escrito en la visita anterior"""
+        from interfaz.pantallas.pantalla_carga_laberinto import PantallaCargaLaberinto
+        from interfaz.pantallas.pantalla_iniciar_juego import PantallaIniciarJuego
+
+        if nombre_clase == "iniciar_juego":
+            pantalla = PantallaIniciarJuego(pantalla_test)
+            entrada = pantalla.input_nombre
+        else:
+            pantalla = PantallaCargaLaberinto(pantalla_test, admin=None)
+            entrada = pantalla.input_ruta
+
+        for _ in range(2):
+            gestor.apilar(pantalla)
+            gestor.frame()
+            assert entrada.texto == ""
+            entrada.activo = True
+            tecla = pygame.event.Event(
+                pygame.KEYDOWN, key=pygame.K_a, unicode="a", mod=0
+            )
+            pantalla.manejar_evento(tecla, (0, 0))
+            assert entrada.texto == "a"
+            gestor.quitar(pantalla)
@@ -6,6 +6,8 @@ Verificar que el jugador se mueve correctamente con las teclas de dirección.
 import pygame
 import pytest
 
+from jugabilidad.gestores.gestor_movimiento import GestorMovimiento
+from mundo.colision import GrillaColision
 from personajes.jugador import Jugador
 from mundo.laberinto import Laberinto
 
@@ -147,5 +149,70 @@ class TestLimitesLaberinto:
         assert laberinto_simple.mapa_data["mapa"][filas - 1][columnas - 1] == "#"
 
 
+MAPA_COLISIONES = [
+    [1, 1, 1, 1, 1],
+    [1, 0, 0, 0, 1],
+    [1, 0, 1, 0, 1],
+    [1, 0, 0, 0, 1],
+    [1, 1, 1, 1, 1],
+]
+
+
+class TestGrillaColision:
+    """Colisiones por celdas equivalentes a recorrer los Rects de los muros"""
+
+    def test_equivale_a_colliderect(self):
+        grilla = GrillaColision(MAPA_COLISIONES, 32, 10, 20)
+        muros = Laberinto({"mapa": MAPA_COLISIONES}).generar_muros_rect(32, 10, 20)
+        for x in range(0, 180, 7):
+            for y in range(10, 190, 7):
+                rect = pygame.Rect(x, y, 21, 21)
+                assert grilla.colisiona(rect) == (rect.collidelist(muros) >= 0)
+
+    def test_desde_muros(self):
+        muros = Laberinto({"mapa": MAPA_COLISIONES}).generar_muros_rect(32, 10, 20)
+        grilla = GrillaColision.desde_muros(muros)
+        assert grilla.colisiona(pygame.Rect(70, 80, 10, 10))  # Toca el muro central
+        assert not grilla.colisiona(pygame.Rect(42, 52, 10, 10))
+
+    def test_barrido_se_detiene_en_la_pared(self):
+        grilla = GrillaColision(MAPA_COLISIONES, 32)
+        rect = pygame.Rect(36, 36, 20, 20)  # Dentro de la celda (1, 1)
+
+        assert grilla.barrer(rect, -10, 0) == (-4, 0)
+        assert grilla.barrer(rect, 80, 0) == (72, 0)  # Hasta el muro de la columna 4
+        assert grilla.barrer(rect, 0, 30) == (0, 30)  # Pasillo (1, 2) libre
+        assert grilla.barrer(rect, 40, 40) == (40, 8)  # Desliza sobre el muro central
+
+    def test_costo_no_depende_de_la_cantidad_de_muros(self):
+        mapa = [[1] * 300 for _ in range(300)]
+        mapa[150][150] = 0
+        grilla = GrillaColision(mapa, 32)
+        consultas = []
+        grilla.es_muro = lambda col, fila: consultas.append((col, fila)) or mapa[fila][col] == 1
+
+        assert not grilla.colisiona(pygame.Rect(150 * 32 + 4, 150 * 32 + 4, 20, 20))
+        assert len(consultas) == 1
+
+
+class TestMovimientoContinuo:
+    """Modo pixel a pixel con barrido contra la grilla"""
+
+    def test_queda_pegado_a_la_pared(self, pantalla_test):
+        jugador = Jugador(33, 33, 12)
+        rect = jugador.jugador_principal
+        rect.topleft = (34, 40)
+        gestor = GestorMovimiento(
+            jugador, [], 32, 0, 0, MAPA_COLISIONES, movimiento_por_celdas=False
+        )
+
+        gestor._mover_continuo("left")
+
+        assert rect.left == 32
+        gestor._mover_continuo("left")
+        assert rect.left == 32
+        assert gestor.detectar_colision()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,621 @@
+"""
+Tests de las estrategias de navegación de la computadora.
+Verificar que todas encuentran caminos mínimos equivalentes al BFS original.
+"""
+
+import random
+
+import pygame
+import pytest
+
+from config.config import ConfigJuego
+from jugabilidad.navegacion import (
+    NavegacionAStar,
+    NavegacionBFS,
+    NavegacionCampoFlujo,
+    NavegacionDStarLite,
+    NavegacionGrafoUniones,
+    NavegacionHPA,
+    NavegacionJPS,
+    NavegacionTablaRutas,
+    crear_navegacion,
+)
+from mundo.laberinto import Laberinto
+
+LABERINTOS_INCLUIDOS = [
+    "src/data/laberintos/laberinto1.json",
+    "src/data/laberintos/laberinto2.json",
+    "src/data/laberintos/laberinto3.json",
+]
+
+
+@pytest.fixture
+def laberinto_pequeno():
+    """Laberinto 5x5 con una isla central y una celda aislada"""
+    return Laberinto(
+        {
+            "mapa": [
+                [0, 0, 0, 0, 1],
+                [0, 1, 1, 0, 1],
+                [0, 0, 0, 0, 1],
+                [1, 1, 1, 1, 1],
+                [0, 1, 1, 1, 1],
+            ]
+        }
+    )
+
+
+def _celdas(laberinto):
+    """Celdas transitables en formato (fila, col)"""
+    return [(fila, col) for col, fila in laberinto._pasillos]
+
+
+def _largo_camino(estrategia, inicio, objetivo):
+    """Número de pasos del camino, validando que cada paso sea adyacente y libre"""
+    camino = estrategia.calcular_camino(inicio, objetivo)
+    if camino is None:
+        return None
+    assert camino[0] == inicio and camino[-1] == objetivo
+    for (f1, c1), (f2, c2) in zip(camino[:-1], camino[1:], strict=True):
+        assert abs(f1 - f2) + abs(c1 - c2) == 1
+        assert estrategia.es_transitable((f2, c2))
+    return len(camino) - 1
+
+
+class TestNavegacionBFS:
+    """Estrategia BFS equivalente a Computadora._calcular_camino_bfs"""
+
+    def test_camino_minimo(self, laberinto_pequeno):
+        bfs = NavegacionBFS(laberinto_pequeno)
+        assert _largo_camino(bfs, (0, 0), (2, 3)) == 5
+
+    def test_sin_camino(self, laberinto_pequeno):
+        bfs = NavegacionBFS(laberinto_pequeno)
+        assert bfs.calcular_camino((0, 0), (4, 0)) is None
+        assert bfs.siguiente_paso((0, 0), (4, 0)) is None
+
+    def test_muro_o_fuera_del_mapa(self, laberinto_pequeno):
+        bfs = NavegacionBFS(laberinto_pequeno)
+        assert bfs.siguiente_paso((1, 1), (0, 0)) is None
+        assert bfs.siguiente_paso((0, 0), (9, 9)) is None
+
+    def test_cuenta_nodos_expandidos(self, laberinto_pequeno):
+        bfs = NavegacionBFS(laberinto_pequeno)
+        bfs.siguiente_paso((0, 0), (2, 3))
+        assert bfs.consultas == 1
+        assert bfs.nodos_expandidos > 0
+
+
+class TestTablaRutas:
+    """Tabla de distancias y siguiente paso para todos los pares"""
+
+    def test_siguiente_paso_es_adyacente(self, laberinto_pequeno):
+        tabla = NavegacionTablaRutas(laberinto_pequeno)
+        assert tabla.siguiente_paso((0, 0), (0, 2)) == (0, 1)
+        assert tabla.siguiente_paso((0, 0), (0, 0)) == (0, 0)
+        assert tabla.siguiente_paso((0, 0), (4, 0)) is None
+
+    def test_consulta_sin_expandir_nodos(self, laberinto_pequeno):
+        tabla = NavegacionTablaRutas(laberinto_pequeno)
+        tabla.siguiente_paso((0, 0), (2, 3))
+        assert tabla.nodos_expandidos == 0
+
+    @pytest.mark.parametrize("ruta", LABERINTOS_INCLUIDOS)
+    def test_distancias_iguales_a_bfs(self, ruta):
+        laberinto = Laberinto(ruta)
+        tabla = NavegacionTablaRutas(laberinto)
+        bfs = NavegacionBFS(laberinto)
+        celdas = _celdas(laberinto)
+        for inicio in celdas[::7]:
+            for objetivo in celdas[::5]:
+                esperado = _largo_camino(bfs, inicio, objetivo)
+                assert tabla.distancia(inicio, objetivo) == esperado
+                assert _largo_camino(tabla, inicio, objetivo) == esperado
+
+    def test_se_reconstruye_si_cambia_el_mapa(self, laberinto_pequeno):
+        tabla = NavegacionTablaRutas(laberinto_pequeno)
+        assert tabla.distancia((0, 0), (4, 0)) is None
+
+        laberinto_pequeno.cambiar_celda((0, 3), 0)
+
+        assert tabla.distancia((0, 0), (4, 0)) == 4
+
+    def test_cambios_sucesivos_sin_reconstruir(self, monkeypatch):
+        laberinto = Laberinto(LABERINTOS_INCLUIDOS[1])
+        tabla = NavegacionTablaRutas(laberinto)
+        bfs = NavegacionBFS(laberinto)
+        monkeypatch.setattr(tabla, "_construir", pytest.fail)
+        rng = random.Random(11)
+
+        for _ in range(25):
+            for _ in range(rng.choice((1, 3))):
+                fila = rng.randrange(1, laberinto.filas - 1)
+                col = rng.randrange(1, laberinto.columnas - 1)
+                laberinto.cambiar_celda((col, fila), 1 - laberinto.laberinto[fila][col])
+            celdas = _celdas(laberinto)
+            for inicio in celdas[::13]:
+                for objetivo in celdas[::11]:
+                    esperado = _largo_camino(bfs, inicio, objetivo)
+                    assert tabla.distancia(inicio, objetivo) == esperado
+                    assert _largo_camino(tabla, inicio, objetivo) == esperado
+
+    def test_limite_de_memoria(self, monkeypatch, laberinto_pequeno):
+        monkeypatch.setattr(ConfigJuego, "MAX_BYTES_TABLA_RUTAS", 16)
+        with pytest.raises(ValueError, match="Demasiadas celdas"):
+            NavegacionTablaRutas(laberinto_pequeno)
+
+    def test_limite_de_memoria_al_abrir_celdas(self, monkeypatch, laberinto_pequeno):
+        tabla = NavegacionTablaRutas(laberinto_pequeno)
+        monkeypatch.setattr(ConfigJuego, "MAX_CELDAS_TABLA_RUTAS", len(tabla._celdas))
+
+        laberinto_pequeno.cambiar_celda((0, 3), 0)
+
+        with pytest.raises(ValueError, match="Demasiadas celdas"):
+            tabla.distancia((0, 0), (4, 0))
+
+
+class TestCampoFlujo:
+    """Un BFS inverso desde el objetivo compartido por todos los perseguidores"""
+
+    @pytest.mark.parametrize("ruta", LABERINTOS_INCLUIDOS)
+    def test_distancias_iguales_a_bfs(self, ruta):
+        laberinto = Laberinto(ruta)
+        campo = NavegacionCampoFlujo(laberinto)
+        bfs = NavegacionBFS(laberinto)
+        celdas = _celdas(laberinto)
+        for objetivo in celdas[::9]:
+            for inicio in celdas[::4]:
+                esperado = _largo_camino(bfs, inicio, objetivo)
+                assert campo.distancia(inicio, objetivo) == esperado
+                assert _largo_camino(campo, inicio, objetivo) == esperado
+
+    def test_un_solo_recalculo_por_objetivo(self, laberinto_pequeno):
+        campo = NavegacionCampoFlujo(laberinto_pequeno)
+        for inicio in _celdas(laberinto_pequeno):
+            campo.siguiente_paso(inicio, (2, 3))
+        assert campo.recalculos == 1
+
+        campo.siguiente_paso((0, 0), (2, 2))
+        assert campo.recalculos == 2
+
+    def test_celda_sin_ruta(self, laberinto_pequeno):
+        campo = NavegacionCampoFlujo(laberinto_pequeno)
+        assert campo.siguiente_paso((4, 0), (0, 0)) is None
+        assert campo.distancia((4, 0), (0, 0)) is None
+
+    def test_se_recalcula_si_cambia_el_mapa(self, laberinto_pequeno):
+        campo = NavegacionCampoFlujo(laberinto_pequeno)
+        assert campo.distancia((0, 0), (4, 0)) is None
+
+        laberinto_pequeno.cambiar_celda((0, 3), 0)
+
+        assert campo.distancia((0, 0), (4, 0)) == 4
+
+
+class TestDStarLite:
+    """Planificador incremental: mismo largo de camino que BFS, menos expansiones"""
+
+    @pytest.mark.parametrize("ruta", LABERINTOS_INCLUIDOS)
+    def test_caminos_minimos_con_objetivo_movil(self, ruta):
+        laberinto = Laberinto(ruta)
+        dstar = NavegacionDStarLite(laberinto)
+        bfs = NavegacionBFS(laberinto)
+        celdas = _celdas(laberinto)
+        inicio = celdas[0]
+        # El jugador recorre celdas consecutivas del mapa; el árbol se reutiliza
+        for objetivo in celdas[len(celdas) // 2 :: 3]:
+            assert _largo_camino(dstar, inicio, objetivo) == _largo_camino(
+                bfs, inicio, objetivo
+            )
+
+    def test_reparar_es_mas_barato_que_buscar(self):
+        laberinto = Laberinto({"mapa": [[0] * 30 for _ in range(30)]})
+        dstar = NavegacionDStarLite(laberinto)
+
+        dstar.siguiente_paso((0, 0), (29, 29))
+        busqueda_inicial = dstar.nodos_expandidos
+
+        dstar.siguiente_paso((0, 1), (29, 29))
+        assert dstar.nodos_expandidos - busqueda_inicial < busqueda_inicial // 4
+
+    def test_repara_tras_cambio_del_mapa(self, laberinto_pequeno):
+        dstar = NavegacionDStarLite(laberinto_pequeno)
+        assert dstar.siguiente_paso((0, 0), (2, 0)) == (1, 0)
+
+        # Cerrar el pasillo izquierdo obliga a rodear por la derecha
+        laberinto_pequeno.cambiar_celda((0, 1), 1)
+
+        assert dstar.siguiente_paso((0, 0), (2, 0)) == (0, 1)
+        assert _largo_camino(dstar, (0, 0), (2, 0)) == 8
+
+    def test_repara_tras_varios_cambios(self):
+        laberinto = Laberinto(LABERINTOS_INCLUIDOS[0])
+        dstar = NavegacionDStarLite(laberinto)
+        bfs = NavegacionBFS(laberinto)
+        rng = random.Random(3)
+
+        for _ in range(20):
+            # Varias celdas por vez, y alguna que vuelve a su valor original
+            for _ in range(3):
+                fila = rng.randrange(1, laberinto.filas - 1)
+                col = rng.randrange(1, laberinto.columnas - 1)
+                laberinto.cambiar_celda((col, fila), 1 - laberinto.laberinto[fila][col])
+            celdas = _celdas(laberinto)
+            inicio = celdas[0]
+            for objetivo in celdas[::29]:
+                assert _largo_camino(dstar, inicio, objetivo) == _largo_camino(
+                    bfs, inicio, objetivo
+                )
+
+
+@pytest.fixture
+def laberinto_pasillos():
+    """Pasillo en U invertida con un ramal central: una unión y tres callejones"""
+    return Laberinto(
+        {
+            "mapa": [
+                [1, 1, 1, 1, 1, 1, 1],
+                [1, 0, 0, 0, 0, 0, 1],
+                [1, 0, 1, 0, 1, 0, 1],
+                [1, 0, 1, 0, 1, 0, 1],
+                [1, 0, 0, 1, 0, 0, 1],
+                [1, 1, 1, 1, 1, 1, 1],
+            ]
+        }
+    )
+
+
+class TestGrafoUniones:
+    """Grafo comprimido: nodos en uniones/callejones, aristas por pasillo"""
+
+    def test_nodos_y_aristas(self, laberinto_pasillos):
+        grafo = laberinto_pasillos.grafo_uniones
+        columnas = laberinto_pasillos.columnas
+        nodos = {divmod(n, columnas) for n in grafo.nodos}
+
+        # Unión en (1,3) y callejones al final del ramal y de ambas patas
+        assert nodos == {(1, 3), (3, 3), (4, 2), (4, 4)}
+        pesos = sorted(len(celdas) + 1 for a, b, celdas in grafo.aristas)
+        assert pesos == [2, 6, 6]
+
+    def test_celdas_de_pasillo_ubicadas(self, laberinto_pasillos):
+        grafo = laberinto_pasillos.grafo_uniones
+        transitables = len(laberinto_pasillos._pasillos)
+        en_pasillos = sum(1 for i in grafo.arista_de_celda if i >= 0)
+        assert en_pasillos + len(grafo.nodos) == transitables
+
+    def test_ciclo_sin_uniones(self):
+        laberinto = Laberinto(
+            {"mapa": [[1, 1, 1, 1], [1, 0, 0, 1], [1, 0, 0, 1], [1, 1, 1, 1]]}
+        )
+        grafo = laberinto.grafo_uniones
+        assert len(grafo.nodos) == 1
+        assert len(grafo.aristas) == 1
+
+    def test_se_corrige_al_cambiar_el_mapa(self, laberinto_pasillos):
+        grafo = laberinto_pasillos.grafo_uniones
+        assert laberinto_pasillos.grafo_uniones is grafo
+
+        laberinto_pasillos.cambiar_celda((3, 4), 0)
+
+        # Se corrige el mismo grafo, sin rehacerlo desde cero
+        assert laberinto_pasillos.grafo_uniones is grafo
+        assert grafo.version == laberinto_pasillos.version_mapa
+        uniones = NavegacionGrafoUniones(laberinto_pasillos)
+        bfs = NavegacionBFS(laberinto_pasillos)
+        celdas = _celdas(laberinto_pasillos)
+        for inicio in celdas:
+            for objetivo in celdas:
+                esperado = _largo_camino(bfs, inicio, objetivo)
+                assert uniones.distancia(inicio, objetivo) == esperado
+
+    def test_cambios_sucesivos_iguales_a_bfs(self):
+        laberinto = Laberinto(LABERINTOS_INCLUIDOS[1])
+        uniones = NavegacionGrafoUniones(laberinto)
+        bfs = NavegacionBFS(laberinto)
+        grafo = laberinto.grafo_uniones
+        rng = random.Random(7)
+
+        for _ in range(40):
+            fila = rng.randrange(1, laberinto.filas - 1)
+            col = rng.randrange(1, laberinto.columnas - 1)
+            laberinto.cambiar_celda((col, fila), 1 - laberinto.laberinto[fila][col])
+
+            assert laberinto.grafo_uniones is grafo
+            en_pasillos = sum(1 for i in grafo.arista_de_celda if i >= 0)
+            assert en_pasillos + len(grafo.nodos) == len(laberinto._pasillos)
+            celdas = _celdas(laberinto)
+            for inicio in celdas[::17]:
+                for objetivo in celdas[::13]:
+                    esperado = _largo_camino(bfs, inicio, objetivo)
+                    assert uniones.distancia(inicio, objetivo) == esperado
+
+    @pytest.mark.parametrize("ruta", LABERINTOS_INCLUIDOS)
+    def test_caminos_iguales_a_bfs(self, ruta):
+        laberinto = Laberinto(ruta)
+        uniones = NavegacionGrafoUniones(laberinto)
+        bfs = NavegacionBFS(laberinto)
+        celdas = _celdas(laberinto)
+        for inicio in celdas[::6]:
+            for objetivo in celdas[::5]:
+                esperado = _largo_camino(bfs, inicio, objetivo)
+                assert uniones.distancia(inicio, objetivo) == esperado
+                assert _largo_camino(uniones, inicio, objetivo) == esperado
+
+    def test_expande_menos_nodos_que_bfs(self, laberinto_pasillos):
+        uniones = NavegacionGrafoUniones(laberinto_pasillos)
+        bfs = NavegacionBFS(laberinto_pasillos)
+        uniones.siguiente_paso((4, 1), (4, 5))
+        bfs.siguiente_paso((4, 1), (4, 5))
+        assert uniones.nodos_expandidos < bfs.nodos_expandidos
+
+
+def _seguir_pasos(estrategia, inicio, objetivo, limite=2000):
+    """Avanza con siguiente_paso hasta el objetivo; retorna la cantidad de pasos"""
+    actual = inicio
+    pasos = 0
+    while actual != objetivo and pasos < limite:
+        siguiente = estrategia.siguiente_paso(actual, objetivo)
+        assert siguiente is not None
+        assert abs(siguiente[0] - actual[0]) + abs(siguiente[1] - actual[1]) == 1
+        assert estrategia.es_transitable(siguiente)
+        actual = siguiente
+        pasos += 1
+    assert actual == objetivo
+    return pasos
+
+
+class TestHPA:
+    """Planificador jerárquico: rutas completas y casi óptimas"""
+
+    @pytest.mark.parametrize("ruta", LABERINTOS_INCLUIDOS)
+    def test_llega_con_rutas_casi_optimas(self, ruta):
+        laberinto = Laberinto(ruta)
+        hpa = NavegacionHPA(laberinto, tam_cluster=5)
+        bfs = NavegacionBFS(laberinto)
+        celdas = _celdas(laberinto)
+        optimo = recorrido = 0
+        for inicio in celdas[::11]:
+            for objetivo in celdas[::13]:
+                optimo += _largo_camino(bfs, inicio, objetivo)
+                recorrido += _seguir_pasos(hpa, inicio, objetivo)
+        assert recorrido <= optimo * 1.1
+
+    def test_sin_camino(self, laberinto_pequeno):
+        hpa = NavegacionHPA(laberinto_pequeno, tam_cluster=2)
+        assert hpa.siguiente_paso((0, 0), (4, 0)) is None
+        assert hpa.distancia((0, 0), (4, 0)) is None
+
+    def test_actualiza_solo_clusters_afectados(self, laberinto_pequeno):
+        hpa = NavegacionHPA(laberinto_pequeno, tam_cluster=2)
+        assert hpa.siguiente_paso((0, 0), (4, 0)) is None
+
+        laberinto_pequeno.cambiar_celda((0, 3), 0)
+
+        assert _seguir_pasos(hpa, (0, 0), (4, 0)) == 4
+        reconstruido = NavegacionHPA(laberinto_pequeno, tam_cluster=2)
+        assert hpa._internas == reconstruido._internas
+
+    def test_reutiliza_la_ruta_abstracta(self):
+        laberinto = Laberinto({"mapa": [[0] * 40 for _ in range(10)]})
+        hpa = NavegacionHPA(laberinto, tam_cluster=5)
+
+        hpa.siguiente_paso((0, 0), (9, 39))
+        nodos_primera = hpa.nodos_expandidos
+        hpa.siguiente_paso((1, 0), (9, 39))
+
+        assert hpa.nodos_expandidos - nodos_primera < nodos_primera
+
+    def test_cada_perseguidor_sigue_su_ruta(self):
+        laberinto = Laberinto({"mapa": [[0] * 40 for _ in range(10)]})
+        hpa = NavegacionHPA(laberinto, tam_cluster=5)
+        objetivo = (5, 21)
+
+        # El primero guarda una ruta larga; el segundo está a dos pasos, en
+        # otro cluster, y no debe seguir la ruta ajena
+        hpa.siguiente_paso((0, 0), objetivo)
+        cerca = (5, 19)
+        assert _seguir_pasos(hpa, cerca, objetivo) == 2
+
+    def test_varios_perseguidores_intercalados(self):
+        laberinto = Laberinto(LABERINTOS_INCLUIDOS[2])
+        hpa = NavegacionHPA(laberinto, tam_cluster=5)
+        bfs = NavegacionBFS(laberinto)
+        celdas = _celdas(laberinto)
+        objetivo = celdas[len(celdas) // 2]
+        perseguidores = celdas[::40]
+        optimo = sum(_largo_camino(bfs, c, objetivo) for c in perseguidores)
+
+        pasos = 0
+        while any(c != objetivo for c in perseguidores) and pasos <= 2 * optimo:
+            for i, celda in enumerate(perseguidores):
+                if celda != objetivo:
+                    perseguidores[i] = hpa.siguiente_paso(celda, objetivo, i)
+                    pasos += 1
+        assert pasos <= optimo * 1.02
+
+    def test_perseguidores_en_la_misma_celda(self):
+        laberinto = Laberinto({"mapa": [[0] * 40 for _ in range(10)]})
+        hpa = NavegacionHPA(laberinto, tam_cluster=5)
+        objetivo = (9, 39)
+
+        # Coinciden en una celda: cada uno guarda y sigue su propia ruta
+        paso_a = hpa.siguiente_paso((0, 0), objetivo, "a")
+        hpa.siguiente_paso((0, 0), objetivo, "b")
+        ruta_a, ruta_b = hpa._rutas["a"], hpa._rutas["b"]
+        assert ruta_a is not ruta_b
+
+        # Si b pisa la celda a la que se mandó a, no se lleva la ruta de a
+        hpa.siguiente_paso(paso_a, objetivo, "b")
+        assert hpa._rutas["a"] is ruta_a
+        assert ruta_a["desde"] == 0 and ruta_a["paso"] == paso_a[0] * 40 + paso_a[1]
+
+        nodos = hpa.nodos_expandidos
+        hpa.siguiente_paso(paso_a, objetivo, "a")
+        assert hpa._rutas["a"] is ruta_a
+        assert hpa.nodos_expandidos - nodos < nodos // 3
+
+    def test_muchos_perseguidores_conservan_su_ruta(self):
+        laberinto = Laberinto({"mapa": [[0] * 40 for _ in range(10)]})
+        hpa = NavegacionHPA(laberinto, tam_cluster=5)
+
+        for fila in range(10):
+            hpa.siguiente_paso((fila, 0), (9, 39), fila)
+            hpa.siguiente_paso((fila, 1), (0, 39), fila + 10)
+        assert set(hpa._rutas) == set(range(20))
+
+
+@pytest.fixture
+def arena():
+    """Mapa abierto 20x20 con dos columnas de obstáculos"""
+    mapa = [[0] * 20 for _ in range(20)]
+    for fila in range(3, 17):
+        mapa[fila][6] = 1
+        mapa[19 - fila][13] = 1
+    return Laberinto({"mapa": mapa})
+
+
+class TestAStarYJPS:
+    """Búsquedas informadas: mismos caminos que BFS con menos nodos expandidos"""
+
+    @pytest.mark.parametrize("clase", [NavegacionAStar, NavegacionJPS])
+    @pytest.mark.parametrize("ruta", LABERINTOS_INCLUIDOS)
+    def test_caminos_iguales_a_bfs(self, clase, ruta):
+        laberinto = Laberinto(ruta)
+        estrategia = clase(laberinto)
+        bfs = NavegacionBFS(laberinto)
+        celdas = _celdas(laberinto)
+        for inicio in celdas[::11]:
+            for objetivo in celdas[::7]:
+                esperado = _largo_camino(bfs, inicio, objetivo)
+                assert _largo_camino(estrategia, inicio, objetivo) == esperado
+                paso = estrategia.siguiente_paso(inicio, objetivo)
+                if inicio != objetivo:
+                    assert _largo_camino(bfs, paso, objetivo) == esperado - 1
+
+    @pytest.mark.parametrize("clase", [NavegacionAStar, NavegacionJPS])
+    def test_sin_camino(self, clase, laberinto_pequeno):
+        estrategia = clase(laberinto_pequeno)
+        assert estrategia.siguiente_paso((0, 0), (4, 0)) is None
+        assert estrategia.calcular_camino((0, 0), (4, 0)) is None
+
+    def test_jps_expande_menos_en_arena(self, arena):
+        bfs, astar, jps = NavegacionBFS(arena), NavegacionAStar(arena), NavegacionJPS(arena)
+        for estrategia in (bfs, astar, jps):
+            assert _largo_camino(estrategia, (0, 0), (19, 19)) == 38
+
+        assert jps.nodos_expandidos < astar.nodos_expandidos < bfs.nodos_expandidos
+
+    def test_se_reconstruye_si_cambia_el_mapa(self, laberinto_pequeno):
+        jps = NavegacionJPS(laberinto_pequeno)
+        laberinto_pequeno.cambiar_celda((0, 3), 0)
+        assert _largo_camino(jps, (0, 0), (4, 0)) == 4
+
+    def test_estadisticas_por_consulta(self, arena):
+        astar = NavegacionAStar(arena)
+        astar.siguiente_paso((0, 0), (19, 19))
+        astar.siguiente_paso((0, 0), (0, 5))
+
+        estadisticas = astar.estadisticas()
+        assert estadisticas["consultas"] == 2
+        assert estadisticas["nodos_por_consulta"] == astar.nodos_expandidos / 2
+        assert estadisticas["microsegundos_por_consulta"] > 0
+
+        astar.reiniciar_estadisticas()
+        assert astar.estadisticas()["consultas"] == 0
+
+
+class TestSeleccionNavegacion:
+    """Elección automática según el tamaño del laberinto"""
+
+    def test_laberinto_incluido_usa_tabla(self):
+        laberinto = Laberinto(LABERINTOS_INCLUIDOS[0])
+        assert isinstance(crear_navegacion(laberinto), NavegacionTablaRutas)
+
+    def test_mapa_abierto_grande_usa_campo_flujo(self, monkeypatch):
+        monkeypatch.setattr(ConfigJuego, "MAX_CELDAS_TABLA_RUTAS", 5)
+        laberinto = Laberinto({"mapa": [[0] * 6 for _ in range(6)]})
+        assert isinstance(crear_navegacion(laberinto), NavegacionCampoFlujo)
+
+    def test_laberinto_de_pasillos_usa_grafo(self, monkeypatch, laberinto_pasillos):
+        monkeypatch.setattr(ConfigJuego, "MAX_CELDAS_TABLA_RUTAS", 5)
+        monkeypatch.setattr(ConfigJuego, "FACTOR_COMPRESION_GRAFO_UNIONES", 3)
+        assert isinstance(crear_navegacion(laberinto_pasillos), NavegacionGrafoUniones)
+
+    def test_mapa_enorme_usa_hpa(self, monkeypatch):
+        monkeypatch.setattr(ConfigJuego, "MIN_CELDAS_HPA", 30 * 30)
+        laberinto = Laberinto({"mapa": [[0] * 30 for _ in range(30)]})
+        assert isinstance(crear_navegacion(laberinto), NavegacionHPA)
+
+    def test_limite_de_memoria(self, monkeypatch, laberinto_pequeno):
+        monkeypatch.setattr(ConfigJuego, "MAX_BYTES_TABLA_RUTAS", 16)
+        assert not isinstance(crear_navegacion(laberinto_pequeno), NavegacionTablaRutas)
+
+    def test_tabla_pedida_respeta_el_limite(self, monkeypatch):
+        monkeypatch.setattr(ConfigJuego, "MAX_CELDAS_TABLA_RUTAS", 5)
+        monkeypatch.setattr(
+            ConfigJuego, "NAVEGACION_POR_DIFICULTAD", {"difícil": "tabla"}
+        )
+        mapa = [[0] * 6 for _ in range(6)]
+        laberinto = Laberinto({"mapa": mapa, "navegacion": "tabla"})
+        assert isinstance(crear_navegacion(laberinto), NavegacionCampoFlujo)
+        assert isinstance(crear_navegacion(laberinto, "tabla"), NavegacionCampoFlujo)
+
+        por_dificultad = Laberinto(LABERINTOS_INCLUIDOS[2])
+        assert not isinstance(crear_navegacion(por_dificultad), NavegacionTablaRutas)
+
+    def test_estrategia_pedida_por_el_laberinto(self):
+        laberinto = Laberinto({"mapa": [[0] * 6 for _ in range(6)], "navegacion": "jps"})
+        assert isinstance(crear_navegacion(laberinto), NavegacionJPS)
+        assert isinstance(crear_navegacion(laberinto, "astar"), NavegacionAStar)
+
+    def test_estrategia_por_dificultad(self, monkeypatch):
+        monkeypatch.setattr(ConfigJuego, "NAVEGACION_POR_DIFICULTAD", {"difícil": "astar"})
+        laberinto = Laberinto(LABERINTOS_INCLUIDOS[2])
+        assert isinstance(crear_navegacion(laberinto), NavegacionAStar)
+
+    def test_estrategia_desconocida(self, laberinto_pequeno):
+        with pytest.raises(ValueError):
+            crear_navegacion(laberinto_pequeno, "dijkstra")
+
+
+class TestComputadoraConNavegacion:
+    """La computadora avanza hacia el jugador usando la estrategia asignada"""
+
+    def test_persigue_con_tabla(self):
+        pygame.display.set_mode((200, 200))
+        from personajes.computadora import Computadora
+        from personajes.jugador import Jugador
+
+        laberinto = Laberinto({"mapa": [[0] * 6 for _ in range(3)]})
+        tam = 32
+        computadora = Computadora(5 * tam + 4, tam + 4, radio=12, velocidad=2)
+        jugador = Jugador(4, tam + 4, 12)
+        computadora.establecer_navegacion(NavegacionTablaRutas(laberinto))
+
+        x_inicial = computadora.computadora_principal.centerx
+        for _ in range(60):
+            computadora.perseguir_bfs(jugador, laberinto.laberinto, tam)
+
+        assert computadora.computadora_principal.centerx < x_inicial - 60
+        assert computadora.navegacion.consultas > 0
+
+
+class TestVariosEnemigos:
+    """PantallaJuego crea un minotauro por cada spawn del laberinto"""
+
+    def test_spawns_desde_json(self):
+        import json
+
+        from interfaz.pantallas.pantalla_juego import PantallaJuego
+
+        pygame.display.set_mode((1200, 800))
+        with open(LABERINTOS_INCLUIDOS[0], "r", encoding="utf-8") as f:
+            datos = json.load(f)
+        datos["inicio_enemigos"] = [{"col": 1, "fila": 13}, [18, 1]]
+
+        pantalla = PantallaJuego("Tester", ruta_laberinto=datos)
+
+        assert len(pantalla.computadoras) == 3
+        assert pantalla.computadora is pantalla.computadoras[0]
+        assert all(c.navegacion is pantalla.navegacion for c in pantalla.computadoras)
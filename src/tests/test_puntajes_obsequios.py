@@ -3,9 +3,18 @@ Tests para HU-08, HU-09, HU-10: Sistema de puntajes y obsequios
 Verificar el sistema de puntos y recolección de obsequios.
 """
 
+import random
+
 import pygame
 import pytest
 
+from jugabilidad.gestores.gestor_obsequios import GestorObsequios
+from mundo.celdas_libres import (
+    CeldasLibres,
+    CeldasLibresPonderadas,
+    pesos_por_distancia,
+)
+from mundo.laberinto import Laberinto
 from personajes.jugador import Jugador
 from mundo.obsequio import Obsequio
 
@@ -160,6 +169,123 @@ class TestTiempoVidaObsequios:
         assert obsequio_test.y == 200
 
 
+class TestVencimientoObsequios:
+    """Vencimiento de obsequios en GestorObsequios (heap de ticks absolutos)"""
+
+    @staticmethod
+    def _laberinto_con_obsequios(cantidad):
+        mapa = [[0] * 10 for _ in range(10)]
+        obsequios = [{"posicion": [i % 10, i // 10], "valor": 10} for i in range(cantidad)]
+        return Laberinto({"mapa": mapa, "obsequios": obsequios})
+
+    def test_vence_tras_su_tiempo_de_vida(self):
+        """Un obsequio desaparece y se repone justo al cumplir su tiempo de vida"""
+        laberinto = self._laberinto_con_obsequios(1)
+        gestor = GestorObsequios(laberinto, 5)
+
+        for _ in range(4):
+            gestor.actualizar()
+        assert (0, 0) in laberinto._obsequios
+        assert gestor.obsequios_timers == {(0, 0): 1}
+
+        gestor.actualizar()
+        assert gestor.obsequios_timers.get((0, 0)) != 0
+        assert gestor.obtener_cantidad_activos() == 1  # Repuesto en otra celda
+        assert list(gestor.obsequios_timers.values()) == [5]
+
+    def test_recolectado_no_vence(self):
+        """Al recolectar, su vencimiento pendiente no afecta al obsequio nuevo"""
+        laberinto = self._laberinto_con_obsequios(1)
+        gestor = GestorObsequios(laberinto, 5)
+        gestor.actualizar()
+        assert gestor.verificar_recoleccion((0, 0)) == 10
+        (nueva,) = laberinto._obsequios
+
+        for _ in range(4):
+            gestor.actualizar()
+        assert nueva in laberinto._obsequios  # Su propio vencimiento es en el tick 6
+        gestor.actualizar()
+        assert nueva not in laberinto._obsequios or gestor.obsequios_timers[nueva] == 5
+
+    def test_muchos_obsequios_vencen_juntos(self):
+        """Todos los obsequios iniciales vencen en el mismo frame y se reponen"""
+        laberinto = self._laberinto_con_obsequios(60)
+        gestor = GestorObsequios(laberinto, 3)
+        for _ in range(3):
+            gestor.actualizar()
+        assert gestor.obtener_cantidad_activos() == 60
+        assert set(gestor.obsequios_timers.values()) == {3}
+
+
+class TestCeldasLibres:
+    """Índice de celdas libres para reponer obsequios"""
+
+    def test_quitar_mantiene_el_arreglo_denso(self):
+        """Quitar cualquier celda deja el resto intacto y sin huecos"""
+        libres = CeldasLibres((i, 0) for i in range(6))
+        assert libres.quitar((2, 0))
+        assert libres.quitar((5, 0))  # La última
+        assert not libres.quitar((2, 0))
+        assert sorted(libres) == [(0, 0), (1, 0), (3, 0), (4, 0)]
+        assert all(libres._celdas[i] == c for c, i in libres._indices.items())
+        assert not libres.agregar((0, 0))
+        assert len(libres) == 4
+
+    def test_eleccion_uniforme(self):
+        """Todas las celdas pueden salir y ninguna quitada vuelve a salir"""
+        libres = CeldasLibres((i, 0) for i in range(10))
+        libres.quitar((3, 0))
+        generador = random.Random(1)
+        vistas = {libres.elegir(generador) for _ in range(500)}
+        assert vistas == set(libres)
+        assert CeldasLibres().elegir(generador) is None
+
+    def test_eleccion_ponderada(self):
+        """Con pesos, la frecuencia sigue la proporción de cada celda"""
+        libres = CeldasLibresPonderadas([(0, 0), (1, 0), (2, 0)], {(0, 0): 0.0, (1, 0): 3.0})
+        generador = random.Random(2)
+        cuenta = {(0, 0): 0, (1, 0): 0, (2, 0): 0}
+        for _ in range(4000):
+            cuenta[libres.elegir(generador)] += 1
+        assert cuenta[(0, 0)] == 0
+        assert 2.5 < cuenta[(1, 0)] / cuenta[(2, 0)] < 3.5
+
+        libres.quitar((1, 0))
+        libres.cambiar_peso((0, 0), 1.0)
+        assert libres.peso_total == 2.0
+        assert {libres.elegir(generador) for _ in range(200)} == {(0, 0), (2, 0)}
+
+    def test_pesos_por_distancia(self):
+        """Las celdas más lejanas del origen pesan más"""
+        laberinto = Laberinto({"mapa": [[0, 0, 0, 0], [1, 1, 1, 0]]})
+        pesos = pesos_por_distancia(laberinto, [(0, 0)])
+        assert pesos[(0, 0)] == 1.0
+        assert pesos[(3, 1)] == 5.0
+        assert (0, 1) not in pesos  # Muro
+
+    def test_gestor_no_usa_spawns_ni_celdas_ocupadas(self):
+        """Los obsequios nuevos nunca caen en un spawn ni sobre otro obsequio"""
+        laberinto = Laberinto(
+            {
+                "mapa": [[0] * 5 for _ in range(2)],
+                "inicio_jugador": {"col": 0, "fila": 0},
+                "inicio_computadora": {"col": 4, "fila": 1},
+                "obsequios": [{"posicion": [1, 0], "valor": 10}],
+            }
+        )
+        gestor = GestorObsequios(laberinto, 100, generador=random.Random(3))
+        for _ in range(20):
+            gestor.crear_nuevo_obsequio()
+        # 10 celdas - 2 spawns = 8 lugares; los pedidos de más no hacen nada
+        assert len(laberinto._obsequios) == 8
+        assert (0, 0) not in laberinto._obsequios
+        assert (4, 1) not in laberinto._obsequios
+
+        # Al recolectar, la celda vuelve a estar disponible
+        assert gestor.verificar_recoleccion((1, 0)) == 10
+        assert len(laberinto._obsequios) == 8
+
+
 class TestVisualizacionPuntaje:
     """CP-10: Tests de visualización del puntaje"""
 
@@ -0,0 +1,527 @@
+"""
+Tests de las cachés de renderizado del juego.
+Verificar que las superficies pre-renderizadas se reutilizan entre frames
+y se reconstruyen solo cuando cambia lo que representan.
+"""
+
+import pygame
+import pytest
+
+from interfaz.pantallas.pantalla_juego import PantallaJuego
+from mundo.laberinto import Laberinto
+from servicios.gestor_recursos import MODO_CRUDO, GestorRecursos
+
+
+@pytest.fixture
+def pantalla_juego():
+    """Fixture que crea una PantallaJuego sobre una ventana de prueba"""
+    pygame.init()
+    screen = pygame.display.set_mode((1200, 800))
+    pantalla = PantallaJuego(
+        "Tester", ruta_laberinto="src/data/laberintos/laberinto1.json"
+    )
+    pantalla.screen = screen
+    return pantalla
+
+
+class TestFondoLaberinto:
+    """Tests del fondo del laberinto pre-renderizado"""
+
+    def test_fondo_se_construye_una_sola_vez(self, pantalla_juego):
+        """Verificar que frames consecutivos reutilizan la misma superficie"""
+        pantalla_juego._dibujar_laberinto()
+        fondo = pantalla_juego._fondo_laberinto
+
+        for _ in range(5):
+            pantalla_juego._dibujar_laberinto()
+
+        assert fondo is not None
+        assert pantalla_juego._fondo_laberinto is fondo
+
+    def test_fondo_se_reconstruye_si_cambia_el_layout(self, pantalla_juego):
+        """Verificar que un cambio de mapa invalida el fondo cacheado"""
+        pantalla_juego._dibujar_laberinto()
+        fondo = pantalla_juego._fondo_laberinto
+
+        pantalla_juego.laberinto.version_mapa += 1
+        pantalla_juego._dibujar_laberinto()
+
+        assert pantalla_juego._fondo_laberinto is not fondo
+
+    def test_fondo_se_reconstruye_si_cambia_el_tamano_de_celda(self, pantalla_juego):
+        """Verificar que cambiar tam_celda invalida el fondo cacheado"""
+        pantalla_juego._dibujar_laberinto()
+        pantalla_juego.tam_celda -= 4
+        pantalla_juego._dibujar_laberinto()
+
+        ancho_esperado = len(pantalla_juego.mapa[0]) * pantalla_juego.tam_celda
+        assert pantalla_juego._fondo_laberinto.get_width() == ancho_esperado
+
+    def test_fondo_se_dibuja_en_el_offset(self, pantalla_juego):
+        """Verificar que el muro de la esquina queda en la posición del laberinto"""
+        pantalla_juego.screen.fill((0, 0, 0))
+        pantalla_juego._dibujar_laberinto()
+
+        # Borde de bronce del muro (0, 0), dibujado en la esquina del laberinto
+        color = pantalla_juego.screen.get_at(
+            (pantalla_juego.offset_x, pantalla_juego.offset_y)
+        )
+        assert tuple(color)[:3] == (184, 115, 51)
+
+
+class TestFramesObsequios:
+    """Tests de la animación pre-renderizada de obsequios"""
+
+    def test_frames_cubren_el_ciclo(self):
+        """Verificar que hay un frame por cada paso del ciclo de animación"""
+        frames = Laberinto.obtener_frames_obsequio()
+        pasos = Laberinto.CICLO_ANIMACION_OBSEQUIO // Laberinto.PASO_ANIMACION_OBSEQUIO
+
+        assert len(frames) == pasos
+
+    def test_obsequio_se_dibuja_centrado_en_su_celda(self, pantalla_juego):
+        """Verificar que el ovillo dorado queda en el centro de la celda del obsequio"""
+        laberinto = pantalla_juego.laberinto
+        screen = pantalla_juego.screen
+        screen.fill((0, 0, 0))
+
+        laberinto.dibujar_obsequios(screen, 0, 32, 0, 0)
+
+        assert laberinto._obsequios, "El laberinto de prueba debe tener obsequios"
+        for col, fila in laberinto._obsequios:
+            r, g, b = tuple(screen.get_at((col * 32 + 16, fila * 32 + 16)))[:3]
+            # Tonos dorados: rojo y verde altos, azul bajo
+            assert r > 150 and g > 100 and b < r
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
+
+
+@pytest.fixture
+def recursos():
+    """GestorRecursos vacío con el presupuesto original restaurado al final"""
+    gestor = GestorRecursos()
+    presupuesto = gestor.presupuesto_bytes
+    gestor.limpiar()
+    yield gestor
+    gestor.presupuesto_bytes = presupuesto
+    gestor.limpiar()
+
+
+class TestGestorRecursos:
+    """Tests de la caché compartida de imágenes"""
+
+    RUTA = "src/assets/imagenes/teseo.png"
+
+    def test_imagen_se_comparte(self, recursos, pantalla_test):
+        """Pedir la misma variante dos veces devuelve la misma superficie"""
+        a = recursos.imagen(self.RUTA, (50, 50))
+        b = recursos.imagen(self.RUTA, (50, 50))
+        assert a is b
+        assert a.get_size() == (50, 50)
+        assert recursos.aciertos >= 1
+
+    def test_variantes_distintas(self, recursos, pantalla_test):
+        """Tamaño, flip y recorte forman parte de la clave"""
+        normal = recursos.imagen(self.RUTA, (40, 40))
+        espejada = recursos.imagen(self.RUTA, (40, 40), flip=True)
+        recorte = recursos.imagen(self.RUTA, recorte=(0, 0, 10, 10))
+        assert normal is not espejada
+        assert recorte.get_size() == (10, 10)
+        assert espejada.get_at((0, 20)) == normal.get_at((39, 20))
+
+    def test_personajes_comparten_imagen(self, recursos, pantalla_test):
+        """Dos jugadores usan la misma superficie cargada una sola vez"""
+        from personajes.jugador import Jugador
+
+        uno, otro = Jugador(0, 0, 10), Jugador(50, 50, 10)
+        assert uno.imagen is otro.imagen
+        fallos = recursos.fallos
+        _ = Jugador(0, 0, 10).imagen
+        assert recursos.fallos == fallos
+
+    def test_desaloja_lo_menos_usado(self, recursos):
+        """Al pasar el presupuesto se descartan las entradas más viejas"""
+        a = recursos.imagen(self.RUTA, (20, 20), modo=MODO_CRUDO)
+        por_imagen = GestorRecursos.bytes_superficie(a)
+        recursos.presupuesto_bytes = recursos.bytes_usados + 2 * por_imagen
+        recursos.imagen(self.RUTA, (21, 21), modo=MODO_CRUDO)
+        recursos.imagen(self.RUTA, (20, 20), modo=MODO_CRUDO)  # Vuelve a ser reciente
+        recursos.imagen(self.RUTA, (22, 22), modo=MODO_CRUDO)
+
+        assert recursos.desalojos > 0
+        assert recursos.bytes_usados <= recursos.presupuesto_bytes
+        assert (self.RUTA, None, (20, 20), False, MODO_CRUDO) in recursos
+        assert recursos.estadisticas()["entradas"] == len(recursos)
+
+    def test_sin_ventana_entrega_la_imagen_cruda(self, recursos):
+        """Sin display la conversión falla y se entrega la versión sin convertir"""
+        pygame.display.quit()
+        imagen = recursos.imagen(self.RUTA, (30, 30))
+        assert imagen.get_size() == (30, 30)
+        assert (self.RUTA, None, (30, 30), False, "alpha") not in recursos
+
+    def test_modo_invalido(self, recursos):
+        """Un modo de conversión desconocido es un error"""
+        with pytest.raises(ValueError):
+            recursos.imagen(self.RUTA, modo="rgb")
+
+
+class TestFramesEspejados:
+    """Tests de los frames espejados precalculados de SpriteAnimado"""
+
+    @pytest.fixture
+    def sprite(self, recursos, pantalla_test, tmp_path):
+        from personajes.sprite_animado import SpriteAnimado
+
+        # Hoja de 16 frames de 8x8, cada uno con su columna izquierda marcada
+        hoja = pygame.Surface((16 * 8, 8), pygame.SRCALPHA)
+        for i in range(16):
+            hoja.fill((255, 0, 0, 255), (i * 8, 0, 1, 8))
+        ruta = str(tmp_path / "hoja.png")
+        pygame.image.save(hoja, ruta)
+        return SpriteAnimado(ruta, frame_width=8, frame_height=8)
+
+    def test_mirar_a_la_izquierda_no_crea_superficies(self, sprite):
+        """El frame espejado es siempre la misma superficie precalculada"""
+        sprite.set_direccion(False)
+        frame = sprite.obtener_frame_actual()
+        assert sprite.obtener_frame_actual() is frame
+        assert frame.get_at((7, 0))[:3] == (255, 0, 0)  # Columna marcada a la derecha
+
+        sprite.set_direccion(True)
+        assert sprite.obtener_frame_actual().get_at((0, 0))[:3] == (255, 0, 0)
+
+    def test_reescalar_genera_ambas_orientaciones(self, sprite):
+        """Reescalar deja frames normales y espejados del nuevo tamaño"""
+        sprite._extraer_frames((16, 16))
+        for anim_data in sprite.animaciones.values():
+            assert len(anim_data["frames_espejados"]) == anim_data["cantidad"]
+            assert {f.get_size() for f in anim_data["frames_espejados"]} == {(16, 16)}
+        assert sprite.frame_width == 16
+
+
+class TestCacheTextos:
+    """Tests de la caché de textos renderizados de GestorFuentes"""
+
+    @pytest.fixture
+    def fuentes(self, pantalla_test):
+        from interfaz.gestor_fuentes import GestorFuentes
+
+        pygame.font.init()
+        gestor = GestorFuentes()
+        maximo = gestor.max_textos
+        gestor.limpiar_textos()
+        yield gestor
+        gestor.max_textos = maximo
+        gestor.limpiar_textos()
+
+    def test_texto_repetido_no_se_rasteriza(self, fuentes):
+        """El mismo texto con la misma fuente y color devuelve la misma superficie"""
+        a = fuentes.renderizar(fuentes.hud_normal, "PAUSA", False, (255, 0, 0))
+        b = fuentes.renderizar(fuentes.hud_normal, "PAUSA", False, [255, 0, 0])
+        assert a is b
+        assert fuentes.estadisticas_textos()["aciertos"] == 1
+        verde = fuentes.renderizar(fuentes.hud_normal, "PAUSA", False, (0, 255, 0))
+        con_fondo = fuentes.renderizar(
+            fuentes.hud_normal, "PAUSA", False, (255, 0, 0), (0, 0, 0)
+        )
+        assert verde is not a and con_fondo is not a
+
+    def test_cache_acotada(self, fuentes):
+        """Al superar el máximo se descartan los textos usados hace más tiempo"""
+        fuentes.max_textos = 3
+        primero = fuentes.renderizar(fuentes.texto_normal, "0", False, (255, 255, 255))
+        for i in range(1, 5):
+            fuentes.renderizar(fuentes.texto_normal, str(i), False, (255, 255, 255))
+        estadisticas = fuentes.estadisticas_textos()
+        assert estadisticas["entradas"] == 3
+        assert estadisticas["desalojos"] == 2
+        otra_vez = fuentes.renderizar(fuentes.texto_normal, "0", False, (255, 255, 255))
+        assert otra_vez is not primero
+
+    def test_titulo_arcade_en_estado_estable(self, fuentes):
+        """Dibujar el título varias veces solo rasteriza en el primer frame"""
+        from interfaz.componentes.titulo_arcade import TituloArcade
+
+        superficie = pygame.Surface((800, 600))
+        titulo = TituloArcade("THESEUS", 100)
+        titulo.dibujar(superficie)
+        fallos = fuentes.fallos
+        for _ in range(5):
+            titulo.dibujar(superficie)
+        assert fuentes.fallos == fallos
+
+
+class TestAtlasGlifos:
+    """Tests del atlas de glifos para contadores del HUD"""
+
+    @pytest.fixture
+    def fuente(self, pantalla_test):
+        from interfaz.gestor_fuentes import GestorFuentes
+
+        pygame.font.init()
+        return GestorFuentes().hud_pequeño
+
+    def test_igual_que_renderizar_la_cadena(self, fuente):
+        """Componer glifo por glifo da los mismos píxeles que Font.render"""
+        from interfaz.atlas_glifos import AtlasGlifos
+
+        atlas = AtlasGlifos(fuente, (255, 220, 60))
+        texto = "001234 12:05"
+        esperado = fuente.render(texto, False, (255, 220, 60))
+        assert atlas.tamaño(texto) == esperado.get_size()
+
+        a = pygame.Surface(esperado.get_size())
+        b = pygame.Surface(esperado.get_size())
+        a.fill((20, 30, 40))
+        b.fill((20, 30, 40))
+        atlas.dibujar(a, texto, (0, 0))
+        b.blit(esperado, (0, 0))
+        assert pygame.image.tobytes(a, "RGB") == pygame.image.tobytes(b, "RGB")
+
+    def test_caracter_fuera_del_atlas(self, fuente):
+        """Un carácter que no estaba se rasteriza una vez y se reutiliza"""
+        from interfaz.atlas_glifos import AtlasGlifos
+
+        atlas = AtlasGlifos(fuente, (255, 255, 255), caracteres="0123456789")
+        rect = atlas.dibujar(pygame.Surface((200, 50)), "9★", (10, 5))
+        assert rect.topleft == (10, 5)
+        assert atlas._glifo("★") is atlas._glifo("★")
+
+    def test_atlas_compartido(self, fuente):
+        """GestorFuentes entrega el mismo atlas para la misma fuente y color"""
+        from interfaz.gestor_fuentes import GestorFuentes
+
+        gestor = GestorFuentes()
+        assert gestor.atlas(fuente, (1, 2, 3)) is gestor.atlas(fuente, [1, 2, 3])
+        assert gestor.atlas(fuente, (1, 2, 3)) is not gestor.atlas(fuente, (3, 2, 1))
+
+
+class TestHudRetenido:
+    """Tests de la capa retenida del HUD"""
+
+    @pytest.fixture
+    def pantalla_hud(self, pantalla_juego):
+        from interfaz.gestor_fuentes import GestorFuentes
+
+        pantalla_juego.fuente_pequena = GestorFuentes().hud_pequeño
+        return pantalla_juego
+
+    def test_sin_cambios_no_redibuja_widgets(self, pantalla_hud, monkeypatch):
+        """En frames sin cambios el HUD es solo blits de la capa y la estrella"""
+        pantalla_hud._dibujar_hud()
+        capa = pantalla_hud._capa_hud
+
+        dibujados = []
+        original = pantalla_hud._dibujar_widget_hud
+
+        def contar(superficie, nombre, valor):
+            dibujados.append(nombre)
+            return original(superficie, nombre, valor)
+
+        monkeypatch.setattr(pantalla_hud, "_dibujar_widget_hud", contar)
+        for _ in range(5):
+            pantalla_hud._dibujar_hud()
+        assert dibujados == []
+        assert pantalla_hud._capa_hud is capa
+
+        pantalla_hud.jugador.sumar_puntos(1)
+        pantalla_hud._dibujar_hud()
+        assert dibujados == ["puntaje"]
+
+    def test_capa_igual_a_reconstruirla(self, pantalla_hud):
+        """Tras varios cambios la capa coincide con una construida desde cero"""
+        pantalla_hud._dibujar_hud()
+        pantalla_hud.jugador.sumar_puntos(1234)
+        pantalla_hud.jugador.perder_vida()
+        pantalla_hud.computadora.velocidad *= 2
+        pantalla_hud._dibujar_hud()
+        incremental = pygame.image.tobytes(pantalla_hud._capa_hud, "RGB")
+
+        pantalla_hud._capa_hud = None
+        pantalla_hud._dibujar_hud()
+        assert pygame.image.tobytes(pantalla_hud._capa_hud, "RGB") == incremental
+
+
+class TestOverlaysPrecompuestos:
+    """Tests de los overlays de pausa, salida y game over pre-compuestos"""
+
+    @pytest.fixture
+    def pantalla_overlay(self, pantalla_juego):
+        from interfaz.gestor_fuentes import GestorFuentes
+
+        fuentes = GestorFuentes()
+        pantalla_juego.fuente_titulo = fuentes.hud_titulo
+        pantalla_juego.fuente_hud = fuentes.hud_normal
+        pantalla_juego.fuente_pequena = fuentes.hud_pequeño
+        return pantalla_juego
+
+    def test_pausa_se_compone_una_sola_vez(self, pantalla_overlay, monkeypatch):
+        """Frames consecutivos en pausa reutilizan la misma superficie"""
+        pantalla_overlay._dibujar_pausa()
+        _, overlay = PantallaJuego._horneadas["pausa"]
+
+        compuestos = []
+        monkeypatch.setattr(
+            pantalla_overlay, "_componer_pausa", lambda sup: compuestos.append(sup)
+        )
+        for _ in range(5):
+            pantalla_overlay._dibujar_pausa()
+        assert compuestos == []
+        assert PantallaJuego._horneadas["pausa"][1] is overlay
+
+    def test_pausa_se_recompone_si_cambia_la_ventana(self, pantalla_overlay):
+        """Cambiar el tamaño de la ventana invalida el overlay"""
+        pantalla_overlay._dibujar_pausa()
+        _, overlay = PantallaJuego._horneadas["pausa"]
+
+        pantalla_overlay.ANCHO, pantalla_overlay.ALTO = 1000, 700
+        pantalla_overlay._dibujar_pausa()
+        _, nuevo = PantallaJuego._horneadas["pausa"]
+        assert nuevo is not overlay
+        assert nuevo.get_size() == (1000, 700)
+
+    def test_game_over_cuenta_regresiva_sin_recomponer(self, pantalla_overlay):
+        """La cuenta regresiva se redibuja sin recomponer lo fijo"""
+        pantalla_overlay.game_over_timer = 180
+        pantalla_overlay._dibujar_game_over()
+        _, overlay = PantallaJuego._horneadas["game_over"]
+
+        pantalla_overlay.game_over_timer = 60
+        pantalla_overlay._dibujar_game_over()
+        assert PantallaJuego._horneadas["game_over"][1] is overlay
+
+        pantalla_overlay.jugador.sumar_puntos(50)
+        pantalla_overlay._dibujar_game_over()
+        assert PantallaJuego._horneadas["game_over"][1] is not overlay
+
+
+class TestRectangulosSucios:
+    """Tests de la presentación por rectángulos sucios"""
+
+    @pytest.fixture
+    def pantalla_sucia(self, pantalla_juego, monkeypatch):
+        from config.config import ConfigJuego
+        from interfaz.gestor_fuentes import GestorFuentes
+
+        fuentes = GestorFuentes()
+        pantalla_juego.fuente_titulo = fuentes.hud_titulo
+        pantalla_juego.fuente_hud = fuentes.hud_normal
+        pantalla_juego.fuente_pequena = fuentes.hud_pequeño
+
+        # Registrar cada presentación: lista de rects (update) o None (flip)
+        presentaciones = []
+        monkeypatch.setattr(ConfigJuego, "RECTANGULOS_SUCIOS", True)
+        monkeypatch.setattr(
+            pygame.display, "update", lambda rects: presentaciones.append(list(rects))
+        )
+        monkeypatch.setattr(pygame.display, "flip", lambda: presentaciones.append(None))
+        pantalla_juego.presentaciones = presentaciones
+        return pantalla_juego
+
+    def _jugar(self, pantalla, direcciones):
+        """Avanza la simulación y renderiza un frame por dirección"""
+        for direccion in direcciones:
+            pantalla.simulacion.step(direccion)
+            pantalla._renderizar()
+
+    def test_frames_parciales_igual_a_completo(self, pantalla_sucia):
+        """Tras varios frames parciales la ventana coincide con un frame completo"""
+        pantalla_sucia._renderizar()
+        self._jugar(pantalla_sucia, ["right"] * 10 + ["down"] * 10)
+        pantalla_sucia.jugador.sumar_puntos(1234)
+        self._jugar(pantalla_sucia, ["left"] * 10)
+
+        assert pantalla_sucia.presentaciones[0] is None
+        assert all(rects for rects in pantalla_sucia.presentaciones[1:])
+        parcial = pygame.image.tobytes(pantalla_sucia.screen, "RGB")
+
+        pantalla_sucia._rects_dinamicos = None  # Forzar un frame completo
+        pantalla_sucia._renderizar()
+        assert pantalla_sucia.presentaciones[-1] is None
+        assert pygame.image.tobytes(pantalla_sucia.screen, "RGB") == parcial
+
+    def test_frame_parcial_presenta_poca_area(self, pantalla_sucia):
+        """Un frame parcial presenta solo las áreas de lo que se mueve o anima"""
+        self._jugar(pantalla_sucia, [None, "right"])
+        rects = pantalla_sucia.presentaciones[-1]
+        area = sum(rect.width * rect.height for rect in rects)
+        assert area < 0.05 * 1200 * 800
+        assert pantalla_sucia.presentaciones_parciales == 1
+
+    def test_area_sobre_el_umbral_presenta_todo(self, pantalla_sucia, monkeypatch):
+        """Si el área sucia pasa el umbral se presenta la ventana entera"""
+        from config.config import ConfigJuego
+
+        monkeypatch.setattr(ConfigJuego, "UMBRAL_AREA_SUCIA", 0.0)
+        self._jugar(pantalla_sucia, [None, "right", "right"])
+        assert pantalla_sucia.presentaciones == [None, None, None]
+        assert pantalla_sucia.presentaciones_parciales == 0
+
+    def test_overlay_fuerza_frames_completos(self, pantalla_sucia):
+        """Con pausa (y al salir de ella) los frames son completos"""
+        pantalla_sucia._renderizar()
+        pantalla_sucia.pausado = True
+        pantalla_sucia._renderizar()
+        pantalla_sucia.pausado = False
+        pantalla_sucia._renderizar()
+        pantalla_sucia._renderizar()
+        assert pantalla_sucia.presentaciones[:3] == [None, None, None]
+        assert pantalla_sucia.presentaciones[3]
+
+
+class TestColaRender:
+    """Tests de la cola de dibujo por capas"""
+
+    @pytest.fixture
+    def cola(self):
+        from interfaz.cola_render import ColaRender
+
+        pygame.init()
+        pygame.display.set_mode((100, 100))
+        return ColaRender()
+
+    def _cuadrado(self, color):
+        superficie = pygame.Surface((10, 10))
+        superficie.fill(color)
+        return superficie
+
+    def test_capas_en_orden(self, cola):
+        """Las capas mayores quedan encima aunque se agreguen antes"""
+        destino = pygame.Surface((20, 20))
+        cola.agregar(1, self._cuadrado((255, 0, 0)), (0, 0))
+        cola.agregar(0, self._cuadrado((0, 255, 0)), (0, 0))
+        cola.vaciar(destino)
+        assert destino.get_at((5, 5))[:3] == (255, 0, 0)
+
+    def test_blits_consecutivos_en_un_lote(self, cola):
+        """Los blits de una capa salen juntos; un dibujo directo corta el lote"""
+        destino = pygame.Surface((100, 100))
+        cuadrado = self._cuadrado((0, 0, 255))
+        cola.agregar_varios(0, [(cuadrado, (x * 10, 0)) for x in range(5)])
+        cola.agregar_dibujo(
+            0, lambda sup: pygame.draw.circle(sup, (9, 9, 9), (50, 50), 5)
+        )
+        cola.agregar(0, cuadrado, (0, 90))
+        cola.agregar(1, cuadrado, (90, 90))
+
+        dibujados = cola.vaciar(destino)
+        assert len(dibujados[0]) == 7
+        assert dibujados[1] == [pygame.Rect(90, 90, 10, 10)]
+        assert cola.lotes == 3  # Capa 0: antes y después del círculo; capa 1
+        assert cola.estadisticas()["dibujos"] == {"obsequios": 7, "actores": 1}
+        assert len(cola) == 0
+
+    def test_contadores_de_la_partida(self, pantalla_juego):
+        """Un frame de la partida cuenta los dibujos de cada capa"""
+        from interfaz.gestor_fuentes import GestorFuentes
+
+        pantalla_juego.fuente_pequena = GestorFuentes().hud_pequeño
+        pantalla_juego._renderizar()
+        dibujos = pantalla_juego.cola.estadisticas()["dibujos"]
+        assert dibujos["actores"] == 1 + len(pantalla_juego.computadoras)
+        assert dibujos["hud"] == len(PantallaJuego.FRANJAS_HUD)
+        assert dibujos["hud_animado"] == 1
+        assert dibujos.get("obsequios", 0) == len(pantalla_juego.laberinto._obsequios)
@@ -0,0 +1,249 @@
+"""
+Tests del núcleo de simulación sin ventana.
+Verificar que la partida avanza con step() sin pantalla ni sonido, y que
+retorna los eventos de obsequio, captura y game over.
+"""
+
+import pytest
+
+from config.config import ConfigJuego
+from jugabilidad.simulacion import (
+    EVENTO_CAPTURA,
+    EVENTO_GAME_OVER,
+    EVENTO_OBSEQUIO,
+    SimulacionJuego,
+)
+
+
+def _datos_pasillo(obsequios=None):
+    """Pasillo horizontal de 8 celdas: jugador a la izquierda, minotauro a la derecha."""
+    return {
+        "nombre": "Pasillo",
+        "mapa": [
+            [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            [1, 0, 0, 0, 0, 0, 0, 0, 0, 1],
+            [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+        ],
+        "inicio_jugador": {"col": 1, "fila": 1},
+        "inicio_computadora": {"col": 8, "fila": 1},
+        "obsequios": obsequios or [],
+    }
+
+
+class TestSimulacion:
+    """Partidas completas avanzadas con step()"""
+
+    def test_corre_sin_ventana(self):
+        """Se puede crear y avanzar sin pygame.display ni superficies"""
+        sim = SimulacionJuego("src/data/laberintos/laberinto1.json")
+        for _ in range(300):
+            sim.step(None)
+        assert sim.frame_count == 300 or sim.game_over
+        assert sim.jugador._imagen is None  # No se cargaron sprites
+
+    def test_entrada_mueve_al_jugador(self):
+        """La dirección pedida en step() mueve al jugador por celdas"""
+        sim = SimulacionJuego(_datos_pasillo())
+        assert sim.celda_jugador() == (1, 1)
+        sim.step("right")
+        for _ in range(ConfigJuego.FRAMES_COOLDOWN_MOVIMIENTO):
+            sim.step(None)  # Termina la interpolación hacia la nueva celda
+        assert sim.celda_jugador() == (2, 1)
+
+    def test_evento_obsequio(self):
+        """Pisar un obsequio suma puntos y retorna el evento"""
+        sim = SimulacionJuego(_datos_pasillo([{"posicion": [2, 1], "valor": 10}]))
+        eventos = sim.step("right")
+        for _ in range(ConfigJuego.FRAMES_COOLDOWN_MOVIMIENTO):
+            eventos += sim.step(None)
+        assert EVENTO_OBSEQUIO in eventos
+        assert sim.jugador.puntaje >= 10
+
+    def test_capturas_hasta_game_over(self):
+        """Cada captura resta una vida; la última termina la partida"""
+        sim = SimulacionJuego(_datos_pasillo())
+        todos = []
+        for _ in range(10000):
+            todos.extend(sim.step(None))
+            if sim.game_over:
+                break
+
+        assert sim.game_over
+        assert todos.count(EVENTO_CAPTURA) == ConfigJuego.VIDAS_INICIALES
+        assert todos[-1] == EVENTO_GAME_OVER
+        assert sim.capturas == ConfigJuego.VIDAS_INICIALES
+        assert sim.puntaje_final == sim.jugador.puntaje
+        assert sim.nombre_laberinto == "Pasillo"
+
+    def test_no_avanza_despues_del_game_over(self):
+        """Tras el game over step() no cambia el estado"""
+        sim = SimulacionJuego(_datos_pasillo())
+        for _ in range(10000):
+            if sim.step(None) and sim.game_over:
+                break
+        assert sim.game_over
+        frames = sim.frame_count
+        assert sim.step("right") == []
+        assert sim.frame_count == frames
+
+    def test_geometria_de_pantalla(self):
+        """Con tamaño de celda y offsets de pantalla las celdas coinciden"""
+        sim = SimulacionJuego(_datos_pasillo(), tam_celda=20, offset_x=100, offset_y=50)
+        assert sim.celda_jugador() == (1, 1)
+        assert sim.celda_computadora() == (8, 1)
+
+
+@pytest.mark.integration
+def test_pantalla_juego_delega_en_la_simulacion(pantalla_test):
+    """PantallaJuego avanza su estado a través de la simulación"""
+    from interfaz.pantallas.pantalla_juego import PantallaJuego
+
+    pantalla = PantallaJuego(ruta_laberinto="src/data/laberintos/laberinto1.json")
+    assert pantalla.jugador is pantalla.simulacion.jugador
+    pantalla._actualizar()
+    assert pantalla.frame_count == 1
+    assert pantalla.tiempo_transcurrido == 1
+
+
+class TestSimuladorLotes:
+    """Partidas automáticas del simulador en lote"""
+
+    @pytest.mark.parametrize("politica", ["quieto", "azar", "huida", "obsequios"])
+    def test_partida_reproducible(self, politica):
+        """Misma semilla y política dan el mismo resultado"""
+        from herramientas.simulador_lotes import jugar_partida
+
+        tarea = {
+            "laberinto": "src/data/laberintos/laberinto1.json",
+            "politica": politica,
+            "semilla": 3,
+            "max_frames": 600,
+        }
+        resultado = jugar_partida(tarea)
+        assert resultado == jugar_partida(tarea)
+        assert resultado["frames"] <= 600
+        assert resultado["capturas"] <= ConfigJuego.VIDAS_INICIALES
+
+    def test_resumen_por_laberinto_y_politica(self):
+        """El resumen agrupa y calcula capturas por minuto de juego"""
+        from herramientas.simulador_lotes import resumir
+
+        resultados = [
+            {
+                "laberinto": "a.json",
+                "politica": "azar",
+                "segundos": 30.0,
+                "game_over": True,
+                "capturas": 3,
+                "puntaje": 10,
+            },
+            {
+                "laberinto": "a.json",
+                "politica": "azar",
+                "segundos": 90.0,
+                "game_over": False,
+                "capturas": 1,
+                "puntaje": 50,
+            },
+        ]
+        (fila,) = resumir(resultados)
+        assert fila["partidas"] == 2
+        assert fila["game_over_pct"] == 50.0
+        assert fila["superv_media_s"] == 60.0
+        assert fila["capturas_min"] == 2.0
+        assert fila["puntaje_p90"] == 50
+
+
+def _grabar_partida(semilla=7, frames=900):
+    """Graba una partida de laberinto2 con entradas pseudoaleatorias."""
+    import random
+
+    from jugabilidad.repeticion import GrabadorPartida
+
+    ruta = "src/data/laberintos/laberinto2.json"
+    simulacion = SimulacionJuego(ruta, semilla=semilla)
+    grabador = GrabadorPartida(simulacion, ruta, frames_por_keyframe=120)
+    generador = random.Random(semilla)
+    direccion = None
+    while not simulacion.game_over and simulacion.frame_count < frames:
+        if generador.random() < 0.05:
+            direccion = generador.choice(["up", "down", "left", "right", None])
+        grabador.step(direccion)
+    return grabador
+
+
+class TestRepeticion:
+    """Grabación y repetición determinista"""
+
+    def test_tramos_compactos(self):
+        """Las entradas se guardan por tramos y se recuperan igual"""
+        from jugabilidad.repeticion import codificar_entradas, decodificar_entradas
+
+        tramos = [[None, 12], ["right", 3], ["up", 1], [None, 250]]
+        texto = codificar_entradas(tramos)
+        assert texto == ".12R3U1.250"
+        assert decodificar_entradas(texto) == tramos
+        with pytest.raises(ValueError):
+            decodificar_entradas("R3X2")
+
+    def test_misma_semilla_mismos_obsequios(self):
+        """Con la misma semilla los obsequios nuevos aparecen en el mismo lugar"""
+        a = SimulacionJuego("src/data/laberintos/laberinto1.json", semilla=5)
+        b = SimulacionJuego("src/data/laberintos/laberinto1.json", semilla=5)
+        for _ in range(5):
+            a.gestor_obsequios.crear_nuevo_obsequio()
+            b.gestor_obsequios.crear_nuevo_obsequio()
+        assert a.laberinto._obsequios.keys() == b.laberinto._obsequios.keys()
+        assert a.huella() == b.huella()
+
+    def test_repeticion_identica(self, tmp_path):
+        """Guardar, cargar y reproducir da el mismo estado en cada keyframe"""
+        from jugabilidad.repeticion import Repeticion, ReproductorRepeticion
+
+        grabador = _grabar_partida()
+        ruta = tmp_path / "partida.json"
+        grabador.guardar(str(ruta))
+
+        reproductor = ReproductorRepeticion(Repeticion.cargar(str(ruta)))
+        assert reproductor.verificar() is None
+        assert reproductor.frame == grabador.simulacion.frame_count
+        assert reproductor.simulacion.huella() == grabador.simulacion.huella()
+
+    def test_busqueda_por_keyframes(self):
+        """Saltar atrás y adelante deja el mismo estado que reproducir de corrido"""
+        from jugabilidad.repeticion import ReproductorRepeticion
+
+        repeticion = _grabar_partida().repeticion
+        lineal = ReproductorRepeticion(repeticion)
+        lineal.ir_a(500)
+        esperada = lineal.simulacion.huella()
+
+        reproductor = ReproductorRepeticion(repeticion, frames_por_instantanea=120)
+        reproductor.ir_a(800)
+        reproductor.ir_a(500)
+        assert reproductor.frame == 500
+        assert reproductor.simulacion.huella() == esperada
+
+    def test_detecta_divergencia(self):
+        """Cambiar las entradas grabadas se detecta en un keyframe"""
+        from jugabilidad.repeticion import ReproductorRepeticion
+
+        repeticion = _grabar_partida().repeticion
+        primer_movimiento = 0
+        for tramo in repeticion.tramos:
+            if tramo[0] is not None:
+                break
+            primer_movimiento += tramo[1]
+        # Mismo largo, pero el jugador nunca se mueve
+        repeticion.tramos = [[None, repeticion.frames]]
+
+        divergencia = ReproductorRepeticion(repeticion).verificar()
+        assert divergencia is not None and divergencia > primer_movimiento
+
+    def test_grabar_requiere_semilla(self):
+        """Sin semilla la partida no es reproducible y no se puede grabar"""
+        from jugabilidad.repeticion import GrabadorPartida
+
+        ruta = "src/data/laberintos/laberinto1.json"
+        with pytest.raises(ValueError):
+            GrabadorPartida(SimulacionJuego(ruta), ruta)